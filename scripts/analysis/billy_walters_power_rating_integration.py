@@ -365,6 +365,9 @@ class BillyWaltersPowerRatingIntegration:
         # Load power ratings into edge detector
         self.edge_detector.power_ratings = self.power_ratings
 
+        # Bulk-load the week's database context before the per-game loop
+        self.edge_detector.prefetch_week_context(2025, self.week)
+
         edges = []
 
         for game_key, game_data in self.overtime_odds.items():
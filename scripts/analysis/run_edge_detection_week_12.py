@@ -279,6 +279,9 @@ def main():
     if not weather_client.api_key:
         logger.warning("No AccuWeather API key - weather analysis will be skipped")
 
+    # Bulk-load the week's database context before the per-game loop
+    detector.prefetch_week_context(2025, 12)
+
     # Analyze each game
     edges = []
     totals_edges = []
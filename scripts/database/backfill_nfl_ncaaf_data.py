@@ -60,7 +60,7 @@ class BackfillManager:
     """Manage data backfill for NFL and NCAAF."""
 
     def __init__(self):
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.current_week = NFLWeekDetector.get_current_week() or 1
 
     def load_massey_ratings(self) -> dict:
@@ -26,7 +26,7 @@ class GameIDMapper:
 
     def __init__(self):
         """Initialize mapper with database connection."""
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self._espn_schedule_cache: Dict[str, str] = {}
         self._load_espn_schedules()
 
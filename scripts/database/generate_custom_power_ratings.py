@@ -38,7 +38,7 @@ class CustomPowerRatingGenerator:
     """Generate custom power ratings from ESPN component data."""
 
     def __init__(self):
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.nfl_engine = CustomPowerRatingEngine(league=League.NFL)
         self.ncaaf_engine = CustomPowerRatingEngine(league=League.NCAAF)
 
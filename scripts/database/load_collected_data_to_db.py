@@ -37,7 +37,7 @@ class DataLoader:
         """
         self.week = week
         self.league = league.upper()
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.mapper = GameIDMapper()
         self.stats = {
             "schedules": 0,
@@ -68,7 +68,7 @@ class ESPNInjuriesLoader:
     """Load ESPN injury data into database."""
 
     def __init__(self):
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.api = ESPNAPIClient()
 
     def get_nfl_teams(self) -> dict:
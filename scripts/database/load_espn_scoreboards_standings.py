@@ -25,7 +25,7 @@ class ESPNScoreboardsStandingsLoader:
     """Load ESPN scoreboards and standings into database."""
 
     def __init__(self):
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.api = ESPNAPIClient()
 
     def load_scoreboards_for_league(self, league: str) -> tuple[int, int]:
@@ -23,7 +23,7 @@ class ESPNTeamStatsLoader:
     """Load ESPN team statistics into database."""
 
     def __init__(self):
-        self.db = get_db_connection()
+        self.db = get_db_connection(pooled=True)
         self.api = ESPNAPIClient()
 
     def get_nfl_teams(self) -> dict:
@@ -76,6 +76,13 @@ Examples:
         help="Run browser in headless mode (default: true)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Game pages scraped in parallel (default: 4)",
+    )
+
     parser.add_argument(
         "--output",
         type=str,
@@ -101,9 +108,10 @@ Examples:
     logger.info(f"  Year: {args.year}")
     logger.info(f"  Week: {args.week}")
     logger.info(f"  Headless: {headless}")
+    logger.info(f"  Concurrency: {args.concurrency}")
     logger.info(f"  Output: {args.output}")
 
-    client = NFLGameStatsClient(headless=headless)
+    client = NFLGameStatsClient(headless=headless, max_concurrency=args.concurrency)
 
     try:
         # Fetch stats for the week
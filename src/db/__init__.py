@@ -41,6 +41,7 @@ from .raw_data_models import (
     TeamTrends,
 )
 from .raw_data_operations import RawDataOperations
+from .reference_tables import ReferenceTables
 
 __all__ = [
     "DatabaseConnection",
@@ -48,6 +49,7 @@ __all__ = [
     "close_db_connection",
     "DatabaseOperations",
     "RawDataOperations",
+    "ReferenceTables",
     # SQLite-based models
     "League",
     "Team",
@@ -2,9 +2,15 @@
 Database Connection Manager
 
 Handles SQLite connections for the Billy Walters Sports Analyzer.
+
+Two modes are supported:
+- Default: a fresh connection per query (simple, no shared state)
+- Pooled: one long-lived connection per thread with WAL journaling,
+  tuned cache/mmap pragmas and a larger prepared-statement cache
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
@@ -19,20 +25,64 @@ if _env_path.exists():
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "walters.db"
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Pooled-mode tuning defaults
+DEFAULT_CACHE_SIZE_KB = 64 * 1024  # 64 MiB page cache per connection
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024  # 256 MiB memory-mapped I/O
+DEFAULT_STATEMENT_CACHE_SIZE = 512  # sqlite3 default is 128
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Connection handed out by pooled-mode get_connection().
+
+    It is shared by every caller on its thread, so close() only rolls back
+    uncommitted work (what closing a per-query connection would discard) and
+    leaves it open; DatabaseConnection.close() releases it for real.
+    """
+
+    def close(self) -> None:
+        if self.in_transaction:
+            self.rollback()
+
+    def _release(self) -> None:
+        super().close()
+
 
 class DatabaseConnection:
     """Manages SQLite database connection."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        pooled: bool = False,
+        cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ):
         """
         Initialize SQLite database connection.
 
         Args:
             db_path: Path to SQLite database file (default: data/walters.db)
+            pooled: Reuse one long-lived connection per thread instead of
+                opening a new connection for every query
+            cache_size_kb: Page cache size per pooled connection (KiB)
+            mmap_size: Memory-mapped I/O size per pooled connection (bytes)
+            statement_cache_size: Prepared statements cached per connection
         """
         self.db_path = db_path or DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self.pooled = pooled
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+        self.statement_cache_size = statement_cache_size
+
+        # Pooled mode state: thread-local connection + registry for close()
+        self._local = threading.local()
+        self._pool: list[_PooledConnection] = []
+        self._pool_lock = threading.Lock()
+
     def create_pool(self) -> None:
         """Initialize database schema if needed."""
         if not self.db_path.exists():
@@ -59,12 +109,19 @@ class DatabaseConnection:
         """
         Get database connection.
 
+        In pooled mode the calling thread's long-lived connection is returned
+        (created on first use). Calling close() on it is safe: it rolls back
+        uncommitted work and keeps the connection open for the next caller.
+
         Returns:
             SQLite database connection
 
         Raises:
             Exception: If connection fails
         """
+        if self.pooled:
+            return self._get_pooled_connection()
+
         try:
             conn = sqlite3.connect(str(self.db_path))
             conn.row_factory = sqlite3.Row
@@ -73,6 +130,49 @@ class DatabaseConnection:
             print(f"[ERROR] Failed to get connection: {e}")
             raise
 
+    def _get_pooled_connection(self) -> _PooledConnection:
+        """Get (or open) the calling thread's pooled connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        try:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                cached_statements=self.statement_cache_size,
+                check_same_thread=False,
+                factory=_PooledConnection,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+            conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+        except sqlite3.Error as e:
+            print(f"[ERROR] Failed to get connection: {e}")
+            raise
+
+        self._local.conn = conn
+        with self._pool_lock:
+            self._pool.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all pooled connections (no-op in per-query mode)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            try:
+                conn._release()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def close_all_connections(self) -> None:
+        """Alias of close(), as called by the loader scripts."""
+        self.close()
+
     @contextmanager
     def get_cursor(self, commit: bool = False) -> Generator[sqlite3.Cursor, None, None]:
         """
@@ -95,13 +195,18 @@ class DatabaseConnection:
             yield cursor
             if commit:
                 conn.commit()
+            elif self.pooled and conn.in_transaction:
+                # Match per-query mode, where uncommitted work is discarded
+                # when the connection closes
+                conn.rollback()
         except Exception as e:
             conn.rollback()
             print(f"[ERROR] Database operation failed: {e}")
             raise
         finally:
             cursor.close()
-            conn.close()
+            if not self.pooled:
+                conn.close()
 
     def execute_query(
         self, query: str, params: Optional[tuple] = None, fetch: bool = True
@@ -123,6 +228,9 @@ class DatabaseConnection:
                 (1,)
             )
         """
+        if self.pooled:
+            return self._execute_pooled(query, params, fetch)
+
         with self.get_cursor(commit=not fetch) as cursor:
             if params:
                 cursor.execute(query, params)
@@ -133,6 +241,25 @@ class DatabaseConnection:
                 return cursor.fetchall()
             return None
 
+    def _execute_pooled(
+        self, query: str, params: Optional[tuple], fetch: bool
+    ) -> Optional[list]:
+        """execute_query fast path: no cursor/context-manager overhead."""
+        conn = self._get_pooled_connection()
+        try:
+            cursor = conn.execute(query, params or ())
+            if fetch:
+                rows = cursor.fetchall()
+                if conn.in_transaction:
+                    conn.rollback()
+                return rows
+            conn.commit()
+            return None
+        except Exception as e:
+            conn.rollback()
+            print(f"[ERROR] Database operation failed: {e}")
+            raise
+
     def execute_many(self, query: str, data: list) -> None:
         """
         Execute query with multiple parameter sets (bulk insert).
@@ -174,12 +301,16 @@ class DatabaseConnection:
 _db_connection: Optional[DatabaseConnection] = None
 
 
-def get_db_connection(db_path: Optional[Path] = None) -> DatabaseConnection:
+def get_db_connection(
+    db_path: Optional[Path] = None, pooled: bool = False
+) -> DatabaseConnection:
     """
     Get or create global database connection instance.
 
     Args:
         db_path: Path to SQLite database file (default: data/walters.db)
+        pooled: Use pooled per-thread connections (only applies when the
+            global instance is first created)
 
     Returns:
         DatabaseConnection instance
@@ -193,7 +324,7 @@ def get_db_connection(db_path: Optional[Path] = None) -> DatabaseConnection:
     global _db_connection
 
     if _db_connection is None:
-        _db_connection = DatabaseConnection(db_path=db_path)
+        _db_connection = DatabaseConnection(db_path=db_path, pooled=pooled)
         _db_connection.create_pool()
 
     return _db_connection
@@ -202,4 +333,6 @@ def get_db_connection(db_path: Optional[Path] = None) -> DatabaseConnection:
 def close_db_connection() -> None:
     """Close global database connection."""
     global _db_connection
+    if _db_connection is not None:
+        _db_connection.close()
     _db_connection = None
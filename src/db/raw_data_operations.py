@@ -25,6 +25,7 @@ from .raw_data_models import (
     GameSWEFactors,
     TeamTrends,
 )
+from .reference_tables import ReferenceTables
 
 
 class RawDataOperations:
@@ -33,6 +34,7 @@ class RawDataOperations:
     def __init__(self, db: DatabaseConnection):
         """Initialize with database connection."""
         self.db = db
+        self._reference_tables: Optional[ReferenceTables] = None
 
     # ============================================================
     # GAME SCHEDULES
@@ -636,6 +638,18 @@ class RawDataOperations:
         results = self.db.execute_query(query, (league_id, team_id, season, week))
         return [dict(row) for row in results] if results else []
 
+    def get_player_valuations_by_week(
+        self, league_id: int, season: int, week: int
+    ) -> List[Dict]:
+        """Get player valuations for every team in a league week."""
+        query = """
+            SELECT * FROM player_valuations
+            WHERE league_id = ? AND season = ? AND week = ?
+            ORDER BY team_id, point_value DESC
+        """
+        results = self.db.execute_query(query, (league_id, season, week))
+        return [dict(row) for row in results] if results else []
+
     def get_starters_by_position(
         self, league_id: int, team_id: int, season: int, week: int, position: str
     ) -> List[Dict]:
@@ -744,6 +758,28 @@ class RawDataOperations:
         results = self.db.execute_query(query, (league_id, team_id, season, week))
         return [dict(row) for row in results] if results else []
 
+    def get_wednesday_status_by_week(
+        self, league_id: int, season: int, week: int
+    ) -> List[Dict]:
+        """Get Wednesday practice status for every team in a league week.
+
+        Joins player valuations so each report carries the player's
+        impact_rating (needed for the Wednesday signal).
+        """
+        query = """
+            SELECT pr.*, pv.impact_rating AS impact_rating
+            FROM practice_reports pr
+            LEFT JOIN player_valuations pv
+              ON pv.league_id = pr.league_id AND pv.team_id = pr.team_id
+             AND pv.season = pr.season AND pv.week = pr.week
+             AND pv.player_id = pr.player_id
+            WHERE pr.league_id = ? AND pr.season = ? AND pr.week = ?
+            AND pr.day_of_week = 2
+            ORDER BY pr.team_id, pr.player_name
+        """
+        results = self.db.execute_query(query, (league_id, season, week))
+        return [dict(row) for row in results] if results else []
+
     def update_practice_trend(
         self,
         league_id: int,
@@ -908,6 +944,18 @@ class RawDataOperations:
         results = self.db.execute_query(query, (league_id, team_id, season, week))
         return dict(results[0]) if results else None
 
+    def get_team_trends_by_week(
+        self, league_id: int, season: int, week: int
+    ) -> List[Dict]:
+        """Get team trends for every team in a league week."""
+        query = """
+            SELECT * FROM team_trends
+            WHERE league_id = ? AND season = ? AND week = ?
+            ORDER BY team_id
+        """
+        results = self.db.execute_query(query, (league_id, season, week))
+        return [dict(row) for row in results] if results else []
+
     def get_streak_info(
         self, league_id: int, team_id: int, season: int, week: int
     ) -> Optional[Dict]:
@@ -958,6 +1006,17 @@ class RawDataOperations:
     # BILLY WALTERS METHODOLOGY REFERENCE TABLES (Read-Only Lookups)
     # ============================================================
 
+    @property
+    def reference_tables(self) -> ReferenceTables:
+        """In-memory lookup tables, loaded on first use."""
+        if self._reference_tables is None:
+            self._reference_tables = ReferenceTables.load(self.db)
+        return self._reference_tables
+
+    def invalidate_reference_tables(self) -> None:
+        """Drop cached lookup tables (call after writing any lookup_* table)."""
+        self._reference_tables = None
+
     def get_point_value_percentage(self, point_spread: float) -> Optional[float]:
         """Get value percentage for a point spread.
 
@@ -970,14 +1029,7 @@ class RawDataOperations:
         Returns:
             Value percentage (e.g., 0.08 for 8%)
         """
-        query = """
-            SELECT value_percentage FROM lookup_point_values
-            WHERE point_spread = ?
-        """
-        results = self.db.execute_query(query, (point_spread,))
-        if results:
-            return results[0]["value_percentage"] / 100.0
-        return None
+        return self.reference_tables.point_value_percentage(point_spread)
 
     def get_all_point_values(self) -> List[Dict]:
         """Get all point value data for reference."""
@@ -997,16 +1049,7 @@ class RawDataOperations:
         Returns:
             Star rating (0.5 to 3.0), or None if below minimum
         """
-        pct = edge_percentage * 100  # Convert to percentage
-
-        query = """
-            SELECT play_strength_stars FROM lookup_play_strength_guidelines
-            WHERE min_percentage <= ?
-            ORDER BY min_percentage DESC
-            LIMIT 1
-        """
-        results = self.db.execute_query(query, (pct,))
-        return results[0]["play_strength_stars"] if results else None
+        return self.reference_tables.play_strength(edge_percentage)
 
     def get_play_strength_table(self) -> List[Dict]:
         """Get complete play strength guidelines table."""
@@ -1032,14 +1075,7 @@ class RawDataOperations:
         Returns:
             Effective implied spread at standard 110/100 vig
         """
-        query = """
-            SELECT implied_spread_at_110 FROM lookup_odds_to_spread_conversion
-            WHERE posted_spread = ? AND bet_price_text = ?
-        """
-        results = self.db.execute_query(query, (posted_spread, bet_price))
-        if results:
-            return results[0]["implied_spread_at_110"]
-        return None
+        return self.reference_tables.odds_adjusted_spread(posted_spread, bet_price)
 
     def get_odds_conversion_table(self) -> List[Dict]:
         """Get complete odds to spread conversion table."""
@@ -1062,18 +1098,7 @@ class RawDataOperations:
         Returns:
             Tuple of (favorite_moneyline, dog_moneyline), or None
         """
-        query = """
-            SELECT favorite_moneyline, dog_moneyline
-            FROM lookup_moneyline_conversion
-            WHERE point_spread = ?
-        """
-        results = self.db.execute_query(query, (point_spread,))
-        if results:
-            return (
-                results[0]["favorite_moneyline"],
-                results[0]["dog_moneyline"],
-            )
-        return None
+        return self.reference_tables.moneyline(point_spread)
 
     def get_moneyline_table(self) -> List[Dict]:
         """Get complete moneyline conversion table."""
@@ -1096,9 +1121,10 @@ class RawDataOperations:
         Returns:
             Total edge percentage (0-100)
         """
+        tables = self.reference_tables
         total_pct = 0.0
         for spread in spreads:
-            val = self.get_point_value_percentage(spread)
+            val = tables.point_value_percentage(spread)
             if val is not None:
                 total_pct += val * 100
 
@@ -1116,11 +1142,4 @@ class RawDataOperations:
         Returns:
             Cost description (e.g., '$20 off tie, $22 on to tie' for 3)
         """
-        query = """
-            SELECT dollar_value_buy_half_point FROM lookup_point_values
-            WHERE point_spread = ?
-        """
-        results = self.db.execute_query(query, (point_spread,))
-        if results:
-            return results[0]["dollar_value_buy_half_point"]
-        return None
+        return self.reference_tables.buying_power_cost(point_spread)
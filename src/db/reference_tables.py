@@ -0,0 +1,124 @@
+"""
+Reference Table Cache
+
+Immutable in-memory copies of the Billy Walters methodology lookup tables
+(point values, play strength, odds-to-spread conversion, moneylines).
+
+The tables are small and static, so they are loaded once with one query
+each and served from sorted arrays (bisect) instead of a SQL round-trip
+per lookup. Call RawDataOperations.invalidate_reference_tables() after
+writing to any lookup_* table.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from .connection import DatabaseConnection
+
+
+def _exact_index(keys: Tuple[float, ...], key: float) -> Optional[int]:
+    """Index of key in a sorted tuple, or None if absent."""
+    idx = bisect_left(keys, key)
+    if idx < len(keys) and keys[idx] == key:
+        return idx
+    return None
+
+
+@dataclass(frozen=True)
+class ReferenceTables:
+    """Loaded-once snapshot of the lookup_* reference tables."""
+
+    # lookup_point_values (sorted by point_spread)
+    point_spreads: Tuple[float, ...] = ()
+    point_value_pcts: Tuple[float, ...] = ()
+    buy_half_point_costs: Tuple[Optional[str], ...] = ()
+
+    # lookup_play_strength_guidelines (sorted by min_percentage)
+    play_strength_mins: Tuple[float, ...] = ()
+    play_strength_stars: Tuple[float, ...] = ()
+
+    # lookup_moneyline_conversion (sorted by point_spread)
+    moneyline_spreads: Tuple[float, ...] = ()
+    moneylines: Tuple[Tuple[int, int], ...] = ()
+
+    # lookup_odds_to_spread_conversion keyed by (posted_spread, bet_price_text)
+    odds_to_spread: Optional[Dict[Tuple[float, str], float]] = None
+
+    @classmethod
+    def load(cls, db: DatabaseConnection) -> "ReferenceTables":
+        """Load all reference tables (one query per table)."""
+        points = db.execute_query(
+            "SELECT point_spread, value_percentage, dollar_value_buy_half_point "
+            "FROM lookup_point_values ORDER BY point_spread"
+        )
+        strength = db.execute_query(
+            "SELECT min_percentage, play_strength_stars "
+            "FROM lookup_play_strength_guidelines ORDER BY min_percentage"
+        )
+        moneyline = db.execute_query(
+            "SELECT point_spread, favorite_moneyline, dog_moneyline "
+            "FROM lookup_moneyline_conversion ORDER BY point_spread"
+        )
+        odds = db.execute_query(
+            "SELECT posted_spread, bet_price_text, implied_spread_at_110 "
+            "FROM lookup_odds_to_spread_conversion"
+        )
+        points = points or []
+        strength = strength or []
+        moneyline = moneyline or []
+        odds = odds or []
+
+        return cls(
+            point_spreads=tuple(row["point_spread"] for row in points),
+            point_value_pcts=tuple(row["value_percentage"] for row in points),
+            buy_half_point_costs=tuple(
+                row["dollar_value_buy_half_point"] for row in points
+            ),
+            play_strength_mins=tuple(row["min_percentage"] for row in strength),
+            play_strength_stars=tuple(row["play_strength_stars"] for row in strength),
+            moneyline_spreads=tuple(row["point_spread"] for row in moneyline),
+            moneylines=tuple(
+                (row["favorite_moneyline"], row["dog_moneyline"]) for row in moneyline
+            ),
+            odds_to_spread={
+                (row["posted_spread"], row["bet_price_text"]): row[
+                    "implied_spread_at_110"
+                ]
+                for row in odds
+            },
+        )
+
+    def point_value_percentage(self, point_spread: float) -> Optional[float]:
+        """Value percentage for a point spread as a fraction (0.08 = 8%)."""
+        idx = _exact_index(self.point_spreads, point_spread)
+        if idx is None:
+            return None
+        return self.point_value_pcts[idx] / 100.0
+
+    def buying_power_cost(self, point_spread: float) -> Optional[str]:
+        """Recommended max cost to buy a half point at this spread."""
+        idx = _exact_index(self.point_spreads, point_spread)
+        if idx is None:
+            return None
+        return self.buy_half_point_costs[idx]
+
+    def play_strength(self, edge_percentage: float) -> Optional[float]:
+        """Star rating for an edge (fraction, 0.14 = 14%), None below minimum."""
+        idx = bisect_right(self.play_strength_mins, edge_percentage * 100) - 1
+        if idx < 0:
+            return None
+        return self.play_strength_stars[idx]
+
+    def moneyline(self, point_spread: float) -> Optional[Tuple[int, int]]:
+        """(favorite_moneyline, dog_moneyline) for a point spread."""
+        idx = _exact_index(self.moneyline_spreads, point_spread)
+        if idx is None:
+            return None
+        return self.moneylines[idx]
+
+    def odds_adjusted_spread(
+        self, posted_spread: float, bet_price: str
+    ) -> Optional[float]:
+        """Effective spread at 110/100 vig for a posted spread and price."""
+        return (self.odds_to_spread or {}).get((posted_spread, bet_price))
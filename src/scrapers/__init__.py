@@ -11,6 +11,7 @@ Modules:
     nfl_com: Official NFL data
     massey: Power ratings
     weather: Game-day weather conditions
+    browser_pool: Shared Playwright browser for the browser-based scrapers
 """
 
 import sys
@@ -21,16 +22,41 @@ _project_root = Path(__file__).parent.parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from scrapers.action_network import ActionNetworkScraper
-from scrapers.espn import ESPNClient
-from scrapers.massey import MasseyRatingsScraper
-from scrapers.nfl_com import NFLComClient
-from scrapers.overtime import OvertimeApiClient
-from scrapers.weather import AccuWeatherClient, OpenWeatherClient, WeatherClient
+from typing import TYPE_CHECKING
+
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from scrapers.action_network import ActionNetworkScraper
+    from scrapers.browser_pool import BrowserPool
+    from scrapers.espn import ESPNClient
+    from scrapers.massey import MasseyRatingsScraper
+    from scrapers.nfl_com import NFLComClient
+    from scrapers.overtime import OvertimeApiClient
+    from scrapers.weather import AccuWeatherClient, OpenWeatherClient, WeatherClient
+
+# Exported name -> submodule. Submodules are imported on first attribute
+# access so `import scrapers.weather` does not also load Playwright, pandas
+# and every other scraper's dependencies.
+_EXPORTS = {
+    "ActionNetworkScraper": "scrapers.action_network",
+    "BrowserPool": "scrapers.browser_pool",
+    "ESPNClient": "scrapers.espn",
+    "MasseyRatingsScraper": "scrapers.massey",
+    "NFLComClient": "scrapers.nfl_com",
+    "OvertimeApiClient": "scrapers.overtime",
+    "AccuWeatherClient": "scrapers.weather",
+    "OpenWeatherClient": "scrapers.weather",
+    "WeatherClient": "scrapers.weather",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Action Network
     "ActionNetworkScraper",
+    # Shared Playwright browser
+    "BrowserPool",
     # ESPN
     "ESPNClient",
     # Massey Ratings
@@ -10,8 +10,11 @@ Key Features:
     - Sharp money detection with signal strength classification
     - Line movement tracking from opening spreads
     - CloudFlare bypass with stealth browser settings
+    - Append-only change log of per-game odds deltas (OddsChangeLog)
 """
 
+from scrapers.action_network.change_log import OddsChangeLog
+
 from scrapers.action_network.scraper import (
     ActionNetworkScraper,
     BettingPercentages,
@@ -28,4 +31,5 @@ __all__ = [
     "MoneylineLine",
     "TotalLine",
     "BettingPercentages",
+    "OddsChangeLog",
 ]
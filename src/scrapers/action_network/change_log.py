@@ -0,0 +1,283 @@
+"""
+Action Network Odds Change Log
+
+Append-only record of per-game odds changes, so repeated polls of the same
+board only cost disk space and parse time when something actually moved.
+
+Each poll hashes every game record (lines, odds, ticket/money percentages,
+opening line, sharp side). Only games whose hash changed are appended, plus
+a removal entry for games that dropped off the board. Board-level fields
+(sharp plays, divergence thresholds) are logged the same way, as one entry
+whenever they change. The full board at any point in time is rebuilt by
+replaying the log.
+
+Files (per league):
+    data/action_network/
+    ├── nfl_changes.jsonl            # One JSON entry per change
+    └── .nfl_changes_index.json      # Last hash per game + log offset
+
+The index is the resume point: on startup the collector loads it and
+replays only log entries written after it (e.g. after a crash), instead
+of the whole log.
+
+Entry format:
+    {"ts": "...", "league": "nfl", "week": 13, "op": "upsert",
+     "game_id": "256733", "hash": "...", "game": {...}}
+    {"ts": "...", "league": "nfl", "op": "remove", "game_id": "256733"}
+    {"ts": "...", "league": "nfl", "op": "board", "hash": "...",
+     "fields": {"sharp_plays": [...], "divergence_thresholds": {...}}}
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Hash index key for the board-level fields (never a game id)
+BOARD_KEY = "_board"
+
+
+class OddsChangeLog:
+    """Delta log of Action Network game records, one JSONL file per league"""
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize change log.
+
+        Args:
+            data_dir: Directory holding the change logs and their indexes
+        """
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._hashes: Dict[str, Dict[str, str]] = {}
+
+    def log_path(self, league: str) -> Path:
+        return self.data_dir / f"{league}_changes.jsonl"
+
+    def _index_path(self, league: str) -> Path:
+        return self.data_dir / f".{league}_changes_index.json"
+
+    @staticmethod
+    def game_hash(game: Dict[str, Any]) -> str:
+        """Stable hash of a game record"""
+        payload = json.dumps(game, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    # =================================================================
+    # WRITE
+    # =================================================================
+
+    def _load_hashes(self, league: str) -> Dict[str, str]:
+        """Current hash per game, from the index plus any newer log entries"""
+        if league in self._hashes:
+            return self._hashes[league]
+
+        hashes: Dict[str, str] = {}
+        offset = 0
+        index_path = self._index_path(league)
+        if index_path.exists():
+            try:
+                with open(index_path) as f:
+                    index = json.load(f)
+                hashes = index.get("hashes", {})
+                offset = index.get("offset", 0)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load {index_path}, replaying log: {e}")
+
+        log_path = self.log_path(league)
+        if log_path.exists() and offset > log_path.stat().st_size:
+            # Log was truncated or replaced; the index no longer applies
+            hashes, offset = {}, 0
+
+        replayed = 0
+        for entry in self._read(league, offset=offset):
+            replayed += 1
+            if entry.get("op") == "remove":
+                hashes.pop(entry["game_id"], None)
+            elif entry.get("op") == "board":
+                hashes[BOARD_KEY] = entry["hash"]
+            else:
+                hashes[entry["game_id"]] = entry["hash"]
+        if replayed:
+            logger.info(f"Replayed {replayed} {league} change log entries")
+
+        self._hashes[league] = hashes
+        return hashes
+
+    def _save_index(self, league: str) -> None:
+        log_path = self.log_path(league)
+        index = {
+            "offset": log_path.stat().st_size if log_path.exists() else 0,
+            "hashes": self._hashes.get(league, {}),
+            "updated_at": datetime.now().isoformat(),
+        }
+        index_path = self._index_path(league)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
+    def record(
+        self,
+        league: str,
+        games: List[Dict[str, Any]],
+        scraped_at: Optional[datetime] = None,
+        week: Optional[int] = None,
+        board_fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Append the games that changed since the last poll.
+
+        Args:
+            league: League identifier
+            games: Full board from this poll (game dicts with ``game_id``)
+            scraped_at: Poll time (default now)
+            week: Week of the board
+            board_fields: Board-level fields to carry into board(), e.g.
+                ``sharp_plays`` and ``divergence_thresholds`` (logged only
+                when they change)
+
+        Returns:
+            Entries written (empty if nothing changed)
+        """
+        hashes = self._load_hashes(league)
+        ts = (scraped_at or datetime.now()).isoformat()
+
+        entries: List[Dict[str, Any]] = []
+        on_board = set()
+        for game in games:
+            game_id = str(game["game_id"])
+            on_board.add(game_id)
+            game_hash = self.game_hash(game)
+            if hashes.get(game_id) == game_hash:
+                continue
+            hashes[game_id] = game_hash
+            entries.append(
+                {
+                    "ts": ts,
+                    "league": league,
+                    "week": game.get("week", week),
+                    "op": "upsert",
+                    "game_id": game_id,
+                    "hash": game_hash,
+                    "game": game,
+                }
+            )
+
+        for game_id in [g for g in hashes if g not in on_board | {BOARD_KEY}]:
+            del hashes[game_id]
+            entries.append(
+                {"ts": ts, "league": league, "op": "remove", "game_id": game_id}
+            )
+
+        if board_fields is not None:
+            fields_hash = self.game_hash(board_fields)
+            if hashes.get(BOARD_KEY) != fields_hash:
+                hashes[BOARD_KEY] = fields_hash
+                entries.append(
+                    {
+                        "ts": ts,
+                        "league": league,
+                        "op": "board",
+                        "hash": fields_hash,
+                        "fields": board_fields,
+                    }
+                )
+
+        if entries:
+            with open(self.log_path(league), "a") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+        self._save_index(league)
+
+        logger.info(
+            f"{league.upper()} change log: {len(entries)} changes "
+            f"across {len(games)} games"
+        )
+        return entries
+
+    # =================================================================
+    # READ
+    # =================================================================
+
+    def _read(self, league: str, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        log_path = self.log_path(league)
+        if not log_path.exists():
+            return
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Partial line from an interrupted write
+                    logger.warning(f"Skipping malformed entry in {log_path}")
+
+    def entries(
+        self,
+        league: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Log entries, optionally limited to a time window (inclusive)"""
+        start = since.isoformat() if since else None
+        end = until.isoformat() if until else None
+        for entry in self._read(league):
+            if start and entry["ts"] < start:
+                continue
+            if end and entry["ts"] > end:
+                break
+            yield entry
+
+    def board(self, league: str, as_of: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Rebuild the full board by replaying the log.
+
+        Args:
+            league: League identifier
+            as_of: Board as it stood at this time (default latest)
+
+        Returns:
+            Dict in the same format as ActionNetworkScraper.build_output
+            (source, league, week, scraped_at, game_count, games, plus the
+            last recorded board_fields such as sharp_plays and
+            divergence_thresholds)
+        """
+        games: Dict[str, Dict[str, Any]] = {}
+        fields: Dict[str, Any] = {}
+        last_ts = None
+        for entry in self.entries(league, until=as_of):
+            last_ts = entry["ts"]
+            if entry["op"] == "remove":
+                games.pop(entry["game_id"], None)
+            elif entry["op"] == "board":
+                fields = entry["fields"]
+            else:
+                games[entry["game_id"]] = entry["game"]
+
+        weeks = [game.get("week") or 0 for game in games.values()]
+        return {
+            "source": "action_network",
+            "league": league,
+            "week": max(weeks, default=0),
+            "scraped_at": last_ts,
+            "game_count": len(games),
+            "games": list(games.values()),
+            **fields,
+        }
+
+    def history(self, league: str, game_id: int | str) -> List[Dict[str, Any]]:
+        """Every recorded version of one game, oldest first, with its timestamp"""
+        game_id = str(game_id)
+        return [
+            {"ts": entry["ts"], **entry["game"]}
+            for entry in self._read(league)
+            if entry["op"] == "upsert" and entry["game_id"] == game_id
+        ]
@@ -8,6 +8,10 @@ betting system. Designed to be run as a background process or scheduled task.
 Features:
 - Configurable scrape intervals
 - Multiple league support (NFL, NCAAF)
+- Delta writes: only games whose odds changed are appended to a per-league
+  change log (``{league}_changes.jsonl``); the full board is rebuilt from it
+- Every scrape is also ingested into the Parquet odds snapshot store
+  (``data/odds_store``) for line-movement queries
 - Data retention and cleanup
 - Error recovery with exponential backoff
 - Logging with rotation
@@ -22,6 +26,9 @@ Usage:
     # Custom interval (in minutes)
     python action_network_collector.py --continuous --interval 120
 
+    # Rebuild the full NFL board from the change log
+    python action_network_collector.py --board nfl
+
 For Windows Task Scheduler:
     - Program: python
     - Arguments: action_network_collector.py --once
@@ -42,9 +49,11 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 try:
+    from scrapers.action_network.change_log import OddsChangeLog
     from scrapers.action_network.scraper import ActionNetworkScraper
 except ImportError:
     # Fallback for direct execution
+    from change_log import OddsChangeLog
     from scraper import ActionNetworkScraper
 
 # Configure logging
@@ -82,6 +91,8 @@ class ActionNetworkCollector:
         data_dir: Optional[Path] = None,
         interval_minutes: int = DEFAULT_INTERVAL_MINUTES,
         headless: bool = True,
+        delta: bool = True,
+        store_snapshots: bool = True,
     ):
         """
         Initialize collector.
@@ -90,6 +101,10 @@ class ActionNetworkCollector:
             data_dir: Directory for storing scraped data
             interval_minutes: Minutes between scrapes
             headless: Run browser in headless mode
+            delta: Append changed games to the change log instead of writing
+                a timestamped full snapshot every scrape
+            store_snapshots: Ingest every scrape into the odds snapshot store
+                next to the data directory (``<data_dir>/../odds_store``)
         """
         self.data_dir = (
             Path(data_dir)
@@ -100,7 +115,14 @@ class ActionNetworkCollector:
 
         self.interval_minutes = interval_minutes
         self.headless = headless
+        self.delta = delta
         self.scraper: Optional[ActionNetworkScraper] = None
+        self.change_log = OddsChangeLog(self.data_dir)
+        self.odds_store = None
+        if store_snapshots:
+            from walters_analyzer.query import OddsSnapshotStore
+
+            self.odds_store = OddsSnapshotStore(self.data_dir.parent / "odds_store")
 
         # State tracking
         self.last_scrape: Optional[datetime] = None
@@ -193,9 +215,25 @@ class ActionNetworkCollector:
                 games = await self.scraper.scrape_odds(league)
 
                 if games:
-                    filepath = self.scraper.save_data(games, league)
+                    output = self.scraper.build_output(games, league)
+                    changes = None
+                    if self.delta:
+                        changes = self.change_log.record(
+                            league,
+                            output["games"],
+                            scraped_at=datetime.fromisoformat(output["scraped_at"]),
+                            week=output["week"],
+                            board_fields={
+                                "sharp_plays": output["sharp_plays"],
+                                "divergence_thresholds": output[
+                                    "divergence_thresholds"
+                                ],
+                            },
+                        )
+                    filepath = self.scraper.write_output(output, archive=not self.delta)
+                    stored = self._store_snapshot(league, output)
                     # Use league-specific thresholds for sharp play detection
-                    sharp_plays = self.scraper.get_sharp_plays(games, league=league)
+                    sharp_plays = output["sharp_plays"]
                     min_div = self.scraper.get_min_divergence(league)
 
                     results[league] = {
@@ -205,6 +243,10 @@ class ActionNetworkCollector:
                         "filepath": str(filepath),
                         "min_divergence": min_div,
                     }
+                    if changes is not None:
+                        results[league]["changes"] = len(changes)
+                    if stored is not None:
+                        results[league]["stored"] = stored
 
                     logger.info(
                         f"Scraped {len(games)} {league.upper()} games, {len(sharp_plays)} sharp plays (threshold: {min_div}+)"
@@ -222,6 +264,30 @@ class ActionNetworkCollector:
 
         return results
 
+    def _store_snapshot(self, league: str, output: dict) -> Optional[int]:
+        """
+        Ingest one league's scrape into the odds snapshot store.
+
+        A store failure is logged, not raised: the JSON output is already
+        written, and the scrape can be re-ingested from it later.
+
+        Returns:
+            Rows written, or None if storing is off or failed
+        """
+        if self.odds_store is None:
+            return None
+        try:
+            return self.odds_store.ingest(
+                output["games"],
+                snapshot_at=datetime.fromisoformat(output["scraped_at"]),
+                source="action_network",
+                league=league,
+                week=output["week"],
+            )
+        except Exception as e:
+            logger.warning(f"Could not store {league.upper()} snapshot: {e}")
+            return None
+
     async def run_once(self) -> dict:
         """
         Run a single scrape cycle.
@@ -392,6 +458,9 @@ Examples:
     
     # Cleanup old files
     python action_network_collector.py --cleanup --days 14
+
+    # Rebuild the NFL board as it stood at a point in time
+    python action_network_collector.py --board nfl --as-of 2025-11-09T12:00:00
         """,
     )
 
@@ -419,6 +488,27 @@ Examples:
         "--no-headless", action="store_true", help="Show browser window"
     )
     parser.add_argument("--data-dir", type=str, help="Custom data directory")
+    parser.add_argument(
+        "--full-snapshots",
+        action="store_true",
+        help="Write a timestamped full board every scrape instead of the change log",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not ingest scrapes into the Parquet odds snapshot store",
+    )
+    parser.add_argument(
+        "--board",
+        type=str,
+        metavar="LEAGUE",
+        help="Rebuild the full board for LEAGUE from the change log and print it",
+    )
+    parser.add_argument(
+        "--as-of",
+        type=str,
+        help="With --board, rebuild the board as of this ISO timestamp",
+    )
 
     args = parser.parse_args()
 
@@ -430,8 +520,16 @@ Examples:
         data_dir=Path(args.data_dir) if args.data_dir else None,
         interval_minutes=args.interval,
         headless=headless,
+        delta=not args.full_snapshots,
+        store_snapshots=not args.no_store,
     )
 
+    if args.board:
+        as_of = datetime.fromisoformat(args.as_of) if args.as_of else None
+        board = collector.change_log.board(args.board, as_of=as_of)
+        print(json.dumps(board, indent=2))
+        return
+
     if args.status:
         status = collector.get_status()
         print("\n" + "=" * 50)
@@ -474,6 +572,8 @@ Examples:
                     print(f"\n{league.upper()}:")
                     print(f"  Games: {data['game_count']}")
                     print(f"  Sharp Plays: {data['sharp_plays']}")
+                    if "changes" in data:
+                        print(f"  Changed: {data['changes']}")
                     print(f"  File: {data['filepath']}")
                 else:
                     print(f"\n{league.upper()}: FAILED - {data.get('error')}")
@@ -19,13 +19,15 @@ from typing import Optional
 from dataclasses import dataclass, asdict, field
 
 try:
-    from playwright.async_api import async_playwright, Page, Browser
+    from playwright.async_api import Page
 except ImportError:
     print(
         "Playwright not installed. Run: pip install playwright && playwright install chromium"
     )
     raise
 
+from scrapers.browser_pool import BrowserPool, ContextProfile
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -213,64 +215,21 @@ class ActionNetworkScraper:
             return "MODERATE"
         return "NONE"
 
-    def __init__(self, headless: bool = True, data_dir: Optional[Path] = None):
-        """
-        Initialize scraper.
-
-        Args:
-            headless: Run browser in headless mode
-            data_dir: Directory to save scraped data
-        """
-        self.headless = headless
-        self.data_dir = Path(data_dir) if data_dir else Path("data/action_network")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-
-        self.browser: Optional[Browser] = None
-        self.context = None
-        self.page: Optional[Page] = None
-        self.playwright = None
-
-    async def initialize(self):
-        """Initialize Playwright browser with anti-detection settings."""
-        self.playwright = await async_playwright().start()
-
-        # Launch options with stealth settings
-        launch_options = {
-            "headless": self.headless,
-            "args": [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-accelerated-2d-canvas",
-                "--disable-gpu",
-            ],
-        }
-
-        self.browser = await self.playwright.chromium.launch(**launch_options)
-
-        # Create context with realistic browser fingerprint
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            locale="en-US",
-            timezone_id="America/New_York",
-            color_scheme="light",
-            extra_http_headers={
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            },
-        )
-
-        self.page = await self.context.new_page()
-
-        # Add stealth scripts to evade detection
-        await self.page.add_init_script("""
+    # Isolated context with a realistic fingerprint; cookies (e.g. CloudFlare
+    # clearance) persist between runs
+    BROWSER_PROFILE = ContextProfile(
+        "action_network",
+        locale="en-US",
+        timezone_id="America/New_York",
+        extra_http_headers={
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate, br",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        },
+        # Stealth scripts to evade detection
+        init_script="""
             // Hide webdriver property
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => false
@@ -296,20 +255,54 @@ class ActionNetworkScraper:
             Object.defineProperty(navigator, 'languages', {
                 get: () => ['en-US', 'en']
             });
-        """)
+        """,
+        persist_state=True,
+        options={"color_scheme": "light"},
+    )
+
+    def __init__(
+        self,
+        headless: bool = True,
+        data_dir: Optional[Path] = None,
+        pool: Optional[BrowserPool] = None,
+    ):
+        """
+        Initialize scraper.
+
+        Args:
+            headless: Run browser in headless mode (when the scraper opens its
+                own pool)
+            data_dir: Directory to save scraped data
+            pool: Shared browser pool (default: one opened by initialize()
+                and closed by close())
+        """
+        self.headless = headless
+        self.data_dir = Path(data_dir) if data_dir else Path("data/action_network")
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        self.pool = pool
+        self._owns_pool = pool is None
+        self.page: Optional[Page] = None
+
+    async def initialize(self):
+        """Lease a page from the browser pool with anti-detection settings."""
+        if self.pool is None:
+            self.pool = BrowserPool(headless=self.headless)
+        await self.pool.start()
+        self.page = await self.pool.acquire(self.BROWSER_PROFILE)
 
         logger.info("Browser initialized with stealth settings")
 
-    async def _wait_for_cloudflare(self):
+    async def _wait_for_cloudflare(self, page: Page):
         """Handle CloudFlare challenge if present."""
         try:
-            await self.page.wait_for_selector("body", timeout=5000)
+            await page.wait_for_selector("body", timeout=5000)
 
             # Check for CloudFlare challenge
-            cf_check = await self.page.locator('text="Checking your browser"').count()
+            cf_check = await page.locator('text="Checking your browser"').count()
             if cf_check > 0:
                 logger.info("CloudFlare challenge detected, waiting...")
-                await self.page.wait_for_selector(
+                await page.wait_for_selector(
                     'text="Checking your browser"', state="hidden", timeout=30000
                 )
                 await asyncio.sleep(2)
@@ -318,16 +311,16 @@ class ActionNetworkScraper:
         except Exception as e:
             logger.debug(f"No CloudFlare challenge or already passed: {e}")
 
-    async def _extract_next_data(self) -> Optional[dict]:
+    async def _extract_next_data(self, page: Page) -> Optional[dict]:
         """Extract __NEXT_DATA__ JSON from page."""
         try:
             # Wait for the script to be attached to DOM (not visible - script tags are always hidden)
-            await self.page.wait_for_selector(
+            await page.wait_for_selector(
                 "script#__NEXT_DATA__", state="attached", timeout=10000
             )
 
             # Extract JSON content
-            script_content = await self.page.evaluate("""
+            script_content = await page.evaluate("""
                 () => {
                     const script = document.getElementById('__NEXT_DATA__');
                     return script ? script.textContent : null;
@@ -464,16 +457,20 @@ class ActionNetworkScraper:
             else:
                 game.under = total_line
 
-    async def scrape_odds(self, league: str = "nfl") -> list[GameOdds]:
+    async def scrape_odds(
+        self, league: str = "nfl", page: Optional[Page] = None
+    ) -> list[GameOdds]:
         """
         Scrape odds for a specific league.
 
         Args:
             league: 'nfl', 'ncaaf', 'nba', or 'ncaab'
+            page: Page to scrape with (default: the scraper's leased page)
 
         Returns:
             List of GameOdds objects
         """
+        page = page or self.page
         url = self.URLS.get(league.lower())
         if not url:
             raise ValueError(f"Unknown league: {league}")
@@ -486,8 +483,8 @@ class ActionNetworkScraper:
             # Navigate with retries
             for attempt in range(3):
                 try:
-                    await self.page.goto(url, wait_until="networkidle", timeout=60000)
-                    await self._wait_for_cloudflare()
+                    await page.goto(url, wait_until="networkidle", timeout=60000)
+                    await self._wait_for_cloudflare(page)
                     break
                 except Exception as e:
                     logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -499,14 +496,12 @@ class ActionNetworkScraper:
             await asyncio.sleep(3)
 
             # Extract __NEXT_DATA__
-            data = await self._extract_next_data()
+            data = await self._extract_next_data(page)
 
             if not data:
                 logger.error("Failed to extract __NEXT_DATA__")
                 # Save screenshot for debugging
-                await self.page.screenshot(
-                    path=str(self.data_dir / "error_screenshot.png")
-                )
+                await page.screenshot(path=str(self.data_dir / "error_screenshot.png"))
                 return games
 
             # Parse games - __NEXT_DATA__ structure is props.pageProps
@@ -524,7 +519,7 @@ class ActionNetworkScraper:
 
         except Exception as e:
             logger.error(f"Error scraping {league}: {e}")
-            await self.page.screenshot(path=str(self.data_dir / f"error_{league}.png"))
+            await page.screenshot(path=str(self.data_dir / f"error_{league}.png"))
 
         return games
 
@@ -536,6 +531,27 @@ class ActionNetworkScraper:
         """Convenience method for NCAAF odds."""
         return await self.scrape_odds("ncaaf")
 
+    async def scrape_leagues(
+        self, leagues: tuple[str, ...] = ("nfl", "ncaaf")
+    ) -> dict[str, list[GameOdds]]:
+        """
+        Scrape several leagues in parallel, each on its own pooled page.
+
+        Pages share the scraper's browser context, so CloudFlare clearance
+        from one page carries over to the others.
+
+        Returns:
+            League -> list of GameOdds
+        """
+        if self.pool is None:
+            await self.initialize()
+        results = await self.pool.map(
+            lambda page, league: self.scrape_odds(league, page=page),
+            leagues,
+            self.BROWSER_PROFILE,
+        )
+        return dict(zip(leagues, results))
+
     def get_sharp_plays(
         self,
         games: list[GameOdds],
@@ -658,7 +674,26 @@ class ActionNetworkScraper:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now()
+        return self.write_output(self.build_output(games, league))
+
+    def build_output(
+        self,
+        games: list[GameOdds],
+        league: str = "nfl",
+        timestamp: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Build the saved board document (games, sharp plays, thresholds).
+
+        Args:
+            games: List of GameOdds
+            league: League identifier
+            timestamp: Scrape time (default now)
+
+        Returns:
+            Dict in the format written by save_data
+        """
+        timestamp = timestamp or datetime.now()
 
         # Determine week number from first game
         week = games[0].week if games else 0
@@ -751,34 +786,52 @@ class ActionNetworkScraper:
             league, self.DIVERGENCE_THRESHOLDS["nfl"]
         )
 
-        # Save to file
-        filename = (
-            f"{league}_odds_week{week}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-        )
-        filepath = self.data_dir / filename
+        return output
 
-        with open(filepath, "w") as f:
-            json.dump(output, f, indent=2)
+    def write_output(self, output: dict, archive: bool = True) -> Path:
+        """
+        Write a board document from build_output.
 
-        logger.info(f"Saved data to {filepath}")
+        Args:
+            output: Board document
+            archive: Also write a timestamped copy (False writes only
+                ``{league}_odds_latest.json``, for collectors that keep
+                history in the change log instead)
 
-        # Also save a "latest" symlink/copy
+        Returns:
+            Path to the timestamped file, or the latest file if not archived
+        """
+        league = output["league"]
         latest_path = self.data_dir / f"{league}_odds_latest.json"
+        filepath = latest_path
+
+        if archive:
+            timestamp = datetime.fromisoformat(output["scraped_at"])
+            filename = (
+                f"{league}_odds_week{output['week']}_"
+                f"{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+            )
+            filepath = self.data_dir / filename
+
+            with open(filepath, "w") as f:
+                json.dump(output, f, indent=2)
+
+            logger.info(f"Saved data to {filepath}")
+
+        # Also save a "latest" symlink/copy
         with open(latest_path, "w") as f:
             json.dump(output, f, indent=2)
 
         return filepath
 
     async def close(self):
-        """Close browser and cleanup."""
-        if self.page:
-            await self.page.close()
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        """Return the page to the pool (closing the pool if this scraper owns it)."""
+        if self.page and self.pool:
+            await self.pool.release(self.page)
+        self.page = None
+        if self._owns_pool and self.pool:
+            await self.pool.close()
+            self.pool = None
         logger.info("Browser closed")
 
 
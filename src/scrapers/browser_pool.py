@@ -0,0 +1,358 @@
+"""
+Shared Playwright Browser Pool
+
+One warm Chromium process shared by every Playwright scraper (Massey,
+Action Network, NFL.com). Each scraper gets its own isolated browser
+context (cookies, storage, fingerprint, proxy) described by a
+ContextProfile, and leases pages from it:
+
+    async with BrowserPool() as pool:
+        async with pool.page(MASSEY_PROFILE) as page:
+            await page.goto(url)
+
+        # Independent scrapes run in parallel, bounded by max_pages
+        results = await pool.map(scrape_one, urls, MASSEY_PROFILE)
+
+Released pages go back to their context's idle list and are reused by the
+next lease. Every context routes requests through one handler that aborts
+images, media, fonts and ad/analytics hosts. Profiles with
+``persist_state`` save cookies and localStorage to ``state_dir`` when the
+pool closes and load them again the next time the context is created
+(e.g. Cloudflare clearance cookies for Action Network).
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+    async_playwright,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_STATE_DIR = Path("data/browser_state")
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Union of the flags the scrapers used when each launched its own browser
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-web-security",
+    "--disable-features=IsolateOrigins",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-accelerated-2d-canvas",
+    "--disable-gpu",
+]
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+BLOCKED_URL_PARTS = (
+    "doubleclick.net",
+    "googlesyndication",
+    "googletagmanager",
+    "google-analytics",
+    "advertising",
+    "analytics",
+    "tracking",
+    "adnxs.com",
+    "amazon-adsystem",
+    "rubiconproject",
+    "pubmatic",
+    "criteo",
+)
+
+
+@dataclass
+class ContextProfile:
+    """Settings for one isolated browser context, shared by all its pages."""
+
+    name: str
+    user_agent: str = DEFAULT_USER_AGENT
+    viewport: Dict[str, int] = field(
+        default_factory=lambda: {"width": 1920, "height": 1080}
+    )
+    locale: Optional[str] = None
+    timezone_id: Optional[str] = None
+    extra_http_headers: Dict[str, str] = field(default_factory=dict)
+    proxy: Optional[Dict[str, str]] = None
+    init_script: Optional[str] = None
+    block_resources: bool = True
+    persist_state: bool = False
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    def context_options(self) -> Dict[str, Any]:
+        """Keyword arguments for Browser.new_context"""
+        options: Dict[str, Any] = {
+            "user_agent": self.user_agent,
+            "viewport": self.viewport,
+        }
+        if self.locale:
+            options["locale"] = self.locale
+        if self.timezone_id:
+            options["timezone_id"] = self.timezone_id
+        if self.extra_http_headers:
+            options["extra_http_headers"] = self.extra_http_headers
+        if self.proxy:
+            options["proxy"] = self.proxy
+        options.update(self.options)
+        return options
+
+
+DEFAULT_PROFILE = ContextProfile("default")
+
+
+async def _route_request(route: Route) -> None:
+    """Abort heavy or tracking requests; let everything else through"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    One Chromium process with per-profile contexts and leased pages.
+
+    Usage:
+        pool = BrowserPool()
+        await pool.start()
+        page = await pool.acquire(profile)
+        ...
+        await pool.release(page)
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages: int = 4,
+        state_dir: Path | str = DEFAULT_STATE_DIR,
+        launch_args: Optional[List[str]] = None,
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            headless: Run the browser in headless mode
+            max_pages: Maximum pages leased at once across all contexts
+            state_dir: Where persisted context storage state is kept
+            launch_args: Chromium flags (default LAUNCH_ARGS)
+        """
+        self.headless = headless
+        self.max_pages = max_pages
+        self.state_dir = Path(state_dir)
+        self.launch_args = launch_args if launch_args is not None else LAUNCH_ARGS
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._contexts: Dict[str, BrowserContext] = {}
+        self._profiles: Dict[str, ContextProfile] = {}
+        self._idle: Dict[str, List[Page]] = {}
+        self._leases: Dict[Page, str] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def is_running(self) -> bool:
+        return self._browser is not None
+
+    async def start(self) -> None:
+        """Launch the shared browser (no-op if already running)"""
+        async with self._lock:
+            if self._browser is not None:
+                return
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=self.launch_args
+            )
+            self._slots = asyncio.Semaphore(self.max_pages)
+            logger.info(f"Browser pool started (max {self.max_pages} pages)")
+
+    async def close(self) -> None:
+        """Save persisted state, then close every context and the browser"""
+        for name, context in list(self._contexts.items()):
+            try:
+                if self._profiles[name].persist_state:
+                    await self._save_state(name, context)
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context {name}: {e}")
+
+        self._contexts.clear()
+        self._profiles.clear()
+        self._idle.clear()
+        self._leases.clear()
+
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool closed")
+
+    def state_path(self, profile: ContextProfile) -> Path:
+        """File holding a profile's persisted cookies and localStorage"""
+        return self.state_dir / f"{profile.name}.json"
+
+    async def _save_state(self, name: str, context: BrowserContext) -> None:
+        path = self.state_path(self._profiles[name])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(path))
+        logger.debug(f"Saved browser state for {name} to {path}")
+
+    async def save_state(self, profile: ContextProfile) -> None:
+        """Persist a profile's storage state now (also done on close)"""
+        context = self._contexts.get(profile.name)
+        if context is not None:
+            await self._save_state(profile.name, context)
+
+    async def context(
+        self, profile: ContextProfile = DEFAULT_PROFILE
+    ) -> BrowserContext:
+        """The profile's browser context, created on first use"""
+        if self._browser is None:
+            await self.start()
+
+        async with self._lock:
+            context = self._contexts.get(profile.name)
+            if context is not None:
+                return context
+
+            options = profile.context_options()
+            state_file = self.state_path(profile)
+            if profile.persist_state and state_file.exists():
+                options["storage_state"] = str(state_file)
+                logger.info(f"Reusing stored browser state for {profile.name}")
+
+            context = await self._browser.new_context(**options)
+            if profile.init_script:
+                await context.add_init_script(profile.init_script)
+            if profile.block_resources:
+                await context.route("**/*", _route_request)
+
+            self._contexts[profile.name] = context
+            self._profiles[profile.name] = profile
+            self._idle[profile.name] = []
+            return context
+
+    async def acquire(self, profile: ContextProfile = DEFAULT_PROFILE) -> Page:
+        """
+        Lease a page in the profile's context, waiting while max_pages are out.
+
+        Callers must hand the page back with release() (or use page()) and
+        remove any event listeners they added.
+        """
+        context = await self.context(profile)
+        await self._slots.acquire()
+        try:
+            idle = self._idle[profile.name]
+            while idle:
+                page = idle.pop()
+                if not page.is_closed():
+                    break
+            else:
+                page = await context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._leases[page] = profile.name
+        return page
+
+    async def release(self, page: Page, reuse: bool = True) -> None:
+        """
+        Return a leased page to its context's idle list.
+
+        Args:
+            page: Page from acquire()
+            reuse: Keep the page for the next lease (False closes it, e.g.
+                after an error left it in an unknown state)
+        """
+        name = self._leases.pop(page, None)
+        if name is None:
+            return
+        try:
+            if reuse and not page.is_closed() and name in self._idle:
+                await page.goto("about:blank")
+                self._idle[name].append(page)
+            elif not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Discarding page from {name}: {e}")
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(
+        self, profile: ContextProfile = DEFAULT_PROFILE
+    ) -> AsyncIterator[Page]:
+        """Lease a page for the duration of an ``async with`` block"""
+        page = await self.acquire(profile)
+        ok = False
+        try:
+            yield page
+            ok = True
+        finally:
+            await self.release(page, reuse=ok)
+
+    async def map(
+        self,
+        scrape: Callable[[Page, T], Awaitable[R]],
+        items: Iterable[T],
+        profile: ContextProfile = DEFAULT_PROFILE,
+        return_exceptions: bool = False,
+    ) -> List[R]:
+        """
+        Run ``scrape(page, item)`` for every item in parallel on leased pages.
+
+        Returns:
+            Results in item order (exceptions in place of results if
+            return_exceptions is True)
+        """
+
+        async def run(item: T) -> R:
+            async with self.page(profile) as page:
+                return await scrape(page, item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=return_exceptions
+        )
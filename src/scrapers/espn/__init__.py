@@ -18,17 +18,39 @@ Clients:
     ESPNNCAAFNormalizer: Team name normalization
 """
 
-from scrapers.espn.client import ESPNClient
-from scrapers.espn.injuries import ESPNInjuryScraper
-from scrapers.espn.ncaaf_news import ESPNNCAAFNewsClient
-from scrapers.espn.ncaaf_normalizer import ESPNNCAAFNormalizer
-from scrapers.espn.ncaaf_scoreboard import ESPNNCAAFScoreboardClient
-from scrapers.espn.ncaaf_team import ESPNNcaafTeamScraper
-from scrapers.espn.ncaaf_transactions import ESPNNCAAFTransactionsClient
-from scrapers.espn.news import ESPNNewsClient
-from scrapers.espn.nfl_scoreboard import ESPNNFLScoreboardClient
-from scrapers.espn.player_stats import ESPNPlayerStatsClient
-from scrapers.espn.transactions import ESPNTransactionsClient
+from typing import TYPE_CHECKING
+
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from scrapers.espn.client import ESPNClient
+    from scrapers.espn.injuries import ESPNInjuryScraper
+    from scrapers.espn.ncaaf_news import ESPNNCAAFNewsClient
+    from scrapers.espn.ncaaf_normalizer import ESPNNCAAFNormalizer
+    from scrapers.espn.ncaaf_scoreboard import ESPNNCAAFScoreboardClient
+    from scrapers.espn.ncaaf_team import ESPNNcaafTeamScraper
+    from scrapers.espn.ncaaf_transactions import ESPNNCAAFTransactionsClient
+    from scrapers.espn.news import ESPNNewsClient
+    from scrapers.espn.nfl_scoreboard import ESPNNFLScoreboardClient
+    from scrapers.espn.player_stats import ESPNPlayerStatsClient
+    from scrapers.espn.transactions import ESPNTransactionsClient
+
+# Exported name -> submodule, imported on first attribute access
+_EXPORTS = {
+    "ESPNClient": "scrapers.espn.client",
+    "ESPNInjuryScraper": "scrapers.espn.injuries",
+    "ESPNNCAAFNewsClient": "scrapers.espn.ncaaf_news",
+    "ESPNNCAAFNormalizer": "scrapers.espn.ncaaf_normalizer",
+    "ESPNNCAAFScoreboardClient": "scrapers.espn.ncaaf_scoreboard",
+    "ESPNNcaafTeamScraper": "scrapers.espn.ncaaf_team",
+    "ESPNNCAAFTransactionsClient": "scrapers.espn.ncaaf_transactions",
+    "ESPNNewsClient": "scrapers.espn.news",
+    "ESPNNFLScoreboardClient": "scrapers.espn.nfl_scoreboard",
+    "ESPNPlayerStatsClient": "scrapers.espn.player_stats",
+    "ESPNTransactionsClient": "scrapers.espn.transactions",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "ESPNClient",
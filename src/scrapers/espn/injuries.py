@@ -2,13 +2,21 @@
 """
 Simple ESPN Injury Scraper
 Fetches NFL and NCAA FBS injury reports directly from ESPN API
+
+Team injury reports are fetched concurrently over one pooled
+httpx.AsyncClient (HTTP/2 when the h2 package is installed), bounded by a
+concurrency limit and a token-bucket rate limit. Parsed injuries can be
+streamed to a JSONL file as each team's report arrives.
 """
 
+import asyncio
+import importlib.util
 import json
 import os
+import time
 import httpx
 from datetime import datetime
-from typing import Dict, List
+from typing import IO, Dict, List, Optional
 import logging
 
 logging.basicConfig(
@@ -16,194 +24,282 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests/sec, bursting up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 class ESPNInjuryScraper:
     """Scraper for ESPN injury data using their internal API"""
 
-    def __init__(self, output_dir: str = "output/injuries"):
+    def __init__(
+        self,
+        output_dir: str = "output/injuries",
+        max_concurrency: int = 8,
+        requests_per_second: float = 10.0,
+        timeout: float = 10.0,
+    ):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
 
         # ESPN uses internal APIs - these are the actual endpoints
         self.base_url = "https://site.api.espn.com/apis/site/v2/sports"
 
-    def scrape_nfl_injuries(self) -> List[Dict]:
-        """
-        Scrape NFL injury data from ESPN API
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._bucket: TokenBucket | None = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open the pooled HTTP client shared by every team request"""
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+            headers={"Accept": "application/json"},
+            follow_redirects=True,
+        )
+        self._bucket = TokenBucket(self.requests_per_second)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None) -> Dict:
+        await self._bucket.acquire()
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _parse_injury(injury: Dict, team: Dict, sport: str, league: str) -> Dict:
+        athlete = injury.get("athlete", {})
+        status = injury.get("status", {})
+
+        return {
+            "source": "espn",
+            "sport": sport,
+            "league": league,
+            "team": team.get("displayName", "Unknown"),
+            "team_abbr": team.get("abbreviation", ""),
+            "team_id": team.get("id"),
+            "player_name": athlete.get("displayName", ""),
+            "player_id": athlete.get("id"),
+            "position": athlete.get("position", {}).get("abbreviation", ""),
+            "injury_status": status.get("type", ""),
+            "injury_description": status.get("description", ""),
+            "injury_detail": injury.get("details", {}).get("detail", ""),
+            "date_reported": injury.get("date", datetime.now().isoformat()),
+            "collected_at": datetime.now().isoformat(),
+        }
+
+    async def _fetch_team_injuries(
+        self,
+        semaphore: asyncio.Semaphore,
+        sport_path: str,
+        team: Dict,
+        sport: str,
+        league: str,
+    ) -> List[Dict]:
+        team_name = team.get("displayName", "Unknown")
+
+        # ESPN injury endpoint per team
+        injury_url = (
+            f"{self.base_url}/football/{sport_path}/teams/{team.get('id')}/injuries"
+        )
 
-        Returns:
-            List of injury dictionaries
+        try:
+            async with semaphore:
+                injury_data = await self._get_json(injury_url)
+        except httpx.HTTPStatusError as e:
+            # Many FBS teams have no injury report at all
+            if e.response.status_code == 404:
+                logger.debug(f"No injuries for {team_name}")
+            else:
+                logger.warning(f"Could not fetch injuries for {team_name}: {e}")
+            return []
+        except (httpx.RequestError, ValueError) as e:
+            logger.warning(f"Could not fetch injuries for {team_name}: {e}")
+            return []
+
+        team_injuries = [
+            self._parse_injury(injury, team, sport, league)
+            for injury in injury_data.get("injuries", [])
+        ]
+        if team_injuries:
+            logger.info(f"  {team_name}: {len(team_injuries)} injuries")
+        return team_injuries
+
+    async def scrape_injuries_async(
+        self,
+        sport_path: str,
+        sport: str,
+        league: str,
+        teams_params: Optional[Dict] = None,
+        max_teams: Optional[int] = None,
+        filename: Optional[str] = None,
+    ) -> List[Dict]:
         """
-        logger.info("Scraping NFL injuries from ESPN...")
+        Scrape every team's injury report for one league concurrently.
 
-        injuries = []
+        Args:
+            sport_path: ESPN API sport segment (e.g. "nfl", "college-football")
+            sport: Value for each record's "sport" field
+            league: Value for each record's "league" field
+            teams_params: Query params for the teams listing
+            max_teams: Only scrape the first N teams (None = all)
+            filename: If given, stream records to ``<filename>.jsonl`` in
+                output_dir as they arrive and write the JSON array at the end
 
-        # ESPN API endpoint for NFL teams
-        teams_url = f"{self.base_url}/football/nfl/teams"
+        Returns:
+            List of injury dictionaries, in team order
+        """
+        opened = self._client is None
+        if opened:
+            await self.connect()
 
+        stream: IO[str] | None = None
         try:
-            response = httpx.get(teams_url, timeout=10)
-            response.raise_for_status()
-            teams_data = response.json()
-
-            # Get all NFL teams
-            teams = (
-                teams_data.get("sports", [{}])[0]
+            teams_data = await self._get_json(
+                f"{self.base_url}/football/{sport_path}/teams", params=teams_params
+            )
+            teams = [
+                team_info.get("team", {})
+                for team_info in teams_data.get("sports", [{}])[0]
                 .get("leagues", [{}])[0]
                 .get("teams", [])
-            )
-
-            logger.info(f"Found {len(teams)} NFL teams")
-
-            # For each team, get their injury report
-            for team_info in teams:
-                team = team_info.get("team", {})
-                team_id = team.get("id")
-                team_name = team.get("displayName", "Unknown")
-                team_abbr = team.get("abbreviation", "")
-
-                # ESPN injury endpoint per team
-                injury_url = f"{self.base_url}/football/nfl/teams/{team_id}/injuries"
-
-                try:
-                    injury_response = httpx.get(injury_url, timeout=10)
-                    injury_response.raise_for_status()
-                    injury_data = injury_response.json()
-
-                    # Parse injuries
-                    team_injuries = injury_data.get("injuries", [])
-
+            ]
+            logger.info(f"Found {len(teams)} {league} teams")
+            if max_teams is not None:
+                teams = teams[:max_teams]
+
+            if filename:
+                filepath = os.path.join(self.output_dir, filename)
+                stream = open(filepath.replace(".json", ".jsonl"), "w")
+
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch(i: int, team: Dict) -> tuple[int, List[Dict]]:
+                return i, await self._fetch_team_injuries(
+                    semaphore, sport_path, team, sport, league
+                )
+
+            # Write each team's report as soon as it lands; return in team order
+            by_team: List[List[Dict]] = [[] for _ in teams]
+            for next_done in asyncio.as_completed(
+                [fetch(i, team) for i, team in enumerate(teams)]
+            ):
+                i, team_injuries = await next_done
+                by_team[i] = team_injuries
+                if stream:
                     for injury in team_injuries:
-                        athlete = injury.get("athlete", {})
-                        status = injury.get("status", {})
-
-                        injuries.append(
-                            {
-                                "source": "espn",
-                                "sport": "nfl",
-                                "league": "NFL",
-                                "team": team_name,
-                                "team_abbr": team_abbr,
-                                "team_id": team_id,
-                                "player_name": athlete.get("displayName", ""),
-                                "player_id": athlete.get("id"),
-                                "position": athlete.get("position", {}).get(
-                                    "abbreviation", ""
-                                ),
-                                "injury_status": status.get("type", ""),
-                                "injury_description": status.get("description", ""),
-                                "injury_detail": injury.get("details", {}).get(
-                                    "detail", ""
-                                ),
-                                "date_reported": injury.get(
-                                    "date", datetime.now().isoformat()
-                                ),
-                                "collected_at": datetime.now().isoformat(),
-                            }
-                        )
-
-                    if team_injuries:
-                        logger.info(f"  {team_name}: {len(team_injuries)} injuries")
-
-                except Exception as e:
-                    logger.warning(f"Could not fetch injuries for {team_name}: {e}")
-                    continue
-
-            logger.info(f"Total NFL injuries collected: {len(injuries)}")
-            return injuries
-
-        except Exception as e:
-            logger.error(f"Error scraping NFL injuries: {e}")
-            return []
+                        stream.write(json.dumps(injury) + "\n")
+                    stream.flush()
 
-    def scrape_ncaaf_injuries(self) -> List[Dict]:
+            injuries = [injury for batch in by_team for injury in batch]
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Error scraping {league} injuries: {e}")
+            return []
+        finally:
+            if stream:
+                stream.close()
+            if opened:
+                await self.close()
+
+        if filename:
+            with open(filepath, "w") as f:
+                json.dump(injuries, f, indent=2)
+            logger.info(f"Saved {len(injuries)} injuries to {filepath}")
+
+        logger.info(f"Total {league} injuries collected: {len(injuries)}")
+        return injuries
+
+    async def scrape_nfl_injuries_async(
+        self, filename: Optional[str] = None
+    ) -> List[Dict]:
         """
-        Scrape NCAA FBS injury data from ESPN API
+        Scrape NFL injury data from ESPN API concurrently
 
         Returns:
             List of injury dictionaries
         """
-        logger.info("Scraping NCAA FBS injuries from ESPN...")
-
-        injuries = []
-
-        # ESPN API endpoint for college football teams (FBS)
-        teams_url = f"{self.base_url}/football/college-football/teams"
-
-        try:
-            response = httpx.get(teams_url, timeout=10)
-            response.raise_for_status()
-            teams_data = response.json()
-
-            # Get all FBS teams
-            teams = (
-                teams_data.get("sports", [{}])[0]
-                .get("leagues", [{}])[0]
-                .get("teams", [])
-            )
+        logger.info("Scraping NFL injuries from ESPN...")
+        return await self.scrape_injuries_async("nfl", "nfl", "NFL", filename=filename)
 
-            logger.info(f"Found {len(teams)} NCAA FBS teams")
+    async def scrape_ncaaf_injuries_async(
+        self, max_teams: Optional[int] = None, filename: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Scrape NCAA FBS injury data from ESPN API concurrently
 
-            # For top 50 teams (to avoid API rate limits)
-            for team_info in teams[:50]:  # Limit to avoid long scrapes
-                team = team_info.get("team", {})
-                team_id = team.get("id")
-                team_name = team.get("displayName", "Unknown")
-                team_abbr = team.get("abbreviation", "")
+        Returns:
+            List of injury dictionaries
+        """
+        logger.info("Scraping NCAA FBS injuries from ESPN...")
+        return await self.scrape_injuries_async(
+            "college-football",
+            "college_football",
+            "NCAAF",
+            # groups=80 is FBS; the default listing is paged
+            teams_params={"groups": 80, "limit": 200},
+            max_teams=max_teams,
+            filename=filename,
+        )
 
-                # ESPN injury endpoint per team
-                injury_url = f"{self.base_url}/football/college-football/teams/{team_id}/injuries"
+    def scrape_nfl_injuries(self) -> List[Dict]:
+        """
+        Scrape NFL injury data from ESPN API
 
-                try:
-                    injury_response = httpx.get(injury_url, timeout=10)
-                    injury_response.raise_for_status()
-                    injury_data = injury_response.json()
+        Returns:
+            List of injury dictionaries
+        """
+        return asyncio.run(self.scrape_nfl_injuries_async())
 
-                    # Parse injuries
-                    team_injuries = injury_data.get("injuries", [])
+    def scrape_ncaaf_injuries(self, max_teams: Optional[int] = None) -> List[Dict]:
+        """
+        Scrape NCAA FBS injury data from ESPN API
 
-                    for injury in team_injuries:
-                        athlete = injury.get("athlete", {})
-                        status = injury.get("status", {})
-
-                        injuries.append(
-                            {
-                                "source": "espn",
-                                "sport": "college_football",
-                                "league": "NCAAF",
-                                "team": team_name,
-                                "team_abbr": team_abbr,
-                                "team_id": team_id,
-                                "player_name": athlete.get("displayName", ""),
-                                "player_id": athlete.get("id"),
-                                "position": athlete.get("position", {}).get(
-                                    "abbreviation", ""
-                                ),
-                                "injury_status": status.get("type", ""),
-                                "injury_description": status.get("description", ""),
-                                "injury_detail": injury.get("details", {}).get(
-                                    "detail", ""
-                                ),
-                                "date_reported": injury.get(
-                                    "date", datetime.now().isoformat()
-                                ),
-                                "collected_at": datetime.now().isoformat(),
-                            }
-                        )
-
-                    if team_injuries:
-                        logger.info(f"  {team_name}: {len(team_injuries)} injuries")
-
-                except Exception:
-                    logger.debug(f"No injuries for {team_name}")
-                    continue
-
-            logger.info(f"Total NCAA FBS injuries collected: {len(injuries)}")
-            return injuries
-
-        except Exception as e:
-            logger.error(f"Error scraping NCAA FBS injuries: {e}")
-            return []
+        Returns:
+            List of injury dictionaries
+        """
+        return asyncio.run(self.scrape_ncaaf_injuries_async(max_teams=max_teams))
 
     def save_injuries(self, injuries: List[Dict], filename: str):
         """Save injuries to JSON file"""
@@ -223,30 +319,27 @@ class ESPNInjuryScraper:
         logger.info(f"Saved JSONL to {jsonl_filepath}")
 
 
-def main():
-    """Main entry point"""
-    scraper = ESPNInjuryScraper()
-
-    # Scrape NFL injuries
-    logger.info("=" * 60)
-    logger.info("NFL INJURY SCRAPER")
-    logger.info("=" * 60)
-    nfl_injuries = scraper.scrape_nfl_injuries()
-
-    if nfl_injuries:
+async def _main():
+    # One pooled client for both leagues
+    async with ESPNInjuryScraper() as scraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        scraper.save_injuries(nfl_injuries, f"nfl_injuries_{timestamp}.json")
 
-    # Scrape NCAA FBS injuries
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info("NCAA FBS INJURY SCRAPER")
-    logger.info("=" * 60)
-    ncaaf_injuries = scraper.scrape_ncaaf_injuries()
-
-    if ncaaf_injuries:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        scraper.save_injuries(ncaaf_injuries, f"ncaaf_injuries_{timestamp}.json")
+        # Scrape NFL injuries
+        logger.info("=" * 60)
+        logger.info("NFL INJURY SCRAPER")
+        logger.info("=" * 60)
+        nfl_injuries = await scraper.scrape_nfl_injuries_async(
+            filename=f"nfl_injuries_{timestamp}.json"
+        )
+
+        # Scrape NCAA FBS injuries
+        logger.info("")
+        logger.info("=" * 60)
+        logger.info("NCAA FBS INJURY SCRAPER")
+        logger.info("=" * 60)
+        ncaaf_injuries = await scraper.scrape_ncaaf_injuries_async(
+            filename=f"ncaaf_injuries_{timestamp}.json"
+        )
 
     # Summary
     logger.info("")
@@ -258,5 +351,10 @@ def main():
     logger.info("=" * 60)
 
 
+def main():
+    """Main entry point"""
+    asyncio.run(_main())
+
+
 if __name__ == "__main__":
     main()
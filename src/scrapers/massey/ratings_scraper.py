@@ -2,38 +2,90 @@
 """
 Massey Ratings Scraper
 Captures power ratings for NFL and NCAA FBS College Football
+
+Pages are leased from a shared BrowserPool, so scraping several Massey
+pages (or Massey alongside other Playwright scrapers) reuses one Chromium.
 """
 
 import os
 import json
 import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
-from playwright.async_api import async_playwright
+from typing import Optional
 import logging
 
+from scrapers.browser_pool import BrowserPool, ContextProfile
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+MASSEY_PROFILE = ContextProfile("massey")
+
 
 class MasseyRatingsScraper:
     """Scraper for masseyratings.com power rankings"""
 
-    def __init__(self):
-        """Initialize scraper"""
+    def __init__(self, pool: Optional[BrowserPool] = None, headless: bool = True):
+        """
+        Initialize scraper
+
+        Args:
+            pool: Shared browser pool (default: a pool opened per scrape, or
+                for the life of an ``async with`` block)
+            headless: Run the browser headless when the scraper opens its own pool
+        """
         self.base_url = "https://masseyratings.com"
         self.output_base_dir = "output/massey"
         os.makedirs(self.output_base_dir, exist_ok=True)
 
+        self.pool = pool
+        self.headless = headless
+        self._owns_pool = False
+
         # Track API calls
         self.captured_requests = []
         self.captured_responses = []
 
-    async def intercept_route(self, route):
-        """Intercept and log network requests"""
-        request = route.request
-
+    async def __aenter__(self):
+        if self.pool is None:
+            self.pool = BrowserPool(headless=self.headless)
+            self._owns_pool = True
+        await self.pool.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._owns_pool:
+            await self.pool.close()
+            self.pool = None
+            self._owns_pool = False
+
+    @asynccontextmanager
+    async def _lease_page(self, responses: list):
+        """Lease a Massey page, capturing JSON responses into ``responses``"""
+        owned = self.pool is None
+        pool = BrowserPool(headless=self.headless) if owned else self.pool
+
+        async def on_response(response):
+            await self.handle_response(response, responses)
+
+        try:
+            async with pool.page(MASSEY_PROFILE) as page:
+                page.on("request", self.handle_request)
+                page.on("response", on_response)
+                try:
+                    yield page
+                finally:
+                    page.remove_listener("request", self.handle_request)
+                    page.remove_listener("response", on_response)
+        finally:
+            if owned:
+                await pool.close()
+
+    def handle_request(self, request):
+        """Log network requests to Massey's data endpoints"""
         # Log API calls
         if "json" in request.url or "/flOm" in request.url:
             logger.info(f"API Request: {request.method} {request.url}")
@@ -45,10 +97,7 @@ class MasseyRatingsScraper:
                 }
             )
 
-        # Continue the request
-        await route.continue_()
-
-    async def handle_response(self, response):
+    async def handle_response(self, response, captured: Optional[list] = None):
         """Handle and log responses"""
         request = response.request
 
@@ -60,7 +109,9 @@ class MasseyRatingsScraper:
             try:
                 data = await response.json()
                 logger.info(f"Captured JSON response from: {request.url[:100]}...")
-                self.captured_responses.append(
+                if captured is None:
+                    captured = self.captured_responses
+                captured.append(
                     {
                         "url": request.url,
                         "data": data,
@@ -83,37 +134,9 @@ class MasseyRatingsScraper:
 
         url = f"{self.base_url}/nfl/ratings"
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Block ads and trackers
-            await page.route(
-                "**/*",
-                lambda route: (
-                    route.abort()
-                    if any(
-                        x in route.request.url
-                        for x in [
-                            "doubleclick.net",
-                            "googlesyndication",
-                            "googletagmanager",
-                            "advertising",
-                            "analytics",
-                            "tracking",
-                            "adnxs.com",
-                            "amazon-adsystem",
-                            "rubiconproject",
-                            "pubmatic",
-                            "criteo",
-                        ]
-                    )
-                    else self.intercept_route(route)
-                ),
-            )
-            page.on("response", self.handle_response)
-
+        # Per-scrape capture list, so parallel scrapes do not mix responses
+        responses = self.captured_responses = []
+        async with self._lease_page(responses) as page:
             # Navigate and wait for content
             logger.info(f"Loading {url}...")
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -174,8 +197,6 @@ class MasseyRatingsScraper:
                 }
             """)
 
-            await browser.close()
-
         logger.info(f"Captured {len(ratings_data.get('teams', []))} NFL teams")
 
         # Save data
@@ -192,15 +213,13 @@ class MasseyRatingsScraper:
             logger.info(f"Saved to {filepath}")
 
             # Save captured API calls
-            if self.captured_responses:
+            if responses:
                 api_file = os.path.join(
                     output_dir, f"nfl_api_responses_{timestamp}.json"
                 )
                 with open(api_file, "w") as f:
-                    json.dump(self.captured_responses, f, indent=2)
-                logger.info(
-                    f"Saved {len(self.captured_responses)} API responses to {api_file}"
-                )
+                    json.dump(responses, f, indent=2)
+                logger.info(f"Saved {len(responses)} API responses to {api_file}")
 
         return ratings_data
 
@@ -217,41 +236,9 @@ class MasseyRatingsScraper:
 
         url = f"{self.base_url}/cf/fbs/ratings"
 
-        # Reset capture lists
-        self.captured_requests = []
-        self.captured_responses = []
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Block ads and trackers
-            await page.route(
-                "**/*",
-                lambda route: (
-                    route.abort()
-                    if any(
-                        x in route.request.url
-                        for x in [
-                            "doubleclick.net",
-                            "googlesyndication",
-                            "googletagmanager",
-                            "advertising",
-                            "analytics",
-                            "tracking",
-                            "adnxs.com",
-                            "amazon-adsystem",
-                            "rubiconproject",
-                            "pubmatic",
-                            "criteo",
-                        ]
-                    )
-                    else self.intercept_route(route)
-                ),
-            )
-            page.on("response", self.handle_response)
-
+        # Per-scrape capture list, so parallel scrapes do not mix responses
+        responses = self.captured_responses = []
+        async with self._lease_page(responses) as page:
             # Navigate and wait for content
             logger.info(f"Loading {url}...")
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
@@ -318,8 +305,6 @@ class MasseyRatingsScraper:
                 }
             """)
 
-            await browser.close()
-
         logger.info(f"Captured {len(ratings_data.get('teams', []))} NCAAF teams")
 
         # Save data
@@ -336,15 +321,13 @@ class MasseyRatingsScraper:
             logger.info(f"Saved to {filepath}")
 
             # Save captured API calls
-            if self.captured_responses:
+            if responses:
                 api_file = os.path.join(
                     output_dir, f"ncaaf_api_responses_{timestamp}.json"
                 )
                 with open(api_file, "w") as f:
-                    json.dump(self.captured_responses, f, indent=2)
-                logger.info(
-                    f"Saved {len(self.captured_responses)} API responses to {api_file}"
-                )
+                    json.dump(responses, f, indent=2)
+                logger.info(f"Saved {len(responses)} API responses to {api_file}")
 
         return ratings_data
 
@@ -361,24 +344,15 @@ class MasseyRatingsScraper:
 
         url = f"{self.base_url}/nfl/games"
 
-        # Reset capture lists
-        self.captured_requests = []
-        self.captured_responses = []
-
         games_data = {
             "sport": "NFL",
             "url": url,
             "scraped_at": datetime.now().isoformat(),
         }
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Set up network monitoring
-            page.on("response", self.handle_response)
-
+        # Per-scrape capture list, so parallel scrapes do not mix responses
+        responses = self.captured_responses = []
+        async with self._lease_page(responses) as page:
             logger.info(f"Loading {url}...")
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
@@ -387,8 +361,6 @@ class MasseyRatingsScraper:
             content = await page.content()
             games_data["html_length"] = len(content)
 
-            await browser.close()
-
         # Save data
         if save:
             output_dir = os.path.join(self.output_base_dir, "nfl", "games")
@@ -416,24 +388,15 @@ class MasseyRatingsScraper:
 
         url = f"{self.base_url}/cf/fbs/games"
 
-        # Reset capture lists
-        self.captured_requests = []
-        self.captured_responses = []
-
         games_data = {
             "sport": "NCAAF",
             "url": url,
             "scraped_at": datetime.now().isoformat(),
         }
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Set up network monitoring
-            page.on("response", self.handle_response)
-
+        # Per-scrape capture list, so parallel scrapes do not mix responses
+        responses = self.captured_responses = []
+        async with self._lease_page(responses) as page:
             logger.info(f"Loading {url}...")
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
@@ -442,8 +405,6 @@ class MasseyRatingsScraper:
             content = await page.content()
             games_data["html_length"] = len(content)
 
-            await browser.close()
-
         # Save data
         if save:
             output_dir = os.path.join(self.output_base_dir, "ncaaf", "games")
@@ -527,10 +488,14 @@ class MasseyRatingsScraper:
         return matchups_data
 
     async def scrape_both(self):
-        """Scrape both NFL and NCAAF ratings"""
-        nfl_data = await self.scrape_nfl_ratings()
-        ncaaf_data = await self.scrape_ncaaf_ratings()
-
+        """Scrape NFL and NCAAF ratings in parallel in one browser"""
+        if self.pool is None:
+            async with self:
+                return await self.scrape_both()
+
+        nfl_data, ncaaf_data = await asyncio.gather(
+            self.scrape_nfl_ratings(), self.scrape_ncaaf_ratings()
+        )
         return {"nfl": nfl_data, "ncaaf": ncaaf_data}
 
 
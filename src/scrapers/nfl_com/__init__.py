@@ -12,11 +12,27 @@ Clients:
     NFLStatsScraper: Team and player statistics
 """
 
-from scrapers.nfl_com.client import NFLComClient
-from scrapers.nfl_com.game_stats import NFLGameStatsClient
-from scrapers.nfl_com.injuries import NFLOfficialInjuryScraper
-from scrapers.nfl_com.scoreboard import NFLScoreboardScraper
-from scrapers.nfl_com.stats import NFLStatsScraperClient
+from typing import TYPE_CHECKING
+
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from scrapers.nfl_com.client import NFLComClient
+    from scrapers.nfl_com.game_stats import NFLGameStatsClient
+    from scrapers.nfl_com.injuries import NFLOfficialInjuryScraper
+    from scrapers.nfl_com.scoreboard import NFLScoreboardScraper
+    from scrapers.nfl_com.stats import NFLStatsScraperClient
+
+# Exported name -> submodule, imported on first attribute access
+_EXPORTS = {
+    "NFLComClient": "scrapers.nfl_com.client",
+    "NFLGameStatsClient": "scrapers.nfl_com.game_stats",
+    "NFLOfficialInjuryScraper": "scrapers.nfl_com.injuries",
+    "NFLScoreboardScraper": "scrapers.nfl_com.scoreboard",
+    "NFLStatsScraperClient": "scrapers.nfl_com.stats",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "NFLComClient",
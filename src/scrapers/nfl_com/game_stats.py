@@ -5,6 +5,11 @@ Fetches game statistics from NFL.com for both teams in a matchup.
 Navigates schedule pages, extracts game links, and scrapes detailed
 team stats from the STATS tab.
 
+Game pages are extracted concurrently on pages leased from the shared
+BrowserPool, waiting on selectors rather than fixed sleeps. Team stats come
+from the JSON responses behind the stats tab when present, falling back to
+scraping the table.
+
 Supports optional ProxyScrape residential proxy integration for
 bypassing bot detection and rate limiting.
 
@@ -41,7 +46,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Any
 
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import Page
+
+from scrapers.browser_pool import BrowserPool, ContextProfile
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +71,15 @@ class NFLGameStatsClient:
     BASE_URL = "https://www.nfl.com"
     SCHEDULE_URL = "https://www.nfl.com/schedules/{year}/by-week/{week}"
 
+    # Readiness waits (replace fixed sleeps after navigation and tab clicks)
+    STATS_READY_SELECTOR = "table, [data-test*='stats']"
+    STATS_READY_TIMEOUT_MS = 15000
+    TAB_SWITCH_TIMEOUT_MS = 1500
+
+    STAT_CATEGORIES = ("passing", "rushing", "receiving", "defense", "special_teams")
+
+    _TABLE_TEXT_JS = "() => document.querySelector('table')?.innerText || ''"
+
     def __init__(
         self,
         headless: bool = True,
@@ -71,21 +87,30 @@ class NFLGameStatsClient:
         proxyscrape_username: Optional[str] = None,
         proxyscrape_password: Optional[str] = None,
         proxy_rotation_strategy: str = "rotate",
+        pool: Optional[BrowserPool] = None,
+        max_concurrency: int = 4,
     ):
         """
         Initialize NFL Game Stats client.
 
         Args:
-            headless: Run browser in headless mode
+            headless: Run browser in headless mode (when the client opens its
+                own pool)
             use_proxies: Enable ProxyScrape residential proxies
             proxyscrape_username: ProxyScrape username (PROXYSCRAPE_USERNAME env)
             proxyscrape_password: ProxyScrape password (PROXYSCRAPE_PASSWORD env)
             proxy_rotation_strategy: "rotate" (sequential) or "random"
+            pool: Shared browser pool (default: one opened by connect() and
+                closed by close())
+            max_concurrency: Game pages extracted in parallel by get_week_stats
         """
         self.headless = headless
         self.use_proxies = use_proxies
         self.proxy_strategy = proxy_rotation_strategy
-        self._browser: Optional[Browser] = None
+        self.max_concurrency = max_concurrency
+        self._pool: Optional[BrowserPool] = pool
+        self._owns_pool = pool is None
+        self._profile: Optional[ContextProfile] = None
         self._page: Optional[Page] = None
         self.proxy_rotator: Optional[Any] = None
 
@@ -111,47 +136,22 @@ class NFLGameStatsClient:
                 )
 
     async def connect(self) -> None:
-        """Initialize Playwright browser with bot evasion and optional proxies."""
+        """Lease a browser page with bot evasion and optional proxies."""
         try:
             # Initialize proxy rotator if configured
             if self.proxy_rotator:
                 await self.proxy_rotator.connect()
                 logger.info("Proxy rotator initialized")
 
-            self._playwright = await async_playwright().start()
-            # Launch with bot detection evasion
-            self._browser = await self._playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                ],
-            )
-
-            # Prepare page context with user agent and viewport
-            page_context = {
-                "user_agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "viewport": {"width": 1920, "height": 1080},
-            }
+            if self._pool is None:
+                # Schedule page plus one page per concurrent game
+                self._pool = BrowserPool(
+                    headless=self.headless, max_pages=self.max_concurrency + 1
+                )
+            await self._pool.start()
 
-            # Add proxy if available
-            if self.proxy_rotator:
-                proxy = await self._get_proxy()
-                if proxy:
-                    # Playwright requires separate username/password fields
-                    page_context["proxy"] = {
-                        "server": proxy,
-                        "username": self.proxy_rotator.username,
-                        "password": self.proxy_rotator.password,
-                    }
-                    logger.info(f"Using proxy: {proxy}")
-
-            self._page = await self._browser.new_page(**page_context)
+            self._profile = await self._next_profile()
+            self._page = await self._pool.acquire(self._profile)
             logger.info("NFL Game Stats client connected with bot evasion")
 
         except Exception as e:
@@ -159,20 +159,41 @@ class NFLGameStatsClient:
             raise
 
     async def close(self) -> None:
-        """Close browser and cleanup resources."""
+        """Return the page to the pool and cleanup resources."""
         try:
-            if self._page:
-                await self._page.close()
-            if self._browser:
-                await self._browser.close()
-            if self._playwright:
-                await self._playwright.stop()
+            if self._page and self._pool:
+                await self._pool.release(self._page)
+            self._page = None
+            if self._owns_pool and self._pool:
+                await self._pool.close()
+                self._pool = None
             if self.proxy_rotator:
                 await self.proxy_rotator.close()
             logger.info("NFL Game Stats client closed")
         except Exception as e:
             logger.error(f"Error closing client: {e}")
 
+    async def _next_profile(self) -> ContextProfile:
+        """
+        Browser context profile for the next page, rotating proxies if enabled.
+
+        Playwright sets proxies per context, so each proxy gets its own context.
+        """
+        proxy = await self._get_proxy() if self.proxy_rotator else None
+        if not proxy:
+            return ContextProfile("nfl_com")
+
+        logger.info(f"Using proxy: {proxy}")
+        # Playwright requires separate username/password fields
+        return ContextProfile(
+            f"nfl_com-{proxy}",
+            proxy={
+                "server": proxy,
+                "username": self.proxy_rotator.username,
+                "password": self.proxy_rotator.password,
+            },
+        )
+
     async def _get_proxy(self) -> Optional[str]:
         """
         Get proxy based on configured strategy.
@@ -203,14 +224,22 @@ class NFLGameStatsClient:
         await self.close()
 
     async def get_week_stats(
-        self, year: int = 2025, week: str = "reg-12"
+        self,
+        year: int = 2025,
+        week: str = "reg-12",
+        max_concurrency: Optional[int] = None,
     ) -> dict[str, Any]:
         """
         Get all game stats for a specific NFL week.
 
+        Game pages are extracted concurrently, each worker on its own pooled
+        page (and its own proxy when proxies are enabled).
+
         Args:
             year: NFL season year (e.g., 2025)
             week: Week identifier ("reg-12", "post-1", etc.)
+            max_concurrency: Parallel game pages (default self.max_concurrency;
+                1 extracts games one at a time)
 
         Returns:
             Dictionary with all games and stats for the week
@@ -222,13 +251,12 @@ class NFLGameStatsClient:
         schedule_url = f"{self.BASE_URL}/schedules/{year}/by-week/{week}"
         logger.info(f"Fetching schedule from {schedule_url}")
 
-        # Navigate to schedule page with timeout
+        # Navigate to schedule page; link extraction waits for the links
         await self._page.goto(
             schedule_url,
             wait_until="domcontentloaded",
             timeout=60000,
         )
-        await asyncio.sleep(2)
 
         # Extract all game links
         game_links = await self._extract_game_links()
@@ -242,16 +270,24 @@ class NFLGameStatsClient:
             "timestamp": datetime.now().isoformat(),
         }
 
-        for idx, game_url in enumerate(game_links, 1):
-            try:
-                logger.info(f"Fetching stats for game {idx}/{len(game_links)}")
-                game_stats = await self.get_game_stats(game_url)
-                if game_stats:
-                    week_stats["games"].append(game_stats)
-                await asyncio.sleep(2)  # Rate limiting
-            except Exception as e:
-                logger.error(f"Error fetching stats for {game_url}: {e}")
+        workers = min(max_concurrency or self.max_concurrency, len(game_links))
+        results: list[dict[str, Any]] = [{} for _ in game_links]
+        pending = iter(enumerate(game_links))
+
+        async def worker(profile: ContextProfile) -> None:
+            async with self._pool.page(profile) as page:
+                # Workers share one iterator, so each game is taken once
+                for idx, game_url in pending:
+                    logger.info(f"Fetching stats for game {idx + 1}/{len(game_links)}")
+                    try:
+                        results[idx] = await self.get_game_stats(game_url, page=page)
+                    except Exception as e:
+                        logger.error(f"Error fetching stats for {game_url}: {e}")
 
+        profiles = [await self._next_profile() for _ in range(workers)]
+        await asyncio.gather(*(worker(profile) for profile in profiles))
+
+        week_stats["games"] = [game for game in results if game]
         return week_stats
 
     async def _extract_game_links(self) -> list[str]:
@@ -327,37 +363,50 @@ class NFLGameStatsClient:
             logger.error(f"Error extracting game links: {e}")
             return []
 
-    async def get_game_stats(self, game_url: str) -> dict[str, Any]:
+    async def get_game_stats(
+        self, game_url: str, page: Optional[Page] = None
+    ) -> dict[str, Any]:
         """
         Get stats for a specific game.
 
+        JSON/XHR responses loaded by the game page are captured; when they
+        contain a team's player stats, the stats table is not scraped.
+
         Args:
             game_url: Full URL to game (with ?tab=stats)
+            page: Page to use (default: the client's own page)
 
         Returns:
             Dictionary with game info and team stats
         """
-        if not self._page:
-            await self.connect()
+        if page is None:
+            if not self._page:
+                await self.connect()
+            page = self._page
+
+        responses: list[dict[str, Any]] = []
+
+        async def on_response(response) -> None:
+            await self._capture_json(response, responses)
 
+        page.on("response", on_response)
         try:
             logger.info(f"Navigating to {game_url}")
             # Use longer timeout and load strategy (120s for slow connections)
-            await self._page.goto(
+            await page.goto(
                 game_url,
                 wait_until="domcontentloaded",
                 timeout=120000,
             )
-            # Extra wait for JS to render
-            await asyncio.sleep(3)
+            await self._wait_for_stats(page)
 
             # Ensure we're on stats tab
-            if "tab=stats" not in self._page.url:
-                await self._page.click("text=STATS")
-                await asyncio.sleep(2)
+            if "tab=stats" not in page.url:
+                await page.click("text=STATS")
+                await self._wait_for_stats(page)
 
             # Extract game info
-            game_info = await self._extract_game_info()
+            game_info = await self._extract_game_info(page)
 
             if not game_info:
                 logger.warning(f"Could not extract game info from {game_url}")
@@ -370,11 +419,15 @@ class NFLGameStatsClient:
                 "teams_stats": {},
             }
 
-            # Extract stats for each team
+            # Extract stats for each team, from the API data when available
             teams = game_info.get("teams", [])
             for team in teams:
                 try:
-                    team_stats = await self._extract_team_stats(team)
+                    stats = self._stats_from_responses(responses, team)
+                    if stats:
+                        team_stats = {"name": team, **stats}
+                    else:
+                        team_stats = await self._extract_team_stats(team, page)
                     if team_stats:
                         game_data["teams_stats"][team] = team_stats
                 except Exception as e:
@@ -385,22 +438,103 @@ class NFLGameStatsClient:
         except Exception as e:
             logger.error(f"Error fetching game stats: {e}")
             return {}
+        finally:
+            page.remove_listener("response", on_response)
 
-    async def _extract_game_info(self) -> dict[str, Any]:
+    async def _wait_for_stats(self, page: Page) -> None:
+        """Wait until the stats table (or stats container) is rendered"""
+        try:
+            await page.wait_for_selector(
+                self.STATS_READY_SELECTOR, timeout=self.STATS_READY_TIMEOUT_MS
+            )
+        except Exception as e:
+            logger.debug(f"Stats table not ready: {e}")
+
+    @staticmethod
+    async def _capture_json(response, captured: list[dict[str, Any]]) -> None:
+        """Keep JSON XHR/fetch responses loaded by a game page"""
+        request = response.request
+        if not response.ok or request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        try:
+            captured.append({"url": response.url, "data": await response.json()})
+        except Exception as e:
+            logger.debug(f"Could not parse JSON from {response.url}: {e}")
+
+    @classmethod
+    def _stats_from_responses(
+        cls, responses: list[dict[str, Any]], team_name: str
+    ) -> Optional[dict[str, Any]]:
+        """
+        Player stats for a team from captured API responses.
+
+        Looks for an object naming the team (e.g. "Packers", or a nested
+        ``team`` object) that holds lists of player stat objects under the
+        category keys. Returns None if no response has them.
+        """
+        team = team_name.casefold()
+        name_keys = ("playerName", "displayName", "name", "player")
+
+        for response in responses:
+            stack = [response["data"]]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, list):
+                    stack.extend(node)
+                    continue
+                if not isinstance(node, dict):
+                    continue
+                stack.extend(node.values())
+
+                labels = [v for v in node.values() if isinstance(v, str)]
+                if isinstance(node.get("team"), dict):
+                    labels += [v for v in node["team"].values() if isinstance(v, str)]
+                if team not in {label.casefold() for label in labels}:
+                    continue
+
+                stats: dict[str, Any] = {c: {} for c in cls.STAT_CATEGORIES}
+                for category in cls.STAT_CATEGORIES:
+                    players = node.get(category)
+                    if not isinstance(players, list):
+                        continue
+                    for player in players:
+                        if not isinstance(player, dict):
+                            continue
+                        name = next(
+                            (player[k] for k in name_keys if player.get(k)), None
+                        )
+                        if isinstance(name, dict):
+                            name = name.get("displayName")
+                        values = [
+                            str(v)
+                            for k, v in player.items()
+                            if k not in name_keys and isinstance(v, (int, float, str))
+                        ]
+                        if name and values:
+                            stats[category][name] = values
+
+                if any(stats.values()):
+                    return stats
+        return None
+
+    async def _extract_game_info(self, page: Optional[Page] = None) -> dict[str, Any]:
         """
         Extract basic game info (teams, score, date).
 
         Returns:
             Dictionary with game metadata
         """
-        if not self._page:
+        page = page or self._page
+        if not page:
             raise RuntimeError("Page not initialized")
 
         try:
             # Get game title from page title meta tag
             # Format: "Team1 at Team2 YYYY REG/POST XX - Game Center"
             # Example: "Green Bay Packers at Detroit Lions 2025 REG 13 - Game Center"
-            page_title = await self._page.title()
+            page_title = await page.title()
             logger.debug(f"Page title: {page_title}")
 
             # Extract teams from page title
@@ -408,7 +542,7 @@ class NFLGameStatsClient:
             if " at " not in page_title.lower():
                 logger.warning(f"Could not parse teams from page title: {page_title}")
                 # Try DOM selectors as fallback
-                game_title = await self._extract_game_title_from_dom()
+                game_title = await self._extract_game_title_from_dom(page)
                 if not game_title:
                     return {}
             else:
@@ -440,7 +574,7 @@ class NFLGameStatsClient:
 
             # Try to get final score
             try:
-                score_text = await self._page.locator(
+                score_text = await page.locator(
                     "[data-test='game-score']"
                 ).first.text_content()
             except Exception:
@@ -458,7 +592,9 @@ class NFLGameStatsClient:
             logger.error(f"Error extracting game info: {e}")
             return {}
 
-    async def _extract_game_title_from_dom(self) -> Optional[str]:
+    async def _extract_game_title_from_dom(
+        self, page: Optional[Page] = None
+    ) -> Optional[str]:
         """
         Extract game title from DOM as fallback when page title parsing fails.
 
@@ -467,7 +603,8 @@ class NFLGameStatsClient:
         Returns:
             Game title string (e.g., "PACKERS AT LIONS") or None
         """
-        if not self._page:
+        page = page or self._page
+        if not page:
             return None
 
         try:
@@ -482,7 +619,7 @@ class NFLGameStatsClient:
             teams = []
             for selector in selectors:
                 try:
-                    elements = await self._page.locator(selector).all()
+                    elements = await page.locator(selector).all()
                     for elem in elements:
                         text = await elem.text_content()
                         if text:
@@ -505,7 +642,9 @@ class NFLGameStatsClient:
             logger.debug(f"Error extracting game title from DOM: {e}")
             return None
 
-    async def _extract_team_stats(self, team_name: str) -> dict[str, Any]:
+    async def _extract_team_stats(
+        self, team_name: str, page: Optional[Page] = None
+    ) -> dict[str, Any]:
         """
         Extract stats for a specific team in the game.
 
@@ -515,7 +654,8 @@ class NFLGameStatsClient:
         Returns:
             Dictionary with team stats
         """
-        if not self._page:
+        page = page or self._page
+        if not page:
             raise RuntimeError("Page not initialized")
 
         try:
@@ -532,21 +672,33 @@ class NFLGameStatsClient:
                 f"text={team_button_text}",
             ]
 
+            before = await page.evaluate(self._TABLE_TEXT_JS)
+
             clicked = False
             for selector in selectors:
                 try:
-                    await self._page.click(selector)
-                    await asyncio.sleep(1)
+                    await page.click(selector)
                     clicked = True
                     break
                 except Exception:
                     continue
 
+            if clicked:
+                # Wait for the table to re-render; it may already show this team
+                try:
+                    await page.wait_for_function(
+                        f"prev => ({self._TABLE_TEXT_JS})() !== prev",
+                        arg=before,
+                        timeout=self.TAB_SWITCH_TIMEOUT_MS,
+                    )
+                except Exception:
+                    logger.debug(f"Stats table unchanged after {team_button_text} tab")
+
             if not clicked:
                 logger.warning(f"Could not click on {team_button_text} tab")
 
             # Extract stats table
-            stats = await self._parse_stats_table()
+            stats = await self._parse_stats_table(page)
 
             return {"name": team_name, **stats}
 
@@ -554,7 +706,7 @@ class NFLGameStatsClient:
             logger.error(f"Error extracting {team_name} stats: {e}")
             return {}
 
-    async def _parse_stats_table(self) -> dict[str, Any]:
+    async def _parse_stats_table(self, page: Optional[Page] = None) -> dict[str, Any]:
         """
         Parse the stats table for the current team view.
 
@@ -568,7 +720,8 @@ class NFLGameStatsClient:
         Returns:
             Dictionary with categorized stats
         """
-        if not self._page:
+        page = page or self._page
+        if not page:
             raise RuntimeError("Page not initialized")
 
         try:
@@ -581,32 +734,17 @@ class NFLGameStatsClient:
             }
 
             # Wait for stats table
-            await self._page.wait_for_selector(
+            await page.wait_for_selector(
                 "table, [data-test*='stats'], tr", timeout=5000
             )
 
-            # Get all table rows
-            rows = await self._page.locator("tr").all()
-            logger.info(f"Found {len(rows)} table rows")
-
-            # Extract all text in one pass (more efficient)
-            row_texts = []
-            for row in rows:
-                try:
-                    # Get all cells (th and td) from this row
-                    cells = await row.locator("th, td").all()
-                    if cells:
-                        texts = []
-                        for cell in cells:
-                            try:
-                                text = await cell.text_content(timeout=1000)
-                                texts.append(text.strip() if text else "")
-                            except Exception:
-                                texts.append("")
-                        row_texts.append(texts)
-                except Exception as e:
-                    logger.debug(f"Error extracting row cells: {e}")
-                    continue
+            # Extract every row's cell text (th and td) in one round trip
+            row_texts = await page.evaluate("""
+                () => Array.from(document.querySelectorAll('tr'))
+                    .map(row => Array.from(row.querySelectorAll('th, td'))
+                        .map(cell => (cell.textContent || '').trim()))
+                    .filter(cells => cells.length > 0)
+            """)
 
             logger.info(f"Extracted text from {len(row_texts)} rows")
 
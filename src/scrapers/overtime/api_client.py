@@ -20,14 +20,20 @@ Date: 2025-11-11
 """
 
 import json
+import logging
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 import httpx
 
+if TYPE_CHECKING:
+    from walters_analyzer.query import OddsSnapshotStore
+
+logger = logging.getLogger(__name__)
+
 
 class OvertimeApiClient:
     """Client for Overtime.ag API (reverse-engineered endpoint)."""
@@ -77,15 +83,26 @@ class OvertimeApiClient:
             return int(match.group(1))
         return None
 
-    def __init__(self, output_dir: str | Path = "output/overtime"):
+    def __init__(
+        self,
+        output_dir: str | Path = "output/overtime",
+        client: httpx.AsyncClient | None = None,
+        odds_store: "OddsSnapshotStore | None" = None,
+    ):
         """
         Initialize the Overtime API client.
 
         Args:
             output_dir: Directory to save output files
+            client: Optional shared AsyncClient, kept open across fetches
+                (caller owns it). Default opens a client per fetch.
+            odds_store: Optional OddsSnapshotStore; each scrape's converted
+                games are ingested into it as one snapshot
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.client = client
+        self.odds_store = odds_store
 
     async def fetch_games(
         self,
@@ -124,16 +141,23 @@ class OvertimeApiClient:
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.BASE_URL, json=payload, headers=headers)
-            response.raise_for_status()
+        if self.client is not None:
+            response = await self.client.post(
+                self.BASE_URL, json=payload, headers=headers
+            )
+        else:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.post(
+                    self.BASE_URL, json=payload, headers=headers
+                )
+        response.raise_for_status()
 
-            data = response.json()
+        data = response.json()
 
-            if "d" in data and "Data" in data["d"] and "GameLines" in data["d"]["Data"]:
-                return data["d"]["Data"]["GameLines"]
+        if "d" in data and "Data" in data["d"] and "GameLines" in data["d"]["Data"]:
+            return data["d"]["Data"]["GameLines"]
 
-            return []
+        return []
 
     def convert_to_billy_walters_format(
         self, games: list[dict[str, Any]], league: str
@@ -285,6 +309,7 @@ class OvertimeApiClient:
             converted_file.parent.mkdir(parents=True, exist_ok=True)
             converted_file.write_text(json.dumps(converted, indent=2))
 
+        self._store(converted)
         return converted
 
     async def scrape_ncaaf(
@@ -322,8 +347,31 @@ class OvertimeApiClient:
             converted_file.parent.mkdir(parents=True, exist_ok=True)
             converted_file.write_text(json.dumps(converted, indent=2))
 
+        self._store(converted)
         return converted
 
+    def _store(self, converted: dict[str, Any]) -> None:
+        """
+        Ingest a converted scrape into the odds store, if one is set.
+
+        A store failure is logged, not raised: the JSON output is already
+        written, and the scrape can be re-ingested from it later.
+        """
+        if self.odds_store is None:
+            return
+        try:
+            self.odds_store.ingest(
+                converted["games"],
+                snapshot_at=datetime.fromisoformat(
+                    converted["metadata"]["converted_at"]
+                ),
+                source="overtime.ag",
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not store {converted['metadata']['league']} odds: {e}"
+            )
+
 
 async def main():
     """Test the Overtime API client."""
@@ -8,16 +8,15 @@ for integration with the sports analyzer system.
 Supports both NFL and NCAAF (College Football).
 """
 
-import json
 import re
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
 from .models import Game, League, OddsMovement, Team
 from walters_analyzer.season_calendar import get_nfl_week
+from walters_analyzer.team_names import get_team_resolver
 
 
 class OvertimeToWaltersConverter:
@@ -31,45 +30,6 @@ class OvertimeToWaltersConverter:
     - Multi-period data (Game, 1H, 1Q)
     """
 
-    # NFL Team name mapping for normalization
-    NFL_TEAM_MAPPINGS = {
-        "Philadelphia Eagles": "PHI",
-        "Green Bay Packers": "GB",
-        "Kansas City Chiefs": "KC",
-        "Buffalo Bills": "BUF",
-        "San Francisco 49ers": "SF",
-        "Dallas Cowboys": "DAL",
-        "Detroit Lions": "DET",
-        "Baltimore Ravens": "BAL",
-        "Miami Dolphins": "MIA",
-        "Los Angeles Rams": "LAR",
-        "Los Angeles Chargers": "LAC",
-        "Cincinnati Bengals": "CIN",
-        "Jacksonville Jaguars": "JAX",
-        "Cleveland Browns": "CLE",
-        "Pittsburgh Steelers": "PIT",
-        "Houston Texans": "HOU",
-        "Seattle Seahawks": "SEA",
-        "Tampa Bay Buccaneers": "TB",
-        "Minnesota Vikings": "MIN",
-        "Atlanta Falcons": "ATL",
-        "New Orleans Saints": "NO",
-        "Indianapolis Colts": "IND",
-        "Las Vegas Raiders": "LV",
-        "New York Jets": "NYJ",
-        "New York Giants": "NYG",
-        "Tennessee Titans": "TEN",
-        "New England Patriots": "NE",
-        "Arizona Cardinals": "ARI",
-        "Washington Commanders": "WAS",
-        "Chicago Bears": "CHI",
-        "Denver Broncos": "DEN",
-        "Carolina Panthers": "CAR",
-    }
-
-    # NCAAF Team mappings loaded from JSON file
-    _NCAAF_MAPPINGS: Optional[Dict[str, str]] = None
-
     def __init__(self, league: League = League.NFL):
         """
         Initialize converter.
@@ -78,25 +38,7 @@ class OvertimeToWaltersConverter:
             league: League to convert data for (NFL or NCAAF)
         """
         self.league = league
-
-        # Load NCAAF mappings if needed
-        if league == League.NCAAF and self._NCAAF_MAPPINGS is None:
-            self._load_ncaaf_mappings()
-
-    @classmethod
-    def _load_ncaaf_mappings(cls):
-        """Load NCAAF team mappings from JSON file"""
-        mappings_file = Path(__file__).parent / "ncaaf_team_mappings.json"
-        try:
-            with open(mappings_file, "r") as f:
-                data = json.load(f)
-                cls._NCAAF_MAPPINGS = data.get("mappings", {})
-        except FileNotFoundError:
-            print(f"Warning: NCAAF team mappings file not found: {mappings_file}")
-            cls._NCAAF_MAPPINGS = {}
-        except Exception as e:
-            print(f"Error loading NCAAF mappings: {e}")
-            cls._NCAAF_MAPPINGS = {}
+        self.team_names = get_team_resolver(league.value)
 
     def convert_game(self, overtime_game: Dict[str, Any]) -> Optional[Game]:
         """
@@ -206,14 +148,7 @@ class OvertimeToWaltersConverter:
         Returns:
             Team abbreviation (e.g., "PHI" or "OSU")
         """
-        # Select appropriate mappings based on league
-        if self.league == League.NCAAF:
-            mappings = self._NCAAF_MAPPINGS or {}
-        else:
-            mappings = self.NFL_TEAM_MAPPINGS
-
-        # Check direct mapping
-        abbr = mappings.get(full_name)
+        abbr = self.team_names.team_id(full_name)
         if abbr:
             return abbr
 
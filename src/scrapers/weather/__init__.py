@@ -8,14 +8,21 @@ Providers:
     AccuWeatherClient: AccuWeather API (primary)
     OpenWeatherClient: OpenWeather API (fallback)
     WeatherClient: Unified client with provider selection
+    SlateWeatherStage: Concurrent weather collection for a full slate
+    WeatherCache: On-disk cache for weather API responses
 """
 
 from scrapers.weather.accuweather import AccuWeatherClient
+from scrapers.weather.cache import WeatherCache
 from scrapers.weather.client import WeatherClient
 from scrapers.weather.openweather import OpenWeatherClient
+from scrapers.weather.slate import GameWeather, SlateWeatherStage
 
 __all__ = [
     "AccuWeatherClient",
+    "GameWeather",
     "OpenWeatherClient",
+    "SlateWeatherStage",
+    "WeatherCache",
     "WeatherClient",
 ]
@@ -12,6 +12,7 @@ Billy Walters Weather Impact Principles:
 """
 
 import asyncio
+import json
 import logging
 import os
 from datetime import datetime
@@ -19,6 +20,9 @@ from typing import Any
 
 import httpx
 
+from scrapers.weather.cache import WeatherCache
+from walters_analyzer.team_names import get_team_resolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,11 +67,23 @@ class AccuWeatherClient:
         "Washington": {"city": "Landover", "state": "MD", "indoor": False},
     }
 
+    # Cache freshness per endpoint: responses stay fresh until the clock
+    # crosses into the next bucket (None = never expires)
+    CACHE_BUCKETS: dict[str, int | None] = {
+        "/locations/": None,  # Stadium location keys never change
+        "/forecasts/v1/hourly/": 3600,  # Hourly forecasts, refreshed each hour
+        "/currentconditions/": 600,
+    }
+
     def __init__(
         self,
         api_key: str | None = None,
         rate_limit_delay: float = 1.0,
         timeout: float = 30.0,
+        cache: WeatherCache | None = None,
+        use_cache: bool = True,
+        stale_while_revalidate: bool = False,
+        max_stale: float = 6 * 3600,
     ):
         """
         Initialize AccuWeather API client.
@@ -76,12 +92,22 @@ class AccuWeatherClient:
             api_key: AccuWeather API key (defaults to ACCUWEATHER_API_KEY env var)
             rate_limit_delay: Delay between requests in seconds
             timeout: Request timeout in seconds
+            cache: Response cache (defaults to the shared on-disk WeatherCache)
+            use_cache: Set False to always hit the API
+            stale_while_revalidate: Serve expired forecasts immediately and
+                refresh them in the background
+            max_stale: Oldest expired entry (seconds) that may be served stale
         """
         self.api_key = api_key or os.getenv("ACCUWEATHER_API_KEY")
         self.rate_limit_delay = rate_limit_delay
         self.timeout = timeout
         self.last_request_time: float = 0.0
+        self._rate_lock = asyncio.Lock()  # Serializes slot reservation
         self._client: httpx.AsyncClient | None = None
+        self.cache = (cache or WeatherCache()) if use_cache else None
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_stale = max_stale
+        self._refreshes: dict[str, asyncio.Task] = {}
 
         if not self.api_key:
             raise ValueError(
@@ -113,21 +139,27 @@ class AccuWeatherClient:
 
     async def close(self) -> None:
         """Close HTTP client."""
+        # Let background cache refreshes finish with the client still open
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes.values(), return_exceptions=True)
         if self._client:
             await self._client.aclose()
         logger.info("Closed AccuWeather client")
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.rate_limit_delay:
-            wait_time = self.rate_limit_delay - time_since_last
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            await asyncio.sleep(wait_time)
+        """
+        Enforce rate limiting between requests.
 
-        self.last_request_time = asyncio.get_event_loop().time()
+        Concurrent callers (a slate fanned out on one client) take turns
+        under a lock, so request starts stay rate_limit_delay apart.
+        """
+        async with self._rate_lock:
+            loop = asyncio.get_running_loop()
+            wait_time = self.last_request_time + self.rate_limit_delay - loop.time()
+            if wait_time > 0:
+                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+            self.last_request_time = loop.time()
 
     async def _make_request(
         self,
@@ -136,7 +168,7 @@ class AccuWeatherClient:
         max_retries: int = 3,
     ) -> dict[str, Any] | list[Any]:
         """
-        Make HTTP request with retry logic.
+        Make HTTP request with retry logic, served from the cache when fresh.
 
         Args:
             endpoint: API endpoint
@@ -152,12 +184,67 @@ class AccuWeatherClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Call connect() first.")
 
+        params = dict(params or {})
+        bucket = self._cache_bucket(endpoint)
+        if bucket is False:
+            return await self._fetch(endpoint, params, max_retries)
+
+        key = self._cache_key(endpoint, params)
+        entry = self.cache.get("accuweather", key)
+        if entry is not None:
+            if entry.is_fresh(bucket):
+                logger.debug(f"Cache hit: {endpoint}")
+                return entry.value
+            if self.stale_while_revalidate and entry.age() <= self.max_stale:
+                logger.debug(f"Serving stale {endpoint}, refreshing in background")
+                if key not in self._refreshes:
+                    self._refreshes[key] = asyncio.create_task(
+                        self._refresh(key, endpoint, params, max_retries)
+                    )
+                return entry.value
+
+        data = await self._fetch(endpoint, params, max_retries)
+        if data:  # Empty results (e.g. no location match) are not cached
+            self.cache.set("accuweather", key, data)
+        return data
+
+    def _cache_bucket(self, endpoint: str) -> int | None | bool:
+        """Cache bucket for an endpoint; False if it is not cached"""
+        if self.cache is None:
+            return False
+        for prefix, bucket in self.CACHE_BUCKETS.items():
+            if endpoint.startswith(prefix):
+                return bucket
+        return False
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict[str, Any]) -> str:
+        return f"{endpoint}?{json.dumps(params, sort_keys=True)}"
+
+    async def _refresh(
+        self, key: str, endpoint: str, params: dict[str, Any], max_retries: int
+    ) -> None:
+        """Refetch a stale cache entry in the background"""
+        try:
+            data = await self._fetch(endpoint, params, max_retries)
+            if data:
+                self.cache.set("accuweather", key, data)
+        except RuntimeError as e:
+            logger.warning(f"Background refresh of {endpoint} failed: {e}")
+        finally:
+            self._refreshes.pop(key, None)
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        max_retries: int = 3,
+    ) -> dict[str, Any] | list[Any]:
+        """Make the HTTP request (rate limited, with retries), bypassing the cache"""
         await self._rate_limit()
 
         # Add API key to params
-        if params is None:
-            params = {}
-        params["apikey"] = self.api_key
+        params = {**params, "apikey": self.api_key}
 
         for attempt in range(max_retries):
             try:
@@ -203,11 +290,11 @@ class AccuWeatherClient:
 
         raise RuntimeError("Unexpected error in _make_request")
 
-    async def get_location_key(
+    async def get_location(
         self, city: str, state: str, max_retries: int = 3
-    ) -> str:
+    ) -> dict[str, Any]:
         """
-        Get AccuWeather location key for a city.
+        Look up an AccuWeather location for a city.
 
         Args:
             city: City name
@@ -215,7 +302,7 @@ class AccuWeatherClient:
             max_retries: Maximum retry attempts
 
         Returns:
-            Location key string
+            Dict with location key, latitude and longitude
 
         Raises:
             RuntimeError: If location not found or request fails
@@ -241,7 +328,32 @@ class AccuWeatherClient:
             raise RuntimeError(f"No location key in response for {query}")
 
         logger.info(f"Location key for {city}, {state}: {location_key}")
-        return location_key
+        geo = location.get("GeoPosition") or {}
+        return {
+            "key": location_key,
+            "latitude": geo.get("Latitude"),
+            "longitude": geo.get("Longitude"),
+        }
+
+    async def get_location_key(
+        self, city: str, state: str, max_retries: int = 3
+    ) -> str:
+        """
+        Get AccuWeather location key for a city.
+
+        Args:
+            city: City name
+            state: State abbreviation
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Location key string
+
+        Raises:
+            RuntimeError: If location not found or request fails
+        """
+        location = await self.get_location(city, state, max_retries=max_retries)
+        return location["key"]
 
     async def get_location_key_by_zipcode(
         self, zipcode: str, max_retries: int = 3
@@ -493,6 +605,28 @@ class AccuWeatherClient:
         # Get location key
         location_key = await self.get_location_key(city, state, max_retries=max_retries)
 
+        return await self.get_forecast_at(location_key, game_time, max_retries)
+
+    async def get_forecast_at(
+        self,
+        location_key: str,
+        game_time: datetime,
+        max_retries: int = 3,
+    ) -> dict[str, Any]:
+        """
+        Get the forecast closest to game time for a known location key.
+
+        Args:
+            location_key: AccuWeather location key
+            game_time: Game start time
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Weather forecast dictionary
+
+        Raises:
+            RuntimeError: If request fails
+        """
         # Get hourly forecast
         from datetime import timezone
 
@@ -619,44 +753,9 @@ class AccuWeatherClient:
             Short team name for stadium lookup (e.g., "New England")
         """
         # Map full team names to stadium lookup keys
-        team_mappings = {
-            "Arizona Cardinals": "Arizona",
-            "Atlanta Falcons": "Atlanta",
-            "Baltimore Ravens": "Baltimore",
-            "Buffalo Bills": "Buffalo",
-            "Carolina Panthers": "Carolina",
-            "Chicago Bears": "Chicago",
-            "Cincinnati Bengals": "Cincinnati",
-            "Cleveland Browns": "Cleveland",
-            "Dallas Cowboys": "Dallas",
-            "Denver Broncos": "Denver",
-            "Detroit Lions": "Detroit",
-            "Green Bay Packers": "Green Bay",
-            "Houston Texans": "Houston",
-            "Indianapolis Colts": "Indianapolis",
-            "Jacksonville Jaguars": "Jacksonville",
-            "Kansas City Chiefs": "Kansas City",
-            "Las Vegas Raiders": "Las Vegas",
-            "Los Angeles Chargers": "LA Chargers",
-            "Los Angeles Rams": "LA Rams",
-            "Miami Dolphins": "Miami",
-            "Minnesota Vikings": "Minnesota",
-            "New England Patriots": "New England",
-            "New Orleans Saints": "New Orleans",
-            "New York Giants": "NY Giants",
-            "New York Jets": "NY Jets",
-            "Philadelphia Eagles": "Philadelphia",
-            "Pittsburgh Steelers": "Pittsburgh",
-            "San Francisco 49ers": "San Francisco",
-            "Seattle Seahawks": "Seattle",
-            "Tampa Bay Buccaneers": "Tampa Bay",
-            "Tennessee Titans": "Tennessee",
-            "Washington Commanders": "Washington",
-        }
-
-        # Try exact match first
-        if team in team_mappings:
-            return team_mappings[team]
+        short_name = get_team_resolver("nfl").lookup(team)
+        if short_name in self.NFL_STADIUM_LOCATIONS:
+            return short_name
 
         # If already short form, return as-is
         if team in self.NFL_STADIUM_LOCATIONS:
@@ -665,6 +764,37 @@ class AccuWeatherClient:
         # Fallback: return original (will log warning in get_game_weather)
         return team
 
+    def get_stadium(self, team: str) -> dict[str, Any] | None:
+        """
+        Look up the home stadium for a team.
+
+        Args:
+            team: Home team name (e.g., "Green Bay Packers" or "Green Bay")
+
+        Returns:
+            Stadium dict with city, state and indoor flag, or None if unknown
+        """
+        normalized_team = self._normalize_team_name(team)
+        stadium_info = self.NFL_STADIUM_LOCATIONS.get(normalized_team)
+        if not stadium_info:
+            logger.warning(
+                f"No stadium info for team: {team} (normalized: {normalized_team})"
+            )
+        return stadium_info
+
+    @staticmethod
+    def indoor_weather(stadium_info: dict[str, Any]) -> dict[str, Any]:
+        """Weather placeholder for indoor stadiums (no weather impact)."""
+        return {
+            "indoor": True,
+            "temperature_f": None,
+            "wind_speed_mph": None,
+            "precipitation_type": None,
+            "weather_text": "Indoor",
+            "city": stadium_info["city"],
+            "state": stadium_info["state"],
+        }
+
     async def get_game_weather(
         self, team: str, game_time: datetime | str, max_retries: int = 3
     ) -> dict[str, Any] | None:
@@ -691,28 +821,14 @@ class AccuWeatherClient:
                 logger.warning(f"Could not parse game_time string for team {team}")
                 return None
 
-        # Normalize team name to stadium lookup format
-        normalized_team = self._normalize_team_name(team)
-
         # Get stadium info
-        stadium_info = self.NFL_STADIUM_LOCATIONS.get(normalized_team)
+        stadium_info = self.get_stadium(team)
         if not stadium_info:
-            logger.warning(
-                f"No stadium info for team: {team} (normalized: {normalized_team})"
-            )
             return None
 
         # Indoor stadium = no weather impact
         if stadium_info.get("indoor"):
-            return {
-                "indoor": True,
-                "temperature_f": None,
-                "wind_speed_mph": None,
-                "precipitation_type": None,
-                "weather_text": "Indoor",
-                "city": stadium_info["city"],
-                "state": stadium_info["state"],
-            }
+            return self.indoor_weather(stadium_info)
 
         # Get forecast for outdoor stadium
         forecast = await self.get_game_forecast(
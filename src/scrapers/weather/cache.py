@@ -0,0 +1,125 @@
+"""
+Weather API Response Cache
+
+Small on-disk (SQLite) cache for weather API responses so repeated runs do
+not spend quota-limited calls on data that has not changed:
+
+- Location lookups never expire (stadiums do not move)
+- Forecasts and conditions are bucketed by time: a response is fresh until
+  the clock crosses into the next bucket (e.g. the next UTC hour)
+
+Entries older than their bucket are kept so callers can serve them stale
+while a refresh runs in the background.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).parents[3] / "data" / "cache" / "weather.db"
+
+
+@dataclass
+class CacheEntry:
+    """Cached response and when it was fetched (epoch seconds)."""
+
+    value: Any
+    fetched_at: float
+
+    def is_fresh(self, bucket_seconds: int | None, now: float | None = None) -> bool:
+        """Fresh while still in the bucket it was fetched in (None = forever)"""
+        if bucket_seconds is None:
+            return True
+        now = time.time() if now is None else now
+        return int(self.fetched_at // bucket_seconds) == int(now // bucket_seconds)
+
+    def age(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+class WeatherCache:
+    """SQLite-backed key/value cache for weather API responses."""
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH):
+        """
+        Initialize weather cache.
+
+        Args:
+            path: SQLite file (created with its directory on first use)
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, namespace: str, key: str) -> CacheEntry | None:
+        """Return the cached entry (fresh or stale), or None on a miss"""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT value, fetched_at FROM responses "
+                    "WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1])
+
+    def set(
+        self, namespace: str, key: str, value: Any, fetched_at: float | None = None
+    ) -> None:
+        """Store a response (replaces any previous entry)"""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (namespace, key, value, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), fetched_at),
+            )
+            conn.commit()
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drop all entries, or only those in one namespace"""
+        with self._lock:
+            conn = self._connection()
+            if namespace is None:
+                conn.execute("DELETE FROM responses")
+            else:
+                conn.execute("DELETE FROM responses WHERE namespace = ?", (namespace,))
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
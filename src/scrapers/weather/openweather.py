@@ -13,7 +13,7 @@ Supports:
 import asyncio
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
@@ -485,8 +485,10 @@ class OpenWeatherClient:
             True if alert overlaps with game window (game time + 3 hours)
         """
         try:
-            alert_start = datetime.fromtimestamp(alert["start"])
-            alert_end = datetime.fromtimestamp(alert["end"])
+            # Compare in UTC when the game time is timezone-aware
+            tz = timezone.utc if game_time.tzinfo else None
+            alert_start = datetime.fromtimestamp(alert["start"], tz)
+            alert_end = datetime.fromtimestamp(alert["end"], tz)
 
             # Game duration approximately 3 hours
             game_end = game_time + timedelta(hours=3)
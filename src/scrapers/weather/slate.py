@@ -0,0 +1,222 @@
+"""
+Slate Weather Stage
+
+Collects game-day weather for a whole slate in one pass instead of one game
+at a time:
+
+1. Every home venue is resolved up front (indoor stadiums need no requests)
+2. Each outdoor venue is looked up once, however many games it hosts
+3. Games at the same venue and kickoff hour share one forecast/alert fetch
+4. All AccuWeather forecasts and OpenWeather alerts run concurrently over a
+   single pooled client per provider
+
+A 14-game NFL Sunday therefore costs two rounds of concurrent requests
+(location lookups, then forecasts + alerts) rather than 14 sequential
+round-trips per provider.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Mapping, TypeVar
+
+from scrapers.weather.accuweather import AccuWeatherClient
+from scrapers.weather.openweather import OpenWeatherClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upper bound on in-flight requests per slate (both providers combined)
+MAX_CONCURRENT_REQUESTS = 16
+
+
+@dataclass
+class GameWeather:
+    """Weather collected for one game on the slate."""
+
+    game_id: str
+    forecast: dict[str, Any] | None = None  # None = weather unavailable
+    alerts: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def indoor(self) -> bool:
+        return bool(self.forecast and self.forecast.get("indoor"))
+
+
+class SlateWeatherStage:
+    """
+    Fetch weather for every game on a slate concurrently.
+
+    Example:
+        >>> stage = SlateWeatherStage(AccuWeatherClient(), OpenWeatherClient())
+        >>> weather = await stage.fetch({"BUF@KC": ("Kansas City", kickoff)})
+        >>> weather["BUF@KC"].forecast["wind_speed"]
+    """
+
+    def __init__(
+        self,
+        accuweather: AccuWeatherClient,
+        openweather: OpenWeatherClient | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        """
+        Initialize the slate weather stage.
+
+        Args:
+            accuweather: Forecast provider (connected on demand)
+            openweather: Optional alert provider (connected on demand)
+            max_concurrency: Maximum simultaneous requests across providers
+        """
+        self.accuweather = accuweather
+        self.openweather = openweather
+        self.max_concurrency = max_concurrency
+
+    async def fetch(
+        self, games: Mapping[str, tuple[str, datetime | str]]
+    ) -> dict[str, GameWeather]:
+        """
+        Fetch weather for a slate of games.
+
+        Args:
+            games: game_id -> (home_team, game_time) for every game on the slate
+
+        Returns:
+            game_id -> GameWeather, in the same order as ``games``
+        """
+        start = time.perf_counter()
+        results = {game_id: GameWeather(game_id) for game_id in games}
+
+        # Resolve venues and kickoff hours up front
+        outdoor: dict[str, tuple[tuple[str, str], datetime]] = {}
+        for game_id, (home_team, game_time) in games.items():
+            if isinstance(game_time, str):
+                game_time = self.accuweather._parse_game_time(game_time)
+            stadium = self.accuweather.get_stadium(home_team)
+            if game_time is None or stadium is None:
+                continue
+            if stadium.get("indoor"):
+                results[game_id].forecast = AccuWeatherClient.indoor_weather(stadium)
+                continue
+            hour = game_time.replace(minute=0, second=0, microsecond=0)
+            outdoor[game_id] = ((stadium["city"], stadium["state"]), hour)
+
+        if not outdoor:
+            return results
+
+        venues = list(dict.fromkeys(venue for venue, _ in outdoor.values()))
+        slots = list(dict.fromkeys(outdoor.values()))
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        opened = await self._connect()
+        try:
+            # Round 1: one location lookup per venue
+            locations = dict(
+                zip(
+                    venues,
+                    await asyncio.gather(
+                        *(
+                            self._limited(
+                                semaphore,
+                                self.accuweather.get_location(city, state),
+                                f"location for {city}, {state}",
+                            )
+                            for city, state in venues
+                        )
+                    ),
+                )
+            )
+
+            # Round 2: forecasts and alerts for every venue/hour, all at once
+            forecast_calls = []
+            alert_calls = []
+            for venue, hour in slots:
+                location = locations[venue]
+                forecast_calls.append(
+                    self._limited(
+                        semaphore,
+                        self.accuweather.get_forecast_at(location["key"], hour),
+                        f"forecast for {venue[0]} at {hour:%Y-%m-%d %H:00}",
+                    )
+                    if location
+                    else _none()
+                )
+                alert_calls.append(self._alerts(semaphore, location, venue, hour))
+
+            fetched = await asyncio.gather(*forecast_calls, *alert_calls)
+        finally:
+            for client in opened:
+                await client.close()
+
+        forecasts = dict(zip(slots, fetched[: len(slots)]))
+        alerts = dict(zip(slots, fetched[len(slots) :]))
+
+        for game_id, (venue, hour) in outdoor.items():
+            forecast = forecasts[(venue, hour)]
+            location = locations[venue]
+            if forecast is not None:
+                results[game_id].forecast = {
+                    **forecast,
+                    "indoor": False,
+                    "city": venue[0],
+                    "state": venue[1],
+                    "latitude": location["latitude"],
+                    "longitude": location["longitude"],
+                }
+            results[game_id].alerts = list(alerts[(venue, hour)] or [])
+
+        logger.info(
+            f"Fetched weather for {len(games)} games ({len(venues)} outdoor venues, "
+            f"{len(slots)} venue/hour slots) in {time.perf_counter() - start:.2f}s"
+        )
+        return results
+
+    async def _connect(self) -> list[AccuWeatherClient | OpenWeatherClient]:
+        """Connect providers that are not connected yet; returns those opened"""
+        opened = []
+        for client in (self.accuweather, self.openweather):
+            if client is not None and client._client is None:
+                await client.connect()
+                opened.append(client)
+        return opened
+
+    async def _alerts(
+        self,
+        semaphore: asyncio.Semaphore,
+        location: dict[str, Any] | None,
+        venue: tuple[str, str],
+        hour: datetime,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch alerts active during the game window, if a provider is set"""
+        if (
+            self.openweather is None
+            or not location
+            or location.get("latitude") is None
+            or location.get("longitude") is None
+        ):
+            return None
+        return await self._limited(
+            semaphore,
+            self.openweather.get_weather_alerts(
+                lat=location["latitude"], lon=location["longitude"], game_time=hour
+            ),
+            f"alerts for {venue[0]}",
+        )
+
+    @staticmethod
+    async def _limited(
+        semaphore: asyncio.Semaphore, call: Awaitable[T], label: str
+    ) -> T | None:
+        """Run one request under the concurrency limit; failures become None"""
+        async with semaphore:
+            try:
+                return await call
+            except Exception as e:
+                logger.warning(f"Could not fetch {label}: {e}")
+                return None
+
+
+async def _none() -> None:
+    return None
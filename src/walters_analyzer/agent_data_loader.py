@@ -15,6 +15,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from walters_analyzer.valuation.injury_impacts import InjuryImpactCalculator
+from walters_analyzer.team_names import get_team_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class AgentDataLoader:
         self.ratings_file = project_root / "data" / "power_ratings_nfl_2025.json"
         self.home_field_advantage = 2.0
         self.injury_calculator = InjuryImpactCalculator()
+        self.team_names = get_team_resolver("nfl")
 
     def load_power_ratings(self) -> Dict[str, float]:
         """Load power ratings from JSON file"""
@@ -103,82 +105,13 @@ class AgentDataLoader:
 
     def normalize_team_name_short(self, team_name: str) -> str:
         """Normalize short team names from injury reports to power rating format"""
-        # Handle short names from NFL official injury reports
-        team_map = {
-            "Cardinals": "Arizona",
-            "Falcons": "Atlanta",
-            "Ravens": "Baltimore",
-            "Bills": "Buffalo",
-            "Panthers": "Carolina",
-            "Bears": "Chicago",
-            "Bengals": "Cincinnati",
-            "Browns": "Cleveland",
-            "Cowboys": "Dallas",
-            "Broncos": "Denver",
-            "Lions": "Detroit",
-            "Packers": "Green Bay",
-            "Texans": "Houston",
-            "Colts": "Indianapolis",
-            "Jaguars": "Jacksonville",
-            "Chiefs": "Kansas City",
-            "Raiders": "Las Vegas",
-            "Chargers": "LA Chargers",
-            "Rams": "LA Rams",
-            "Dolphins": "Miami",
-            "Vikings": "Minnesota",
-            "Patriots": "New England",
-            "Saints": "New Orleans",
-            "Giants": "NY Giants",
-            "Jets": "NY Jets",
-            "Eagles": "Philadelphia",
-            "Steelers": "Pittsburgh",
-            "49ers": "San Francisco",
-            "Seahawks": "Seattle",
-            "Buccaneers": "Tampa Bay",
-            "Titans": "Tennessee",
-            "Commanders": "Washington",
-        }
-        return team_map.get(team_name, team_name)
+        # Handle short names from NFL official injury reports ("Bears" -> "Chicago")
+        return self.team_names.lookup(team_name) or team_name
 
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team name for power rating lookup"""
-        # Handle team name variations between Overtime.ag and power ratings
-        team_map = {
-            # Overtime.ag format -> Power ratings format
-            "Arizona Cardinals": "Arizona",
-            "Atlanta Falcons": "Atlanta",
-            "Baltimore Ravens": "Baltimore",
-            "Buffalo Bills": "Buffalo",
-            "Carolina Panthers": "Carolina",
-            "Chicago Bears": "Chicago",
-            "Cincinnati Bengals": "Cincinnati",
-            "Cleveland Browns": "Cleveland",
-            "Dallas Cowboys": "Dallas",
-            "Denver Broncos": "Denver",
-            "Detroit Lions": "Detroit",
-            "Green Bay Packers": "Green Bay",
-            "Houston Texans": "Houston",
-            "Indianapolis Colts": "Indianapolis",
-            "Jacksonville Jaguars": "Jacksonville",
-            "Kansas City Chiefs": "Kansas City",
-            "Las Vegas Raiders": "Las Vegas",
-            "Los Angeles Chargers": "LA Chargers",
-            "Los Angeles Rams": "LA Rams",
-            "Miami Dolphins": "Miami",
-            "Minnesota Vikings": "Minnesota",
-            "New England Patriots": "New England",
-            "New Orleans Saints": "New Orleans",
-            "New York Giants": "NY Giants",
-            "New York Jets": "NY Jets",
-            "Philadelphia Eagles": "Philadelphia",
-            "Pittsburgh Steelers": "Pittsburgh",
-            "San Francisco 49ers": "San Francisco",
-            "Seattle Seahawks": "Seattle",
-            "Tampa Bay Buccaneers": "Tampa Bay",
-            "Tennessee Titans": "Tennessee",
-            "Washington Commanders": "Washington",
-        }
-        return team_map.get(team_name, team_name)
+        # Overtime.ag format -> Power ratings format ("Chicago Bears" -> "Chicago")
+        return self.team_names.lookup(team_name) or team_name
 
     def calculate_team_injury_impact(
         self, team_name: str, injuries_by_team: Dict[str, List[Dict]]
@@ -3,5 +3,16 @@ Backtesting framework for Billy Walters Power Rating System
 """
 
 from .power_rating_backtest import PowerRatingBacktest, BacktestResult
+from .walk_forward import (
+    BacktestConfig,
+    WalkForwardBacktest,
+    WalkForwardResult,
+)
 
-__all__ = ["PowerRatingBacktest", "BacktestResult"]
+__all__ = [
+    "PowerRatingBacktest",
+    "BacktestResult",
+    "BacktestConfig",
+    "WalkForwardBacktest",
+    "WalkForwardResult",
+]
@@ -370,17 +370,22 @@ class PowerRatingBacktest:
 
     def _parse_date(self, date_input) -> date:
         """Parse date from various formats"""
-        if isinstance(date_input, date):
-            return date_input
-        elif isinstance(date_input, str):
-            # Try ISO format
-            try:
-                return datetime.fromisoformat(date_input).date()
-            except:
-                # Try other common formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
-                    try:
-                        return datetime.strptime(date_input, fmt).date()
-                    except:
-                        continue
-        raise ValueError(f"Cannot parse date: {date_input}")
+        return parse_game_date(date_input)
+
+
+def parse_game_date(date_input) -> date:
+    """Parse a game date from a date object or ISO/US-format string"""
+    if isinstance(date_input, date):
+        return date_input
+    elif isinstance(date_input, str):
+        # Try ISO format
+        try:
+            return datetime.fromisoformat(date_input).date()
+        except:
+            # Try other common formats
+            for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
+                try:
+                    return datetime.strptime(date_input, fmt).date()
+                except:
+                    continue
+    raise ValueError(f"Cannot parse date: {date_input}")
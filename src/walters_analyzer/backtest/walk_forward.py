@@ -0,0 +1,520 @@
+"""
+Walk-Forward Power Rating Backtests
+
+Evaluates a grid of rating configurations (update weights, home field
+advantage, initial ratings) against historical results. Each configuration
+replays the season on array-backed rating state in its own worker process,
+predicting every game before updating ratings exactly as
+PowerRatingBacktest.run_backtest does.
+
+Ratings are checkpointed after every week. Re-running after another week of
+results resumes each configuration from its last matching checkpoint and
+only replays the new games.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..valuation.power_ratings import PowerRatingSystem, initialize_nfl_ratings
+from .power_rating_backtest import BacktestResult, PredictionResult, parse_game_date
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BacktestConfig:
+    """
+    One power rating configuration to backtest
+
+    Defaults reproduce PowerRatingSystem (90/10 update, 2.0 HFA) starting
+    from initialize_nfl_ratings().
+    """
+
+    name: str = "walters_90_10"
+    old_rating_weight: float = PowerRatingSystem.OLD_RATING_WEIGHT
+    performance_weight: float = PowerRatingSystem.TRUE_PERFORMANCE_WEIGHT
+    home_field_advantage: float = PowerRatingSystem.HOME_FIELD_ADVANTAGE
+    initial_ratings: Optional[Dict[str, float]] = None
+
+    def starting_ratings(self) -> Dict[str, float]:
+        """Initial ratings, normalized and rounded like PowerRatingSystem"""
+        ratings = self.initial_ratings
+        if ratings is None:
+            ratings = initialize_nfl_ratings()
+        return {team.strip(): round(rating, 2) for team, rating in ratings.items()}
+
+    @property
+    def key(self) -> str:
+        """Stable hash of the parameters (names the checkpoint file)"""
+        payload = json.dumps(
+            [
+                self.old_rating_weight,
+                self.performance_weight,
+                self.home_field_advantage,
+                sorted(self.starting_ratings().items()),
+            ]
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+    @classmethod
+    def grid(
+        cls,
+        performance_weights: Sequence[float] = (0.10,),
+        home_field_advantages: Sequence[float] = (2.0,),
+        initial_ratings: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> List[BacktestConfig]:
+        """
+        Cartesian product of parameter values
+
+        Args:
+            performance_weights: Weights on game performance (old rating
+                weight is 1 - weight)
+            home_field_advantages: HFA values in points
+            initial_ratings: Named sets of starting ratings
+                (defaults to {"preseason": initialize_nfl_ratings()})
+
+        Returns:
+            One BacktestConfig per combination
+        """
+        rating_sets = initial_ratings or {"preseason": initialize_nfl_ratings()}
+        return [
+            cls(
+                name=f"{label}_w{weight:g}_hfa{hfa:g}",
+                old_rating_weight=round(1.0 - weight, 6),
+                performance_weight=weight,
+                home_field_advantage=hfa,
+                initial_ratings=ratings,
+            )
+            for (label, ratings), weight, hfa in itertools.product(
+                rating_sets.items(), performance_weights, home_field_advantages
+            )
+        ]
+
+
+@dataclass
+class GameArrays:
+    """Game results as parallel arrays, in input order"""
+
+    teams: List[str]
+    home: np.ndarray  # Team index
+    away: np.ndarray
+    home_score: np.ndarray
+    away_score: np.ndarray
+    week: np.ndarray
+    dates: List[date]
+    week_digests: Dict[int, str]  # Digest of all games through each week
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    @classmethod
+    def from_games(
+        cls, games: Sequence[Dict], week_labels: Optional[Sequence[int]] = None
+    ) -> GameArrays:
+        """
+        Encode game dicts (same format as PowerRatingBacktest.run_backtest)
+
+        Every game needs a week (from the dict or week_labels) and weeks must
+        be non-decreasing, since checkpoints are taken at week boundaries.
+        """
+        team_index: Dict[str, int] = {}
+        columns: Dict[str, List] = {
+            "home": [],
+            "away": [],
+            "home_score": [],
+            "away_score": [],
+            "week": [],
+        }
+        dates = []
+        week_digests: Dict[int, str] = {}
+        digest = hashlib.sha1()
+
+        for i, game in enumerate(games):
+            week = game.get("week", week_labels[i] if week_labels else None)
+            if not week:
+                raise ValueError(f"Game {i} has no week label")
+            if columns["week"] and week < columns["week"][-1]:
+                raise ValueError(f"Games must be in week order (game {i})")
+
+            home = game["home_team"].strip()
+            away = game["away_team"].strip()
+            game_date = parse_game_date(game["date"])
+            for team in (home, away):
+                team_index.setdefault(team, len(team_index))
+
+            columns["home"].append(team_index[home])
+            columns["away"].append(team_index[away])
+            columns["home_score"].append(game["home_score"])
+            columns["away_score"].append(game["away_score"])
+            columns["week"].append(week)
+            dates.append(game_date)
+
+            row = (
+                f"{game_date.isoformat()}|{home}|{away}|"
+                f"{game['home_score']}|{game['away_score']}|{week}\n"
+            )
+            digest.update(row.encode())
+            week_digests[week] = digest.hexdigest()
+
+        return cls(
+            teams=list(team_index),
+            home=np.array(columns["home"], dtype=np.int32),
+            away=np.array(columns["away"], dtype=np.int32),
+            home_score=np.array(columns["home_score"], dtype=np.int64),
+            away_score=np.array(columns["away_score"], dtype=np.int64),
+            week=np.array(columns["week"], dtype=np.int64),
+            dates=dates,
+            week_digests=week_digests,
+        )
+
+
+@dataclass
+class WalkForwardResult:
+    """Metrics for one configuration"""
+
+    config: BacktestConfig
+    total_games: int
+    correct_winner_pct: float
+    ats_record: Tuple[int, int, int]
+    ats_win_pct: float
+    mean_absolute_error: float
+    median_absolute_error: float
+    initial_ratings: Dict[str, float]
+    final_ratings: Dict[str, float]
+    weekly_stats: Dict[int, Dict] = field(default_factory=dict)
+
+    # Predicted spread per input game (NaN = skipped, team had no rating)
+    predicted_spreads: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    # Checkpoint usage: week resumed from (None = full replay), games replayed
+    resumed_from_week: Optional[int] = None
+    games_replayed: int = 0
+
+    def to_backtest_result(self, games: Sequence[Dict]) -> BacktestResult:
+        """Expand to a BacktestResult (for PowerRatingBacktest.generate_report)"""
+        predictions = []
+        for i in np.flatnonzero(~np.isnan(self.predicted_spreads)):
+            game = games[i]
+            predicted = float(self.predicted_spreads[i])
+            margin = game["home_score"] - game["away_score"]
+            predictions.append(
+                PredictionResult(
+                    date=parse_game_date(game["date"]),
+                    home_team=game["home_team"],
+                    away_team=game["away_team"],
+                    predicted_spread=predicted,
+                    actual_home_score=game["home_score"],
+                    actual_away_score=game["away_score"],
+                    actual_margin=margin,
+                    prediction_error=abs(predicted - margin),
+                    correct_winner=_correct_winner(predicted, margin),
+                    covered_spread=_covered(predicted, margin),
+                )
+            )
+
+        changes = [
+            (team, self.final_ratings[team] - rating)
+            for team, rating in self.initial_ratings.items()
+            if team in self.final_ratings
+        ]
+        return BacktestResult(
+            start_date=predictions[0].date if predictions else date.today(),
+            end_date=predictions[-1].date if predictions else date.today(),
+            total_games=self.total_games,
+            predictions=predictions,
+            correct_winner_pct=self.correct_winner_pct,
+            ats_record=self.ats_record,
+            ats_win_pct=self.ats_win_pct,
+            mean_absolute_error=self.mean_absolute_error,
+            median_absolute_error=self.median_absolute_error,
+            initial_ratings=self.initial_ratings,
+            final_ratings=self.final_ratings,
+            biggest_movers=sorted(changes, key=lambda x: abs(x[1]), reverse=True)[:10],
+            weekly_stats=self.weekly_stats,
+        )
+
+
+class WalkForwardBacktest:
+    """
+    Run a grid of power rating configurations over the same games
+
+    Usage:
+        >>> configs = BacktestConfig.grid(
+        ...     performance_weights=[0.08, 0.10, 0.12],
+        ...     home_field_advantages=[1.5, 2.0, 2.5],
+        ... )
+        >>> engine = WalkForwardBacktest(configs, checkpoint_dir=Path("data/backtest"))
+        >>> results = engine.run(games)
+        >>> best = min(results, key=lambda r: r.mean_absolute_error)
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[BacktestConfig],
+        checkpoint_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            configs: Configurations to evaluate
+            checkpoint_dir: Directory for per-configuration weekly checkpoints
+                (None disables checkpointing)
+            max_workers: Worker processes (default: CPU count; 1 runs inline)
+        """
+        self.configs = list(configs)
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(
+        self, games: Sequence[Dict], week_labels: Optional[Sequence[int]] = None
+    ) -> List[WalkForwardResult]:
+        """
+        Backtest every configuration
+
+        Args:
+            games: Game dicts in week order (see PowerRatingBacktest.run_backtest)
+            week_labels: Optional week number per game
+
+        Returns:
+            One WalkForwardResult per configuration, in config order
+        """
+        arrays = GameArrays.from_games(games, week_labels)
+        if self.checkpoint_dir:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+        jobs = [(config, arrays, self.checkpoint_dir) for config in self.configs]
+        workers = min(self.max_workers, len(jobs))
+        if workers <= 1:
+            results = [run_config(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run_config, *zip(*jobs)))
+
+        replayed = sum(r.games_replayed for r in results)
+        logger.info(
+            f"Backtested {len(results)} configs on {len(arrays)} games "
+            f"({replayed} game replays, {workers} workers)"
+        )
+        return results
+
+
+def run_config(
+    config: BacktestConfig, games: GameArrays, checkpoint_dir: Optional[Path] = None
+) -> WalkForwardResult:
+    """Walk one configuration forward through the games (worker entry point)"""
+    initial = config.starting_ratings()
+    ratings = np.array([initial.get(team, np.nan) for team in games.teams])
+    predicted = np.full(len(games), np.nan)
+
+    checkpoint_path = (
+        checkpoint_dir / f"{config.key}.npz" if checkpoint_dir is not None else None
+    )
+    checkpoint = _load_checkpoint(checkpoint_path, games)
+    start = 0
+    resumed_from = None
+    week_rows: Dict[int, np.ndarray] = {}
+    if checkpoint is not None:
+        resumed_from, start, saved_ratings, saved_predicted, week_rows = checkpoint
+        # Teams first seen after the checkpoint start from their initial
+        # rating, exactly as in a full replay
+        ratings = np.where(np.isnan(saved_ratings), ratings, saved_ratings)
+        predicted[:start] = saved_predicted[:start]
+
+    _replay(config, games, ratings, predicted, start, week_rows)
+
+    if checkpoint_path is not None and start < len(games):
+        _save_checkpoint(checkpoint_path, games, predicted, week_rows)
+
+    final = dict(initial)
+    final.update(
+        {team: float(r) for team, r in zip(games.teams, ratings) if not math.isnan(r)}
+    )
+    return _summarize(config, games, predicted, initial, final, resumed_from, start)
+
+
+def _replay(
+    config: BacktestConfig,
+    games: GameArrays,
+    ratings: np.ndarray,
+    predicted: np.ndarray,
+    start: int,
+    week_rows: Dict[int, np.ndarray],
+) -> None:
+    """Predict-then-update from game `start`, snapshotting ratings per week"""
+    # Plain Python floats in the hot loop; numpy scalar indexing is slower
+    state = ratings.tolist()
+    spreads = predicted.tolist()
+    home_idx = games.home.tolist()
+    away_idx = games.away.tolist()
+    margins = (games.home_score - games.away_score).tolist()
+    weeks = games.week.tolist()
+    old_w = config.old_rating_weight
+    perf_w = config.performance_weight
+    hfa = config.home_field_advantage
+
+    for i in range(start, len(weeks)):
+        h, a = home_idx[i], away_idx[i]
+        home_rating, away_rating = state[h], state[a]
+        if not (math.isnan(home_rating) or math.isnan(away_rating)):
+            spreads[i] = round(home_rating - away_rating + hfa, 1)
+            margin = margins[i]
+            state[h] = round(
+                old_w * home_rating + perf_w * (margin + away_rating - hfa), 2
+            )
+            state[a] = round(
+                old_w * away_rating + perf_w * (-margin + home_rating + hfa), 2
+            )
+
+        if i + 1 == len(weeks) or weeks[i + 1] != weeks[i]:
+            week_rows[weeks[i]] = np.array(state)
+
+    ratings[:] = state
+    predicted[:] = spreads
+
+
+def _summarize(
+    config: BacktestConfig,
+    games: GameArrays,
+    predicted: np.ndarray,
+    initial: Dict[str, float],
+    final: Dict[str, float],
+    resumed_from: Optional[int],
+    start: int,
+) -> WalkForwardResult:
+    """Aggregate metrics from the per-game prediction array"""
+    mask = ~np.isnan(predicted)
+    spread = predicted[mask]
+    margin = (games.home_score - games.away_score)[mask]
+    errors = np.abs(spread - margin)
+    correct = ((spread > 0) & (margin > 0)) | ((spread < 0) & (margin < 0))
+    correct |= spread == 0
+    covered = np.where(spread > 0, margin > spread, margin < spread)
+
+    total = len(spread)
+    ats_wins = int(covered.sum())
+    # Upper median, as in PowerRatingBacktest.run_backtest
+    median = float(np.partition(errors, total // 2)[total // 2]) if total else 0.0
+
+    weekly_stats = {}
+    week_values, week_inverse = np.unique(games.week[mask], return_inverse=True)
+    counts = np.bincount(week_inverse, minlength=len(week_values))
+    winners = np.bincount(week_inverse, weights=correct, minlength=len(week_values))
+    ats = np.bincount(week_inverse, weights=covered, minlength=len(week_values))
+    error_sums = np.bincount(week_inverse, weights=errors, minlength=len(week_values))
+    for j, week in enumerate(week_values.tolist()):
+        n = int(counts[j])
+        weekly_stats[week] = {
+            "games": n,
+            "correct_winners": int(winners[j]),
+            "ats_wins": int(ats[j]),
+            "total_error": float(error_sums[j]),
+            "winner_accuracy": float(winners[j] / n),
+            "ats_accuracy": float(ats[j] / n),
+            "avg_error": float(error_sums[j] / n),
+        }
+
+    return WalkForwardResult(
+        config=config,
+        total_games=total,
+        correct_winner_pct=int(correct.sum()) / total if total else 0.0,
+        ats_record=(ats_wins, total - ats_wins, 0),
+        ats_win_pct=ats_wins / total if total else 0.0,
+        mean_absolute_error=float(errors.mean()) if total else 0.0,
+        median_absolute_error=median,
+        initial_ratings=initial,
+        final_ratings=final,
+        weekly_stats=weekly_stats,
+        predicted_spreads=predicted,
+        resumed_from_week=resumed_from,
+        games_replayed=len(games) - start,
+    )
+
+
+def _load_checkpoint(path: Optional[Path], games: GameArrays):
+    """
+    Find the latest checkpointed week whose games match `games`
+
+    Returns (week, games covered, ratings, predicted, week rows kept) or
+    None when there is no usable checkpoint.
+    """
+    if path is None or not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            teams = data["teams"].tolist()
+            weeks = data["weeks"].tolist()
+            digests = data["digests"].tolist()
+            rows = data["ratings"]
+            saved_predicted = data["predicted"]
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return None
+
+    matching = [
+        j for j, week in enumerate(weeks) if games.week_digests.get(week) == digests[j]
+    ]
+    if not matching:
+        return None
+
+    # Digests are cumulative, so the last match covers every earlier week
+    last = matching[-1]
+    week = weeks[last]
+    covered = int(np.searchsorted(games.week, week, side="right"))
+
+    index = {team: j for j, team in enumerate(teams)}
+    week_rows = {}
+    for j in range(last + 1):
+        row = rows[j]
+        week_rows[weeks[j]] = np.array(
+            [row[index[t]] if t in index else np.nan for t in games.teams]
+        )
+
+    # Teams not in the checkpoint are NaN here; run_config fills them in
+    ratings = week_rows[week].copy()
+    return week, covered, ratings, saved_predicted, week_rows
+
+
+def _save_checkpoint(
+    path: Path,
+    games: GameArrays,
+    predicted: np.ndarray,
+    week_rows: Dict[int, np.ndarray],
+) -> None:
+    """Write weekly rating snapshots atomically"""
+    weeks = sorted(week_rows)
+    tmp_path = path.with_suffix(".tmp.npz")
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            teams=np.array(games.teams),
+            weeks=np.array(weeks, dtype=np.int64),
+            digests=np.array([games.week_digests[w] for w in weeks]),
+            ratings=np.vstack([week_rows[w] for w in weeks]),
+            predicted=predicted,
+        )
+    os.replace(tmp_path, path)
+
+
+def _correct_winner(predicted: float, margin: int) -> bool:
+    return (
+        (predicted > 0 and margin > 0)
+        or (predicted < 0 and margin < 0)
+        or predicted == 0
+    )
+
+
+def _covered(predicted: float, margin: int) -> bool:
+    return margin > predicted if predicted > 0 else margin < predicted
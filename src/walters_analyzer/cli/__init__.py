@@ -1,14 +1,28 @@
 """
 CLI Package
 
-Provides both the legacy argparse-based CLI (cli.py) and the new
+Provides both the legacy argparse-based CLI (legacy.py) and the new
 Typer-based CLI (main.py).
 
 Entry points:
-- walters-analyzer: Legacy CLI (cli:main)
+- walters-analyzer: Legacy CLI (cli.legacy:main)
 - walters: New Typer CLI (cli.main:cli)
+
+`app` and `cli` are resolved lazily so importing this package (e.g. for the
+legacy entry point) does not load Typer and the command groups.
 """
 
-from .main import app, cli
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main import app, cli
 
 __all__ = ["app", "cli"]
+
+
+def __getattr__(name: str):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import main
+
+    return getattr(main, name)
@@ -2,6 +2,8 @@
 CLI Commands Package
 
 Each module exports a typer.Typer() app that gets registered with the main CLI.
+Modules are imported on demand by main.LazyGroup (see COMMAND_GROUPS), so
+this package deliberately does not import them.
 
 Available command groups:
 - analyze: Edge detection, game analysis, injury/weather impact
@@ -13,14 +15,6 @@ Available command groups:
 - monitor: Line movement monitoring
 """
 
-from . import analyze
-from . import scrape
-from . import clv
-from . import status
-from . import power_ratings
-from . import db
-from . import monitor
-
 __all__ = [
     "analyze",
     "scrape",
@@ -3,9 +3,7 @@ import sys
 import pathlib
 import subprocess
 import logging
-from walters_analyzer.wkcard import load_card, summarize_card, validate_gates
 from walters_analyzer.config import get_settings
-from walters_analyzer.ingest.nfl_site_scraper import NFLComScraper
 
 
 def setup_logging(settings):
@@ -307,6 +305,8 @@ def main():
     args = parser.parse_args()
 
     if args.cmd == "wk-card":
+        from walters_analyzer.wkcard import load_card, summarize_card, validate_gates
+
         p = pathlib.Path(args.file)
         if not p.exists():
             print(f"ERROR: card not found: {p}", file=sys.stderr)
@@ -838,6 +838,8 @@ def main():
         asyncio.run(scrape_highlightly())
 
     elif args.cmd == "scrape-nfl-site":
+        from walters_analyzer.ingest.nfl_site_scraper import NFLComScraper
+
         scraper = NFLComScraper(
             output_root=args.output_dir,
             season=args.season,
@@ -854,7 +856,7 @@ def main():
         sys.exit(0)
 
     elif args.cmd == "view-odds":
-        from .query.odds_viewer import OddsViewer
+        from walters_analyzer.query.odds_viewer import OddsViewer
         from pathlib import Path
 
         # Initialize viewer
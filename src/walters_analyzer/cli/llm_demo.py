@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from walters_analyzer.llm.agent import WaltersLLMAgent
 from walters_analyzer.pipelines.run_test_pipelines import run_pipeline
 from walters_analyzer.models import BetRecommendation, MatchupEvaluation
@@ -23,14 +25,13 @@ def main() -> None:
     if not isinstance(recommendation, BetRecommendation):
         raise TypeError("Expected BetRecommendation from pipeline.")
 
+    # The pipeline yields a one-game slate; explain_slate batches, rate
+    # limits and caches the call like any full slate
     agent = WaltersLLMAgent()
-    explanation = agent.explain_matchup(
-        evaluation=evaluation,
-        recommendation=recommendation,
-    )
+    explanations = asyncio.run(agent.explain_slate([(evaluation, recommendation)]))
 
     print("\n=== LLM EXPLANATION ===\n")
-    print(explanation)
+    print(explanations[0])
 
 
 if __name__ == "__main__":
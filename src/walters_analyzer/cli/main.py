@@ -2,7 +2,12 @@
 Billy Walters Sports Analyzer - Main CLI Application
 
 This is the new unified CLI using Typer for cleaner subcommand handling.
-The old argparse-based cli.py is preserved for backward compatibility.
+The old argparse-based CLI is preserved in legacy.py for backward compatibility.
+
+Command groups are registered by name and only imported when invoked, and
+heavy dependencies are imported inside the commands that need them, so
+`walters --help` and other light commands start fast (see
+tests/test_cli_startup.py for the import-time budget).
 
 Usage:
     walters analyze edges --sport nfl --week 13
@@ -12,17 +17,68 @@ Usage:
     walters power-ratings update --week 13
 """
 
+from importlib import import_module
+from typing import List, Optional
+
 import typer
-from typing import Optional
+import typer.main
 from rich.console import Console
 from rich.panel import Panel
+from typer.core import TyperGroup
+
+# Command groups: CLI name -> (module in .commands, help). Each module is
+# imported the first time its group is looked up, not at startup.
+COMMAND_GROUPS = {
+    "analyze": ("analyze", "Analyze games, edges, injuries, weather"),
+    "scrape": ("scrape", "Scrape data from various sources"),
+    "clv": ("clv", "Closing Line Value tracking"),
+    "power-ratings": ("power_ratings", "Power ratings management"),
+    "db": ("db", "Database operations"),
+    "monitor": ("monitor", "Line movement monitoring"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """
+    Root command group that loads COMMAND_GROUPS on demand.
+
+    Help output lists unloaded groups from their COMMAND_GROUPS entry, so
+    `walters --help` imports none of them; a group's module is imported
+    only when get_command is asked for it outside of help formatting.
+    """
+
+    _formatting_help = False
+
+    def list_commands(self, ctx: typer.Context) -> List[str]:
+        eager = [
+            name for name in super().list_commands(ctx) if name not in COMMAND_GROUPS
+        ]
+        return eager + list(COMMAND_GROUPS)
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name in COMMAND_GROUPS and cmd_name not in self.commands:
+            module_name, help_text = COMMAND_GROUPS[cmd_name]
+            if self._formatting_help:
+                return TyperGroup(name=cmd_name, help=help_text)
+            module = import_module(f".commands.{module_name}", __package__)
+            group = typer.main.get_group(module.app)
+            group.name = cmd_name
+            group.help = help_text
+            self.add_command(group, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_help(self, ctx: typer.Context, formatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
 
-# Import command groups
-from .commands import analyze, scrape, clv, power_ratings, db, monitor
 
 # Create main app
 app = typer.Typer(
     name="walters",
+    cls=LazyGroup,
     help="Billy Walters Sports Analyzer - Professional betting analysis system",
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -32,16 +88,6 @@ app = typer.Typer(
 
 console = Console()
 
-# Register command groups
-app.add_typer(
-    analyze.app, name="analyze", help="Analyze games, edges, injuries, weather"
-)
-app.add_typer(scrape.app, name="scrape", help="Scrape data from various sources")
-app.add_typer(clv.app, name="clv", help="Closing Line Value tracking")
-app.add_typer(power_ratings.app, name="power-ratings", help="Power ratings management")
-app.add_typer(db.app, name="db", help="Database operations")
-app.add_typer(monitor.app, name="monitor", help="Line movement monitoring")
-
 
 @app.command()
 def status(
@@ -122,6 +122,13 @@ def merge_mcp_config(settings: Settings, mcp_config: Dict[str, Any]) -> Settings
                 monitor_interval=ma_config.get(
                     "monitor_interval", settings.skills.market_analysis.monitor_interval
                 ),
+                history_size=ma_config.get(
+                    "history_size", settings.skills.market_analysis.history_size
+                ),
+                history_max_age_hours=ma_config.get(
+                    "history_max_age_hours",
+                    settings.skills.market_analysis.history_max_age_hours,
+                ),
             )
 
         # ML power ratings
@@ -24,6 +24,8 @@ class MarketAnalysisConfig(BaseModel):
     )
     alert_threshold: float = 0.7
     monitor_interval: int = 30  # seconds
+    history_size: int = 120  # line snapshots kept per game
+    history_max_age_hours: float = 6.0  # drop games idle longer than this
 
 
 class MLPowerRatingsConfig(BaseModel):
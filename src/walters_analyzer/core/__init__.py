@@ -26,12 +26,15 @@ from .calculator import (
     closing_line_value,
 )
 from .bankroll import BankrollManager
+from .simulation import BankrollSimulator, SimBet, SimulationResult
+from .portfolio import PortfolioAllocation, PortfolioOptimizer
 from .point_analyzer import PointAnalyzer
 from .analyzer import BillyWaltersAnalyzer
 
 __all__ = [
     "AnalyzerConfig",
     "BankrollManager",
+    "BankrollSimulator",
     "BetRecommendation",
     "BillyWaltersAnalyzer",
     "GameAnalysis",
@@ -41,6 +44,10 @@ __all__ = [
     "KeyNumberAlert",
     "Moneyline",
     "PointAnalyzer",
+    "PortfolioAllocation",
+    "PortfolioOptimizer",
+    "SimBet",
+    "SimulationResult",
     "SpreadLine",
     "TeamSnapshot",
     "TotalLine",
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from .calculator import kelly_fraction
 
+if TYPE_CHECKING:
+    from .simulation import SimBet, SimulationResult
+
 
 @dataclass(slots=True)
 class BetRecord:
@@ -69,3 +72,20 @@ class BankrollManager:
         elif result < 0:
             self.bankroll -= stake
         record.result = result
+
+    def simulate(
+        self,
+        bets: Iterable["SimBet"],
+        n_paths: int = 100_000,
+        repeat: int = 1,
+        **kwargs,
+    ) -> "SimulationResult":
+        """
+        Monte Carlo the bankroll over a slate or season using this sizing.
+
+        See BankrollSimulator for the correlation and ruin options.
+        """
+        from .simulation import BankrollSimulator
+
+        simulator = BankrollSimulator(self, n_paths=n_paths, **kwargs)
+        return simulator.simulate(bets, repeat=repeat)
@@ -11,6 +11,15 @@ Responsibilities:
 4. Adjust weights for future predictions
 5. Provide calibration reports and recommendations
 
+Storage:
+    calibration_records          One row per prediction (+ outcome)
+    calibration_record_sources   One row per (record, E-Factor source, weight)
+    calibration_weekly_rollups   Per (league, week) sums, refreshed on write
+    calibration_source_rollups   Per (league, week, source) weighted sums
+
+Reports aggregate the rollup tables rather than scanning every record, so
+their cost grows with the number of weeks, not the number of predictions.
+
 Usage:
     calibrator = EFactorCalibrator(db_path="output/calibration.db")
     await calibrator.initialize()
@@ -38,7 +47,7 @@ import sqlite3
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +113,8 @@ class CalibrationMetrics:
     best_source: Optional[str] = None
     worst_source: Optional[str] = None
     source_scores: Dict[str, float] = None  # type: ignore
+    # Per source: bets, win_rate, roi_per_bet_pct, rmse (weighted by source share)
+    source_breakdown: Dict[str, Dict[str, float]] = None  # type: ignore
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -130,6 +141,7 @@ class EFactorCalibrator:
     async def initialize(self) -> None:
         """Initialize database and create tables."""
         self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
         cursor = self.conn.cursor()
 
         # Create records table
@@ -193,17 +205,84 @@ class EFactorCalibrator:
         """
         )
 
+        # Create normalized E-Factor sources table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS calibration_record_sources (
+                record_id INTEGER NOT NULL
+                    REFERENCES calibration_records(id) ON DELETE CASCADE,
+                source TEXT NOT NULL,
+                weight REAL NOT NULL DEFAULT 1.0,
+                PRIMARY KEY (record_id, source)
+            )
+        """
+        )
+
+        # Create weekly rollup tables (refreshed by record_prediction/outcome)
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS calibration_weekly_rollups (
+                league TEXT NOT NULL,
+                week INTEGER NOT NULL,
+
+                predictions INTEGER NOT NULL,
+                outcomes INTEGER NOT NULL,
+                sum_predicted_edge REAL,
+                sum_actual_margin REAL,
+                sum_squared_error REAL,
+                ats_wins INTEGER,
+                ats_losses INTEGER,
+                ats_pushes INTEGER,
+                sum_roi REAL,
+                sum_abs_adjustment REAL,
+                max_abs_adjustment REAL,
+                min_abs_adjustment REAL,
+
+                PRIMARY KEY (league, week)
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS calibration_source_rollups (
+                league TEXT NOT NULL,
+                week INTEGER NOT NULL,
+                source TEXT NOT NULL,
+
+                bets INTEGER NOT NULL,
+                weight REAL NOT NULL,
+                weighted_wins REAL,
+                weighted_roi REAL,
+                weighted_squared_error REAL,
+
+                PRIMARY KEY (league, week, source)
+            )
+        """
+        )
+
         # Create index for faster queries
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_game_id ON calibration_records(game_id)"
         )
+        # Covering index for per-week aggregation (replaces the week-only index
+        # and the unusable index on the JSON sources column)
+        cursor.execute("DROP INDEX IF EXISTS idx_week")
+        cursor.execute("DROP INDEX IF EXISTS idx_efactor_sources")
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_week ON calibration_records(week)"
+            """
+            CREATE INDEX IF NOT EXISTS idx_league_week ON calibration_records(
+                league, week, actual_result, ats_result, actual_margin,
+                edge_accuracy, roi_contribution, predicted_edge_pct,
+                efactor_adjustment
+            )
+        """
         )
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_efactor_sources ON calibration_records(efactor_sources)"
+            "CREATE INDEX IF NOT EXISTS idx_source_record "
+            "ON calibration_record_sources(source, record_id)"
         )
 
+        self._migrate(cursor)
         self.conn.commit()
         logger.info("EFactorCalibrator initialized")
 
@@ -213,6 +292,127 @@ class EFactorCalibrator:
             self.conn.close()
             logger.info("EFactorCalibrator closed")
 
+    def _migrate(self, cursor: sqlite3.Cursor) -> None:
+        """Backfill source rows and rollups for records from older databases."""
+        cursor.execute(
+            """
+            SELECT id, efactor_sources FROM calibration_records r
+            WHERE efactor_sources NOT IN ('[]', '{}')
+            AND NOT EXISTS (
+                SELECT 1 FROM calibration_record_sources s WHERE s.record_id = r.id
+            )
+        """
+        )
+        rows = cursor.fetchall()
+        for record_id, sources in rows:
+            self._insert_sources(cursor, record_id, json.loads(sources))
+
+        cursor.execute(
+            """
+            SELECT DISTINCT league, week FROM calibration_records r
+            WHERE NOT EXISTS (
+                SELECT 1 FROM calibration_weekly_rollups w
+                WHERE w.league = r.league AND w.week = r.week
+            )
+        """
+        )
+        weeks = cursor.fetchall()
+        for league, week in weeks:
+            self._refresh_rollups(cursor, league, week)
+
+        if rows or weeks:
+            logger.info(
+                f"Backfilled sources for {len(rows)} records and "
+                f"rollups for {len(weeks)} weeks"
+            )
+
+    @staticmethod
+    def _source_weights(
+        efactor_sources: Union[List[str], Dict[str, float]],
+    ) -> Dict[str, float]:
+        """Weight per source: as given, or the adjustment split evenly."""
+        if isinstance(efactor_sources, dict):
+            return {source: float(w) for source, w in efactor_sources.items()}
+        unique = list(dict.fromkeys(efactor_sources))
+        return {source: 1.0 / len(unique) for source in unique}
+
+    def _insert_sources(
+        self,
+        cursor: sqlite3.Cursor,
+        record_id: int,
+        efactor_sources: Union[List[str], Dict[str, float]],
+    ) -> None:
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO calibration_record_sources
+                (record_id, source, weight)
+            VALUES (?, ?, ?)
+        """,
+            [
+                (record_id, source, weight)
+                for source, weight in self._source_weights(efactor_sources).items()
+            ],
+        )
+
+    def _refresh_rollups(self, cursor: sqlite3.Cursor, league: str, week: int) -> None:
+        """Recompute the weekly and per-source rollups for one league week."""
+        params = {"league": league, "week": week}
+        for table in ("calibration_weekly_rollups", "calibration_source_rollups"):
+            cursor.execute(
+                f"DELETE FROM {table} WHERE league = :league AND week = :week", params
+            )
+
+        cursor.execute(
+            """
+            INSERT INTO calibration_weekly_rollups
+            SELECT
+                league,
+                week,
+                COUNT(*),
+                COUNT(actual_result),
+                SUM(CASE WHEN actual_result IS NOT NULL THEN predicted_edge_pct END),
+                SUM(CASE WHEN actual_result IS NOT NULL THEN actual_margin END),
+                SUM(CASE WHEN actual_result IS NOT NULL
+                    THEN edge_accuracy * edge_accuracy END),
+                SUM(CASE WHEN actual_result IS NOT NULL AND ats_result = 1
+                    THEN 1 ELSE 0 END),
+                SUM(CASE WHEN actual_result IS NOT NULL AND ats_result = 0
+                    THEN 1 ELSE 0 END),
+                SUM(CASE WHEN actual_result IS NOT NULL AND actual_margin = 0
+                    THEN 1 ELSE 0 END),
+                SUM(CASE WHEN actual_result IS NOT NULL THEN roi_contribution END),
+                SUM(ABS(efactor_adjustment)),
+                MAX(ABS(efactor_adjustment)),
+                MIN(ABS(efactor_adjustment))
+            FROM calibration_records
+            WHERE league = :league AND week = :week
+            GROUP BY league, week
+        """,
+            params,
+        )
+
+        cursor.execute(
+            """
+            INSERT INTO calibration_source_rollups
+            SELECT
+                r.league,
+                r.week,
+                s.source,
+                COUNT(*),
+                SUM(s.weight),
+                SUM(s.weight * r.ats_result),
+                SUM(s.weight * r.roi_contribution),
+                SUM(s.weight * r.edge_accuracy * r.edge_accuracy)
+            FROM calibration_records r
+            JOIN calibration_record_sources s ON s.record_id = r.id
+            WHERE r.league = :league AND r.week = :week
+            AND r.actual_result IS NOT NULL
+            AND r.ats_result IS NOT NULL
+            GROUP BY s.source
+        """,
+            params,
+        )
+
     async def record_prediction(
         self,
         game_id: str,
@@ -221,11 +421,17 @@ class EFactorCalibrator:
         league: str,
         predicted_edge_pct: float,
         efactor_adjustment: float,
-        efactor_sources: List[str],
+        efactor_sources: Union[List[str], Dict[str, float]],
         sharp_alignment: str = "NEUTRAL",
         confidence_level: str = "NONE",
     ) -> None:
-        """Record a prediction for later calibration."""
+        """
+        Record a prediction for later calibration.
+
+        ``efactor_sources`` is a list of source names (the adjustment is
+        split evenly between them) or a mapping of source name to weight.
+        """
+        weights = self._source_weights(efactor_sources)
         record = CalibrationRecord(
             game_id=game_id,
             week=week,
@@ -234,12 +440,20 @@ class EFactorCalibrator:
             league=league,
             predicted_edge_pct=predicted_edge_pct,
             efactor_adjustment=efactor_adjustment,
-            efactor_sources=efactor_sources,
+            efactor_sources=list(weights),
             sharp_alignment=sharp_alignment,
             confidence_level=confidence_level,
         )
 
         cursor = self.conn.cursor()
+
+        # A re-recorded prediction may move weeks; refresh the old week too
+        cursor.execute(
+            "SELECT league, week FROM calibration_records WHERE game_id = ?",
+            (game_id,),
+        )
+        previous = cursor.fetchone()
+
         cursor.execute(
             """
             INSERT OR REPLACE INTO calibration_records (
@@ -261,6 +475,11 @@ class EFactorCalibrator:
                 record.confidence_level,
             ),
         )
+        self._insert_sources(cursor, cursor.lastrowid, weights)
+
+        self._refresh_rollups(cursor, record.league, record.week)
+        if previous and previous != (record.league, record.week):
+            self._refresh_rollups(cursor, *previous)
         self.conn.commit()
         logger.debug(f"Recorded prediction for {game_id}")
 
@@ -276,7 +495,8 @@ class EFactorCalibrator:
 
         # Get the prediction
         cursor.execute(
-            "SELECT predicted_edge_pct FROM calibration_records WHERE game_id = ?",
+            "SELECT predicted_edge_pct, league, week FROM calibration_records "
+            "WHERE game_id = ?",
             (game_id,),
         )
         row = cursor.fetchone()
@@ -284,7 +504,7 @@ class EFactorCalibrator:
             logger.warning(f"No prediction found for {game_id}")
             return
 
-        predicted_edge = row[0]
+        predicted_edge, league, week = row
 
         # Calculate metrics
         edge_accuracy = abs(predicted_edge - actual_margin)
@@ -313,6 +533,7 @@ class EFactorCalibrator:
                 game_id,
             ),
         )
+        self._refresh_rollups(cursor, league, week)
         self.conn.commit()
         logger.debug(f"Recorded outcome for {game_id}")
 
@@ -331,69 +552,52 @@ class EFactorCalibrator:
         """
         cursor = self.conn.cursor()
 
-        # Build query
-        where_clause = "WHERE league = ?"
-        params: List[Any] = [league]
-
-        if weeks:
-            cursor.execute(
-                "SELECT MAX(week) FROM calibration_records WHERE league = ?", [league]
+        # Weeks in scope: all, or the last N up to the league's latest week
+        scope = """
+            league = :league AND (
+                :weeks IS NULL
+                OR week > (
+                    SELECT MAX(week) FROM calibration_weekly_rollups
+                    WHERE league = :league
+                ) - :weeks
             )
-            max_week = cursor.fetchone()[0]
-            if max_week:
-                min_week = max_week - weeks + 1
-                where_clause += f" AND week >= {min_week}"
-
-        # Get predictions and outcomes
-        cursor.execute(
-            f"""
-            SELECT COUNT(*) FROM calibration_records {where_clause}
-        """,
-            params,
-        )
-        total_predictions = cursor.fetchone()[0]
+        """
+        params = {"league": league, "weeks": weeks or None}
 
         cursor.execute(
             f"""
-            SELECT COUNT(*) FROM calibration_records {where_clause}
-            AND actual_result IS NOT NULL
+            SELECT
+                SUM(predictions),
+                SUM(outcomes),
+                SUM(sum_predicted_edge),
+                SUM(sum_actual_margin),
+                SUM(sum_squared_error),
+                SUM(ats_wins),
+                SUM(ats_losses),
+                SUM(ats_pushes),
+                SUM(sum_roi),
+                SUM(sum_abs_adjustment),
+                MAX(max_abs_adjustment),
+                MIN(min_abs_adjustment)
+            FROM calibration_weekly_rollups
+            WHERE {scope}
         """,
             params,
         )
-        total_outcomes = cursor.fetchone()[0]
+        row = cursor.fetchone()
+        total_predictions = row[0] or 0
+        total_outcomes = row[1] or 0
 
         # Edge accuracy metrics
-        cursor.execute(
-            f"""
-            SELECT AVG(predicted_edge_pct), AVG(actual_margin), AVG(edge_accuracy * edge_accuracy)
-            FROM calibration_records {where_clause}
-            AND actual_result IS NOT NULL
-        """,
-            params,
-        )
-        row = cursor.fetchone()
-        avg_predicted_edge = row[0] or 0.0
-        avg_actual_margin = row[1] or 0.0
-        edge_rmse = (row[2] or 0.0) ** 0.5
+        avg_predicted_edge = (row[2] or 0.0) / total_outcomes if total_outcomes else 0.0
+        avg_actual_margin = (row[3] or 0.0) / total_outcomes if total_outcomes else 0.0
+        edge_rmse = ((row[4] or 0.0) / total_outcomes) ** 0.5 if total_outcomes else 0.0
 
         # ATS performance
-        cursor.execute(
-            f"""
-            SELECT
-                COUNT(*),
-                SUM(CASE WHEN ats_result = 1 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN ats_result = 0 THEN 1 ELSE 0 END),
-                SUM(CASE WHEN actual_margin = 0 THEN 1 ELSE 0 END)
-            FROM calibration_records {where_clause}
-            AND actual_result IS NOT NULL
-        """,
-            params,
-        )
-        row = cursor.fetchone()
-        ats_total = row[0] or 0
-        ats_wins = row[1] or 0
-        ats_losses = row[2] or 0
-        ats_pushes = row[3] or 0
+        ats_total = total_outcomes
+        ats_wins = row[5] or 0
+        ats_losses = row[6] or 0
+        ats_pushes = row[7] or 0
         ats_win_rate = (
             (ats_wins / (ats_total - ats_pushes) * 100)
             if (ats_total - ats_pushes) > 0
@@ -401,53 +605,43 @@ class EFactorCalibrator:
         )
 
         # ROI
-        cursor.execute(
-            f"""
-            SELECT SUM(roi_contribution)
-            FROM calibration_records {where_clause}
-            AND actual_result IS NOT NULL
-        """,
-            params,
-        )
-        total_roi = cursor.fetchone()[0] or 0.0
+        total_roi = row[8] or 0.0
         roi_per_bet = (total_roi / ats_total * 100) if ats_total > 0 else 0.0
 
         # E-Factor impact
-        cursor.execute(
-            f"""
-            SELECT AVG(ABS(efactor_adjustment)), MAX(ABS(efactor_adjustment)), MIN(ABS(efactor_adjustment))
-            FROM calibration_records {where_clause}
-        """,
-            params,
+        efactor_impact_avg = (
+            (row[9] or 0.0) / total_predictions if total_predictions else 0.0
         )
-        row = cursor.fetchone()
-        efactor_impact_avg = row[0] or 0.0
-        efactor_impact_max = row[1] or 0.0
-        efactor_impact_min = row[2] or 0.0
+        efactor_impact_max = row[10] or 0.0
+        efactor_impact_min = row[11] or 0.0
 
-        # Source quality
+        # Source quality (weighted by each source's share of the adjustment)
         cursor.execute(
             f"""
-            SELECT efactor_sources, AVG(CAST(ats_result AS FLOAT))
-            FROM calibration_records {where_clause}
-            AND actual_result IS NOT NULL
-            AND ats_result IS NOT NULL
-            GROUP BY efactor_sources
+            SELECT
+                source,
+                SUM(bets),
+                SUM(weighted_wins) / SUM(weight),
+                SUM(weighted_roi) / SUM(weight),
+                SUM(weighted_squared_error) / SUM(weight)
+            FROM calibration_source_rollups
+            WHERE {scope}
+            GROUP BY source
+            HAVING SUM(weight) > 0
         """,
             params,
         )
-        source_scores: Dict[str, float] = {}
-        rows = cursor.fetchall()
-        for row in rows:
-            sources = json.loads(row[0])
-            win_rate = row[1] or 0.0
-            for source in sources:
-                if source not in source_scores:
-                    source_scores[source] = []
-                source_scores[source].append(win_rate)
-
-        # Average by source
-        source_scores = {k: sum(v) / len(v) for k, v in source_scores.items()}
+        source_breakdown: Dict[str, Dict[str, float]] = {}
+        for source, bets, win_rate, roi, mse in cursor.fetchall():
+            source_breakdown[source] = {
+                "bets": bets,
+                "win_rate": win_rate or 0.0,
+                "roi_per_bet_pct": (roi or 0.0) * 100,
+                "rmse": (mse or 0.0) ** 0.5,
+            }
+        source_scores = {
+            source: stats["win_rate"] for source, stats in source_breakdown.items()
+        }
 
         best_source = (
             max(source_scores, key=source_scores.get) if source_scores else None
@@ -475,6 +669,7 @@ class EFactorCalibrator:
             best_source=best_source,
             worst_source=worst_source,
             source_scores=source_scores,
+            source_breakdown=source_breakdown,
         )
 
     async def export_report(
@@ -638,8 +833,8 @@ async def main() -> None:
 
     # Record outcomes
     print("Recording outcomes...")
-    await calibrator.record_outcome("KC@DAL_W13", "LOSS", -2.5, clv=0.05)
-    await calibrator.record_outcome("GB@DET_W13", "WIN", 4.5, clv=-0.02)
+    await calibrator.record_outcome("KC@DAL_W13", "LOSS", -2.5, closing_line_value=0.05)
+    await calibrator.record_outcome("GB@DET_W13", "WIN", 4.5, closing_line_value=-0.02)
 
     # Get and print report
     await calibrator.print_report(league="nfl")
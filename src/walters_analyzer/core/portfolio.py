@@ -0,0 +1,224 @@
+"""Joint Kelly sizing for a week's bets under per-bet and total exposure caps."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .bankroll import BankrollManager
+from .calculator import american_to_decimal
+from .simulation import SimBet, bet_returns, correlated_latent
+
+DEFAULT_MAX_TOTAL_PCT = 15.0
+
+
+@dataclass(slots=True)
+class PortfolioAllocation:
+    """Stakes for a slate, as percentages of bankroll, aligned with the bets."""
+
+    stake_pct: List[float]
+    independent_pct: List[float]  # What recommend_pct gives each bet alone
+    total_pct: float
+    expected_growth: float  # E[log(bankroll after / before)] for the slate
+    expected_return_pct: float
+    iterations: int
+    solve_seconds: float
+
+
+def project_capped_simplex(
+    x: np.ndarray, upper: np.ndarray, total: float
+) -> np.ndarray:
+    """Euclidean projection onto {0 <= f <= upper, sum(f) <= total}."""
+    f = np.clip(x, 0.0, upper)
+    if f.sum() <= total:
+        return f
+
+    # sum(clip(x - tau, 0, upper)) falls as tau rises; bisect for == total
+    lo, hi = 0.0, float(x.max())
+    for _ in range(60):
+        tau = (lo + hi) / 2.0
+        if np.clip(x - tau, 0.0, upper).sum() > total:
+            lo = tau
+        else:
+            hi = tau
+    return np.clip(x - hi, 0.0, upper)
+
+
+class PortfolioOptimizer:
+    """
+    Sizes all of a week's bets together by maximizing expected log growth.
+
+    Individual Kelly sizing ignores that bets share one bankroll and that a
+    game's spread and total are correlated. This solves
+
+        max E[log(1 + sum_i f_i r_i)]
+        s.t. 0 <= f_i <= max_risk_pct, sum_i f_i <= max_total_pct
+
+    over sampled outcome scenarios (the same same-game copula as
+    BankrollSimulator), scaled by the manager's fractional Kelly. Scenario
+    draws and the last solution are kept, so ``update`` after a line move
+    only recomputes returns and warm-starts the solver.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[BankrollManager] = None,
+        max_total_pct: float = DEFAULT_MAX_TOTAL_PCT,
+        same_game_correlation: float = 0.3,
+        n_scenarios: int = 20_000,
+        seed: Optional[int] = 0,
+        tol: float = 1e-7,
+        max_iter: int = 500,
+    ) -> None:
+        self.manager = manager or BankrollManager()
+        self.max_total_pct = max_total_pct
+        self.same_game_correlation = same_game_correlation
+        self.n_scenarios = n_scenarios
+        self.seed = seed
+        self.tol = tol
+        self.max_iter = max_iter
+
+        self._bets: List[SimBet] = []
+        self._latent: Optional[np.ndarray] = None
+        self._solution: Optional[np.ndarray] = None
+
+    @property
+    def bets(self) -> List[SimBet]:
+        return list(self._bets)
+
+    def optimize(self, bets: Sequence[SimBet]) -> PortfolioAllocation:
+        """
+        Jointly size a slate of bets.
+
+        Scenarios are redrawn only when the slate's games change, so
+        re-optimizing the same slate with new prices is warm-started.
+        """
+        bets = list(bets)
+        games = [b.game_id for b in bets]
+        if self._latent is None or games != [b.game_id for b in self._bets]:
+            rng = np.random.default_rng(self.seed)
+            self._latent = correlated_latent(
+                rng, self.n_scenarios, bets, self.same_game_correlation
+            )
+            self._solution = None
+        self._bets = bets
+        return self._solve()
+
+    def update(
+        self,
+        index: int,
+        odds: Optional[int] = None,
+        win_probability: Optional[float] = None,
+        push_probability: Optional[float] = None,
+    ) -> PortfolioAllocation:
+        """Re-optimize after one bet's price or probability moves."""
+        bet = self._bets[index]
+        changes = {
+            "odds": odds,
+            "win_probability": win_probability,
+            "push_probability": push_probability,
+        }
+        self._bets[index] = replace(
+            bet, **{k: v for k, v in changes.items() if v is not None}
+        )
+        return self._solve()
+
+    def _solve(self) -> PortfolioAllocation:
+        start = time.perf_counter()
+        bets = self._bets
+        independent = [
+            self.manager.recommend_pct(b.win_probability, b.odds) for b in bets
+        ]
+        if not bets:
+            return PortfolioAllocation([], [], 0.0, 0.0, 0.0, 0, 0.0)
+
+        # Fractional Kelly: solve full Kelly on g = f / fraction, with the
+        # caps scaled to match, then scale back down
+        fraction = self.manager.fractional_kelly
+        upper = np.full(len(bets), self.manager.max_risk_pct / 100.0 / fraction)
+        total = self.max_total_pct / 100.0 / fraction
+
+        # Recentre each bet's sampled returns on its exact expected value, so
+        # sampling noise in the means (comparable to the edges themselves)
+        # does not decide which bets get funded
+        ev = np.array(
+            [
+                b.win_probability * (american_to_decimal(b.odds) - 1.0)
+                - (1.0 - b.win_probability - b.push_probability)
+                for b in bets
+            ]
+        )
+        returns = bet_returns(self._latent, bets)
+        returns += ev - returns.mean(axis=0)
+
+        # Never stake a bet with no edge of its own
+        upper[ev <= 0.0] = 0.0
+
+        g, iterations = self._ascend(returns, upper, total, self._solution)
+
+        # Stakes below the manager's minimum bet are dropped, not rounded up.
+        # Drop only the smallest one per pass: its share of the total goes to
+        # the rest, which may lift them over the minimum (dropping all of
+        # them at once would zero out a full card of thin edges)
+        min_stake = self.manager.min_bet_pct / 100.0 / fraction
+        for _ in range(len(bets)):
+            below_min = np.flatnonzero((g > 0.0) & (g < min_stake))
+            if not below_min.size:
+                break
+            upper[below_min[np.argmin(g[below_min])]] = 0.0
+            g, more = self._ascend(returns, upper, total, g)
+            iterations += more
+        self._solution = g
+
+        stakes = g * fraction
+        wealth = 1.0 + returns @ stakes
+        return PortfolioAllocation(
+            stake_pct=[round(float(s) * 100.0, 2) for s in stakes],
+            independent_pct=independent,
+            total_pct=round(float(stakes.sum()) * 100.0, 2),
+            expected_growth=float(np.log(wealth).mean()),
+            expected_return_pct=float((wealth.mean() - 1.0) * 100.0),
+            iterations=iterations,
+            solve_seconds=time.perf_counter() - start,
+        )
+
+    def _ascend(
+        self,
+        returns: np.ndarray,
+        upper: np.ndarray,
+        total: float,
+        start: Optional[np.ndarray],
+    ) -> tuple[np.ndarray, int]:
+        """Projected gradient ascent on mean log wealth with backtracking."""
+        n_scenarios = returns.shape[0]
+        g = project_capped_simplex(
+            start if start is not None else np.zeros(returns.shape[1]), upper, total
+        )
+        wealth = 1.0 + returns @ g
+        objective = np.log(wealth).mean()
+        step = 1.0
+
+        for iteration in range(1, self.max_iter + 1):
+            gradient = returns.T @ (1.0 / wealth) / n_scenarios
+            while True:
+                candidate = project_capped_simplex(g + step * gradient, upper, total)
+                move = candidate - g
+                cand_wealth = 1.0 + returns @ candidate
+                if cand_wealth.min() > 0.0:
+                    cand_objective = np.log(cand_wealth).mean()
+                    bound = objective + gradient @ move - (move @ move) / (2.0 * step)
+                    if cand_objective >= bound:
+                        break
+                step /= 2.0
+                if step < 1e-12:
+                    return g, iteration
+
+            g, wealth, objective = candidate, cand_wealth, cand_objective
+            if np.abs(move).max() < self.tol:
+                return g, iteration
+            step *= 2.0
+
+        return g, self.max_iter
@@ -0,0 +1,262 @@
+"""Vectorized Monte Carlo bankroll simulation for a slate or season of bets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bankroll import BankrollManager
+from .calculator import american_to_decimal
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+
+@dataclass(slots=True)
+class SimBet:
+    """A recommended wager to simulate.
+
+    Bets sharing a ``round`` are placed together (one slate/week) and sized
+    from the bankroll at the start of that round. Bets sharing a ``game_id``
+    (e.g. a spread and total on the same game) have correlated outcomes.
+    """
+
+    win_probability: float
+    odds: int
+    round: int = 0
+    game_id: Optional[str] = None
+    push_probability: float = 0.0
+
+
+@dataclass
+class SimulationResult:
+    """Per-path outcomes of a bankroll simulation."""
+
+    initial_bankroll: float
+    rounds: int
+    ruin_threshold: float
+    final_bankroll: np.ndarray
+    min_bankroll: np.ndarray
+    max_drawdown: np.ndarray
+    settings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def paths(self) -> int:
+        return len(self.final_bankroll)
+
+    @property
+    def risk_of_ruin(self) -> float:
+        """Share of paths that fell to the ruin threshold at any point."""
+        floor = self.initial_bankroll * self.ruin_threshold
+        return float(np.mean(self.min_bankroll <= floor))
+
+    @property
+    def growth_rate(self) -> np.ndarray:
+        """Log growth of the bankroll per round, per path."""
+        ratio = np.maximum(self.final_bankroll, 1e-12) / self.initial_bankroll
+        return np.log(ratio) / max(self.rounds, 1)
+
+    def summary(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, object]:
+        """Risk-of-ruin plus percentile tables for bankroll, drawdown and growth."""
+
+        def table(values: np.ndarray) -> Dict[str, float]:
+            points = np.percentile(values, percentiles)
+            stats = {f"p{p:g}": float(v) for p, v in zip(percentiles, points)}
+            stats["mean"] = float(values.mean())
+            return stats
+
+        return {
+            "settings": dict(self.settings),
+            "paths": self.paths,
+            "rounds": self.rounds,
+            "risk_of_ruin": self.risk_of_ruin,
+            "prob_profit": float(np.mean(self.final_bankroll > self.initial_bankroll)),
+            "final_bankroll": table(self.final_bankroll),
+            "max_drawdown_pct": table(self.max_drawdown * 100.0),
+            "growth_rate": table(self.growth_rate),
+        }
+
+
+class BankrollSimulator:
+    """Simulates many bankroll paths at once using a BankrollManager's sizing.
+
+    Stakes come from ``manager.recommend_pct`` (fractional Kelly with the
+    manager's min/max limits) as a share of each path's current bankroll.
+    Outcomes are drawn from a Gaussian copula: every bet's latent normal has
+    correlation ``same_game_correlation`` with the other bets on its game and
+    is independent of everything else, so each bet keeps its own win/push
+    probabilities.
+    """
+
+    def __init__(
+        self,
+        manager: BankrollManager,
+        n_paths: int = 100_000,
+        same_game_correlation: float = 0.3,
+        ruin_threshold: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        if not 0.0 <= same_game_correlation < 1.0:
+            raise ValueError("same_game_correlation must be in [0, 1)")
+        self.manager = manager
+        self.n_paths = n_paths
+        self.same_game_correlation = same_game_correlation
+        self.ruin_threshold = ruin_threshold
+        self.seed = seed
+
+    def stake_fractions(self, bets: Sequence[SimBet]) -> np.ndarray:
+        """Fraction of bankroll the manager would risk on each bet."""
+        pcts = [self.manager.recommend_pct(b.win_probability, b.odds) for b in bets]
+        return np.array(pcts) / 100.0
+
+    def _outcomes(self, rng: np.random.Generator, bets: Sequence[SimBet]) -> np.ndarray:
+        """Per-path return per unit staked (win: payout, push: 0, loss: -1)."""
+        latent = correlated_latent(rng, self.n_paths, bets, self.same_game_correlation)
+        return bet_returns(latent, bets)
+
+    def simulate(self, bets: Iterable[SimBet], repeat: int = 1) -> SimulationResult:
+        """
+        Run all paths through the schedule of bets.
+
+        Args:
+            bets: Bets to place, grouped into rounds by ``SimBet.round``
+            repeat: Replay the whole schedule this many times (e.g. a typical
+                weekly slate over a season)
+
+        Returns:
+            SimulationResult with final bankroll, minimum bankroll and maximum
+            drawdown per path
+        """
+        bets = list(bets)
+        rounds: Dict[int, List[SimBet]] = {}
+        for bet in bets:
+            rounds.setdefault(bet.round, []).append(bet)
+        schedule = [rounds[r] for r in sorted(rounds)] * repeat
+        fractions = [self.stake_fractions(slate) for slate in schedule]
+
+        rng = np.random.default_rng(self.seed)
+        initial = self.manager.bankroll
+        bankroll = np.full(self.n_paths, initial, dtype=float)
+        peak = bankroll.copy()
+        low = bankroll.copy()
+        drawdown = np.zeros(self.n_paths)
+
+        for slate, stakes in zip(schedule, fractions):
+            # Never risk more than the whole bankroll in one round
+            exposure = stakes.sum()
+            if exposure > 1.0:
+                stakes = stakes / exposure
+            growth = 1.0 + self._outcomes(rng, slate) @ stakes
+            bankroll *= np.maximum(growth, 0.0)
+
+            np.maximum(peak, bankroll, out=peak)
+            np.minimum(low, bankroll, out=low)
+            np.maximum(drawdown, 1.0 - bankroll / peak, out=drawdown)
+
+        return SimulationResult(
+            initial_bankroll=initial,
+            rounds=len(schedule),
+            ruin_threshold=self.ruin_threshold,
+            final_bankroll=bankroll,
+            min_bankroll=low,
+            max_drawdown=drawdown,
+            settings={
+                "fractional_kelly": self.manager.fractional_kelly,
+                "max_risk_pct": self.manager.max_risk_pct,
+                "min_bet_pct": self.manager.min_bet_pct,
+            },
+        )
+
+    def compare(
+        self,
+        bets: Iterable[SimBet],
+        settings: Iterable[Mapping[str, float]],
+        repeat: int = 1,
+    ) -> List[SimulationResult]:
+        """
+        Simulate the same bets under alternative manager settings.
+
+        Every run uses this simulator's seed, so all settings see the same
+        game outcomes and differences come from sizing alone.
+
+        Args:
+            bets: Bets to place
+            settings: BankrollManager overrides, e.g.
+                ``[{"fractional_kelly": 0.25}, {"fractional_kelly": 0.5}]``
+            repeat: Replay the schedule this many times
+
+        Returns:
+            One SimulationResult per settings entry
+        """
+        bets = list(bets)
+        base = {
+            "initial_bankroll": self.manager.bankroll,
+            "max_risk_pct": self.manager.max_risk_pct,
+            "min_bet_pct": self.manager.min_bet_pct,
+            "fractional_kelly": self.manager.fractional_kelly,
+        }
+        results = []
+        for overrides in settings:
+            simulator = BankrollSimulator(
+                BankrollManager(**{**base, **overrides}),
+                n_paths=self.n_paths,
+                same_game_correlation=self.same_game_correlation,
+                ruin_threshold=self.ruin_threshold,
+                seed=self.seed,
+            )
+            results.append(simulator.simulate(bets, repeat=repeat))
+        return results
+
+
+def correlated_latent(
+    rng: np.random.Generator,
+    n_paths: int,
+    bets: Sequence[SimBet],
+    same_game_correlation: float,
+) -> np.ndarray:
+    """Standard-normal draws per path and bet, correlated within each game."""
+    rho = same_game_correlation
+    latent = rng.standard_normal((n_paths, len(bets)))
+    if rho <= 0.0:
+        return latent
+
+    games: Dict[str, List[int]] = {}
+    for i, bet in enumerate(bets):
+        if bet.game_id is not None:
+            games.setdefault(bet.game_id, []).append(i)
+    shared = [cols for cols in games.values() if len(cols) > 1]
+    if shared:
+        factors = rng.standard_normal((n_paths, len(shared)))
+        for g, cols in enumerate(shared):
+            latent[:, cols] = (
+                np.sqrt(rho) * factors[:, [g]] + np.sqrt(1.0 - rho) * latent[:, cols]
+            )
+    return latent
+
+
+def bet_returns(latent: np.ndarray, bets: Sequence[SimBet]) -> np.ndarray:
+    """
+    Map latent draws to returns per unit staked (win: payout, push: 0, loss: -1).
+
+    A bet wins when its draw falls below the normal quantile of its win
+    probability, so outcomes follow each bet's own probabilities.
+    """
+    normal = NormalDist()
+    win_cut = np.array([normal.inv_cdf(_clip(b.win_probability)) for b in bets])
+    push_cut = np.array(
+        [normal.inv_cdf(_clip(b.win_probability + b.push_probability)) for b in bets]
+    )
+    payout = np.array([american_to_decimal(b.odds) - 1.0 for b in bets])
+
+    returns = np.where(latent < win_cut, payout, -1.0)
+    returns[(latent >= win_cut) & (latent < push_cut)] = 0.0
+    return returns
+
+
+def _clip(probability: float) -> float:
+    """Keep probabilities inside (0, 1) for the normal quantile."""
+    return min(max(probability, 1e-12), 1.0 - 1e-12)
@@ -2,13 +2,32 @@
 Market data feeds for live odds and line movement tracking
 """
 
-from .market_data_client import (
-    MarketDataFeed,
-    OddsAPIClient,
-    PinnacleClient,
-    DraftKingsClient,
-)
-from .market_monitor import MarketMonitor
+from typing import TYPE_CHECKING
+
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .market_data_client import (
+        MarketDataFeed,
+        OddsAPIClient,
+        PinnacleClient,
+        DraftKingsClient,
+    )
+    from .market_monitor import MarketMonitor
+    from .line_history import GameLineHistory, LineHistory
+
+# Exported name -> submodule, imported on first attribute access
+_EXPORTS = {
+    "MarketDataFeed": ".market_data_client",
+    "OddsAPIClient": ".market_data_client",
+    "PinnacleClient": ".market_data_client",
+    "DraftKingsClient": ".market_data_client",
+    "MarketMonitor": ".market_monitor",
+    "GameLineHistory": ".line_history",
+    "LineHistory": ".line_history",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "MarketDataFeed",
@@ -16,4 +35,6 @@ __all__ = [
     "PinnacleClient",
     "DraftKingsClient",
     "MarketMonitor",
+    "GameLineHistory",
+    "LineHistory",
 ]
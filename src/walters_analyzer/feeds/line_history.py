@@ -0,0 +1,180 @@
+"""
+Bounded per-game line history for market monitoring
+
+Keeps only what movement detection needs (book, home spread line, timestamp)
+in fixed-size NumPy ring buffers, with sharp/public book averages computed
+once per snapshot as it arrives
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_HISTORY_SIZE = 120  # 1 hour at the default 30s monitor interval
+
+
+def extract_home_lines(odds: List[Dict]) -> Dict[str, float]:
+    """Map book -> home spread line for one game's odds snapshot"""
+    lines = {}
+    for odd in odds:
+        book = odd.get("book")
+        home_line = odd.get("markets", {}).get("spread", {}).get("home", {})
+        line = home_line.get("line")
+        if book and line is not None:
+            lines[book] = float(line)
+    return lines
+
+
+class GameLineHistory:
+    """
+    Fixed-capacity ring buffer of line snapshots for one game
+
+    Per-book lines live in a (capacity x books) float array (NaN = no line);
+    new books add a column. Sharp/public averages are stored per snapshot.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE):
+        if capacity < 2:
+            raise ValueError("capacity must be >= 2 to detect movement")
+
+        self.capacity = capacity
+        self.books: Dict[str, int] = {}
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.lines = np.full((capacity, 0), np.nan, dtype=np.float64)
+        self.sharp_avg = np.full(capacity, np.nan, dtype=np.float64)
+        self.public_avg = np.full(capacity, np.nan, dtype=np.float64)
+        self._next = 0  # Slot for the next snapshot
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_updated(self) -> Optional[datetime]:
+        """Timestamp of the newest snapshot"""
+        if not self._count:
+            return None
+        return datetime.fromtimestamp(self.timestamps[self._slot(-1)])
+
+    def append(
+        self,
+        timestamp: datetime,
+        book_lines: Dict[str, float],
+        sharp_avg: Optional[float],
+        public_avg: Optional[float],
+    ) -> None:
+        """Store one snapshot, overwriting the oldest when full"""
+        for book in book_lines:
+            if book not in self.books:
+                self.books[book] = len(self.books)
+                column = np.full((self.capacity, 1), np.nan, dtype=np.float64)
+                self.lines = np.hstack([self.lines, column])
+
+        slot = self._next
+        self.timestamps[slot] = timestamp.timestamp()
+        self.lines[slot, :] = np.nan
+        for book, line in book_lines.items():
+            self.lines[slot, self.books[book]] = line
+        self.sharp_avg[slot] = np.nan if sharp_avg is None else sharp_avg
+        self.public_avg[slot] = np.nan if public_avg is None else public_avg
+
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def averages(self, index: int = -1) -> Tuple[Optional[float], Optional[float]]:
+        """(sharp_avg, public_avg) for a snapshot (-1 = newest, -2 = previous)"""
+        slot = self._slot(index)
+        return _optional(self.sharp_avg[slot]), _optional(self.public_avg[slot])
+
+    def book_history(self, book: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, home lines) for a book, oldest first"""
+        order = self._order()
+        if book not in self.books:
+            return self.timestamps[order], np.full(len(order), np.nan)
+        return self.timestamps[order], self.lines[order, self.books[book]]
+
+    def average_history(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(timestamps, sharp averages, public averages), oldest first"""
+        order = self._order()
+        return self.timestamps[order], self.sharp_avg[order], self.public_avg[order]
+
+    def _order(self) -> np.ndarray:
+        """Buffer slots in chronological order"""
+        start = (self._next - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+
+    def _slot(self, index: int) -> int:
+        if not -self._count <= index < self._count:
+            raise IndexError("snapshot index out of range")
+        if index < 0:
+            return (self._next + index) % self.capacity
+        return (self._next - self._count + index) % self.capacity
+
+
+class LineHistory:
+    """
+    Line history for every monitored game
+
+    Args:
+        sharp_books: Books averaged into the sharp line
+        public_books: Books averaged into the public line
+        history_size: Snapshots kept per game
+    """
+
+    def __init__(
+        self,
+        sharp_books: Iterable[str],
+        public_books: Iterable[str],
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ):
+        self.sharp_books = frozenset(sharp_books)
+        self.public_books = frozenset(public_books)
+        self.history_size = history_size
+        self.games: Dict[str, GameLineHistory] = {}
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self.games
+
+    def __getitem__(self, game_id: str) -> GameLineHistory:
+        return self.games[game_id]
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def record(
+        self, game_id: str, odds: List[Dict], timestamp: Optional[datetime] = None
+    ) -> GameLineHistory:
+        """Add an odds snapshot for a game and return its history"""
+        book_lines = extract_home_lines(odds)
+        history = self.games.get(game_id)
+        if history is None:
+            history = self.games[game_id] = GameLineHistory(self.history_size)
+
+        history.append(
+            timestamp or datetime.now(),
+            book_lines,
+            self._average(book_lines, self.sharp_books),
+            self._average(book_lines, self.public_books),
+        )
+        return history
+
+    def prune(self, older_than: datetime) -> int:
+        """Drop games with no snapshot since older_than; returns count dropped"""
+        stale = [
+            game_id
+            for game_id, history in self.games.items()
+            if history.last_updated is None or history.last_updated < older_than
+        ]
+        for game_id in stale:
+            del self.games[game_id]
+        return len(stale)
+
+    @staticmethod
+    def _average(book_lines: Dict[str, float], books: frozenset) -> Optional[float]:
+        lines = [line for book, line in book_lines.items() if book in books]
+        return sum(lines) / len(lines) if lines else None
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
@@ -26,6 +26,7 @@ if sys.platform == "win32":
 
 from walters_analyzer.config import get_settings
 from walters_analyzer.feeds.market_data_client import OddsAPIClient
+from walters_analyzer.feeds.line_history import LineHistory
 
 
 class MarketMonitor:
@@ -41,7 +42,12 @@ class MarketMonitor:
 
     def __init__(self):
         self.settings = get_settings()
-        self.line_history = defaultdict(list)
+        market_settings = self.settings.skills.market_analysis
+        self.line_history = LineHistory(
+            sharp_books=market_settings.sharp_books,
+            public_books=market_settings.public_books,
+            history_size=market_settings.history_size,
+        )
         self.alerts = []
 
         # Use The Odds API as primary data source
@@ -83,24 +89,7 @@ class MarketMonitor:
             iteration += 1
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Check #{iteration}")
 
-            # Fetch current odds
-            odds = await self.client.get_odds(sport)
-
-            if not odds:
-                print("   [WARNING]  No odds data received")
-            else:
-                print(f"   [OK] Fetched odds for {len(odds)} book/game combinations")
-
-                # Process each game
-                games = self._group_by_game(odds)
-                print(f"   [OK] Monitoring {len(games)} games")
-
-                for game_id, game_odds in games.items():
-                    # Analyze for sharp money
-                    alert = self._detect_sharp_money(game_id, game_odds)
-
-                    if alert:
-                        self._send_alert(alert)
+            await self.check_once(sport)
 
             # Wait before next check
             print(f"   ⏱[*]  Waiting {check_interval} seconds...\n")
@@ -108,6 +97,41 @@ class MarketMonitor:
 
         print(f"\n[*] Monitoring complete. Total alerts: {len(self.alerts)}")
 
+    async def check_once(self, sport: str = "americanfootball_nfl") -> List[Dict]:
+        """
+        Run a single monitoring pass over all games for a sport
+
+        Used by monitor_sport and by the in-process scraper scheduler, which
+        keeps one MarketMonitor (and its HTTP client) warm between passes.
+
+        Returns:
+            Alerts raised during this pass
+        """
+        alerts = []
+
+        # Fetch current odds
+        odds = await self.client.get_odds(sport)
+
+        if not odds:
+            print("   [WARNING]  No odds data received")
+        else:
+            print(f"   [OK] Fetched odds for {len(odds)} book/game combinations")
+
+            # Process each game
+            games = self._group_by_game(odds)
+            print(f"   [OK] Monitoring {len(games)} games")
+
+            for game_id, game_odds in games.items():
+                # Analyze for sharp money
+                alert = self._detect_sharp_money(game_id, game_odds)
+
+                if alert:
+                    self._send_alert(alert)
+                    alerts.append(alert)
+
+        self._prune_history()
+        return alerts
+
     async def monitor_game(
         self,
         game_id: str,
@@ -157,6 +181,13 @@ class MarketMonitor:
 
         return games
 
+    def _prune_history(self):
+        """Drop line history for games that stopped appearing in the feed"""
+        max_age = self.settings.skills.market_analysis.history_max_age_hours
+        dropped = self.line_history.prune(datetime.now() - timedelta(hours=max_age))
+        if dropped:
+            print(f"   [OK] Dropped line history for {dropped} inactive games")
+
     def _detect_sharp_money(
         self, game_id: str, game_odds: List[Dict]
     ) -> Optional[Dict]:
@@ -172,30 +203,26 @@ class MarketMonitor:
         Returns:
             Alert dict if sharp money detected, None otherwise
         """
-        # Store current odds snapshot
+        # Store current snapshot (sharp/public averages computed on arrival)
         timestamp = datetime.now()
-        self.line_history[game_id].append({"timestamp": timestamp, "odds": game_odds})
+        history = self.line_history.record(game_id, game_odds, timestamp)
 
         # Need at least 2 snapshots to detect movement
-        if len(self.line_history[game_id]) < 2:
+        if len(history) < 2:
             return None
 
-        # Get previous and current snapshots
-        previous = self.line_history[game_id][-2]
-        current = self.line_history[game_id][-1]
-
         # Separate sharp vs public books
         sharp_books = self.settings.skills.market_analysis.sharp_books
         public_books = self.settings.skills.market_analysis.public_books
 
+        # Previous and current sharp/public average lines
+        prev_sharp, prev_public = history.averages(-2)
+        curr_sharp, curr_public = history.averages(-1)
+
         # Calculate sharp book line movement
-        prev_sharp = self._avg_line(previous["odds"], sharp_books)
-        curr_sharp = self._avg_line(current["odds"], sharp_books)
         sharp_movement = curr_sharp - prev_sharp if prev_sharp and curr_sharp else 0
 
         # Calculate public book line movement
-        prev_public = self._avg_line(previous["odds"], public_books)
-        curr_public = self._avg_line(current["odds"], public_books)
         public_movement = (
             curr_public - prev_public if prev_public and curr_public else 0
         )
@@ -224,32 +251,15 @@ class MarketMonitor:
                 "confidence": min(abs(sharp_movement) / threshold * 100, 100),
                 "timestamp": timestamp.isoformat(),
                 "books_analyzed": {
-                    "sharp": [
-                        o["book"] for o in current["odds"] if o["book"] in sharp_books
-                    ],
+                    "sharp": [o["book"] for o in game_odds if o["book"] in sharp_books],
                     "public": [
-                        o["book"] for o in current["odds"] if o["book"] in public_books
+                        o["book"] for o in game_odds if o["book"] in public_books
                     ],
                 },
             }
 
         return None
 
-    def _avg_line(self, odds: List[Dict], books: List[str]) -> Optional[float]:
-        """Calculate average spread line for specified books"""
-        lines = []
-
-        for odd in odds:
-            book = odd.get("book")
-            if book in books:
-                spread = odd.get("markets", {}).get("spread", {})
-                home_line = spread.get("home", {}).get("line")
-
-                if home_line is not None:
-                    lines.append(home_line)
-
-        return sum(lines) / len(lines) if lines else None
-
     def _get_direction(self, movement: float, teams: Dict) -> str:
         """Get human-readable direction of line movement"""
         home = teams.get("home", "Home")
@@ -166,6 +166,7 @@ class NFLComScraper:
         season: int | None = None,
         week: int | None = None,
         season_type: str = "REG",
+        client: httpx.Client | None = None,
     ) -> None:
         self.output_root = Path(output_root)
         self.output_root.mkdir(parents=True, exist_ok=True)
@@ -174,6 +175,8 @@ class NFLComScraper:
         self.week = week or max(1, today.isocalendar().week % 18)
         self.season_type = season_type.upper()
         self.scraped_at = datetime.now(timezone.utc).isoformat()
+        # Optional caller-owned client reused across scrape() calls
+        self.shared_client = client
 
     def scrape(self) -> dict[str, Path]:
         jobs: list[Callable[[], Iterable[ScrapeJob]]] = [
@@ -188,15 +191,25 @@ class NFLComScraper:
             self._scrape_team_stats,
             self._scrape_standings,
         ]
-        saved: dict[str, Path] = {}
+        if self.shared_client is not None:
+            self.scraped_at = datetime.now(timezone.utc).isoformat()
+            self.client = self.shared_client
+            return self._run_jobs(jobs)
+
         with httpx.Client(
             headers=self.HEADERS, timeout=30.0, follow_redirects=True
         ) as client:
             self.client = client
-            for job in jobs:
-                for section_job in job():
-                    path = self._write_payload(section_job)
-                    saved[f"{section_job.section}/{section_job.filename}"] = path
+            return self._run_jobs(jobs)
+
+    def _run_jobs(
+        self, jobs: list[Callable[[], Iterable[ScrapeJob]]]
+    ) -> dict[str, Path]:
+        saved: dict[str, Path] = {}
+        for job in jobs:
+            for section_job in job():
+                path = self._write_payload(section_job)
+                saved[f"{section_job.section}/{section_job.filename}"] = path
         return saved
 
     def _write_payload(self, job: ScrapeJob) -> Path:
@@ -0,0 +1,45 @@
+"""
+Lazy Package Exports
+
+Lets a package ``__init__`` re-export names from its submodules without
+importing them at package import time (PEP 562 module ``__getattr__``), so
+importing one light submodule does not drag in every sibling's heavy
+dependencies.
+
+Example:
+    _EXPORTS = {"MarketMonitor": ".market_monitor"}
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+"""
+
+import sys
+from importlib import import_module
+from typing import Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> submodule (absolute, or relative to package)
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace. The first
+        access to a name imports its submodule and caches the value in the
+        package globals, so later lookups are plain attribute hits.
+    """
+
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,6 +1,7 @@
 from importlib.resources import files
 
 __all__ = [
+    "build_system_prompt",
     "load_system_prompt",
     "load_tool_spec",
 ]
@@ -14,3 +15,21 @@ def load_tool_spec(
     name: str = "billy_walters_sports_analyzer.json",
 ) -> str:
     return (files(__package__) / name).read_text(encoding="utf-8")
+
+
+def build_system_prompt() -> str:
+    """
+    Shared system prompt for matchup explanations.
+
+    Role and output instructions, then the packaged methodology graph that
+    System.BWSA refers to. Nothing in it varies per matchup, so it is the
+    prompt-cacheable prefix of every request (several thousand tokens, well
+    above the API's minimum cacheable length).
+    """
+    return (
+        "You are the analysis layer of the Billy Walters Sports Analyzer.\n"
+        "Explain the evaluation and recommendation in clear terms.\n"
+        "Return a concise explanation.\n\n"
+        f"{load_system_prompt().strip()}\n\n"
+        f"== METHODOLOGY GRAPH ==\n{load_tool_spec()}"
+    )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, List, Sequence, Tuple
 
+from walters_analyzer.llm import build_system_prompt
+from walters_analyzer.llm.batch import ExplanationBatcher
 from walters_analyzer.llm.client import Message, call_llm
 from walters_analyzer.llm.settings import LLMSettings
 from walters_analyzer.models.matchup_evaluation import MatchupEvaluation
@@ -26,14 +28,14 @@ class WaltersLLMAgent:
         recommendation: BetRecommendation,
     ) -> str:
         """
-        Generate the prompt for the LLM using pure text instructions.
+        Generate the per-matchup user prompt.
+
+        Only the matchup data goes here; the fixed instructions live in
+        build_system_prompt() so they are shared (and cached) across calls.
         """
         return (
-            "You are the analysis layer of the Billy Walters Sports Analyzer.\n"
-            "Explain the evaluation and recommendation in clear terms.\n\n"
             f"== MATCHUP EVALUATION ==\n{evaluation.model_dump_json()}\n\n"
-            f"== RECOMMENDATION ==\n{recommendation.model_dump_json()}\n\n"
-            "Return a concise explanation."
+            f"== RECOMMENDATION ==\n{recommendation.model_dump_json()}"
         )
 
     def explain_matchup(
@@ -42,5 +44,24 @@ class WaltersLLMAgent:
         recommendation: BetRecommendation,
     ) -> str:
         prompt = self.build_prompt(evaluation, recommendation)
-        msg: Message = call_llm(prompt)
+        msg: Message = call_llm(prompt, system=build_system_prompt())
         return msg.content
+
+    async def explain_slate(
+        self,
+        matchups: Sequence[Tuple[MatchupEvaluation, BetRecommendation]],
+        batcher: ExplanationBatcher | None = None,
+    ) -> List[str]:
+        """
+        Explain a full slate concurrently, in input order.
+
+        Unchanged matchups are served from the batcher's disk cache. Pass a
+        batcher to tune concurrency/rate limits or share it across slates;
+        otherwise one is created with this agent's settings and closed after.
+        """
+        prompts = [self.build_prompt(ev, rec) for ev, rec in matchups]
+        if batcher is not None:
+            return await batcher.explain_many(prompts)
+
+        async with ExplanationBatcher(settings=self.settings) as owned:
+            return await owned.explain_many(prompts)
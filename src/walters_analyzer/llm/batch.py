@@ -0,0 +1,266 @@
+"""Concurrent, disk-cached LLM explanations for a full slate of matchups."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from anthropic import AsyncAnthropic
+
+from walters_analyzer.llm import build_system_prompt
+from walters_analyzer.llm.client import FALLBACK_EXPLANATION, validate_settings
+from walters_analyzer.llm.settings import LLMSettings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("data/cache/llm")
+
+
+@dataclass
+class BatchStats:
+    """Counters for one ExplanationBatcher's lifetime."""
+
+    requested: int = 0
+    cache_hits: int = 0
+    api_calls: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    prompt_cache_read_tokens: int = 0
+    prompt_cache_write_tokens: int = 0
+
+
+class ExplanationCache:
+    """
+    Explanations on disk, one JSON file per prompt hash.
+
+    Files are written to a temp name and renamed, so a crash mid-write
+    never leaves a truncated entry behind.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self.path(key), encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, text: str, model: str) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"model": model, "text": text}, f)
+        os.replace(tmp, path)
+
+
+class RequestRateLimiter:
+    """Spaces request starts evenly to stay under a requests-per-minute budget."""
+
+    def __init__(self, requests_per_minute: float) -> None:
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self.interval <= 0.0:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            if delay > 0:
+                logger.debug(f"Rate limiting: waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+            self._next_slot = loop.time() + self.interval
+
+
+class ExplanationBatcher:
+    """
+    Explains many prompts concurrently against the Anthropic Messages API.
+
+    - Responses are cached on disk by a hash of everything that affects
+      them (model, system prompt, prompt, sampling params), so re-running
+      an unchanged matchup is never billed twice. Identical prompts in
+      flight at the same time share one request.
+    - At most ``max_concurrency`` requests are open at once and starts are
+      spaced to ``requests_per_minute``; the SDK retries 429/5xx responses.
+    - The shared system prompt (instructions plus the methodology graph,
+      several thousand tokens) is sent as a cacheable prefix block
+      (``cache_control: ephemeral``) so repeated calls can reuse it.
+      Prompts should carry only per-matchup data.
+    - Failures fall back to the same stub text as ``call_llm`` and are not
+      cached. The client is created on first request, not at construction.
+
+    Usage:
+        async with ExplanationBatcher() as batcher:
+            texts = await batcher.explain_many(prompts)
+    """
+
+    def __init__(
+        self,
+        settings: Optional[LLMSettings] = None,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        max_concurrency: int = 4,
+        requests_per_minute: float = 50.0,
+        system_prompt: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 2,
+        timeout: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            settings: Model and API key; loaded from the environment if omitted
+            cache_dir: Directory for cached explanations
+            max_concurrency: Maximum requests in flight at once
+            requests_per_minute: Request start budget (0 disables spacing)
+            system_prompt: Shared system prompt (defaults to
+                build_system_prompt())
+            base_url: Override the API endpoint (e.g. a proxy or test server)
+            max_retries: SDK retries per request on rate limits/server errors
+            timeout: Per-request timeout in seconds
+        """
+        self.settings = settings or LLMSettings()
+        self.cache = ExplanationCache(cache_dir)
+        self.system_prompt = (
+            system_prompt if system_prompt is not None else build_system_prompt()
+        )
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.stats = BatchStats()
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RequestRateLimiter(requests_per_minute)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._client: Optional[AsyncAnthropic] = None
+
+    async def __aenter__(self) -> "ExplanationBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        if self._client is None:
+            validate_settings(self.settings)
+            self._client = AsyncAnthropic(
+                api_key=self.settings.anthropic_api_key,
+                base_url=self.base_url,
+                max_retries=self.max_retries,
+                timeout=self.timeout,
+            )
+        return self._client
+
+    def cache_key(self, prompt: str) -> str:
+        payload = {
+            "model": self.settings.model_name,
+            "max_tokens": self.settings.max_tokens,
+            "temperature": self.settings.temperature,
+            "system": self.system_prompt,
+            "prompt": prompt,
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def explain(self, prompt: str) -> str:
+        """Explain one prompt, from cache when possible."""
+        self.stats.requested += 1
+        key = self.cache_key(prompt)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.stats.cache_hits += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats.cache_hits += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text = await self._request(key, prompt)
+            future.set_result(text)
+            return text
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody else may be waiting; don't warn about an unretrieved error
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def explain_many(self, prompts: Iterable[str]) -> List[str]:
+        """Explain all prompts concurrently; results keep the input order."""
+        return list(await asyncio.gather(*(self.explain(p) for p in prompts)))
+
+    async def _request(self, key: str, prompt: str) -> str:
+        async with self._semaphore:
+            await self._rate_limiter.wait()
+            client = self.client
+            self.stats.api_calls += 1
+            try:
+                resp = await client.messages.create(
+                    model=self.settings.model_name,
+                    max_tokens=self.settings.max_tokens,
+                    temperature=self.settings.temperature,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": self.system_prompt,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                text = resp.content[0].text
+            except Exception as e:
+                # Fail-soft like call_llm, but leave the cache empty so the
+                # next run tries again
+                self.stats.failures += 1
+                logger.warning(f"LLM request failed, using fallback text: {e}")
+                return FALLBACK_EXPLANATION
+
+        self._record_usage(resp.usage)
+        self.cache.put(key, text, self.settings.model_name)
+        return text
+
+    def _record_usage(self, usage: Any) -> None:
+        if usage is None:
+            return
+        self.stats.input_tokens += usage.input_tokens or 0
+        self.stats.output_tokens += usage.output_tokens or 0
+        self.stats.prompt_cache_read_tokens += (
+            getattr(usage, "cache_read_input_tokens", None) or 0
+        )
+        self.stats.prompt_cache_write_tokens += (
+            getattr(usage, "cache_creation_input_tokens", None) or 0
+        )
+
+    def summary(self) -> Dict[str, int]:
+        return asdict(self.stats)
@@ -1,11 +1,19 @@
 # src/walters_analyzer/llm/client.py
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
 from anthropic import Anthropic
 
 from walters_analyzer.llm.settings import LLMSettings
 
+FALLBACK_EXPLANATION = (
+    "LLM explanation is currently disabled (no API credits available).\n\n"
+    "Numeric evaluation and bet recommendation above are still valid; "
+    "this section will show a narrative breakdown once LLM access is restored."
+)
+
 
 @dataclass
 class Message:
@@ -13,45 +21,56 @@ class Message:
     content: str
 
 
-settings = LLMSettings()
+def validate_settings(settings: LLMSettings) -> None:
+    """Raise if the settings cannot be used to call Anthropic."""
+    if settings.provider != "anthropic":
+        raise RuntimeError("LLM_PROVIDER must be 'anthropic' for this build.")
+
+    if not settings.anthropic_api_key:
+        raise RuntimeError(
+            "ANTHROPIC_API_KEY is not set. Please set it in your env or .env file."
+        )
+
 
-if settings.provider != "anthropic":
-    raise RuntimeError("LLM_PROVIDER must be 'anthropic' for this build.")
+@lru_cache(maxsize=1)
+def get_settings() -> LLMSettings:
+    """Load LLM settings on first use rather than at import."""
+    return LLMSettings()
 
-if not settings.anthropic_api_key:
-    raise RuntimeError(
-        "ANTHROPIC_API_KEY is not set. Please set it in your env or .env file."
-    )
 
-_client = Anthropic(api_key=settings.anthropic_api_key)
+@lru_cache(maxsize=1)
+def get_client() -> Anthropic:
+    """Build the shared Anthropic client on first use."""
+    settings = get_settings()
+    validate_settings(settings)
+    return Anthropic(api_key=settings.anthropic_api_key)
 
 
-def call_llm(prompt: str) -> Message:
+def call_llm(prompt: str, system: Optional[str] = None) -> Message:
     """
     Thin wrapper around Anthropic's Messages API.
 
     If the API call fails (no credits, rate limits, etc.), we return
     a stub explanation instead of raising, so the CLI can complete.
+    Missing configuration still raises, on the first call.
     """
+    settings = get_settings()
+    client = get_client()
+    extra = {"system": system} if system else {}
     try:
-        resp = _client.messages.create(
+        resp = client.messages.create(
             model=settings.model_name,
             max_tokens=settings.max_tokens,
             temperature=settings.temperature,
             messages=[
                 {"role": "user", "content": prompt},
             ],
+            **extra,
         )
 
         text = resp.content[0].text
         return Message(role="assistant", content=text)
 
-    except Exception as exc:
+    except Exception:
         # Fail-soft: keep the numeric engine working even when LLM is unavailable
-        fallback = (
-            "LLM explanation is currently disabled (no API credits available).\n\n"
-            "Numeric evaluation and bet recommendation above are still valid; "
-            "this section will show a narrative breakdown once LLM access is restored."
-        )
-
-        return Message(role="assistant", content=fallback)
+        return Message(role="assistant", content=FALLBACK_EXPLANATION)
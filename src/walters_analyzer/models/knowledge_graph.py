@@ -7,11 +7,19 @@ This module provides graph-based storage and querying for:
 - Matchup evaluations with all adjustments
 - Bet recommendations and their outcomes
 - Historical performance tracking
+
+Power ratings are indexed per team and per (team, source) in time order, so
+as-of lookups are a binary search. Evaluated games are indexed by market
+spread per team for similarity search. Persistence is a JSON snapshot plus
+an append-only JSONL change log: save() only writes what changed since the
+last save, and the log is folded into the snapshot periodically.
 """
 
 from __future__ import annotations
 
+import heapq
 import json
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +37,36 @@ from walters_analyzer.models.core import (
     Team,
 )
 
+# Fold the change log into the snapshot once it holds this many records and
+# more records than the graph has entities (O(1) amortized per save)
+COMPACT_MIN_RECORDS = 1000
+
+# Stop queuing changes once this many are pending and let the next save()
+# write a full snapshot instead, so a writer that rarely saves stays bounded
+PENDING_FLUSH_RECORDS = 1000
+
+
+def _evaluation_key(evaluation: Any) -> Tuple[str, str, str, float]:
+    """(game_id, home_team_id, away_team_id, market_spread) for an evaluation.
+
+    Evaluations that fail validation on load are kept as plain dicts.
+    """
+    if isinstance(evaluation, dict):
+        game = evaluation["game"]
+        return (
+            game["game_id"],
+            game["home_team_id"],
+            game["away_team_id"],
+            float(evaluation["market_spread"]),
+        )
+    game = evaluation.game
+    return (
+        game.game_id,
+        game.home_team_id,
+        game.away_team_id,
+        float(evaluation.market_spread),
+    )
+
 
 class BettingKnowledgeGraph:
     """
@@ -74,6 +112,23 @@ class BettingKnowledgeGraph:
         ] = {}  # recommendation_id -> outcome
         self.closing_lines: Dict[str, float] = {}  # game_id -> closing_spread
 
+        # Indexes (see _rebuild_indexes)
+        self._rating_times: Dict[str, List[datetime]] = defaultdict(list)
+        self._source_ratings: Dict[Tuple[str, str], List[PowerRatingSnapshot]] = (
+            defaultdict(list)
+        )
+        self._source_times: Dict[Tuple[str, str], List[datetime]] = defaultdict(list)
+        self._latest_evaluation: Dict[str, str] = {}  # game_id -> eval_id
+        self._spread_keys: Dict[str, Tuple[float, str, str]] = {}
+        self._spread_index: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+
+        # Incremental persistence state
+        self._pending: List[Dict[str, Any]] = []
+        self._replaying = False
+        self._persisted_path: Optional[Path] = None
+        self._log_records = 0
+        self._needs_compaction = False
+
         # Load existing data if path provided
         if self.storage_path and self.storage_path.exists():
             self.load()
@@ -83,6 +138,7 @@ class BettingKnowledgeGraph:
     def add_team(self, team: Team) -> None:
         """Add or update a team in the graph."""
         self.teams[team.team_id] = team
+        self._log({"type": "team", "data": team.model_dump(mode="json")})
 
     def get_team(self, team_id: str) -> Optional[Team]:
         """Retrieve a team by ID."""
@@ -101,6 +157,7 @@ class BettingKnowledgeGraph:
         # Update team-game relationships
         self.team_games[game.home_team_id].add(game.game_id)
         self.team_games[game.away_team_id].add(game.game_id)
+        self._log({"type": "game", "data": game.model_dump(mode="json")})
 
     def get_game(self, game_id: str) -> Optional[Game]:
         """Retrieve a game by ID."""
@@ -127,10 +184,19 @@ class BettingKnowledgeGraph:
 
     def add_power_rating(self, rating: PowerRatingSnapshot) -> None:
         """Add a power rating snapshot for a team."""
-        self.power_ratings[rating.team_id].append(rating)
+        # Insert in creation-time order (after any equal timestamps)
+        times = self._rating_times[rating.team_id]
+        pos = bisect_right(times, rating.created_at)
+        times.insert(pos, rating.created_at)
+        self.power_ratings[rating.team_id].insert(pos, rating)
+
+        key = (rating.team_id, rating.source)
+        source_times = self._source_times[key]
+        pos = bisect_right(source_times, rating.created_at)
+        source_times.insert(pos, rating.created_at)
+        self._source_ratings[key].insert(pos, rating)
 
-        # Keep sorted by creation time
-        self.power_ratings[rating.team_id].sort(key=lambda r: r.created_at)
+        self._log({"type": "power_rating", "data": rating.model_dump(mode="json")})
 
     def get_latest_power_rating(
         self,
@@ -139,15 +205,21 @@ class BettingKnowledgeGraph:
         as_of: Optional[datetime] = None,
     ) -> Optional[PowerRatingSnapshot]:
         """Get the most recent power rating for a team."""
-        ratings = self.power_ratings.get(team_id, [])
-
         if source:
-            ratings = [r for r in ratings if r.source == source]
-
-        if as_of:
-            ratings = [r for r in ratings if r.created_at <= as_of]
+            key = (team_id, source)
+            ratings = self._source_ratings.get(key, [])
+            times = self._source_times.get(key, [])
+        else:
+            ratings = self.power_ratings.get(team_id, [])
+            times = self._rating_times.get(team_id, [])
+
+        if not ratings:
+            return None
+        if not as_of:
+            return ratings[-1]
 
-        return ratings[-1] if ratings else None
+        pos = bisect_right(times, as_of)
+        return ratings[pos - 1] if pos else None
 
     def get_power_rating_history(
         self,
@@ -156,14 +228,14 @@ class BettingKnowledgeGraph:
         source: Optional[str] = None,
     ) -> List[PowerRatingSnapshot]:
         """Get power rating history for a team."""
-        ratings = self.power_ratings.get(team_id, [])
+        if source:
+            ratings = self._source_ratings.get((team_id, source), [])
+        else:
+            ratings = self.power_ratings.get(team_id, [])
 
         if season:
             ratings = [r for r in ratings if r.season == season]
 
-        if source:
-            ratings = [r for r in ratings if r.source == source]
-
         return ratings
 
     # --- Evaluation Management ---
@@ -173,11 +245,43 @@ class BettingKnowledgeGraph:
         # Generate ID if not present (using game_id + timestamp)
         eval_id = f"eval_{evaluation.game.game_id}_{int(datetime.utcnow().timestamp())}"
 
-        self.evaluations[eval_id] = evaluation
-        self.game_evaluations[evaluation.game.game_id].add(eval_id)
+        self._put_evaluation(eval_id, evaluation)
+        self._log(
+            {
+                "type": "evaluation",
+                "id": eval_id,
+                "data": evaluation.model_dump(mode="json"),
+            }
+        )
 
         return eval_id
 
+    def _put_evaluation(self, eval_id: str, evaluation: Any) -> None:
+        """Store an evaluation and update the spread index."""
+        game_id, home_id, away_id, spread = _evaluation_key(evaluation)
+
+        self.evaluations[eval_id] = evaluation
+        self.game_evaluations[game_id].add(eval_id)
+        self._latest_evaluation[game_id] = eval_id
+        self._index_spread(game_id, home_id, away_id, spread)
+
+    def _index_spread(
+        self, game_id: str, home_id: str, away_id: str, spread: float
+    ) -> None:
+        """(Re)index a game's latest market spread under both teams."""
+        previous = self._spread_keys.get(game_id)
+        if previous is not None:
+            old_spread, old_home, old_away = previous
+            for team_id in {old_home, old_away}:
+                entries = self._spread_index[team_id]
+                pos = bisect_left(entries, (old_spread, game_id))
+                if pos < len(entries) and entries[pos] == (old_spread, game_id):
+                    del entries[pos]
+
+        self._spread_keys[game_id] = (spread, home_id, away_id)
+        for team_id in {home_id, away_id}:
+            insort(self._spread_index[team_id], (spread, game_id))
+
     def get_evaluation(self, eval_id: str) -> Optional[MatchupEvaluation]:
         """Retrieve an evaluation by ID."""
         return self.evaluations.get(eval_id)
@@ -185,7 +289,16 @@ class BettingKnowledgeGraph:
     def get_game_evaluations(self, game_id: str) -> List[MatchupEvaluation]:
         """Get all evaluations for a game."""
         eval_ids = self.game_evaluations.get(game_id, set())
-        return [self.evaluations[eid] for eid in eval_ids if eid in self.evaluations]
+        evaluations = [
+            self.evaluations[eid]
+            for eid in eval_ids
+            if eid in self.evaluations and eid != self._latest_evaluation.get(game_id)
+        ]
+        # Most recently added evaluation last
+        latest = self._latest_evaluation.get(game_id)
+        if latest in self.evaluations and latest in eval_ids:
+            evaluations.append(self.evaluations[latest])
+        return evaluations
 
     # --- Recommendation Management ---
 
@@ -209,6 +322,14 @@ class BettingKnowledgeGraph:
                 recommendation.recommendation_id
             )
 
+        self._log(
+            {
+                "type": "recommendation",
+                "evaluation_id": evaluation_id,
+                "data": recommendation.model_dump(mode="json"),
+            }
+        )
+
         return recommendation.recommendation_id
 
     def get_recommendation(self, rec_id: str) -> Optional[BetRecommendation]:
@@ -254,10 +375,18 @@ class BettingKnowledgeGraph:
             "profit_loss": profit_loss,
             "recorded_at": datetime.utcnow().isoformat(),
         }
+        self._log(
+            {
+                "type": "bet_outcome",
+                "id": recommendation_id,
+                "data": self.bet_outcomes[recommendation_id],
+            }
+        )
 
     def record_closing_line(self, game_id: str, closing_spread: float) -> None:
         """Record the closing line for CLV calculation."""
         self.closing_lines[game_id] = closing_spread
+        self._log({"type": "closing_line", "id": game_id, "value": closing_spread})
 
     def calculate_clv(self, recommendation_id: str) -> Optional[float]:
         """Calculate Closing Line Value for a recommendation."""
@@ -354,57 +483,97 @@ class BettingKnowledgeGraph:
         game_id: str,
         max_results: int = 5,
     ) -> List[Tuple[Game, MatchupEvaluation]]:
-        """Find historically similar matchups based on spreads and totals."""
+        """Find historically similar matchups based on spreads and totals.
+
+        Walks outward from the target spread in the per-team spread index,
+        so only the closest candidates are visited.
+        """
         target_game = self.games.get(game_id)
         if not target_game:
             return []
 
-        # Get the most recent evaluation for this game
-        target_evals = self.get_game_evaluations(game_id)
-        if not target_evals:
+        # Most recent evaluation for this game
+        target_eval_id = self._latest_evaluation.get(game_id)
+        if target_eval_id not in self.evaluations:
             return []
+        target_spread = _evaluation_key(self.evaluations[target_eval_id])[3]
+
+        # One frontier per (team, direction): (spread_diff, game_id, list, pos, step)
+        frontier = []
+        for team_id in {target_game.home_team_id, target_game.away_team_id}:
+            entries = self._spread_index.get(team_id, [])
+            pos = bisect_left(entries, (target_spread, ""))
+            for start, step in ((pos, 1), (pos - 1, -1)):
+                if 0 <= start < len(entries):
+                    spread, other_id = entries[start]
+                    diff = abs(target_spread - spread)
+                    frontier.append((diff, other_id, team_id, start, step))
+        heapq.heapify(frontier)
 
-        target_eval = target_evals[-1]  # Most recent
-
-        # Find similar games
         similar = []
+        seen = {game_id}
+        while frontier and len(similar) < max_results:
+            _, other_id, team_id, pos, step = heapq.heappop(frontier)
+
+            entries = self._spread_index[team_id]
+            nxt = pos + step
+            if 0 <= nxt < len(entries):
+                spread, next_id = entries[nxt]
+                heapq.heappush(
+                    frontier,
+                    (abs(target_spread - spread), next_id, team_id, nxt, step),
+                )
 
-        for other_game_id, other_game in self.games.items():
-            if other_game_id == game_id:
-                continue
-
-            # Must involve at least one of the same teams
-            if not (
-                target_game.home_team_id
-                in (other_game.home_team_id, other_game.away_team_id)
-                or target_game.away_team_id
-                in (other_game.home_team_id, other_game.away_team_id)
-            ):
+            if other_id in seen or other_id not in self.games:
                 continue
+            seen.add(other_id)
+            other_eval = self.evaluations[self._latest_evaluation[other_id]]
+            similar.append((self.games[other_id], other_eval))
 
-            other_evals = self.get_game_evaluations(other_game_id)
-            if not other_evals:
-                continue
+        return similar
 
-            other_eval = other_evals[-1]
+    # --- Persistence ---
 
-            # Calculate similarity based on spread difference
-            spread_diff = abs(target_eval.market_spread - other_eval.market_spread)
+    @staticmethod
+    def log_path_for(path: Path) -> Path:
+        """Change-log file that accompanies a snapshot file."""
+        path = Path(path)
+        return path.with_name(path.name + ".log")
 
-            similar.append((other_game, other_eval, spread_diff))
+    def save(self, path: Optional[Path] = None) -> None:
+        """Save the knowledge graph to disk.
 
-        # Sort by similarity (smaller difference = more similar)
-        similar.sort(key=lambda x: x[2])
+        Appends only the changes made since the last save to the change log.
+        A full snapshot is written the first time a path is saved to, after
+        more than PENDING_FLUSH_RECORDS unsaved changes, and whenever the log
+        outgrows the graph (see compact()).
+        """
+        save_path = path or self.storage_path
+        if not save_path:
+            raise ValueError("No save path specified")
+        save_path = Path(save_path)
+
+        if (
+            save_path != self._persisted_path
+            or not save_path.exists()
+            or self._needs_compaction
+        ):
+            self.compact(save_path)
+            return
 
-        return [(g, e) for g, e, _ in similar[:max_results]]
+        if not self._pending:
+            return
 
-    # --- Persistence ---
+        self._flush_pending(save_path)
+        if self._log_records >= max(COMPACT_MIN_RECORDS, self._entity_count()):
+            self.compact(save_path)
 
-    def save(self, path: Optional[Path] = None) -> None:
-        """Save the knowledge graph to disk."""
+    def compact(self, path: Optional[Path] = None) -> None:
+        """Write a full snapshot and clear the change log."""
         save_path = path or self.storage_path
         if not save_path:
             raise ValueError("No save path specified")
+        save_path = Path(save_path)
 
         data = {
             "teams": {tid: t.model_dump() for tid, t in self.teams.items()},
@@ -413,7 +582,10 @@ class BettingKnowledgeGraph:
                 tid: [r.model_dump() for r in ratings]
                 for tid, ratings in self.power_ratings.items()
             },
-            "evaluations": {eid: e.model_dump() for eid, e in self.evaluations.items()},
+            "evaluations": {
+                eid: e if isinstance(e, dict) else e.model_dump()
+                for eid, e in self.evaluations.items()
+            },
             "recommendations": {
                 rid: r.model_dump() for rid, r in self.recommendations.items()
             },
@@ -421,6 +593,7 @@ class BettingKnowledgeGraph:
             "game_evaluations": {
                 gid: list(eids) for gid, eids in self.game_evaluations.items()
             },
+            "latest_evaluation": self._latest_evaluation,
             "evaluation_recommendations": {
                 eid: list(rids) for eid, rids in self.evaluation_recommendations.items()
             },
@@ -430,12 +603,19 @@ class BettingKnowledgeGraph:
 
         with open(save_path, "w") as f:
             json.dump(data, f, indent=2, default=str)
+        self.log_path_for(save_path).write_text("")
+
+        self._persisted_path = save_path
+        self._pending = []
+        self._log_records = 0
+        self._needs_compaction = False
 
     def load(self, path: Optional[Path] = None) -> None:
-        """Load the knowledge graph from disk."""
+        """Load the knowledge graph from disk (snapshot + change log)."""
         load_path = path or self.storage_path
-        if not load_path or not load_path.exists():
+        if not load_path or not Path(load_path).exists():
             return
+        load_path = Path(load_path)
 
         with open(load_path) as f:
             data = json.load(f)
@@ -460,11 +640,12 @@ class BettingKnowledgeGraph:
                     rdata["created_at"] = datetime.fromisoformat(rdata["created_at"])
                 self.power_ratings[tid].append(PowerRatingSnapshot(**rdata))
 
-        # Load evaluations
+        # Load evaluations (kept as dicts if they no longer validate)
         for eid, edata in data.get("evaluations", {}).items():
-            # Note: This requires proper deserialization of nested objects
-            # For now, storing as dict - you may need to enhance this
-            self.evaluations[eid] = edata
+            try:
+                self.evaluations[eid] = MatchupEvaluation.model_validate(edata)
+            except ValidationError:
+                self.evaluations[eid] = edata
 
         # Load recommendations
         for rid, rdata in data.get("recommendations", {}).items():
@@ -473,20 +654,133 @@ class BettingKnowledgeGraph:
             self.recommendations[rid] = BetRecommendation(**rdata)
 
         # Load relationships
-        self.team_games = {
-            tid: set(gids) for tid, gids in data.get("team_games", {}).items()
-        }
-        self.game_evaluations = {
-            gid: set(eids) for gid, eids in data.get("game_evaluations", {}).items()
-        }
-        self.evaluation_recommendations = {
-            eid: set(rids)
-            for eid, rids in data.get("evaluation_recommendations", {}).items()
-        }
+        for tid, gids in data.get("team_games", {}).items():
+            self.team_games[tid].update(gids)
+        for gid, eids in data.get("game_evaluations", {}).items():
+            self.game_evaluations[gid].update(eids)
+        for eid, rids in data.get("evaluation_recommendations", {}).items():
+            self.evaluation_recommendations[eid].update(rids)
 
         # Load performance data
-        self.bet_outcomes = data.get("bet_outcomes", {})
-        self.closing_lines = data.get("closing_lines", {})
+        self.bet_outcomes.update(data.get("bet_outcomes", {}))
+        self.closing_lines.update(data.get("closing_lines", {}))
+
+        self._rebuild_indexes(data.get("latest_evaluation", {}))
+        self._replay_log(self.log_path_for(load_path))
+
+        self._persisted_path = load_path
+        self._pending = []
+        self._needs_compaction = False
+
+    # --- Indexes & Change Log ---
+
+    def _rebuild_indexes(self, latest_evaluation: Dict[str, str]) -> None:
+        """Rebuild rating and spread indexes from the loaded entities."""
+        self._rating_times.clear()
+        self._source_ratings.clear()
+        self._source_times.clear()
+        for tid, ratings in self.power_ratings.items():
+            ratings.sort(key=lambda r: r.created_at)
+            self._rating_times[tid] = [r.created_at for r in ratings]
+            for rating in ratings:
+                key = (tid, rating.source)
+                self._source_ratings[key].append(rating)
+                self._source_times[key].append(rating.created_at)
+
+        self._latest_evaluation = {}
+        self._spread_keys = {}
+        self._spread_index.clear()
+        for gid, eids in self.game_evaluations.items():
+            eid = latest_evaluation.get(gid)
+            if eid not in self.evaluations:
+                # Older snapshots don't record it; eval IDs end in a timestamp
+                candidates = [e for e in eids if e in self.evaluations]
+                if not candidates:
+                    continue
+                eid = max(candidates)
+            self._latest_evaluation[gid] = eid
+            _, home_id, away_id, spread = _evaluation_key(self.evaluations[eid])
+            self._spread_keys[gid] = (spread, home_id, away_id)
+            for team_id in {home_id, away_id}:
+                self._spread_index[team_id].append((spread, gid))
+        for entries in self._spread_index.values():
+            entries.sort()
+
+    def _replay_log(self, log_path: Path) -> None:
+        """Apply change-log records written after the snapshot."""
+        self._log_records = 0
+        if not log_path.exists():
+            return
+
+        self._replaying = True
+        try:
+            with open(log_path) as f:
+                for line in f:
+                    if line.strip():
+                        self._apply(json.loads(line))
+                        self._log_records += 1
+        finally:
+            self._replaying = False
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one change-log record."""
+        kind = record["type"]
+        if kind == "team":
+            self.add_team(Team.model_validate(record["data"]))
+        elif kind == "game":
+            self.add_game(Game.model_validate(record["data"]))
+        elif kind == "power_rating":
+            self.add_power_rating(PowerRatingSnapshot.model_validate(record["data"]))
+        elif kind == "evaluation":
+            try:
+                evaluation = MatchupEvaluation.model_validate(record["data"])
+            except ValidationError:
+                evaluation = record["data"]
+            self._put_evaluation(record["id"], evaluation)
+        elif kind == "recommendation":
+            self.add_recommendation(
+                BetRecommendation.model_validate(record["data"]),
+                record.get("evaluation_id"),
+            )
+        elif kind == "bet_outcome":
+            self.bet_outcomes[record["id"]] = record["data"]
+        elif kind == "closing_line":
+            self.closing_lines[record["id"]] = record["value"]
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        """
+        Queue a change for the next save().
+
+        Nothing is queued before the graph has a snapshot on disk: the first
+        save() writes the whole graph anyway. Past PENDING_FLUSH_RECORDS the
+        queue is dropped and the next save() compacts instead, so nothing
+        reaches disk before save() is called.
+        """
+        if self._replaying or self._persisted_path is None or self._needs_compaction:
+            return
+        self._pending.append(record)
+        if len(self._pending) >= PENDING_FLUSH_RECORDS:
+            self._pending = []
+            self._needs_compaction = True
+
+    def _flush_pending(self, save_path: Path) -> None:
+        """Append queued changes to the change log for save_path."""
+        with open(self.log_path_for(save_path), "a") as f:
+            for record in self._pending:
+                f.write(json.dumps(record, default=str) + "\n")
+        self._log_records += len(self._pending)
+        self._pending = []
+
+    def _entity_count(self) -> int:
+        return (
+            len(self.teams)
+            + len(self.games)
+            + sum(len(r) for r in self.power_ratings.values())
+            + len(self.evaluations)
+            + len(self.recommendations)
+            + len(self.bet_outcomes)
+            + len(self.closing_lines)
+        )
 
 
 # --- Utility Functions ---
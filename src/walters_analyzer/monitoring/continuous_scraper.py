@@ -2,129 +2,106 @@
 """
 Continuous Odds Scraper - Runs your existing scrapers at specified intervals
 Uses your installed walters_analyzer package
+
+Scrapers run in-process on an asyncio scheduler (see monitoring.scheduler):
+clients stay warm between polls and independent sources poll concurrently,
+each on its own interval with jitter.
 """
 
-import time
-import subprocess
+import asyncio
 import argparse
 from datetime import datetime
 import sys
 
+from walters_analyzer.monitoring.scheduler import (
+    DEFAULT_INTERVALS,
+    SOURCES,
+    ScraperScheduler,
+    build_source,
+)
+
 
 def run_scraper(scraper_name: str, sport: str = "nfl"):
-    """Run one of your existing scrapers"""
-    try:
-        print(f"[CHART] Running {scraper_name}...")
-
-        if scraper_name == "overtime":
-            cmd = ["python", "-m", "walters_analyzer.cli", "scrape-overtime"]
-        elif scraper_name == "highlightly":
-            cmd = ["python", "-m", "walters_analyzer.cli", "scrape-highlightly"]
-        elif scraper_name == "sharp-monitor":
-            cmd = ["python", "-m", "walters_analyzer.cli", "monitor-sharp"]
-        elif scraper_name == "nfl-site":
-            cmd = ["python", "-m", "walters_analyzer.cli", "scrape-nfl-site"]
-        else:
-            print(f"[ERROR] Unknown scraper: {scraper_name}")
-            return False
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode == 0:
-            print(f"[*] {scraper_name} completed successfully")
-            if result.stdout:
-                # Show last few lines of output
-                lines = result.stdout.strip().split("\n")
-                for line in lines[-5:]:
-                    print(f"   {line}")
-            return True
-        else:
-            print(f"[ERROR] {scraper_name} failed:")
-            if result.stderr:
-                print(f"   {result.stderr[:200]}")
-            return False
+    """Run one of your existing scrapers once (in-process)"""
+    if scraper_name not in SOURCES:
+        print(f"[ERROR] Unknown scraper: {scraper_name}")
+        return False
 
+    print(f"[CHART] Running {scraper_name}...")
+    scheduler = ScraperScheduler([build_source(scraper_name, sport)])
+    try:
+        stats = asyncio.run(scheduler.run_once())
     except Exception as e:
         print(f"[ERROR] Error running {scraper_name}: {e}")
         return False
+    return stats[scraper_name].failures == 0
 
 
-def continuous_scrape(interval: int = 60, scrapers: list = None):
+def continuous_scrape(
+    interval: int = None,
+    scrapers: list = None,
+    sport: str = "nfl",
+    jitter: float = 0.1,
+    source_intervals: dict = None,
+):
     """
     Continuously scrape odds at specified intervals
 
     Args:
-        interval: Seconds between scrapes
+        interval: Seconds between scrapes for every source
+            (default: per-source DEFAULT_INTERVALS)
         scrapers: List of scrapers to run (default: all)
+        sport: nfl or ncaaf (overtime, sharp-monitor)
+        jitter: Random +/- fraction applied to each interval
+        source_intervals: Per-source interval overrides {name: seconds}
     """
     if scrapers is None:
         scrapers = ["overtime", "highlightly", "sharp-monitor"]
+    source_intervals = source_intervals or {}
+
+    sources = [
+        build_source(
+            name,
+            sport,
+            interval=source_intervals.get(name, interval),
+            jitter=jitter,
+        )
+        for name in scrapers
+    ]
 
     print(f"\n{'=' * 60}")
     print("[*] CONTINUOUS ODDS SCRAPING")
-    print(f"Interval: {interval}s ({interval / 60:.1f} min)")
-    print(f"Scrapers: {', '.join(scrapers)}")
+    for source in sources:
+        print(f"   {source.name}: every {source.interval:.0f}s (+/-{jitter:.0%})")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("Press Ctrl+C to stop")
     print(f"{'=' * 60}\n")
 
-    iteration = 0
     start_time = datetime.now()
-    successes = 0
-    failures = 0
+    scheduler = ScraperScheduler(sources)
 
     try:
-        while True:
-            iteration += 1
-            iter_start = datetime.now()
-
-            print(f"\n{'[*]' * 60}")
-            print(f"[*] Iteration #{iteration} - {iter_start.strftime('%H:%M:%S')}")
-            print(f"{'[*]' * 60}")
-
-            # Run each scraper
-            for scraper in scrapers:
-                if run_scraper(scraper):
-                    successes += 1
-                else:
-                    failures += 1
-
-                # Small delay between scrapers
-                if len(scrapers) > 1:
-                    time.sleep(2)
-
-            # Stats
-            iter_time = (datetime.now() - iter_start).total_seconds()
-            runtime = datetime.now() - start_time
-            hours = int(runtime.total_seconds() // 3600)
-            minutes = int((runtime.total_seconds() % 3600) // 60)
-
-            print("\n[CHART] STATS:")
-            print(f"   Iteration time: {iter_time:.1f}s")
-            print(f"   Total runtime: {hours}h {minutes}m")
-            print(f"   Iterations: {iteration}")
-            print(
-                f"   Success rate: {successes}/{successes + failures} ({100 * successes / (successes + failures):.1f}%)"
-            )
-
-            # Wait for next iteration
-            wait_msg = f"{interval / 60:.1f} min" if interval >= 60 else f"{interval}s"
-            print(f"\n⏳ Waiting {wait_msg} until next check...")
-            time.sleep(interval)
-
+        asyncio.run(scheduler.run())
     except KeyboardInterrupt:
-        runtime = datetime.now() - start_time
-        hours = int(runtime.total_seconds() // 3600)
-        minutes = int((runtime.total_seconds() % 3600) // 60)
-
-        print(f"\n\n{'=' * 60}")
-        print("[*] SCRAPING STOPPED")
-        print(f"Total runtime: {hours}h {minutes}m")
-        print(f"Total iterations: {iteration}")
-        print(
-            f"Success rate: {successes}/{successes + failures} ({100 * successes / (successes + failures):.1f}%)"
-        )
-        print(f"{'=' * 60}\n")
+        pass
+
+    runtime = datetime.now() - start_time
+    hours = int(runtime.total_seconds() // 3600)
+    minutes = int((runtime.total_seconds() % 3600) // 60)
+
+    print(f"\n\n{'=' * 60}")
+    print("[*] SCRAPING STOPPED")
+    print(f"Total runtime: {hours}h {minutes}m")
+    for line in scheduler.summary_lines():
+        print(line)
+    print(f"{'=' * 60}\n")
+
+
+def _parse_source_interval(value: str):
+    name, _, seconds = value.partition("=")
+    if name not in SOURCES or not seconds:
+        raise argparse.ArgumentTypeError(f"expected SCRAPER=SECONDS, got {value!r}")
+    return name, float(seconds)
 
 
 def main():
@@ -134,19 +111,42 @@ def main():
     parser.add_argument(
         "--interval",
         type=int,
-        default=60,
-        help="Scrape interval in seconds (default: 60)",
+        default=None,
+        help="Scrape interval in seconds for every scraper "
+        f"(default: per scraper, {DEFAULT_INTERVALS})",
+    )
+    parser.add_argument(
+        "--source-interval",
+        type=_parse_source_interval,
+        action="append",
+        default=[],
+        metavar="SCRAPER=SECONDS",
+        help="Interval override for one scraper (repeatable)",
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0.1,
+        help="Random +/- fraction applied to each interval (default: 0.1)",
+    )
+    parser.add_argument(
+        "--sport",
+        choices=["nfl", "ncaaf"],
+        default="nfl",
+        help="Sport for overtime and sharp-monitor (default: nfl)",
     )
     parser.add_argument(
         "--scrapers",
         nargs="+",
-        choices=["overtime", "highlightly", "sharp-monitor", "nfl-site"],
+        choices=list(SOURCES),
         help="Which scrapers to run (default: overtime, highlightly, sharp-monitor)",
     )
 
     args = parser.parse_args()
+    source_intervals = dict(args.source_interval)
 
-    if args.interval < 30:
+    intervals = [args.interval] if args.interval else []
+    if min(intervals + list(source_intervals.values()), default=30) < 30:
         print(
             "[WARNING]  Warning: Intervals <30s may trigger rate limits or API quotas"
         )
@@ -154,7 +154,13 @@ def main():
         if response.lower() != "y":
             sys.exit(0)
 
-    continuous_scrape(args.interval, args.scrapers)
+    continuous_scrape(
+        args.interval,
+        args.scrapers,
+        sport=args.sport,
+        jitter=args.jitter,
+        source_intervals=source_intervals,
+    )
 
 
 if __name__ == "__main__":
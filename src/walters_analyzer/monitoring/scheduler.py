@@ -0,0 +1,349 @@
+"""
+In-process asyncio scheduler for continuous scraping
+
+Each source keeps its clients warm (HTTP connection pools, API sessions)
+between polls and runs on its own interval with jitter; independent sources
+poll concurrently. Per-poll latency and success counts are tracked per source.
+"""
+
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+# Default poll interval per source (seconds)
+DEFAULT_INTERVALS = {
+    "overtime": 60.0,
+    "highlightly": 300.0,
+    "sharp-monitor": 30.0,
+    "nfl-site": 3600.0,
+}
+
+ODDS_API_SPORTS = {"nfl": "americanfootball_nfl", "ncaaf": "americanfootball_ncaaf"}
+
+
+@dataclass
+class SourceStats:
+    """Latency and success counters for one source"""
+
+    runs: int = 0
+    failures: int = 0
+    last_latency: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_result: str = ""
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.runs if self.runs else 0.0
+
+    @property
+    def successes(self) -> int:
+        return self.runs - self.failures
+
+    def record(self, latency: float, ok: bool, result: str) -> None:
+        self.runs += 1
+        self.failures += 0 if ok else 1
+        self.last_latency = latency
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_result = result
+
+
+class ScraperSource(ABC):
+    """
+    One pollable data source
+
+    Subclasses open long-lived clients in setup(), do one scrape per poll()
+    (returning a short summary) and release clients in close().
+    """
+
+    name = "source"
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        jitter: float = 0.1,
+        timeout: Optional[float] = None,
+    ):
+        self.interval = interval or DEFAULT_INTERVALS.get(self.name, 60.0)
+        self.jitter = jitter
+        self.timeout = timeout
+
+    async def setup(self) -> None:
+        pass
+
+    @abstractmethod
+    async def poll(self) -> str:
+        """Scrape once and return a short summary of what was collected"""
+
+    async def close(self) -> None:
+        pass
+
+    def next_delay(self) -> float:
+        """Interval with +/- jitter (fraction of interval)"""
+        spread = self.interval * self.jitter
+        return max(0.0, self.interval + random.uniform(-spread, spread))
+
+
+class OvertimeSource(ScraperSource):
+    """Overtime.ag pregame odds via the direct API client"""
+
+    name = "overtime"
+
+    def __init__(
+        self,
+        sport: str = "nfl",
+        output_dir: str = "output/overtime",
+        store_dir: Optional[str] = "data/odds_store",
+        **kw,
+    ):
+        super().__init__(**kw)
+        self.sport = sport
+        self.output_dir = output_dir
+        self.store_dir = store_dir  # Odds snapshot store; None to skip storing
+
+    async def setup(self) -> None:
+        import httpx
+        from scrapers.overtime import OvertimeApiClient
+
+        odds_store = None
+        if self.store_dir:
+            from walters_analyzer.query import OddsSnapshotStore
+
+            odds_store = OddsSnapshotStore(self.store_dir)
+
+        self.http = httpx.AsyncClient(timeout=30.0)
+        self.client = OvertimeApiClient(
+            output_dir=self.output_dir, client=self.http, odds_store=odds_store
+        )
+
+    async def poll(self) -> str:
+        if self.sport == "ncaaf":
+            data = await self.client.scrape_ncaaf()
+        else:
+            data = await self.client.scrape_nfl()
+        return f"{data['summary']['total_games']} games"
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+
+class HighlightlySource(ScraperSource):
+    """Highlightly prematch odds for NFL and NCAA"""
+
+    name = "highlightly"
+
+    def __init__(self, output_dir: Optional[str] = None, **kw):
+        super().__init__(**kw)
+        self.output_dir = output_dir
+
+    async def setup(self) -> None:
+        from walters_analyzer.feeds.highlightly_client import HighlightlyClient
+
+        self.client = HighlightlyClient()
+
+    async def poll(self) -> str:
+        from walters_analyzer.feeds.highlightly_storage import save_to_jsonl
+
+        total = 0
+        for sport_key, league in (("nfl", "NFL"), ("ncaaf", "NCAA")):
+            odds = await self.client.get_odds(league_name=league)
+            if odds:
+                output_dir = self.output_dir or f"data/highlightly/{sport_key}"
+                save_to_jsonl(odds, "odds-prematch", sport_key, output_dir, "latest")
+                total += len(odds)
+        return f"{total} odds records"
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class SharpMonitorSource(ScraperSource):
+    """One MarketMonitor pass per poll (reverse line movement alerts)"""
+
+    name = "sharp-monitor"
+
+    def __init__(self, sport: str = "nfl", **kw):
+        super().__init__(**kw)
+        self.sport = ODDS_API_SPORTS.get(sport, sport)
+
+    async def setup(self) -> None:
+        from walters_analyzer.feeds.market_monitor import MarketMonitor
+
+        self.monitor = MarketMonitor()
+
+    async def poll(self) -> str:
+        alerts = await self.monitor.check_once(self.sport)
+        return f"{len(alerts)} alerts"
+
+    async def close(self) -> None:
+        await self.monitor.client.client.aclose()
+
+
+class NFLSiteSource(ScraperSource):
+    """nfl.com research snapshots (sync scraper run in a worker thread)"""
+
+    name = "nfl-site"
+
+    def __init__(self, output_dir: str = "src/output/nfl", **kw):
+        super().__init__(**kw)
+        self.output_dir = output_dir
+
+    async def setup(self) -> None:
+        import httpx
+        from walters_analyzer.ingest.nfl_site_scraper import NFLComScraper
+
+        self.http = httpx.Client(
+            headers=NFLComScraper.HEADERS, timeout=30.0, follow_redirects=True
+        )
+        self.scraper = NFLComScraper(output_root=self.output_dir, client=self.http)
+
+    async def poll(self) -> str:
+        saved = await asyncio.to_thread(self.scraper.scrape)
+        return f"{len(saved)} files"
+
+    async def close(self) -> None:
+        self.http.close()
+
+
+SOURCES = {
+    source.name: source
+    for source in (OvertimeSource, HighlightlySource, SharpMonitorSource, NFLSiteSource)
+}
+
+
+def build_source(
+    name: str, sport: str = "nfl", interval: Optional[float] = None, **kw
+) -> ScraperSource:
+    """Create a source by scraper name (overtime, highlightly, ...)"""
+    if name not in SOURCES:
+        raise ValueError(f"Unknown scraper: {name}")
+    if name in ("overtime", "sharp-monitor"):
+        kw["sport"] = sport
+    return SOURCES[name](interval=interval, **kw)
+
+
+class ScraperScheduler:
+    """
+    Run sources concurrently, each on its own interval
+
+    Example:
+        scheduler = ScraperScheduler([build_source("overtime"),
+                                      build_source("sharp-monitor")])
+        await scheduler.run(duration=3600)
+    """
+
+    def __init__(self, sources: Sequence[ScraperSource], verbose: bool = True):
+        self.sources: List[ScraperSource] = list(sources)
+        self.stats: Dict[str, SourceStats] = {s.name: SourceStats() for s in sources}
+        self.verbose = verbose
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask run() to finish after in-flight polls"""
+        self._stop.set()
+
+    async def run(
+        self, duration: Optional[float] = None, max_polls: Optional[int] = None
+    ) -> Dict[str, SourceStats]:
+        """
+        Poll all sources until stopped, duration elapses or each source has
+        run max_polls times. Clients are set up once and closed on exit.
+
+        If any source fails to set up, the sources that did set up are
+        closed and the first setup error is raised.
+        """
+        self._stop = asyncio.Event()
+        results = await asyncio.gather(
+            *(source.setup() for source in self.sources), return_exceptions=True
+        )
+        ready = [
+            source
+            for source, result in zip(self.sources, results)
+            if not isinstance(result, BaseException)
+        ]
+        loops: List[asyncio.Task] = []
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            loops = [
+                asyncio.create_task(self._source_loop(source, max_polls))
+                for source in self.sources
+            ]
+            if duration is None:
+                await asyncio.gather(*loops)
+            else:
+                await asyncio.wait(loops, timeout=duration)
+        finally:
+            self._stop.set()
+            for loop in loops:
+                loop.cancel()
+            await asyncio.gather(*loops, return_exceptions=True)
+            await asyncio.gather(
+                *(source.close() for source in ready), return_exceptions=True
+            )
+        return self.stats
+
+    async def run_once(self) -> Dict[str, SourceStats]:
+        """Poll every source once, concurrently (clients set up and closed)"""
+        return await self.run(max_polls=1)
+
+    async def poll_source(self, source: ScraperSource) -> bool:
+        """Poll one source, recording latency; never raises"""
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(source.poll(), timeout=source.timeout)
+            ok = True
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            result, ok = f"timed out after {source.timeout}s", False
+        except Exception as e:
+            result, ok = str(e)[:200], False
+        latency = time.perf_counter() - start
+
+        stats = self.stats[source.name]
+        stats.record(latency, ok, result)
+        if self.verbose:
+            tag = "[OK]" if ok else "[ERROR]"
+            print(
+                f"[{datetime.now().strftime('%H:%M:%S')}] {tag} {source.name}: "
+                f"{result} in {latency:.2f}s (avg {stats.avg_latency:.2f}s, "
+                f"max {stats.max_latency:.2f}s, "
+                f"{stats.successes}/{stats.runs} ok)"
+            )
+        return ok
+
+    async def _source_loop(
+        self, source: ScraperSource, max_polls: Optional[int]
+    ) -> None:
+        polls = 0
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            await self.poll_source(source)
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                return
+
+            # Keep cadence: interval is measured from poll start
+            delay = source.next_delay() - (time.perf_counter() - start)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=max(0.0, delay))
+            except asyncio.TimeoutError:
+                pass
+
+    def summary_lines(self) -> List[str]:
+        """Human-readable per-source stats"""
+        lines = []
+        for name, stats in self.stats.items():
+            rate = 100 * stats.successes / stats.runs if stats.runs else 0.0
+            lines.append(
+                f"   {name}: {stats.runs} polls, {rate:.1f}% ok, "
+                f"avg {stats.avg_latency:.2f}s, max {stats.max_latency:.2f}s"
+            )
+        return lines
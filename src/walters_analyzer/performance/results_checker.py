@@ -4,11 +4,14 @@ Fetches actual game scores, parses predictions, and calculates performance metri
 """
 
 import json
+import re
 import httpx
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+
+from walters_analyzer.team_names import get_team_resolver
 
 
 @dataclass
@@ -23,6 +26,9 @@ class GameScore:
     home_score: int
     status: str  # 'Final', 'In Progress', 'Scheduled'
     game_time: str
+    # Other names ESPN uses for each team (location, short name, abbreviation)
+    away_aliases: List[str] = field(default_factory=list)
+    home_aliases: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -41,6 +47,7 @@ class Prediction:
     kelly_fraction: float
     confidence_score: float
     timestamp: str
+    game_time: str = ""
 
 
 @dataclass
@@ -56,6 +63,89 @@ class GameResult:
     margin_error: int
 
 
+def _parse_date(value: str) -> Optional[datetime]:
+    """Kickoff time from an ISO timestamp, or None if it is not ISO formatted"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+@dataclass
+class _IndexedScore:
+    score: GameScore
+    week: Optional[int]
+    kickoff: Optional[datetime]
+
+
+def _team_aliases(team: Dict) -> List[str]:
+    """Alternate ESPN names for a team (e.g. "Miami (OH)", "M-OH")"""
+    names = (team.get(k) for k in ("location", "shortDisplayName", "abbreviation"))
+    return [name for name in dict.fromkeys(names) if name]
+
+
+class ScoreIndex:
+    """
+    Fetched scores for one league, keyed by canonical (away, home) team.
+
+    Every name a source may use for a team (ESPN display name, location,
+    abbreviation, Overtime.ag or Massey name) resolves to the same key, so a
+    prediction is matched with one dict lookup instead of a substring scan.
+    Exact keys also keep "Miami" from matching "Miami (OH)". When a matchup
+    appears more than once (e.g. several weeks indexed), the fetch week and
+    then the kickoff date break the tie.
+    """
+
+    def __init__(self, league: str = "nfl"):
+        self.league = league.lower()
+        self.team_names = get_team_resolver(self.league)
+        self._games: Dict[Tuple[str, str], List[_IndexedScore]] = {}
+
+    def __len__(self) -> int:
+        return len({id(e.score) for games in self._games.values() for e in games})
+
+    def team_key(self, name: str) -> str:
+        """Canonical, punctuation-insensitive key for a team name"""
+        canonical = self.team_names.lookup(name) or self.team_names.strip_mascot(name)
+        return re.sub(r"[^\w&]+", " ", canonical.casefold()).strip()
+
+    def add(self, scores: Iterable[GameScore], week: Optional[int] = None) -> None:
+        """Index a batch of fetched scores"""
+        for score in scores:
+            entry = _IndexedScore(score, week, _parse_date(score.game_time))
+            away_keys = {
+                self.team_key(n) for n in [score.away_team, *score.away_aliases] if n
+            }
+            home_keys = {
+                self.team_key(n) for n in [score.home_team, *score.home_aliases] if n
+            }
+            for away in away_keys:
+                for home in home_keys:
+                    self._games.setdefault((away, home), []).append(entry)
+
+    def match(self, pred: Prediction) -> Optional[GameScore]:
+        """Score for a prediction's matchup, or None if it was not fetched"""
+        key = (self.team_key(pred.away_team), self.team_key(pred.home_team))
+        candidates = self._games.get(key)
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0].score
+
+        kickoff = _parse_date(pred.game_time)
+
+        def distance(entry: _IndexedScore) -> Tuple[bool, float]:
+            days = float("inf")
+            if kickoff and entry.kickoff:
+                try:
+                    days = abs((entry.kickoff - kickoff).total_seconds())
+                except TypeError:  # Naive vs aware: compare calendar dates
+                    days = abs((entry.kickoff.date() - kickoff.date()).days) * 86400
+            return (entry.week != pred.week, days)
+
+        return min(candidates, key=distance).score
+
+
 class BettingResultsChecker:
     """Check betting predictions against actual game results"""
 
@@ -70,6 +160,7 @@ class BettingResultsChecker:
             }
         )
         self.games: Dict[str, GameScore] = {}
+        self.score_indexes: Dict[str, ScoreIndex] = {}
         self.predictions: Dict[str, Prediction] = {}
         self.results: List[GameResult] = []
 
@@ -90,62 +181,7 @@ class BettingResultsChecker:
         Returns:
             List of GameScore objects
         """
-        try:
-            url = f"{self.base_url}/nfl/scoreboard"
-            if week:
-                url += f"?week={week}"
-
-            response = self.client.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            scores = []
-            for event in data.get("events", []):
-                try:
-                    competition = event.get("competitions", [{}])[0]
-                    competitors = competition.get("competitors", [])
-
-                    if len(competitors) < 2:
-                        continue
-
-                    # ESPN API has home first, away second
-                    home = competitors[0]
-                    away = competitors[1]
-
-                    away_loc = away["team"].get("location", "")
-                    home_loc = home["team"].get("location", "")
-
-                    # Extract status properly
-                    status_dict = competition.get("status", {})
-                    if isinstance(status_dict, dict):
-                        status_type = status_dict.get("description", "Scheduled")
-                    else:
-                        status_type = status_dict.get("type", "Scheduled")
-
-                    score = GameScore(
-                        game_id=f"{away_loc}_{home_loc}",
-                        matchup=(
-                            f"{away['team']['displayName']} @ "
-                            f"{home['team']['displayName']}"
-                        ),
-                        away_team=away["team"]["displayName"],
-                        home_team=home["team"]["displayName"],
-                        away_score=int(away.get("score", 0)),
-                        home_score=int(home.get("score", 0)),
-                        status=status_type,
-                        game_time=event.get("date", ""),
-                    )
-                    scores.append(score)
-                    self.games[score.game_id] = score
-                except (KeyError, ValueError, IndexError) as e:
-                    print(f"[WARNING] Failed to parse game: {e}")
-                    continue
-
-            return scores
-
-        except httpx.RequestError as e:
-            print(f"[ERROR] Failed to fetch NFL scores: {e}")
-            return []
+        return self._fetch_scores("nfl", "nfl", week)
 
     def fetch_ncaaf_scores(
         self, week: Optional[int] = None, season: int = 2025
@@ -160,8 +196,14 @@ class BettingResultsChecker:
         Returns:
             List of GameScore objects
         """
+        return self._fetch_scores("ncaaf", "college-football", week)
+
+    def _fetch_scores(
+        self, league: str, sport_path: str, week: Optional[int]
+    ) -> List[GameScore]:
+        """Fetch one scoreboard and add its games to the league's score index"""
         try:
-            url = f"{self.base_url}/college-football/scoreboard"
+            url = f"{self.base_url}/{sport_path}/scoreboard"
             if week:
                 url += f"?week={week}"
 
@@ -204,6 +246,8 @@ class BettingResultsChecker:
                         home_score=int(home.get("score", 0)),
                         status=status_type,
                         game_time=event.get("date", ""),
+                        away_aliases=_team_aliases(away["team"]),
+                        home_aliases=_team_aliases(home["team"]),
                     )
                     scores.append(score)
                     self.games[score.game_id] = score
@@ -211,10 +255,13 @@ class BettingResultsChecker:
                     print(f"[WARNING] Failed to parse game: {e}")
                     continue
 
+            self.score_indexes.setdefault(league, ScoreIndex(league)).add(
+                scores, week=week
+            )
             return scores
 
         except httpx.RequestError as e:
-            print(f"[ERROR] Failed to fetch NCAAF scores: {e}")
+            print(f"[ERROR] Failed to fetch {league.upper()} scores: {e}")
             return []
 
     def load_predictions(self, edge_file: Path) -> List[Prediction]:
@@ -254,6 +301,7 @@ class BettingResultsChecker:
                             kelly_fraction=float(data.get("kelly_fraction", 0)),
                             confidence_score=float(data.get("confidence_score", 0)),
                             timestamp=data.get("timestamp", ""),
+                            game_time=data.get("game_time", ""),
                         )
                         predictions.append(pred)
                         self.predictions[pred.game_id] = pred
@@ -337,13 +385,16 @@ class BettingResultsChecker:
         roi = (profit_loss / risk_amount * 100) if risk_amount > 0 else 0
         return profit_loss, roi
 
-    def _find_matching_score(self, pred: Prediction) -> Optional[GameScore]:
+    def _find_matching_score(
+        self, pred: Prediction, league: Optional[str] = None
+    ) -> Optional[GameScore]:
         """
         Find matching game score for a prediction.
-        Tries exact match first, then fuzzy match by team names.
+        Tries exact match first, then the canonical team-name index.
 
         Args:
             pred: Prediction object
+            league: League whose scores to search (all fetched leagues if None)
 
         Returns:
             Matching GameScore or None
@@ -353,23 +404,32 @@ class BettingResultsChecker:
         if score:
             return score
 
-        # Try fuzzy match by team names
-        pred_away = pred.away_team.lower()
-        pred_home = pred.home_team.lower()
-
-        for game_id, score in self.games.items():
-            score_away = score.away_team.lower()
-            score_home = score.home_team.lower()
+        if league is not None:
+            index = self.score_indexes.get(league.lower())
+            return index.match(pred) if index else None
 
-            # Check if team names match (handle abbreviations and variations)
-            away_match = pred_away in score_away or score_away in pred_away
-            home_match = pred_home in score_home or score_home in pred_home
-
-            if away_match and home_match:
+        for index in self.score_indexes.values():
+            score = index.match(pred)
+            if score:
                 return score
 
         return None
 
+    def match_predictions(
+        self, predictions: Iterable[Prediction], league: Optional[str] = None
+    ) -> List[Tuple[Prediction, Optional[GameScore]]]:
+        """
+        Pair every prediction with its game score in one pass.
+
+        Args:
+            predictions: Predictions from load_predictions (any number of weeks)
+            league: League whose scores to search (all fetched leagues if None)
+
+        Returns:
+            (prediction, score or None) for each prediction, in order
+        """
+        return [(pred, self._find_matching_score(pred, league)) for pred in predictions]
+
     def check_results(
         self, league: str = "nfl", week: Optional[int] = None
     ) -> List[GameResult]:
@@ -430,9 +490,7 @@ class BettingResultsChecker:
         bankroll = 10000
         results = []
 
-        for pred in predictions:
-            score = self._find_matching_score(pred)
-
+        for pred, score in self.match_predictions(predictions, league):
             if not score:
                 print(f"[WARNING] No score found for {pred.matchup}")
                 continue
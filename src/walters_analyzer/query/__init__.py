@@ -2,6 +2,21 @@
 Query utilities for scraped betting data
 """
 
-from .odds_viewer import OddsViewer
+from typing import TYPE_CHECKING
 
-__all__ = ["OddsViewer"]
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .odds_store import OddsSnapshotStore
+    from .odds_viewer import OddsViewer
+
+# Exported name -> submodule, imported on first attribute access (the store
+# needs pyarrow)
+_EXPORTS = {
+    "OddsSnapshotStore": ".odds_store",
+    "OddsViewer": ".odds_viewer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["OddsSnapshotStore", "OddsViewer"]
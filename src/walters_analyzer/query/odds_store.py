@@ -0,0 +1,526 @@
+"""
+Odds Snapshot Store
+
+Columnar store for every odds scrape (Overtime.ag, The Odds API, Action
+Network). Each scrape is flattened to one row per game/book and written to
+a Parquet dataset partitioned by league, season and week:
+
+    data/odds_store/league=nfl/season=2025/week=12/<snapshot>.parquet
+
+Queries filter on partitions and Parquet statistics (predicate pushdown), so
+looking up one team's lines over a season reads only the matching files and
+row groups instead of reparsing every JSONL scrape.
+
+Example:
+    >>> store = OddsSnapshotStore()
+    >>> store.ingest_file(Path("data/overtime_live/overtime-live-20251123.jsonl"))
+    >>> store.line_movement("Chiefs", league="nfl", market="spread")
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from walters_analyzer.season_calendar import get_ncaaf_week, get_nfl_week
+from walters_analyzer.team_names import get_team_resolver
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path("data/odds_store")
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("league", pa.string()), ("season", pa.int16()), ("week", pa.int16())]),
+    flavor="hive",
+)
+
+SCHEMA = pa.schema(
+    [
+        ("snapshot_at", pa.timestamp("us", tz="UTC")),
+        ("source", pa.string()),
+        ("book", pa.string()),
+        ("game_key", pa.string()),
+        ("event_date", pa.date32()),
+        ("event_time", pa.string()),
+        ("rotation_number", pa.string()),
+        ("away_team", pa.string()),
+        ("home_team", pa.string()),
+        ("away_key", pa.string()),  # Canonical team name (see team_names)
+        ("home_key", pa.string()),
+        ("spread_away_line", pa.float64()),
+        ("spread_away_price", pa.int32()),
+        ("spread_home_line", pa.float64()),
+        ("spread_home_price", pa.int32()),
+        ("total_line", pa.float64()),
+        ("over_price", pa.int32()),
+        ("under_price", pa.int32()),
+        ("ml_away_price", pa.int32()),
+        ("ml_home_price", pa.int32()),
+        ("league", pa.string()),
+        ("season", pa.int16()),
+        ("week", pa.int16()),
+    ]
+)
+
+MARKETS = ("spread", "total", "moneyline")
+
+_LEAGUES = {"nfl": "nfl", "ncaaf": "ncaaf", "college_football": "ncaaf"}
+
+
+def _league(value: Optional[str]) -> Optional[str]:
+    return _LEAGUES.get((value or "").lower())
+
+
+def _as_utc(value: datetime) -> datetime:
+    """UTC datetime; naive values are taken as UTC, never as local time, so a
+    scrape ingested live and re-ingested from its file gets one snapshot"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """UTC datetime from an ISO string (naive values are taken as UTC)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return _as_utc(parsed)
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    parsed = _parse_timestamp(value)
+    return parsed.date() if parsed else None
+
+
+def _season_week(league: str, event_date: Optional[date]) -> tuple[int, int]:
+    """Season (year it started) and week; week 0 = outside the regular season"""
+    if event_date is None:
+        return 0, 0
+    season = event_date.year - 1 if event_date.month <= 2 else event_date.year
+    week_of = get_nfl_week if league == "nfl" else get_ncaaf_week
+    return season, week_of(event_date) or 0
+
+
+def _number(side: Optional[Dict], *keys: str, cast=float) -> Optional[Any]:
+    """First non-null numeric field of a market side"""
+    if not side:
+        return None
+    for key in keys:
+        value = side.get(key)
+        if value is None or value == "":
+            continue
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _from_overtime_api(game: Dict[str, Any]) -> Dict[str, Any]:
+    """Overtime.ag API client game (convert_to_billy_walters_format) as a
+    shared-format game"""
+    spread = game.get("spread") or {}
+    total = game.get("total") or {}
+    moneyline = game.get("moneyline") or {}
+    rotation = (game.get("rotation_numbers") or {}).get("team1")
+    return {
+        "source": game.get("source") or "overtime.ag",
+        "league": game.get("league"),
+        "week": game.get("week"),
+        "game_key": game.get("game_id"),
+        "rotation_number": rotation,
+        "event_time": game.get("game_datetime_utc") or "",
+        "teams": {"away": game.get("away_team"), "home": game.get("home_team")},
+        "markets": {
+            "spread": {
+                "away": {"line": spread.get("away"), "price": spread.get("away_odds")},
+                "home": {"line": spread.get("home"), "price": spread.get("home_odds")},
+            },
+            "total": {
+                "over": {"line": total.get("points"), "price": total.get("over_odds")},
+                "under": {
+                    "line": total.get("points"),
+                    "price": total.get("under_odds"),
+                },
+            },
+            "moneyline": {
+                "away": {"price": moneyline.get("away")},
+                "home": {"price": moneyline.get("home")},
+            },
+        },
+        "collected_at": game.get("collected_at"),
+    }
+
+
+class OddsSnapshotStore:
+    """Partitioned Parquet store of odds snapshots."""
+
+    def __init__(self, root: Path | str = DEFAULT_STORE_DIR):
+        """
+        Initialize odds snapshot store.
+
+        Args:
+            root: Dataset directory (created on first ingest)
+        """
+        self.root = Path(root)
+
+    # =================================================================
+    # INGEST
+    # =================================================================
+
+    def ingest(
+        self,
+        games: Iterable[Dict[str, Any]],
+        snapshot_at: Optional[datetime] = None,
+        source: Optional[str] = None,
+        league: Optional[str] = None,
+        week: Optional[int] = None,
+    ) -> int:
+        """
+        Add one scrape to the store.
+
+        Accepts games in the shared scraper format (``teams`` and ``markets``
+        keys, as written by the Overtime.ag and Odds API scrapers), the
+        Overtime.ag API client's converted format (``rotation_numbers`` and
+        plain-number ``spread``/``total`` values) or the Action Network
+        format (``away_team``/``spread``/``total`` keys).
+
+        Args:
+            games: Games from one scrape
+            snapshot_at: When the scrape ran (defaults to each game's
+                ``collected_at``, then now); naive values are taken as UTC
+            source: Source name when games do not carry one
+            league: League when games do not carry one
+            week: Week when games do not carry one
+
+        Returns:
+            Number of rows written
+        """
+        rows = []
+        for game in games:
+            row = self._flatten(game, snapshot_at, source, league, week)
+            if row is not None:
+                rows.append(row)
+        if not rows:
+            return 0
+
+        table = pa.Table.from_pylist(rows, schema=SCHEMA)
+
+        # One file per partition per snapshot; re-ingesting a scrape overwrites it
+        snapshots = sorted({f"{r['source']}|{r['snapshot_at']}" for r in rows})
+        digest = hashlib.sha1("|".join(snapshots).encode()).hexdigest()[:16]
+        ds.write_dataset(
+            table,
+            self.root,
+            format="parquet",
+            partitioning=PARTITIONING,
+            basename_template=f"snapshot-{digest}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        logger.info(f"Stored {len(rows)} odds rows in {self.root}")
+        return len(rows)
+
+    def ingest_file(self, path: Path) -> int:
+        """
+        Add a scrape file: JSONL (one game per line) or an Action Network
+        JSON document (``{"source": ..., "games": [...]}``).
+
+        Returns:
+            Number of rows written
+        """
+        path = Path(path)
+        fallback_time = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+
+        if path.suffix == ".jsonl":
+            games = []
+            with open(path, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        games.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+            # Rows without collected_at fall back to the file time
+            for game in games:
+                game.setdefault("collected_at", fallback_time.isoformat())
+            return self.ingest(games)
+
+        with open(path, "r") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return self.ingest(data, snapshot_at=fallback_time)
+        return self.ingest(
+            data.get("games", []),
+            snapshot_at=_parse_timestamp(data.get("scraped_at")) or fallback_time,
+            source=data.get("source"),
+            league=data.get("league"),
+            week=data.get("week"),
+        )
+
+    def ingest_directory(self, directory: Path, pattern: str = "*.jsonl") -> int:
+        """Ingest every scrape file in a directory matching ``pattern``"""
+        return sum(
+            self.ingest_file(path) for path in sorted(Path(directory).glob(pattern))
+        )
+
+    def _flatten(
+        self,
+        game: Dict[str, Any],
+        snapshot_at: Optional[datetime],
+        source: Optional[str],
+        league: Optional[str],
+        week: Optional[int],
+    ) -> Optional[Dict[str, Any]]:
+        """One store row for a game, or None if it has no teams/league"""
+        if "rotation_numbers" in game and "teams" not in game:
+            game = _from_overtime_api(game)
+        league = (
+            _league(game.get("league")) or _league(game.get("sport")) or _league(league)
+        )
+
+        if "teams" in game:
+            # Shared scraper format (Overtime.ag, The Odds API)
+            away = game["teams"].get("away")
+            home = game["teams"].get("home")
+            markets = game.get("markets") or {}
+            line_keys, price_keys = ("line",), ("price",)
+            event_time = game.get("event_time") or ""
+            event_date = _parse_date(game.get("event_date")) or _parse_date(event_time)
+            game_key = game.get("game_key")
+        else:
+            # Action Network format
+            away = game.get("away_team")
+            home = game.get("home_team")
+            markets = game
+            line_keys, price_keys = ("value",), ("odds",)
+            event_time = game.get("start_time") or ""
+            event_date = _parse_date(event_time)
+            game_key = game.get("game_id")
+
+        if not (league and away and home):
+            return None
+
+        spread = markets.get("spread") or {}
+        total = markets.get("total") or {}
+        moneyline = markets.get("moneyline") or {}
+
+        # "the-odds-api/pinnacle" -> source "the-odds-api", book "pinnacle"
+        source_name, _, book = (game.get("source") or source or "unknown").partition(
+            "/"
+        )
+        snapshot = (
+            snapshot_at
+            or _parse_timestamp(game.get("collected_at"))
+            or datetime.now(timezone.utc)
+        )
+        season, game_week = _season_week(league, event_date)
+        resolver = get_team_resolver(league)
+        away_key, home_key = resolver.canonical(away), resolver.canonical(home)
+
+        return {
+            "snapshot_at": _as_utc(snapshot),
+            "source": source_name,
+            "book": book or source_name,
+            "game_key": str(game_key or f"{event_date}:{away_key}@{home_key}"),
+            "event_date": event_date,
+            "event_time": event_time,
+            "rotation_number": str(game.get("rotation_number") or ""),
+            "away_team": away,
+            "home_team": home,
+            "away_key": away_key,
+            "home_key": home_key,
+            "spread_away_line": _number(spread.get("away"), *line_keys),
+            "spread_away_price": _number(spread.get("away"), *price_keys, cast=int),
+            "spread_home_line": _number(spread.get("home"), *line_keys),
+            "spread_home_price": _number(spread.get("home"), *price_keys, cast=int),
+            "total_line": _number(total.get("over"), *line_keys)
+            or _number(total.get("under"), *line_keys),
+            "over_price": _number(total.get("over"), *price_keys, cast=int),
+            "under_price": _number(total.get("under"), *price_keys, cast=int),
+            "ml_away_price": _number(moneyline.get("away"), *price_keys, cast=int),
+            "ml_home_price": _number(moneyline.get("home"), *price_keys, cast=int),
+            "league": league,
+            "season": season,
+            "week": int(game.get("week") or week or game_week),
+        }
+
+    # =================================================================
+    # QUERY
+    # =================================================================
+
+    def dataset(self) -> ds.Dataset:
+        """The whole store as a pyarrow dataset"""
+        return ds.dataset(
+            self.root, format="parquet", schema=SCHEMA, partitioning=PARTITIONING
+        )
+
+    def team_key(self, team: str, league: str) -> str:
+        """Canonical key stored in away_key/home_key for a team name"""
+        return get_team_resolver(league).canonical(team)
+
+    def filter(
+        self,
+        league: Optional[str] = None,
+        season: Optional[int] = None,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        start: Optional[date | str] = None,
+        end: Optional[date | str] = None,
+        book: Optional[str] = None,
+    ) -> Optional[pc.Expression]:
+        """Dataset filter expression for the given predicates (None = all rows)"""
+        league = _league(league) if league else None
+        conditions = []
+        if league:
+            conditions.append(pc.field("league") == league)
+        if season is not None:
+            conditions.append(pc.field("season") == season)
+        if week is not None:
+            conditions.append(pc.field("week") == week)
+        if team:
+            leagues = [league] if league else ["nfl", "ncaaf"]
+            keys = list({self.team_key(team, lg) for lg in leagues})
+            conditions.append(
+                pc.field("away_key").isin(keys) | pc.field("home_key").isin(keys)
+            )
+        if start:
+            conditions.append(pc.field("event_date") >= _parse_date(start))
+        if end:
+            conditions.append(pc.field("event_date") <= _parse_date(end))
+        if book:
+            conditions.append(pc.field("book") == book)
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def query(
+        self,
+        league: Optional[str] = None,
+        season: Optional[int] = None,
+        week: Optional[int] = None,
+        team: Optional[str] = None,
+        start: Optional[date | str] = None,
+        end: Optional[date | str] = None,
+        book: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pa.Table:
+        """
+        Rows matching every given predicate, pushed down to the Parquet scan.
+
+        Args:
+            league: "nfl" or "ncaaf"
+            season: Season year
+            week: Week number
+            team: Any name for a team (resolved to its canonical key)
+            start: First event date (inclusive)
+            end: Last event date (inclusive)
+            book: Sportsbook (e.g. "overtime.ag", "pinnacle")
+            columns: Columns to read (default all)
+
+        Returns:
+            pyarrow Table sorted by snapshot time
+        """
+        if not self.root.exists():
+            return SCHEMA.empty_table()
+        table = self.dataset().to_table(
+            columns=columns,
+            filter=self.filter(league, season, week, team, start, end, book),
+        )
+        if "snapshot_at" in table.column_names:
+            table = table.sort_by("snapshot_at")
+        return table
+
+    def latest(self, **predicates: Any) -> List[Dict[str, Any]]:
+        """Most recent snapshot row per game and book"""
+        latest: Dict[tuple, Dict[str, Any]] = {}
+        for row in self.query(**predicates).to_pylist():
+            latest[(row["game_key"], row["book"])] = row  # Sorted by snapshot_at
+        return list(latest.values())
+
+    def line_movement(
+        self,
+        team: str,
+        league: Optional[str] = None,
+        market: str = "spread",
+        book: Optional[str] = None,
+        start: Optional[date | str] = None,
+        end: Optional[date | str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Line time series for a team's games across every stored snapshot.
+
+        Args:
+            team: Any name for the team
+            league: "nfl" or "ncaaf" (both if None)
+            market: "spread", "total" or "moneyline"
+            book: Only this sportsbook
+            start: First event date (inclusive)
+            end: Last event date (inclusive)
+
+        Returns:
+            One entry per snapshot where the line or price changed (plus the
+            first sighting), ordered by game, book and time. ``line``/``price``
+            are from the team's side; ``move`` is the change in line since the
+            previous entry for that game and book.
+        """
+        if market not in MARKETS:
+            raise ValueError(f"Unknown market: {market} (expected one of {MARKETS})")
+
+        table = self.query(league=league, team=team, book=book, start=start, end=end)
+        if table.num_rows == 0:
+            return []
+        table = table.sort_by(
+            [(column, "ascending") for column in ("game_key", "book", "snapshot_at")]
+        )
+
+        series: List[Dict[str, Any]] = []
+        previous: Dict[tuple, tuple] = {}
+        for row in table.to_pylist():
+            team_keys = {self.team_key(team, row["league"])}
+            side = "away" if row["away_key"] in team_keys else "home"
+            if market == "spread":
+                line = row[f"spread_{side}_line"]
+                price = row[f"spread_{side}_price"]
+            elif market == "total":
+                line, price = row["total_line"], row["over_price"]
+            else:
+                line, price = None, row[f"ml_{side}_price"]
+
+            key = (row["game_key"], row["book"])
+            last = previous.get(key)
+            if last == (line, price):
+                continue
+            move = 0.0
+            if last and last[0] is not None and line is not None:
+                move = round(line - last[0], 2)
+            previous[key] = (line, price)
+
+            series.append(
+                {
+                    "game_key": row["game_key"],
+                    "event_date": row["event_date"],
+                    "book": row["book"],
+                    "snapshot_at": row["snapshot_at"],
+                    "side": side,
+                    "opponent": row["home_team" if side == "away" else "away_team"],
+                    "line": line,
+                    "price": price,
+                    "move": move,
+                }
+            )
+        return series
@@ -17,9 +17,81 @@ from collections import defaultdict
 class OddsViewer:
     """Query and display overtime.ag scraped odds"""
 
-    def __init__(self, data_dir: str = "data/overtime_live"):
+    def __init__(
+        self, data_dir: str = "data/overtime_live", store_dir: Optional[str] = None
+    ):
         self.data_dir = Path(data_dir)
         self.games = []
+        self.store_dir = Path(store_dir) if store_dir else None
+        self._store = None
+
+    @property
+    def store(self):
+        """Odds snapshot store, opened on first use"""
+        if self._store is None:
+            from walters_analyzer.query.odds_store import (
+                DEFAULT_STORE_DIR,
+                OddsSnapshotStore,
+            )
+
+            self._store = OddsSnapshotStore(self.store_dir or DEFAULT_STORE_DIR)
+        return self._store
+
+    def ingest_scrapes(self) -> int:
+        """Add every scraped JSONL file in data_dir to the snapshot store"""
+        return self.store.ingest_directory(self.data_dir)
+
+    def load_from_store(
+        self,
+        sport: Optional[str] = None,
+        book: Optional[str] = "overtime.ag",
+        **predicates: Any,
+    ) -> int:
+        """
+        Load the latest stored line for each game instead of reparsing JSONL.
+
+        Args:
+            sport: nfl or college_football
+            book: Sportsbook to show (None = every book)
+            **predicates: Extra store filters (season, week, team, start, end)
+        """
+        rows = self.store.latest(league=sport, book=book, **predicates)
+        self.games = [self._game_from_row(row) for row in rows]
+        return len(self.games)
+
+    @staticmethod
+    def _game_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Store row -> the scraped game format the display methods expect"""
+
+        def side(line_key: Optional[str], price_key: str) -> Dict[str, Any]:
+            if row[price_key] is None:
+                return {}
+            line = row[line_key] if line_key else None
+            return {"line": line, "price": row[price_key]}
+
+        return {
+            "source": row["source"],
+            "sport": "nfl" if row["league"] == "nfl" else "college_football",
+            "game_key": row["game_key"],
+            "rotation_number": row["rotation_number"],
+            "event_date": row["event_date"].isoformat() if row["event_date"] else "",
+            "event_time": row["event_time"],
+            "teams": {"away": row["away_team"], "home": row["home_team"]},
+            "markets": {
+                "spread": {
+                    "away": side("spread_away_line", "spread_away_price"),
+                    "home": side("spread_home_line", "spread_home_price"),
+                },
+                "total": {
+                    "over": side("total_line", "over_price"),
+                    "under": side("total_line", "under_price"),
+                },
+                "moneyline": {
+                    "away": side(None, "ml_away_price"),
+                    "home": side(None, "ml_home_price"),
+                },
+            },
+        }
 
     def load_latest(self, sport: Optional[str] = None) -> int:
         """Load the most recent scraped data file"""
@@ -285,6 +357,46 @@ class OddsViewer:
 
         print()
 
+    def display_line_movement(
+        self,
+        team_name: str,
+        market: str = "spread",
+        sport: Optional[str] = None,
+        book: Optional[str] = None,
+    ):
+        """Show how a team's lines moved across every stored snapshot"""
+        moves = self.store.line_movement(
+            team_name, league=sport, market=market, book=book
+        )
+        if not moves:
+            print(f"No stored lines found for '{team_name}'")
+            return
+
+        print(f"\n[UP] {market.upper()} MOVEMENT FOR '{team_name.upper()}':")
+        print("=" * 80)
+
+        current = None
+        for move in moves:
+            if (move["game_key"], move["book"]) != current:
+                current = (move["game_key"], move["book"])
+                location = "@ " if move["side"] == "away" else "vs "
+                print(
+                    f"\n{move['event_date']} {location}{move['opponent']} "
+                    f"[{move['book']}]"
+                )
+
+            line = move["line"]
+            line_text = f"{line:+6.1f}" if line is not None else "    --"
+            price = move["price"]
+            price_text = f"({price:+4d})" if price is not None else ""
+            change = f"  [{move['move']:+.1f}]" if move["move"] else ""
+            print(
+                f"   {move['snapshot_at']:%Y-%m-%d %H:%M} | "
+                f"{line_text} {price_text}{change}"
+            )
+
+        print()
+
     def export_csv(self, games: List[Dict[str, Any]], output_file: str):
         """Export filtered games to CSV"""
         import csv
@@ -368,6 +480,10 @@ Examples:
   
   # Export to CSV
   python odds_viewer.py --sport nfl --export nfl_odds.csv
+
+  # Add all scrapes to the snapshot store, then show line movement
+  python odds_viewer.py --ingest
+  python odds_viewer.py --movement "Cardinals" --sport nfl
         """,
     )
 
@@ -392,14 +508,48 @@ Examples:
         "--brief", action="store_true", help="Brief output (no detailed odds)"
     )
     parser.add_argument("--export", metavar="FILE", help="Export results to CSV file")
+    parser.add_argument(
+        "--store", metavar="DIR", help="Odds snapshot store (default data/odds_store)"
+    )
+    parser.add_argument(
+        "--ingest",
+        action="store_true",
+        help="Add every scrape in --data-dir to the snapshot store",
+    )
+    parser.add_argument(
+        "--from-store",
+        action="store_true",
+        help="Load latest lines from the snapshot store instead of a JSONL file",
+    )
+    parser.add_argument(
+        "--movement", metavar="TEAM", help="Show a team's line movement from the store"
+    )
+    parser.add_argument(
+        "--market",
+        choices=["spread", "total", "moneyline"],
+        default="spread",
+        help="Market for --movement",
+    )
 
     args = parser.parse_args()
 
     # Initialize viewer
-    viewer = OddsViewer(data_dir=args.data_dir)
+    viewer = OddsViewer(data_dir=args.data_dir, store_dir=args.store)
+
+    if args.ingest:
+        count = viewer.ingest_scrapes()
+        print(f"Stored {count} odds rows from {args.data_dir}")
+        sys.exit(0)
+
+    if args.movement:
+        viewer.display_line_movement(args.movement, args.market, sport=args.sport)
+        sys.exit(0)
 
     # Load data
-    if args.file:
+    if args.from_store:
+        count = viewer.load_from_store(sport=args.sport)
+        print(f"Loaded {count} games from the snapshot store")
+    elif args.file:
         count = viewer.load_file(Path(args.file), sport=args.sport)
         print(f"Loaded {count} games from {args.file}")
     else:
@@ -0,0 +1,323 @@
+"""
+Team Name Resolution
+
+One shared resolver per league for turning whatever a source calls a team
+("Chicago Bears", "Bears", "CHI", "Ohio State Buckeyes", "Ohio State") into
+the canonical name used by the Massey power ratings ("Chicago", "Ohio St")
+and a canonical team ID ("CHI", "OSU").
+
+Each resolver is built once per process from the NFL table below and the
+NCAAF mapping files in src/data:
+
+- ncaaf_team_name_mapping.json: Overtime.ag name -> Massey name
+- ncaaf_team_mappings.json: Massey name -> team abbreviation
+
+Lookups go through a casefolded hash index; ESPN-style mascot suffixes are
+stripped with a word-level suffix trie (longest mascot wins). Results are
+memoized, so repeat lookups are a single dict hit.
+
+Example:
+    >>> nfl = get_team_resolver("nfl")
+    >>> nfl.canonical("Kansas City Chiefs"), nfl.team_id("Chiefs")
+    ('Kansas City', 'KC')
+    >>> get_team_resolver("ncaaf").canonical("Ohio State Buckeyes")
+    'Ohio St'
+"""
+
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# (team ID, Massey short name, full name); nickname is the last word
+NFL_TEAMS = (
+    ("ARI", "Arizona", "Arizona Cardinals"),
+    ("ATL", "Atlanta", "Atlanta Falcons"),
+    ("BAL", "Baltimore", "Baltimore Ravens"),
+    ("BUF", "Buffalo", "Buffalo Bills"),
+    ("CAR", "Carolina", "Carolina Panthers"),
+    ("CHI", "Chicago", "Chicago Bears"),
+    ("CIN", "Cincinnati", "Cincinnati Bengals"),
+    ("CLE", "Cleveland", "Cleveland Browns"),
+    ("DAL", "Dallas", "Dallas Cowboys"),
+    ("DEN", "Denver", "Denver Broncos"),
+    ("DET", "Detroit", "Detroit Lions"),
+    ("GB", "Green Bay", "Green Bay Packers"),
+    ("HOU", "Houston", "Houston Texans"),
+    ("IND", "Indianapolis", "Indianapolis Colts"),
+    ("JAX", "Jacksonville", "Jacksonville Jaguars"),
+    ("KC", "Kansas City", "Kansas City Chiefs"),
+    ("LV", "Las Vegas", "Las Vegas Raiders"),
+    ("LAC", "LA Chargers", "Los Angeles Chargers"),
+    ("LAR", "LA Rams", "Los Angeles Rams"),
+    ("MIA", "Miami", "Miami Dolphins"),
+    ("MIN", "Minnesota", "Minnesota Vikings"),
+    ("NE", "New England", "New England Patriots"),
+    ("NO", "New Orleans", "New Orleans Saints"),
+    ("NYG", "NY Giants", "New York Giants"),
+    ("NYJ", "NY Jets", "New York Jets"),
+    ("PHI", "Philadelphia", "Philadelphia Eagles"),
+    ("PIT", "Pittsburgh", "Pittsburgh Steelers"),
+    ("SF", "San Francisco", "San Francisco 49ers"),
+    ("SEA", "Seattle", "Seattle Seahawks"),
+    ("TB", "Tampa Bay", "Tampa Bay Buccaneers"),
+    ("TEN", "Tennessee", "Tennessee Titans"),
+    ("WAS", "Washington", "Washington Commanders"),
+)
+
+# ESPN display names that differ from Overtime.ag (ESPN name -> Massey name)
+NCAAF_ESPN_OVERRIDES = {
+    "Ole Miss": "Mississippi",  # ESPN: "Ole Miss Rebels"
+    "Central Florida": "UCF",  # ESPN: "Central Florida Knights"
+    "Miami Florida": "Miami FL",
+    "Miami Ohio": "Miami OH",
+    # ESPN: "Miami Hurricanes" (location "Miami", abbreviation "MIA") and
+    # "Miami (OH) RedHawks" (location "Miami (OH)", abbreviation "M-OH")
+    "Miami": "Miami FL",
+    "Miami (FL)": "Miami FL",
+    "MIA": "Miami FL",
+    "Miami (OH)": "Miami OH",
+    "M-OH": "Miami OH",
+}
+
+# ESPN mascot suffixes for FBS teams
+NCAAF_MASCOTS = (
+    "Crimson Tide",
+    "Scarlet Knights",
+    "Golden Eagles",
+    "Golden Gophers",
+    "Golden Bears",  # California
+    "Golden Flashes",  # Kent State
+    "Nittany Lions",
+    "Yellow Jackets",
+    "Demon Deacons",
+    "Blue Devils",
+    "Green Wave",
+    "Tar Heels",
+    "Fighting Illini",
+    "Fighting Irish",  # Notre Dame
+    "Sun Devils",
+    "Red Raiders",  # Texas Tech
+    "Wildcats",
+    "Bulldogs",
+    "Tide",
+    "Tigers",
+    "Gators",
+    "Sooners",
+    "Longhorns",
+    "Cowboys",
+    "Aggies",
+    "Mavericks",
+    "Commodores",
+    "Vols",
+    "Volunteers",
+    "Rebels",
+    "Razorbacks",
+    "Gamecocks",
+    "Jayhawks",
+    "Utes",
+    "Buffaloes",
+    "Rams",
+    "Broncos",
+    "Falcons",
+    "Panthers",
+    "Hurricanes",
+    "Orange",
+    "Mountaineers",
+    "Hokies",
+    "Boilermakers",
+    "Hoosiers",
+    "Hawkeyes",
+    "Badgers",
+    "Spartans",
+    "Wolverines",
+    "Buckeyes",
+    "Terrapins",
+    "Bearcats",
+    "Cardinals",
+    "Cardinal",  # Stanford (singular)
+    "Cavaliers",
+    "49ers",
+    "Knights",
+    "Bears",
+    "Cougars",  # BYU, Houston, Washington State
+    "Ducks",  # Oregon
+    "Huskies",  # Washington, UConn
+    "Trojans",  # USC
+    "Bruins",  # UCLA
+    "Mustangs",  # SMU
+    "Beavers",  # Oregon State
+    "RedHawks",  # Miami (OH)
+)
+
+_END = ""  # Trie key marking the end of a mascot
+
+
+class TeamNameResolver:
+    """Resolves raw team names for one league to canonical names and IDs."""
+
+    def __init__(
+        self,
+        league: str,
+        aliases: Mapping[str, str],
+        team_ids: Mapping[str, str],
+        mascots: Iterable[str],
+        full_names: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Build the resolver's indexes.
+
+        Args:
+            league: "nfl" or "ncaaf"
+            aliases: Any known name -> canonical name (first alias wins on a
+                case-insensitive clash)
+            team_ids: Canonical name -> team ID
+            mascots: Mascot suffixes stripped from display names
+            full_names: Canonical name -> full display name
+        """
+        self.league = league
+        self._index: Dict[str, str] = {}
+        for alias, canonical in aliases.items():
+            self._index.setdefault(alias.casefold(), canonical)
+        self._team_ids = dict(team_ids)
+        self._full_names = dict(full_names or {})
+
+        # Mascots reversed word by word: "Crimson Tide" -> tide -> crimson
+        self._mascots: Dict[str, dict] = {}
+        for mascot in mascots:
+            node = self._mascots
+            for word in reversed(mascot.casefold().split()):
+                node = node.setdefault(word, {})
+            node[_END] = {}
+
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(set(self._index.values()))
+
+    def strip_mascot(self, name: str) -> str:
+        """
+        Strip a mascot suffix ("Ohio State Buckeyes" -> "Ohio State").
+
+        The longest matching mascot wins and at least one word is always
+        kept, so "Orange" stays "Orange".
+        """
+        words = name.split()
+        node = self._mascots
+        cut = 0
+        for depth, word in enumerate(reversed(words[1:]), start=1):
+            node = node.get(word.casefold())
+            if node is None:
+                break
+            if _END in node:
+                cut = depth
+        return " ".join(words[:-cut]) if cut else name.strip()
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Canonical name for a known team, or None if it is not recognized"""
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+
+        key = name.strip().casefold()
+        canonical = self._index.get(key)
+        if canonical is None:
+            stripped = self.strip_mascot(name).casefold()
+            if stripped != key:
+                canonical = self._index.get(stripped)
+
+        self._memo[name] = canonical
+        return canonical
+
+    def canonical(self, name: str) -> str:
+        """
+        Canonical name, falling back to a best-effort normalization.
+
+        Unknown NCAAF names have their mascot stripped and "State" shortened
+        to "St" (Massey style); unknown NFL names are returned stripped.
+        """
+        canonical = self.lookup(name)
+        if canonical is not None:
+            return canonical
+        if self.league == "ncaaf":
+            stripped = self.strip_mascot(name)
+            if stripped.endswith(" State"):
+                return stripped.replace(" State", " St")
+            return stripped
+        return name.strip()
+
+    def team_id(self, name: str) -> Optional[str]:
+        """Canonical team ID (e.g. "KC", "OSU"), or None if unknown"""
+        canonical = self.lookup(name)
+        return self._team_ids.get(canonical) if canonical else None
+
+    def full_name(self, name: str) -> Optional[str]:
+        """Full display name (e.g. "Kansas City Chiefs"), or None if unknown"""
+        canonical = self.lookup(name)
+        return self._full_names.get(canonical) if canonical else None
+
+
+def _load_json(filename: str, key: str) -> Dict[str, str]:
+    path = DATA_DIR / filename
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get(key, {})
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load team mappings from {path}: {e}")
+        return {}
+
+
+def _build_nfl() -> TeamNameResolver:
+    aliases: Dict[str, str] = {}
+    for team_id, short, full in NFL_TEAMS:
+        for alias in (full, short, team_id, full.split()[-1]):
+            aliases[alias] = short
+    return TeamNameResolver(
+        "nfl",
+        aliases,
+        team_ids={short: team_id for team_id, short, _ in NFL_TEAMS},
+        mascots=(full.split()[-1] for _, _, full in NFL_TEAMS),
+        full_names={short: full for _, short, full in NFL_TEAMS},
+    )
+
+
+def _build_ncaaf() -> TeamNameResolver:
+    overtime_to_massey = _load_json(
+        "ncaaf_team_name_mapping.json", "overtime_to_massey"
+    )
+    massey_to_id = _load_json("ncaaf_team_mappings.json", "mappings")
+
+    # Overtime.ag names first, then ESPN overrides, then Massey names as-is
+    aliases = dict(overtime_to_massey)
+    for espn_name, massey_name in NCAAF_ESPN_OVERRIDES.items():
+        aliases.setdefault(espn_name, massey_name)
+    for massey_name in [*overtime_to_massey.values(), *massey_to_id]:
+        aliases.setdefault(massey_name, massey_name)
+
+    logger.debug(f"Built NCAAF team resolver from {len(aliases)} names")
+    return TeamNameResolver("ncaaf", aliases, massey_to_id, NCAAF_MASCOTS)
+
+
+@lru_cache(maxsize=None)
+def _resolver(league: str) -> TeamNameResolver:
+    if league == "nfl":
+        return _build_nfl()
+    if league == "ncaaf":
+        return _build_ncaaf()
+    raise ValueError(f"Unsupported league: {league}")
+
+
+def get_team_resolver(league: str) -> TeamNameResolver:
+    """
+    Shared resolver for a league, built on first use.
+
+    Args:
+        league: "nfl" or "ncaaf" (any case, or a League enum value)
+    """
+    return _resolver(str(getattr(league, "value", league)).casefold())
@@ -2,7 +2,8 @@
 CLV Storage System - Persistent Tracking of Betting CLV
 
 This module implements dual persistence for CLV tracking:
-- JSON: Current bets (mutable, updated as information arrives)
+- JSON: Current bets (snapshot + append-only change log, compacted
+  periodically so each write is O(1) amortized)
 - CSV: Historical log (append-only, immutable audit trail)
 
 Together they provide:
@@ -18,9 +19,10 @@ long-term regardless of short-term win-loss record."
 
 from __future__ import annotations
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 import json
 import csv
+import re
 from datetime import datetime, date
 import logging
 
@@ -33,18 +35,37 @@ from walters_analyzer.models.clv_tracking_module import (
 
 logger = logging.getLogger(__name__)
 
+# Matches every "_<season>_W<week>_" token in a game_id (overlapping)
+_WEEK_TOKEN = re.compile(r"(?=_(\d+)_W(\d+)_)")
+
+# Compact the change log once it holds this many records and more records
+# than there are live bets (keeps compaction O(1) amortized per write)
+COMPACT_MIN_RECORDS = 500
+
+
+def _week_keys(game_id: str) -> List[Tuple[str, str]]:
+    """(season, week) tokens in a game_id, matching list_by_week semantics."""
+    return [(m.group(1), m.group(2)) for m in _WEEK_TOKEN.finditer(game_id)]
+
 
 class CLVStorage:
     """
     Persistent storage for CLV tracking records.
 
     Implements dual persistence strategy:
-    - JSON file: Current/active bets (mutable, enables updates)
+    - JSON file: Current/active bets (mutable, enables updates). Stored as
+      a compacted snapshot (bets.json) plus an append-only change log
+      (bets_log.jsonl) that is folded into the snapshot periodically.
     - CSV file: Historical log (append-only, immutable audit trail)
 
     This allows bets to be updated as information arrives (opening line →
     closing line → final result) while maintaining an immutable historical
     record of all changes.
+
+    Current bets are held in memory with indexes by recommendation_id,
+    season/week and clv_outcome. Files written by other CLVStorage instances
+    are picked up on the next call (new log lines are replayed; a new
+    snapshot triggers a full reload).
     """
 
     def __init__(self, data_dir: Optional[str] = None):
@@ -65,9 +86,31 @@ class CLVStorage:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         self.bets_json = self.data_dir / "bets.json"
+        self.bets_log = self.data_dir / "bets_log.jsonl"
         self.history_csv = self.data_dir / "bets_history.csv"
         self.summaries_json = self.data_dir / "summaries.json"
 
+        # In-memory state and indexes (see _reload)
+        self._bets: Dict[str, dict] = {}
+        self._order: Dict[str, int] = {}
+        self._by_week: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._by_outcome: Dict[str, Dict[str, None]] = {}
+        self._next_order = 0
+        self._log_records = 0
+        self._log_offset = 0
+        self._snapshot_mtime: Optional[int] = None
+
+        # Migration: rebuild current bets from the CSV audit trail when the
+        # JSON store is missing (e.g. history copied from another machine)
+        if (
+            not self.bets_json.exists()
+            and not self.bets_log.exists()
+            and self.history_csv.exists()
+        ):
+            self.rebuild_from_history()
+
+        self._reload()
+
         logger.info(f"CLVStorage initialized at {self.data_dir}")
 
     def save_bet(self, bet: CLVTracking) -> None:
@@ -86,15 +129,14 @@ class CLVStorage:
         if not isinstance(bet, CLVTracking):
             raise ValueError(f"Expected CLVTracking, got {type(bet)}")
 
-        # Load existing bets
-        bets = self._load_all_bets()
+        data = bet.model_dump(mode="json")
 
-        # Update or add
-        bets[bet.recommendation_id] = bet.model_dump(mode="json")
-
-        # Save to JSON
+        # Append to JSON change log (O(1)) and update indexes
         try:
-            self._save_json(self.bets_json, bets)
+            self._sync()
+            self._append_log({"op": "put", "bet": data})
+            self._apply_put(data)
+            self._maybe_compact()
             logger.debug(f"Saved bet {bet.recommendation_id} to JSON")
         except IOError as e:
             logger.error(f"Failed to save JSON: {e}")
@@ -123,14 +165,14 @@ class CLVStorage:
         Raises:
             ValueError: If stored data is malformed
         """
-        bets = self._load_all_bets()
+        self._sync()
 
-        if recommendation_id not in bets:
+        if recommendation_id not in self._bets:
             logger.warning(f"Bet {recommendation_id} not found")
             return None
 
         try:
-            return CLVTracking(**bets[recommendation_id])
+            return CLVTracking(**self._bets[recommendation_id])
         except Exception as e:
             logger.error(f"Failed to load bet {recommendation_id}: {e}")
             raise ValueError(f"Malformed bet data for {recommendation_id}") from e
@@ -142,8 +184,8 @@ class CLVStorage:
         Returns:
             List of all CLVTracking records
         """
-        bets = self._load_all_bets()
-        return [CLVTracking(**data) for data in bets.values()]
+        self._sync()
+        return [CLVTracking(**data) for data in self._bets.values()]
 
     def list_pending(self, limit: Optional[int] = None) -> List[CLVTracking]:
         """
@@ -155,11 +197,10 @@ class CLVStorage:
         Returns:
             List of unresolved CLVTracking records
         """
-        bets = self._load_all_bets()
+        self._sync()
         pending = [
-            CLVTracking(**data)
-            for data in bets.values()
-            if data["clv_outcome"] == "pending"
+            CLVTracking(**self._bets[rec_id])
+            for rec_id in self._ordered(self._by_outcome.get("pending", {}))
         ]
 
         if limit:
@@ -179,11 +220,10 @@ class CLVStorage:
         Returns:
             List of CLVTracking records for week
         """
-        bets = self._load_all_bets()
+        self._sync()
+        week_ids = self._by_week.get((str(season), str(week)), {})
         week_bets = [
-            CLVTracking(**data)
-            for data in bets.values()
-            if f"_{season}_W{week}_" in data["game_id"]
+            CLVTracking(**self._bets[rec_id]) for rec_id in self._ordered(week_ids)
         ]
 
         logger.info(f"Found {len(week_bets)} bets in week {week}")
@@ -307,14 +347,15 @@ class CLVStorage:
         Returns:
             True if deleted, False if not found
         """
-        bets = self._load_all_bets()
+        self._sync()
 
-        if recommendation_id not in bets:
+        if recommendation_id not in self._bets:
             logger.warning(f"Bet {recommendation_id} not found for deletion")
             return False
 
-        deleted_bet = bets.pop(recommendation_id)
-        self._save_json(self.bets_json, bets)
+        self._append_log({"op": "delete", "recommendation_id": recommendation_id})
+        self._apply_delete(recommendation_id)
+        self._maybe_compact()
 
         logger.warning(f"Deleted bet {recommendation_id} (CSV history preserved)")
         return True
@@ -396,10 +437,62 @@ class CLVStorage:
         logger.info(f"Exported {len(bets)} bets to {output_path}")
         return output_path
 
+    def compact(self) -> None:
+        """
+        Fold the change log into a fresh bets.json snapshot.
+
+        Runs automatically once the log outgrows the live bet count; call
+        directly to force a compact snapshot (e.g. before backups).
+        """
+        self._sync()
+        self._save_json(self.bets_json, self._bets)
+        self.bets_log.write_text("")
+        self._log_records = 0
+        self._log_offset = 0
+        self._snapshot_mtime = self.bets_json.stat().st_mtime_ns
+        logger.debug(f"Compacted CLV store ({len(self._bets)} bets)")
+
+    def rebuild_from_history(self) -> int:
+        """
+        Rebuild current bets from the CSV audit trail.
+
+        The last history row per recommendation_id wins. Overwrites the JSON
+        snapshot and clears the change log.
+
+        Returns:
+            Number of bets restored
+        """
+        if not self.history_csv.exists():
+            return 0
+
+        latest: Dict[str, dict] = {}
+        with open(self.history_csv, newline="") as f:
+            for row in csv.DictReader(f):
+                data = {k: (v if v != "" else None) for k, v in row.items()}
+                try:
+                    bet = CLVTracking(**data)
+                except Exception as e:
+                    logger.warning(f"Skipping malformed history row: {e}")
+                    continue
+                latest.pop(bet.recommendation_id, None)
+                latest[bet.recommendation_id] = bet.model_dump(mode="json")
+
+        self._save_json(self.bets_json, latest)
+        self.bets_log.write_text("")
+        self._reload()
+
+        logger.info(f"Rebuilt {len(latest)} bets from {self.history_csv}")
+        return len(latest)
+
     # ========== Private Methods ==========
 
     def _load_all_bets(self) -> Dict[str, dict]:
-        """Load all bets from JSON file."""
+        """Load all bets (snapshot + change log)."""
+        self._sync()
+        return dict(self._bets)
+
+    def _read_snapshot(self) -> Dict[str, dict]:
+        """Read the bets.json snapshot."""
         if not self.bets_json.exists():
             return {}
 
@@ -410,6 +503,110 @@ class CLVStorage:
             logger.error(f"Failed to parse JSON: {e}")
             raise ValueError("Corrupted JSON file") from e
 
+    def _reload(self) -> None:
+        """Rebuild in-memory state from snapshot and full change log."""
+        self._bets = {}
+        self._order = {}
+        self._by_week = {}
+        self._by_outcome = {}
+        self._next_order = 0
+        self._log_records = 0
+        self._log_offset = 0
+
+        self._snapshot_mtime = (
+            self.bets_json.stat().st_mtime_ns if self.bets_json.exists() else None
+        )
+        for data in self._read_snapshot().values():
+            self._apply_put(data)
+
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Apply change-log records appended since the last read."""
+        if not self.bets_log.exists():
+            return
+
+        with open(self.bets_log, "rb") as f:
+            f.seek(self._log_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial write in progress; pick it up next time
+                self._log_offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Skipping corrupted CLV log line: {e}")
+                    continue
+                self._log_records += 1
+                if record.get("op") == "delete":
+                    self._apply_delete(record["recommendation_id"])
+                else:
+                    self._apply_put(record["bet"])
+
+    def _sync(self) -> None:
+        """Pick up changes written by other CLVStorage instances."""
+        snapshot_mtime = (
+            self.bets_json.stat().st_mtime_ns if self.bets_json.exists() else None
+        )
+        log_size = self.bets_log.stat().st_size if self.bets_log.exists() else 0
+
+        if snapshot_mtime != self._snapshot_mtime or log_size < self._log_offset:
+            self._reload()
+        elif log_size > self._log_offset:
+            self._replay_log()
+
+    def _append_log(self, record: dict) -> None:
+        """Append one record to the change log."""
+        if not self.bets_json.exists():
+            # Start every store with a (possibly empty) snapshot
+            self._save_json(self.bets_json, {})
+            self._snapshot_mtime = self.bets_json.stat().st_mtime_ns
+
+        line = (json.dumps(record, default=str) + "\n").encode()
+        with open(self.bets_log, "ab") as f:
+            f.write(line)
+            self._log_offset = f.tell()
+        self._log_records += 1
+
+    def _maybe_compact(self) -> None:
+        """Compact once the log is larger than the live bet set."""
+        if self._log_records >= max(COMPACT_MIN_RECORDS, len(self._bets)):
+            self.compact()
+
+    def _apply_put(self, data: dict) -> None:
+        """Insert/update a bet in memory and in the indexes."""
+        rec_id = data["recommendation_id"]
+        previous = self._bets.get(rec_id)
+        if previous is not None:
+            self._unindex(rec_id, previous)
+        else:
+            self._order[rec_id] = self._next_order
+            self._next_order += 1
+
+        self._bets[rec_id] = data
+        for key in _week_keys(data.get("game_id", "")):
+            self._by_week.setdefault(key, {})[rec_id] = None
+        self._by_outcome.setdefault(data.get("clv_outcome"), {})[rec_id] = None
+
+    def _apply_delete(self, rec_id: str) -> None:
+        """Remove a bet from memory and the indexes."""
+        previous = self._bets.pop(rec_id, None)
+        if previous is not None:
+            self._unindex(rec_id, previous)
+            self._order.pop(rec_id, None)
+
+    def _unindex(self, rec_id: str, data: dict) -> None:
+        """Drop a bet's index entries."""
+        for key in _week_keys(data.get("game_id", "")):
+            self._by_week.get(key, {}).pop(rec_id, None)
+        self._by_outcome.get(data.get("clv_outcome"), {}).pop(rec_id, None)
+
+    def _ordered(self, rec_ids: Iterable[str]) -> List[str]:
+        """Sort recommendation IDs into storage (first-saved) order."""
+        return sorted(rec_ids, key=self._order.__getitem__)
+
     def _save_json(self, path: Path, data: dict) -> None:
         """Save data to JSON file."""
         try:
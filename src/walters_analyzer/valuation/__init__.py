@@ -3,11 +3,30 @@ Billy Walters Valuation System
 Sophisticated injury impact analysis and betting edge detection
 """
 
-from .player_values import PlayerPosition, PlayerValuation
-from .injury_impacts import InjuryType, InjuryImpactCalculator
-from .market_analysis import MarketAnalyzer
-from .config import load_config, get_config
-from .core import BillyWaltersValuation
+from typing import TYPE_CHECKING
+
+from walters_analyzer.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_values import PlayerPosition, PlayerValuation
+    from .injury_impacts import InjuryType, InjuryImpactCalculator
+    from .market_analysis import MarketAnalyzer
+    from .config import load_config, get_config
+    from .core import BillyWaltersValuation
+
+# Exported name -> submodule, imported on first attribute access
+_EXPORTS = {
+    "PlayerPosition": ".player_values",
+    "PlayerValuation": ".player_values",
+    "InjuryType": ".injury_impacts",
+    "InjuryImpactCalculator": ".injury_impacts",
+    "MarketAnalyzer": ".market_analysis",
+    "load_config": ".config",
+    "get_config": ".config",
+    "BillyWaltersValuation": ".core",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BillyWaltersValuation",
@@ -10,6 +10,7 @@ from pathlib import Path
 
 # Import Billy Walters valuation system
 from walters_analyzer.valuation import BillyWaltersValuation
+from walters_analyzer.team_names import get_team_resolver
 
 
 def load_nfl_schedule(data_dir="data/nfl_schedule"):
@@ -51,47 +52,8 @@ def normalize_team_name(team_name):
     # Remove common suffixes and normalize
     team_name = team_name.replace(" Injuries", "").strip()
 
-    # Create mapping for team abbreviations to full names
-    mappings = {
-        "Cardinals": "Arizona Cardinals",
-        "Falcons": "Atlanta Falcons",
-        "Ravens": "Baltimore Ravens",
-        "Bills": "Buffalo Bills",
-        "Panthers": "Carolina Panthers",
-        "Bears": "Chicago Bears",
-        "Bengals": "Cincinnati Bengals",
-        "Browns": "Cleveland Browns",
-        "Cowboys": "Dallas Cowboys",
-        "Broncos": "Denver Broncos",
-        "Lions": "Detroit Lions",
-        "Packers": "Green Bay Packers",
-        "Texans": "Houston Texans",
-        "Colts": "Indianapolis Colts",
-        "Jaguars": "Jacksonville Jaguars",
-        "Chiefs": "Kansas City Chiefs",
-        "Raiders": "Las Vegas Raiders",
-        "Chargers": "Los Angeles Chargers",
-        "Rams": "Los Angeles Rams",
-        "Dolphins": "Miami Dolphins",
-        "Vikings": "Minnesota Vikings",
-        "Patriots": "New England Patriots",
-        "Saints": "New Orleans Saints",
-        "Giants": "New York Giants",
-        "Jets": "New York Jets",
-        "Eagles": "Philadelphia Eagles",
-        "Steelers": "Pittsburgh Steelers",
-        "49ers": "San Francisco 49ers",
-        "Seahawks": "Seattle Seahawks",
-        "Buccaneers": "Tampa Bay Buccaneers",
-        "Titans": "Tennessee Titans",
-        "Commanders": "Washington Commanders",
-    }
-
-    for abbr, full in mappings.items():
-        if abbr in team_name or full in team_name:
-            return full
-
-    return team_name
+    # Resolve nicknames/short names to full names ("Bears" -> "Chicago Bears")
+    return get_team_resolver("nfl").full_name(team_name) or team_name
 
 
 def get_team_injuries(injuries, team_name):
@@ -19,12 +19,12 @@ import os
 import json
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
-from scrapers.weather import AccuWeatherClient, OpenWeatherClient
+import numpy as np
 
 # Import weather alert mapper and injury/player valuation modules
 from walters_analyzer.valuation.weather_alert_mapper import WeatherAlertMapper
@@ -34,6 +34,11 @@ from walters_analyzer.valuation.espn_integration import (
     ESPNDataLoader,
     PowerRatingEnhancer,
 )
+from walters_analyzer.valuation.week_context import WeekContext
+from walters_analyzer.team_names import get_team_resolver
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -209,83 +214,6 @@ class BillyWaltersEdgeDetector:
     POWER_RATING_WEIGHT_OLD = 0.9
     POWER_RATING_WEIGHT_NEW = 0.1
 
-    # Team name mapping: Action Network nicknames -> Massey short names
-    TEAM_NAME_MAP = {
-        # NFL Teams (nickname -> city/region)
-        "Cardinals": "Arizona",
-        "Falcons": "Atlanta",
-        "Ravens": "Baltimore",
-        "Bills": "Buffalo",
-        "Panthers": "Carolina",
-        "Bears": "Chicago",
-        "Bengals": "Cincinnati",
-        "Browns": "Cleveland",
-        "Cowboys": "Dallas",
-        "Broncos": "Denver",
-        "Lions": "Detroit",
-        "Packers": "Green Bay",
-        "Texans": "Houston",
-        "Colts": "Indianapolis",
-        "Jaguars": "Jacksonville",
-        "Chiefs": "Kansas City",
-        "Raiders": "Las Vegas",
-        "Chargers": "LA Chargers",
-        "Rams": "LA Rams",
-        "Dolphins": "Miami",
-        "Vikings": "Minnesota",
-        "Patriots": "New England",
-        "Saints": "New Orleans",
-        "Giants": "NY Giants",
-        "Jets": "NY Jets",
-        "Eagles": "Philadelphia",
-        "Steelers": "Pittsburgh",
-        "49ers": "San Francisco",
-        "Seahawks": "Seattle",
-        "Buccaneers": "Tampa Bay",
-        "Titans": "Tennessee",
-        "Commanders": "Washington",
-    }
-
-    # Full NFL team names -> Massey short names (for dict-format Massey files)
-    NFL_FULL_NAME_MAP = {
-        "Arizona Cardinals": "Arizona",
-        "Atlanta Falcons": "Atlanta",
-        "Baltimore Ravens": "Baltimore",
-        "Buffalo Bills": "Buffalo",
-        "Carolina Panthers": "Carolina",
-        "Chicago Bears": "Chicago",
-        "Cincinnati Bengals": "Cincinnati",
-        "Cleveland Browns": "Cleveland",
-        "Dallas Cowboys": "Dallas",
-        "Denver Broncos": "Denver",
-        "Detroit Lions": "Detroit",
-        "Green Bay Packers": "Green Bay",
-        "Houston Texans": "Houston",
-        "Indianapolis Colts": "Indianapolis",
-        "Jacksonville Jaguars": "Jacksonville",
-        "Kansas City Chiefs": "Kansas City",
-        "Las Vegas Raiders": "Las Vegas",
-        "Los Angeles Chargers": "LA Chargers",
-        "Los Angeles Rams": "LA Rams",
-        "LA Chargers": "LA Chargers",
-        "LA Rams": "LA Rams",
-        "Miami Dolphins": "Miami",
-        "Minnesota Vikings": "Minnesota",
-        "New England Patriots": "New England",
-        "New Orleans Saints": "New Orleans",
-        "New York Giants": "NY Giants",
-        "New York Jets": "NY Jets",
-        "NY Giants": "NY Giants",
-        "NY Jets": "NY Jets",
-        "Philadelphia Eagles": "Philadelphia",
-        "Pittsburgh Steelers": "Pittsburgh",
-        "San Francisco 49ers": "San Francisco",
-        "Seattle Seahawks": "Seattle",
-        "Tampa Bay Buccaneers": "Tampa Bay",
-        "Tennessee Titans": "Tennessee",
-        "Washington Commanders": "Washington",
-    }
-
     def __init__(self, output_dir: str = "output/edge_detection", db_ops=None):
         """
         Initialize edge detector
@@ -306,6 +234,12 @@ class BillyWaltersEdgeDetector:
         # Database operations (optional)
         self.db_ops = db_ops
 
+        # Shared NFL team name resolver (Overtime/Action Network -> Massey)
+        self.team_names = get_team_resolver("nfl")
+
+        # Prefetched week context (see prefetch_week_context)
+        self.week_context: Optional[WeekContext] = None
+
         # ESPN integration
         self.espn_loader = ESPNDataLoader()
         self.espn_enhancer_nfl = PowerRatingEnhancer(league="nfl")
@@ -319,6 +253,41 @@ class BillyWaltersEdgeDetector:
 
         logger.info("Billy Walters Edge Detector initialized")
 
+    def prefetch_week_context(
+        self, season: int, week: int, league_id: int = 1
+    ) -> Optional[WeekContext]:
+        """
+        Bulk-load SWE factors, practice reports, team trends, player valuations
+        and injuries for a whole week so detect_edge reads from memory instead
+        of issuing per-game database queries.
+
+        Args:
+            season: Season year
+            week: Week number
+            league_id: League ID (1 = NFL)
+
+        Returns:
+            Loaded WeekContext, or None if no database is configured
+        """
+        if not self.db_ops:
+            return None
+
+        try:
+            self.week_context = WeekContext.load(self.db_ops, league_id, season, week)
+        except Exception as e:
+            logger.warning(f"Could not prefetch week context: {e}")
+            self.week_context = None
+
+        return self.week_context
+
+    def _get_week_context(
+        self, season: Optional[int], week: Optional[int]
+    ) -> Optional[WeekContext]:
+        """Return the prefetched week context if it covers season/week"""
+        if self.week_context and self.week_context.covers(season, week):
+            return self.week_context
+        return None
+
     def check_wednesday_signal(
         self, team_id: int, team_name: str, season: int, week: int
     ) -> tuple[bool, float]:
@@ -340,17 +309,21 @@ class BillyWaltersEdgeDetector:
             - is_signal_detected: Whether Wednesday status indicates strong signal
             - confidence_multiplier: 1.15 if positive signal, 1.0 if none, 0.95 if negative
         """
-        if not self.db_ops or not team_id:
+        context = self._get_week_context(season, week)
+        if (not self.db_ops and not context) or not team_id:
             return (False, 1.0)
 
         try:
-            # Query Wednesday practice reports for team
-            wednesday_reports = self.db_ops.get_wednesday_practice_status(
-                league_id=1,  # NFL
-                team_id=team_id,
-                season=season,
-                week=week,
-            )
+            # Wednesday practice reports for team (prefetched or queried)
+            if context:
+                wednesday_reports = context.get_wednesday_reports(team_id)
+            else:
+                wednesday_reports = self.db_ops.get_wednesday_practice_status(
+                    league_id=1,  # NFL
+                    team_id=team_id,
+                    season=season,
+                    week=week,
+                )
 
             if not wednesday_reports:
                 return (False, 1.0)
@@ -359,17 +332,17 @@ class BillyWaltersEdgeDetector:
             fully_participating = sum(
                 1
                 for report in wednesday_reports
-                if report.participation == "FP" and report.impact_rating >= 3.0
+                if report.participation == "FP" and (report.impact_rating or 0) >= 3.0
             )
             limited_participating = sum(
                 1
                 for report in wednesday_reports
-                if report.participation == "LP" and report.impact_rating >= 2.0
+                if report.participation == "LP" and (report.impact_rating or 0) >= 2.0
             )
             did_not_participate = sum(
                 1
                 for report in wednesday_reports
-                if report.participation == "DNP" and report.impact_rating >= 3.0
+                if report.participation == "DNP" and (report.impact_rating or 0) >= 3.0
             )
 
             # Positive signal: Multiple key players practicing
@@ -415,7 +388,8 @@ class BillyWaltersEdgeDetector:
             - total: Total combined adjustment (points)
             - confidence_impact: Multiplier for confidence score (0.8-1.2)
         """
-        if not self.db_ops:
+        context = self._get_week_context(season, week)
+        if not self.db_ops and not context:
             return {
                 "special": 0.0,
                 "weather": 0.0,
@@ -425,13 +399,16 @@ class BillyWaltersEdgeDetector:
             }
 
         try:
-            # Query database for game SWE factors
-            swe_factors = self.db_ops.get_game_swe_factors(
-                league_id=1,  # NFL
-                game_id=game_id,
-                season=season,
-                week=week,
-            )
+            # Game SWE factors (prefetched or queried)
+            if context:
+                swe_factors = context.get_swe_factors(game_id)
+            else:
+                swe_factors = self.db_ops.get_game_swe_factors(
+                    league_id=1,  # NFL
+                    game_id=game_id,
+                    season=season,
+                    week=week,
+                )
 
             if swe_factors:
                 return {
@@ -475,17 +452,21 @@ class BillyWaltersEdgeDetector:
             - 1.0 = neutral (no trend signals)
             - 0.8 = -20% confidence (cold team, no motivation)
         """
-        if not self.db_ops or not team_id:
+        context = self._get_week_context(season, week)
+        if (not self.db_ops and not context) or not team_id:
             return 1.0
 
         try:
-            # Get team trends
-            team_trends = self.db_ops.get_team_trends(
-                league_id=1,  # NFL
-                team_id=team_id,
-                season=season,
-                week=week,
-            )
+            # Get team trends (prefetched or queried)
+            if context:
+                team_trends = context.get_team_trends(team_id)
+            else:
+                team_trends = self.db_ops.get_team_trends(
+                    league_id=1,  # NFL
+                    team_id=team_id,
+                    season=season,
+                    week=week,
+                )
 
             if not team_trends:
                 return 1.0
@@ -554,22 +535,9 @@ class BillyWaltersEdgeDetector:
         Returns:
             Normalized team name for Massey lookup (e.g., "Chicago")
         """
-        # Try full name mapping first (e.g., "Chicago Bears" -> "Chicago")
-        if team_name in self.NFL_FULL_NAME_MAP:
-            return self.NFL_FULL_NAME_MAP[team_name]
-
-        # Try mascot-only mapping (e.g., "Bears" -> "Chicago")
-        if team_name in self.TEAM_NAME_MAP:
-            return self.TEAM_NAME_MAP[team_name]
-
-        # Try case-insensitive search in both maps
-        for full_name, massey_name in self.NFL_FULL_NAME_MAP.items():
-            if full_name.lower() == team_name.lower():
-                return massey_name
-
-        for action_name, massey_name in self.TEAM_NAME_MAP.items():
-            if action_name.lower() == team_name.lower():
-                return massey_name
+        massey_name = self.team_names.lookup(team_name)
+        if massey_name is not None:
+            return massey_name
 
         # Return as-is if no mapping found
         logger.warning(f"No mapping found for team: {team_name}")
@@ -596,10 +564,9 @@ class BillyWaltersEdgeDetector:
             raw_team_name = team["team"]
 
             # Normalize team name for consistent lookups
-            # Try full name map first (e.g., "Buffalo Bills" -> "Buffalo")
-            # Then keep as-is for short names (e.g., "Philadelphia" stays "Philadelphia")
-            if league == "nfl" and raw_team_name in self.NFL_FULL_NAME_MAP:
-                team_name = self.NFL_FULL_NAME_MAP[raw_team_name]
+            # (e.g., "Buffalo Bills" -> "Buffalo"; "Philadelphia" stays as-is)
+            if league == "nfl":
+                team_name = self.team_names.lookup(raw_team_name) or raw_team_name
             else:
                 team_name = raw_team_name
 
@@ -1055,9 +1022,9 @@ class BillyWaltersEdgeDetector:
             for injury in injuries_list:
                 # Get raw team name from injury file (e.g., "Bills", "Bears")
                 raw_team = injury.get("team", "Unknown")
-                # Normalize to city/region format using TEAM_NAME_MAP
+                # Normalize to city/region format
                 # e.g., "Bills" -> "Buffalo", "Bears" -> "Chicago"
-                team = self.TEAM_NAME_MAP.get(raw_team, raw_team)
+                team = self.team_names.lookup(raw_team) or raw_team
                 if team not in injuries_by_team:
                     injuries_by_team[team] = []
                 injuries_by_team[team].append(injury)
@@ -1088,10 +1055,9 @@ class BillyWaltersEdgeDetector:
         Returns:
             InjuryImpact object with detailed breakdown
         """
-        if not self.injury_data:
-            return InjuryImpact(team=team_name)
+        context = self._get_week_context(season, week)
 
-        team_injuries = self.injury_data.get(team_name, [])
+        team_injuries = self.injury_data.get(team_name, []) if self.injury_data else []
         if not team_injuries:
             return InjuryImpact(team=team_name)
 
@@ -1111,7 +1077,15 @@ class BillyWaltersEdgeDetector:
             )
 
             # Get player value: database-driven if available, else position default
-            if self.db_ops and team_id and season and week and player_id:
+            if context and team_id and player_id:
+                valuation = context.get_player_valuation(team_id, player_id)
+                if valuation:
+                    player_value = float(valuation.point_value)
+                else:
+                    player_value = self.player_valuation.calculate_player_value(
+                        position
+                    )
+            elif self.db_ops and team_id and season and week and player_id:
                 player_value = self.player_valuation.get_player_value_from_db(
                     player_id=player_id,
                     team_id=team_id,
@@ -1515,6 +1489,236 @@ class BillyWaltersEdgeDetector:
 
         return edge
 
+    # HFA for detect_edges_batch when neither a column nor a cached rating has one
+    DEFAULT_HOME_FIELD_ADVANTAGE = 2.0
+
+    # Optional slate columns for detect_edges_batch and their defaults
+    BATCH_COLUMN_DEFAULTS = {
+        "market_total": 0.0,
+        "game_time": "",
+        "best_odds": -110,
+        "situational_adjustment": 0.0,
+        "weather_adjustment": 0.0,
+        "emotional_adjustment": 0.0,
+        "injury_adjustment": 0.0,
+        "weather_total_adjustment": 0.0,
+        "swe_confidence_impact": 1.0,
+        "reverse_line_movement": False,
+        "away_wednesday_multiplier": 1.0,
+        "home_wednesday_multiplier": 1.0,
+        "away_trend_multiplier": 1.0,
+        "home_trend_multiplier": 1.0,
+    }
+
+    def detect_edges_batch(
+        self,
+        slate,
+        min_edge_threshold: Optional[float] = None,
+        bias_correction: float = 0.15,
+        home_field_advantage: Optional[float] = None,
+        as_frame: bool = False,
+    ):
+        """
+        Vectorized detect_edge over a whole slate
+
+        Applies the same arithmetic as detect_edge (predicted spread, bias
+        correction, market respect, key numbers, strength, Kelly, confidence
+        multipliers) to NumPy columns, so threshold/HFA/bias sweeps over
+        thousands of games run in one pass. Per-game database lookups are not
+        made: SWE, injury, Wednesday and trend inputs are taken from columns.
+
+        Args:
+            slate: DataFrame (or dict of equal-length arrays) with columns
+                game_id, away_team, home_team, market_spread, week. Ratings
+                come from away_rating/home_rating/home_field_advantage columns
+                when present, else from self.power_ratings. Any column in
+                BATCH_COLUMN_DEFAULTS may be supplied per game.
+            min_edge_threshold: Edge threshold (default MIN_EDGE_THRESHOLD)
+            bias_correction: Favorite haircut / underdog boost (0.15 = 15%)
+            home_field_advantage: Override HFA for every game
+            as_frame: Return a DataFrame of every game (with an is_edge
+                column) instead of a list of BettingEdge
+
+        Returns:
+            List of BettingEdge for qualifying games (slate order), or a
+            DataFrame when as_frame is True
+        """
+        import pandas as pd
+
+        df = pd.DataFrame(slate).reset_index(drop=True)
+        threshold = (
+            self.MIN_EDGE_THRESHOLD
+            if min_edge_threshold is None
+            else min_edge_threshold
+        )
+
+        for column, default in self.BATCH_COLUMN_DEFAULTS.items():
+            if column not in df:
+                df[column] = default
+
+        # Ratings: columns if provided, else cached power ratings (NaN = missing)
+        if "away_rating" not in df or "home_rating" not in df:
+            ratings = {t: r.rating for t, r in self.power_ratings.items()}
+            df["away_rating"] = df["away_team"].map(ratings)
+            df["home_rating"] = df["home_team"].map(ratings)
+
+        # HFA: override, else column, else the home team's cached HFA (2.0,
+        # the Billy Walters default, for teams without a loaded rating)
+        if home_field_advantage is not None:
+            df["home_field_advantage"] = home_field_advantage
+        elif "home_field_advantage" not in df:
+            hfas = {t: r.home_field_advantage for t, r in self.power_ratings.items()}
+            df["home_field_advantage"] = (
+                df["home_team"].map(hfas).fillna(self.DEFAULT_HOME_FIELD_ADVANTAGE)
+            )
+
+        away_rating = df["away_rating"].to_numpy(dtype=float)
+        home_rating = df["home_rating"].to_numpy(dtype=float)
+        hfa = df["home_field_advantage"].to_numpy(dtype=float)
+        market = df["market_spread"].to_numpy(dtype=float)
+        sit_adj = df["situational_adjustment"].to_numpy(dtype=float)
+        weather_adj = df["weather_adjustment"].to_numpy(dtype=float)
+        injury_adj = df["injury_adjustment"].to_numpy(dtype=float)
+        rlm = df["reverse_line_movement"].to_numpy(dtype=bool)
+
+        # Predicted spread (missing ratings -> 0, as in calculate_predicted_spread)
+        has_ratings = ~(np.isnan(away_rating) | np.isnan(home_rating))
+        predicted = np.where(
+            has_ratings,
+            home_rating - away_rating + hfa + sit_adj + injury_adj + weather_adj,
+            0.0,
+        )
+        away_rating = np.where(has_ratings, away_rating, 0.0)
+        home_rating = np.where(has_ratings, home_rating, 0.0)
+
+        # Bias correction (apply_bias_correction)
+        betting_favorite = ((predicted > market) & (predicted < 0)) | (
+            (predicted < market) & (predicted > 0)
+        )
+        corrected = predicted * np.where(
+            betting_favorite, 1 - bias_correction, 1 + bias_correction
+        )
+
+        diff = corrected - market
+        edge_points = np.abs(diff)
+        too_large = edge_points > 10
+        is_edge = ~too_large & ((edge_points >= threshold) | rlm)
+
+        recommended = np.select(
+            [diff > threshold, -diff > threshold], ["home", "away"], default=""
+        )
+
+        # First key number (in priority order) strictly between the two lines
+        low = np.minimum(corrected, market)
+        high = np.maximum(corrected, market)
+        key_number = np.zeros(len(df), dtype=int)
+        for key_num in self.KEY_NUMBERS:
+            key_number = np.where(
+                (key_number == 0) & (low < key_num) & (key_num < high),
+                key_num,
+                key_number,
+            )
+        edge_points = edge_points + np.select(
+            [key_number == 3, key_number == 7], [0.8, 0.6], default=0.0
+        )
+
+        strength = np.select(
+            [edge_points >= 7.0, edge_points >= 5.5, edge_points >= 4.0],
+            ["very_strong", "strong", "medium"],
+            default="weak",
+        )
+        kelly = np.minimum(
+            self.KELLY_FRACTION * (edge_points / 7.0), self.KELLY_FRACTION
+        )
+
+        confidence = np.minimum((edge_points / 10.0) * 100, 100)
+        confidence = np.where(rlm, np.minimum(confidence * 1.2, 100), confidence)
+        confidence = np.minimum(
+            confidence * df["swe_confidence_impact"].to_numpy(dtype=float), 100
+        )
+        for side in ("wednesday", "trend"):
+            multiplier = np.select(
+                [recommended == "away", recommended == "home"],
+                [
+                    df[f"away_{side}_multiplier"].to_numpy(dtype=float),
+                    df[f"home_{side}_multiplier"].to_numpy(dtype=float),
+                ],
+                default=1.0,
+            )
+            confidence = np.minimum(confidence * multiplier, 100)
+
+        edge_type = np.full(len(df), EdgeType.POWER_RATING.value, dtype=object)
+        edge_type[rlm] = EdgeType.SHARP_ACTION.value
+        weather_total = df["weather_total_adjustment"].to_numpy(dtype=float)
+        edge_type[np.abs(weather_total) > 3] = EdgeType.WEATHER.value
+        edge_type[np.abs(sit_adj) > 2] = EdgeType.SITUATIONAL.value
+
+        result = df.assign(
+            away_rating=away_rating,
+            home_rating=home_rating,
+            predicted_spread=corrected,
+            edge_points=edge_points,
+            edge_type=edge_type,
+            edge_strength=strength,
+            crosses_key_number=key_number > 0,
+            key_number_value=key_number,
+            recommended_bet=recommended,
+            kelly_fraction=kelly,
+            confidence_score=confidence,
+            is_edge=is_edge,
+        )
+
+        if too_large.any():
+            logger.warning(
+                f"MARKET RESPECT: Skipped {int(too_large.sum())} games with "
+                f"edges > 10 pts"
+            )
+        logger.info(f"Batch edge detection: {int(is_edge.sum())}/{len(df)} edges")
+
+        if as_frame:
+            return result
+        return self._edges_from_frame(result[result["is_edge"]])
+
+    def _edges_from_frame(self, frame: "pd.DataFrame") -> List[BettingEdge]:
+        """Build BettingEdge objects from detect_edges_batch rows"""
+        timestamp = datetime.now().isoformat()
+        edges = []
+        for row in frame.itertuples(index=False):
+            edges.append(
+                BettingEdge(
+                    game_id=row.game_id,
+                    matchup=f"{row.away_team} @ {row.home_team}",
+                    week=int(row.week),
+                    game_time=row.game_time,
+                    away_team=row.away_team,
+                    home_team=row.home_team,
+                    away_rating=float(row.away_rating),
+                    home_rating=float(row.home_rating),
+                    predicted_spread=float(row.predicted_spread),
+                    market_spread=float(row.market_spread),
+                    market_total=float(row.market_total),
+                    best_odds=int(row.best_odds),
+                    edge_points=float(row.edge_points),
+                    edge_type=row.edge_type,
+                    edge_strength=row.edge_strength,
+                    situational_adjustment=float(row.situational_adjustment),
+                    weather_adjustment=float(row.weather_adjustment),
+                    emotional_adjustment=float(row.emotional_adjustment),
+                    injury_adjustment=float(row.injury_adjustment),
+                    sharp_action=SharpAction(
+                        reverse_line_movement=bool(row.reverse_line_movement)
+                    ),
+                    crosses_key_number=bool(row.crosses_key_number),
+                    key_number_value=int(row.key_number_value) or None,
+                    recommended_bet=row.recommended_bet or None,
+                    kelly_fraction=float(row.kelly_fraction),
+                    confidence_score=float(row.confidence_score),
+                    timestamp=timestamp,
+                    data_sources=["massey", "action_network", "nfl_official_injuries"],
+                )
+            )
+        return edges
+
     # =================================================================
     # OUTPUT
     # =================================================================
@@ -1591,8 +1795,23 @@ class BillyWaltersEdgeDetector:
         return "\n".join(report)
 
 
+def _overtime_game_time(game: Dict) -> str:
+    """Kickoff from an Overtime.ag game, preferring ISO datetime fields"""
+    return (
+        game.get("game_datetime_utc")
+        or game.get("game_datetime_et")
+        or game.get("game_time", "")
+    )
+
+
 def main():
     """Demo: Run edge detection on real data"""
+    from scrapers.weather import (
+        AccuWeatherClient,
+        OpenWeatherClient,
+        SlateWeatherStage,
+    )
+
     # Pre-flight schedule validation
     from walters_analyzer.utils.schedule_validator import ScheduleValidator
 
@@ -1621,8 +1840,10 @@ def main():
     detector = BillyWaltersEdgeDetector()
 
     # Initialize weather client
-    weather_client = AccuWeatherClient()
-    if not weather_client.api_key:
+    weather_client = None
+    try:
+        weather_client = AccuWeatherClient()
+    except ValueError:
         logger.warning("No AccuWeather API key - weather analysis will be skipped")
 
     # Load proprietary 90/10 power ratings (use master file for current ratings)
@@ -1686,6 +1907,33 @@ def main():
         logger.info(f"Loading Overtime.ag data from {overtime_file}")
         games_data = detector.load_overtime_odds(overtime_file)
 
+        # Fetch weather for every game on the slate concurrently
+        slate_weather = {}
+        if weather_client:
+            slate = {
+                game_id: (
+                    detector.normalize_team_name(game["home_team"]),
+                    _overtime_game_time(game),
+                )
+                for game_id, game in games_data.items()
+                if game.get("away_team")
+                and game.get("home_team")
+                and _overtime_game_time(game)
+            }
+            openweather = None
+            if os.getenv("OPENWEATHER_API_KEY"):
+                openweather = OpenWeatherClient()
+            stage = SlateWeatherStage(weather_client, openweather)
+            try:
+                slate_weather = asyncio.run(stage.fetch(slate))
+            except Exception as e:
+                logger.warning(f"Could not fetch slate weather: {e}")
+
+        # Current NFL week from Overtime.ag. Load the week's database context
+        # once so detect_edge does not query per game
+        season, week = 2025, 13
+        detector.prefetch_week_context(season, week)
+
         # Analyze each game
         edges = []
         totals_edges = []
@@ -1717,110 +1965,60 @@ def main():
             # Would need to compare multiple books for true sharp detection
             sharp = None
 
-            # Fetch weather data for the game
+            # Weather was collected for the whole slate up front
             weather_impact = None
-            # Prefer ISO format datetime fields from Overtime API
-            game_time_str = (
-                game.get("game_datetime_utc")
-                or game.get("game_datetime_et")
-                or game.get("game_time", "")
-            )
-            if weather_client.api_key and game_time_str:
-                try:
-                    # Get weather for home team's location
-                    # AccuWeather client now handles datetime parsing internally
-                    # (async call - run synchronously)
-                    async def fetch_weather():
-                        await weather_client.connect()
-                        return await weather_client.get_game_weather(
-                            home_team, game_time_str
-                        )
-
-                    weather_data = asyncio.run(fetch_weather())
-
-                    if weather_data:
-                        # Fetch weather alerts from OpenWeather (if available)
-                        weather_alerts = []
-                        try:
-                            # Check if we have OpenWeather client
-                            # (needs OPENWEATHER_API_KEY)
-                            if os.getenv("OPENWEATHER_API_KEY"):
-                                # Get stadium coordinates from weather data
-                                lat = weather_data.get("latitude")
-                                lon = weather_data.get("longitude")
-
-                                if lat and lon:
-                                    # Define async helper to fetch alerts
-                                    async def fetch_alerts():
-                                        openweather = OpenWeatherClient()
-                                        await openweather.connect()
-                                        try:
-                                            alert_data = (
-                                                await openweather.get_weather_alerts(
-                                                    lat=lat,
-                                                    lon=lon,
-                                                    game_time=game_time,
-                                                )
-                                            )
-                                            return alert_data
-                                        finally:
-                                            await openweather.close()
-
-                                    # Run async function in sync context
-                                    alert_data = asyncio.run(fetch_alerts())
-
-                                    # Map alerts to Billy Walters adjustments
-                                    mapper = WeatherAlertMapper()
-                                    for alert in alert_data:
-                                        weather_alerts.append(mapper.map_alert(alert))
-
-                                    if weather_alerts:
-                                        logger.info(
-                                            f"Found {len(weather_alerts)} active "
-                                            f"weather alerts for {home_team}"
-                                        )
-                        except Exception as alert_error:
-                            logger.debug(f"Weather alerts unavailable: {alert_error}")
-
-                        # Calculate combined weather impact (conditions + alerts)
-                        weather_impact = detector.calculate_weather_impact(
-                            temperature=weather_data.get("temperature"),
-                            wind_speed=weather_data.get("wind_speed"),
-                            precipitation=weather_data.get("precipitation"),
-                            indoor=weather_data.get("indoor", False),
-                            alerts=weather_alerts if weather_alerts else None,
-                        )
-
-                        # Log weather impact details
-                        alert_info = ""
-                        if weather_impact.alert_severity != "NONE":
-                            alert_info = (
-                                f" [ALERT: {weather_impact.alert_severity} "
-                                f"({weather_impact.alert_total_adjustment:.1f} pts)]"
-                            )
-
-                        logger.info(
-                            f"Weather for {home_team}: "
-                            f"{weather_data.get('temperature')}°F, "
-                            f"{weather_data.get('wind_speed')} MPH wind, "
-                            f"Total adj: {weather_impact.total_adjustment:.1f}, "
-                            f"Spread adj: {weather_impact.spread_adjustment:.1f}"
-                            f"{alert_info}"
-                        )
-                except Exception as e:
-                    logger.warning(f"Could not fetch weather for {home_team}: {e}")
-
-            # Detect edge (using Week 13 for Overtime.ag current data)
+            game_time_str = _overtime_game_time(game)
+            game_weather = slate_weather.get(game_id)
+            if game_weather and game_weather.forecast:
+                weather_data = game_weather.forecast
+
+                # Map alerts to Billy Walters adjustments
+                mapper = WeatherAlertMapper()
+                weather_alerts = [mapper.map_alert(a) for a in game_weather.alerts]
+                if weather_alerts:
+                    logger.info(
+                        f"Found {len(weather_alerts)} active "
+                        f"weather alerts for {home_team}"
+                    )
+
+                # Calculate combined weather impact (conditions + alerts)
+                weather_impact = detector.calculate_weather_impact(
+                    temperature=weather_data.get("temperature"),
+                    wind_speed=weather_data.get("wind_speed"),
+                    precipitation=weather_data.get("precipitation"),
+                    indoor=weather_data.get("indoor", False),
+                    alerts=weather_alerts if weather_alerts else None,
+                )
+
+                # Log weather impact details
+                alert_info = ""
+                if weather_impact.alert_severity != "NONE":
+                    alert_info = (
+                        f" [ALERT: {weather_impact.alert_severity} "
+                        f"({weather_impact.alert_total_adjustment:.1f} pts)]"
+                    )
+
+                logger.info(
+                    f"Weather for {home_team}: "
+                    f"{weather_data.get('temperature')}°F, "
+                    f"{weather_data.get('wind_speed')} MPH wind, "
+                    f"Total adj: {weather_impact.total_adjustment:.1f}, "
+                    f"Spread adj: {weather_impact.spread_adjustment:.1f}"
+                    f"{alert_info}"
+                )
+
+            # Detect edge
             edge = detector.detect_edge(
                 game_id=game_id,
                 away_team=away_team,
                 home_team=home_team,
                 market_spread=market_spread,
                 market_total=market_total,
-                week=13,  # Current NFL week from Overtime.ag
+                week=week,
                 game_time=game_time_str,
                 weather=weather_impact,
                 sharp_action=sharp,
+                season=season,
             )
 
             if edge:
@@ -1838,7 +2036,7 @@ def main():
                 market_total=market_total,
                 market_over_odds=over_odds,
                 market_under_odds=under_odds,
-                week=13,  # Current NFL week from Overtime.ag
+                week=week,
                 game_time=game_time_str,
                 weather=weather_impact,
                 sharp_action=sharp,
@@ -16,6 +16,7 @@ Key Differences from NFL:
 import os
 import json
 import asyncio
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
@@ -27,6 +28,7 @@ from walters_analyzer.valuation.ncaaf_situational_factors import (
     NCAAFSituationalFactors,
 )
 from walters_analyzer.valuation.ncaaf_injury_impacts import NCAAFInjuryImpacts
+from walters_analyzer.team_names import get_team_resolver
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -90,6 +92,10 @@ class NCAAFEdgeDetector:
     EDGE_THRESHOLD = 3.5
     MAX_KELLY = 0.25
 
+    # Concurrent game analysis (DB lookups + weather fetches per game)
+    MAX_CONCURRENT_GAMES = 16
+    GAME_TIMEOUT_SECONDS = 30.0
+
     # Weather adjustments (NCAAF-specific, larger impacts than NFL)
     WIND_IMPACTS = {
         ">20mph": -6.0,  # vs NFL -5.0
@@ -110,12 +116,29 @@ class NCAAFEdgeDetector:
         "drizzle": -0.5,
     }
 
-    def __init__(self, db_ops=None):
+    # ESPN names (after mascot stripping) whose Overtime.ag name differs
+    OVERTIME_NAME_OVERRIDES = {
+        "Ole Miss": "Mississippi",  # Overtime uses full state name
+        "UCF": "Central Florida",  # Overtime uses full name
+        "Miami": "Miami Florida",  # Distinguish from Miami OH
+        "Kent State": "Kent",
+        "Miami (OH)": "Miami OH",
+        "Miami (FL)": "Miami FL",
+    }
+
+    def __init__(
+        self,
+        db_ops=None,
+        max_concurrency: Optional[int] = None,
+        game_timeout: Optional[float] = None,
+    ):
         """
         Initialize NCAAF edge detector
 
         Args:
             db_ops: Optional RawDataOperations instance for database queries
+            max_concurrency: Games analyzed at once (1 = one at a time)
+            game_timeout: Seconds allowed per game analysis (None = no limit)
         """
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.data_dir = self.project_root / "data" / "current"
@@ -125,12 +148,16 @@ class NCAAFEdgeDetector:
         )
         self.situational = NCAAFSituationalFactors()
         self.injury_calc = NCAAFInjuryImpacts()
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENT_GAMES
+        self.game_timeout = (
+            self.GAME_TIMEOUT_SECONDS if game_timeout is None else game_timeout
+        )
 
         # Database operations (optional)
         self.db_ops = db_ops
 
-        # Load comprehensive team name mappings
-        self.team_name_map = self._load_team_mappings()
+        # Shared NCAAF team name resolver (ESPN/Overtime.ag -> Massey)
+        self.team_names = get_team_resolver("ncaaf")
 
     async def get_player_value_for_injury(
         self, player_id: str, team_id: int, season: int, week: int, position: str
@@ -164,7 +191,8 @@ class NCAAFEdgeDetector:
             return default_impacts.get(position.upper(), 1.0)
 
         try:
-            valuation = self.db_ops.get_player_valuation(
+            valuation = await asyncio.to_thread(
+                self.db_ops.get_player_valuation,
                 league_id=2,  # NCAAF
                 team_id=team_id,
                 player_id=player_id,
@@ -211,7 +239,8 @@ class NCAAFEdgeDetector:
             return (False, 1.0)
 
         try:
-            wednesday_reports = self.db_ops.get_wednesday_practice_status(
+            wednesday_reports = await asyncio.to_thread(
+                self.db_ops.get_wednesday_practice_status,
                 league_id=2,  # NCAAF
                 team_id=team_id,
                 season=season,
@@ -277,7 +306,8 @@ class NCAAFEdgeDetector:
             }
 
         try:
-            swe_factors = self.db_ops.get_game_swe_factors(
+            swe_factors = await asyncio.to_thread(
+                self.db_ops.get_game_swe_factors,
                 league_id=2,  # NCAAF
                 game_id=game_id,
                 season=season,
@@ -322,7 +352,8 @@ class NCAAFEdgeDetector:
             return 1.0
 
         try:
-            team_trends = self.db_ops.get_team_trends(
+            team_trends = await asyncio.to_thread(
+                self.db_ops.get_team_trends,
                 league_id=2,  # NCAAF
                 team_id=team_id,
                 season=season,
@@ -360,78 +391,6 @@ class NCAAFEdgeDetector:
 
         return 1.0
 
-    def _load_team_mappings(self) -> Dict[str, str]:
-        """
-        Load comprehensive team name mappings from Overtime.ag to Massey format.
-
-        Loads Overtime.ag -> Massey mappings and adds ESPN-specific overrides
-        for teams that have different names in different systems.
-
-        Returns:
-            Dictionary mapping team names to Massey rating format
-        """
-        mappings = {}
-
-        # Try to load from comprehensive mapping file first
-        mapping_file = (
-            self.project_root / "src" / "data" / "ncaaf_team_name_mapping.json"
-        )
-
-        if mapping_file.exists():
-            try:
-                with open(mapping_file, "r") as f:
-                    data = json.load(f)
-                    if "overtime_to_massey" in data:
-                        mappings = data["overtime_to_massey"].copy()
-                        logger.info(
-                            f"[OK] Loaded {len(mappings)} "
-                            "team mappings from comprehensive mapping file"
-                        )
-            except Exception as e:
-                logger.warning(f"Error loading team mappings: {e}")
-
-        # Add ESPN-specific overrides for teams with different display names
-        # These handle special cases where ESPN uses different names than Overtime.ag
-        espn_overrides = {
-            "Ole Miss": "Mississippi",  # ESPN: "Ole Miss Rebels" -> Massey: "Mississippi"
-            "Central Florida": "UCF",  # ESPN: "Central Florida Knights"
-            "Miami Florida": "Miami FL",
-            "Miami Ohio": "Miami OH",
-        }
-
-        # Merge ESPN overrides into mappings (ESPN names may not be in Overtime map)
-        for espn_name, massey_name in espn_overrides.items():
-            if espn_name not in mappings:
-                mappings[espn_name] = massey_name
-
-        if not mappings:
-            # Fallback to basic ESPN -> Massey mappings if file not found
-            logger.info("Using fallback team name mappings")
-            mappings = {
-                "Ohio State": "Ohio St",
-                "Penn State": "Penn St",
-                "Mississippi State": "Mississippi St",
-                "Iowa State": "Iowa St",
-                "Arizona State": "Arizona St",
-                "Oklahoma State": "Oklahoma St",
-                "Texas State": "Texas St",
-                "San Jose State": "San Jose St",
-                "North Carolina State": "NC State",
-                "South Carolina State": "S.Carolina St",
-                "Colorado State": "Colorado St",
-                "Kansas State": "Kansas St",
-                "Utah State": "Utah St",
-                "Ball State": "Ball St",
-                "Arkansas State": "Arkansas St",
-                "Portland State": "Portland St",
-                "Appalachian State": "App State",
-                "New Mexico State": "New Mexico St",
-                "South Dakota State": "South Dakota St",
-                "Ole Miss": "Mississippi",
-            }
-
-        return mappings
-
     async def detect_edges(self, week: int) -> List[BettingEdge]:
         """
         Detect all NCAAF edges for a given week.
@@ -465,16 +424,13 @@ class NCAAFEdgeDetector:
 
             logger.info(f"[OK] Loaded {len(games)} games for Week {week}")
 
-            # Analyze each game
-            edges = []
-            for game in games:
-                try:
-                    edge = await self._analyze_game(game, ratings, odds, injuries, week)
-                    if edge and edge.edge_points >= self.EDGE_THRESHOLD:
-                        edges.append(edge)
-                except Exception as e:
-                    logger.warning(f"Error analyzing {game.get('matchup')}: {e}")
-                    continue
+            # Analyze games concurrently; results keep schedule order
+            results = await self.analyze_games(games, ratings, odds, injuries, week)
+            edges = [
+                edge
+                for edge in results
+                if edge and edge.edge_points >= self.EDGE_THRESHOLD
+            ]
 
             logger.info(
                 f"[OK] Found {len(edges)} edges (threshold: {self.EDGE_THRESHOLD})"
@@ -497,6 +453,49 @@ class NCAAFEdgeDetector:
             except Exception:
                 pass  # Ignore cleanup errors
 
+    async def analyze_games(
+        self,
+        games: List[Dict],
+        ratings: Dict[str, float],
+        odds: Dict[str, Dict],
+        injuries: Dict[str, List[Dict]],
+        week: int,
+    ) -> List[Optional[BettingEdge]]:
+        """
+        Analyze a slate with at most max_concurrency games in flight
+
+        Each game gets game_timeout seconds once it starts. Failed or timed
+        out games yield None.
+
+        Returns:
+            One result per game, in the same order as games
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze(game: Dict) -> Optional[BettingEdge]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self._analyze_game(game, ratings, odds, injuries, week),
+                        timeout=self.game_timeout or None,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Timed out analyzing {game.get('matchup')} "
+                        f"after {self.game_timeout}s"
+                    )
+                except Exception as e:
+                    logger.warning(f"Error analyzing {game.get('matchup')}: {e}")
+                return None
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(analyze(game) for game in games))
+        logger.info(
+            f"[OK] Analyzed {len(games)} games in {time.perf_counter() - start:.1f}s "
+            f"(concurrency {self.max_concurrency})"
+        )
+        return list(results)
+
     async def _load_schedule(self, week: int) -> List[Dict]:
         """Load NCAAF schedule for given week"""
         try:
@@ -921,82 +920,7 @@ class NCAAFEdgeDetector:
         - "Georgia Bulldogs" -> "Georgia"
         - "Utah Utes" -> "Utah"
         """
-        # Common NCAAF mascots (multi-word first for proper matching)
-        mascots = [
-            # Multi-word mascots (check these first - order matters!)
-            "Crimson Tide",
-            "Scarlet Knights",
-            "Golden Eagles",
-            "Golden Gophers",
-            "Golden Bears",  # California
-            "Golden Flashes",  # Kent State
-            "Nittany Lions",
-            "Yellow Jackets",
-            "Demon Deacons",
-            "Blue Devils",
-            "Green Wave",
-            "Tar Heels",
-            "Fighting Illini",
-            "Fighting Irish",  # Notre Dame
-            "Sun Devils",
-            "Red Raiders",  # Texas Tech
-            # Single-word mascots
-            "Wildcats",
-            "Bulldogs",
-            "Tide",
-            "Tigers",
-            "Gators",
-            "Sooners",
-            "Longhorns",
-            "Cowboys",
-            "Aggies",
-            "Mavericks",
-            "Commodores",
-            "Vols",
-            "Volunteers",
-            "Rebels",
-            "Razorbacks",
-            "Gamecocks",
-            "Jayhawks",
-            "Utes",
-            "Buffaloes",
-            "Rams",
-            "Broncos",
-            "Falcons",
-            "Panthers",
-            "Hurricanes",
-            "Orange",
-            "Mountaineers",
-            "Hokies",
-            "Boilermakers",
-            "Hoosiers",
-            "Hawkeyes",
-            "Badgers",
-            "Spartans",
-            "Wolverines",
-            "Buckeyes",
-            "Terrapins",
-            "Bearcats",
-            "Cardinals",
-            "Cardinal",  # Stanford (singular)
-            "Cavaliers",
-            "49ers",
-            "Knights",
-            "Bears",
-            "Cougars",  # BYU, Houston, Washington State
-            "Ducks",  # Oregon
-            "Huskies",  # Washington, UConn
-            "Trojans",  # USC
-            "Bruins",  # UCLA
-            "Mustangs",  # SMU
-            "Beavers",  # Oregon State
-        ]
-
-        for mascot in mascots:
-            if team_name.endswith(f" {mascot}"):
-                return team_name[: -len(mascot) - 1].strip()
-
-        return team_name
+        return self.team_names.strip_mascot(team_name)
 
     def _normalize_for_odds_matching(self, team_name: str) -> str:
         """
@@ -1017,39 +941,7 @@ class NCAAFEdgeDetector:
         # First strip the mascot
         stripped = self._strip_mascot(team_name)
 
-        # Special case mappings for teams with unique Overtime.ag names
-        # Maps ESPN names (after mascot stripping) to Overtime.ag names
-        special_mappings = {
-            # ESPN -> Overtime.ag format differences
-            "Ole Miss": "Mississippi",  # Overtime uses full state name
-            "UCF": "Central Florida",  # Overtime uses full name
-            "Miami": "Miami Florida",  # Distinguish from Miami OH
-            "Miami Hurricanes": "Miami Florida",  # If mascot not stripped
-            # Standard mappings
-            "Kent State": "Kent",
-            "Northern Illinois": "Northern Illinois",
-            "Central Michigan": "Central Michigan",
-            "Western Michigan": "Western Michigan",
-            "Eastern Michigan": "Eastern Michigan",
-            "Ball State": "Ball State",
-            "Miami (OH)": "Miami OH",
-            "Miami (FL)": "Miami FL",
-            "San Diego State": "San Diego State",
-            "San Jose State": "San Jose State",
-            "Florida Atlantic": "Florida Atlantic",
-            "Florida International": "Florida International",
-            "UL Monroe": "UL Monroe",
-            "South Alabama": "South Alabama",
-            "Arkansas State": "Arkansas State",
-            "Texas State": "Texas State",
-            "New Mexico State": "New Mexico State",
-            "Louisiana Tech": "Louisiana Tech",
-        }
-
-        if stripped in special_mappings:
-            return special_mappings[stripped]
-
-        return stripped
+        return self.OVERTIME_NAME_OVERRIDES.get(stripped, stripped)
 
     def _normalize_team_name(self, team_name: str) -> str:
         """
@@ -1062,22 +954,7 @@ class NCAAFEdgeDetector:
         - "Ohio State Buckeyes" (ESPN) -> "Ohio State" -> "Ohio St"
         - "Ohio State" (Overtime.ag) -> "Ohio State" -> "Ohio St"
         """
-        # First, try direct mapping (for Overtime.ag names already in map)
-        if team_name in self.team_name_map:
-            return self.team_name_map[team_name]
-
-        # Strip mascot if present
-        stripped = self._strip_mascot(team_name)
-
-        # Try mapping again with stripped name
-        if stripped != team_name and stripped in self.team_name_map:
-            return self.team_name_map[stripped]
-
-        # Default handling: abbreviated states
-        if stripped.endswith(" State"):
-            return stripped.replace(" State", " St")
-
-        return stripped
+        return self.team_names.canonical(team_name)
 
     def _is_indoor_stadium(self, team: str) -> bool:
         """Check if team plays in indoor stadium"""
@@ -1137,9 +1014,23 @@ async def main():
     parser.add_argument(
         "--week", type=int, default=13, help="NCAAF week number (default: 13)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=NCAAFEdgeDetector.MAX_CONCURRENT_GAMES,
+        help="Games analyzed at once (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--game-timeout",
+        type=float,
+        default=NCAAFEdgeDetector.GAME_TIMEOUT_SECONDS,
+        help="Seconds allowed per game, 0 = no limit (default: %(default)s)",
+    )
     args = parser.parse_args()
 
-    detector = NCAAFEdgeDetector()
+    detector = NCAAFEdgeDetector(
+        max_concurrency=args.concurrency, game_timeout=args.game_timeout
+    )
     edges = await detector.detect_edges(args.week)
 
     if edges:
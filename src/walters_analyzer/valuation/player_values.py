@@ -310,7 +310,10 @@ class PlayerValuation:
             )
 
             if valuation:
-                # Use actual database-driven value (0.5-5.0 range)
+                # Use actual database-driven value (0.5-5.0 range); rows come
+                # back from RawDataOperations as dicts
+                if isinstance(valuation, dict):
+                    return float(valuation["point_value"])
                 return float(valuation.point_value)
 
         except Exception:
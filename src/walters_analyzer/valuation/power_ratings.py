@@ -21,6 +21,8 @@ from pathlib import Path
 import json
 import logging
 
+from walters_analyzer.team_names import get_team_resolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,16 +97,21 @@ class PowerRatingSystem:
     TRUE_PERFORMANCE_WEIGHT = 0.10  # 10% weight on last game
     HOME_FIELD_ADVANTAGE = 2.0  # Standard home field points
 
-    def __init__(self, ratings_file: Optional[Path] = None):
+    def __init__(
+        self, ratings_file: Optional[Path] = None, league: Optional[str] = None
+    ):
         """
         Initialize the Power Rating System
 
         Args:
             ratings_file: Optional path to JSON file for persistent storage
+            league: Optional "nfl"/"ncaaf"; when set, team names from any
+                source ("KC", "Kansas City Chiefs") resolve to one canonical key
         """
         self.ratings: Dict[str, float] = {}
         self.history: List[Dict] = []
         self.ratings_file = ratings_file
+        self.team_names = get_team_resolver(league) if league else None
 
         # Load existing ratings if file provided
         if ratings_file and ratings_file.exists():
@@ -432,13 +439,12 @@ class PowerRatingSystem:
         Returns:
             Normalized team name
         """
-        # Basic normalization: strip whitespace, title case
-        normalized = team.strip()
-
-        # Optional: Add more sophisticated normalization
-        # e.g., "KC" -> "Kansas City", "SF" -> "San Francisco"
+        # Resolve aliases (e.g., "KC" -> "Kansas City") when a league is set
+        if self.team_names is not None:
+            return self.team_names.canonical(team)
 
-        return normalized
+        # Basic normalization: strip whitespace
+        return team.strip()
 
     def reset_ratings(self) -> None:
         """Reset all ratings and history"""
@@ -0,0 +1,97 @@
+"""
+Week-level context prefetch for edge detection
+Loads SWE factors, Wednesday practice reports, team trends and player
+valuations for a whole (league, season, week) in a handful of bulk queries,
+then serves per-game/per-team lookups from in-memory indexes
+"""
+
+import logging
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _record(row: Dict) -> SimpleNamespace:
+    """Wrap a DB row so callers can use attribute access (row.field)"""
+    return SimpleNamespace(**row)
+
+
+@dataclass
+class WeekContext:
+    """In-memory indexes for one league week of TIER 1 data"""
+
+    league_id: int
+    season: int
+    week: int
+
+    swe_by_game: Dict[str, SimpleNamespace] = field(default_factory=dict)
+    wednesday_by_team: Dict[int, List[SimpleNamespace]] = field(default_factory=dict)
+    trends_by_team: Dict[int, SimpleNamespace] = field(default_factory=dict)
+    valuations_by_player: Dict[Tuple[int, str], SimpleNamespace] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def load(cls, db_ops, league_id: int, season: int, week: int) -> "WeekContext":
+        """
+        Load all week context with one query per table
+
+        Args:
+            db_ops: RawDataOperations instance
+            league_id: League ID (1 = NFL, 2 = NCAAF)
+            season: Season year
+            week: Week number
+
+        Returns:
+            Populated WeekContext
+        """
+        context = cls(league_id=league_id, season=season, week=week)
+
+        for row in db_ops.get_swe_factors_by_week(league_id, season, week):
+            context.swe_by_game[row["game_id"]] = _record(row)
+
+        for row in db_ops.get_wednesday_status_by_week(league_id, season, week):
+            context.wednesday_by_team.setdefault(row["team_id"], []).append(
+                _record(row)
+            )
+
+        for row in db_ops.get_team_trends_by_week(league_id, season, week):
+            context.trends_by_team[row["team_id"]] = _record(row)
+
+        for row in db_ops.get_player_valuations_by_week(league_id, season, week):
+            if row.get("player_id"):
+                key = (row["team_id"], str(row["player_id"]))
+                context.valuations_by_player[key] = _record(row)
+
+        logger.info(
+            f"Week context loaded (league {league_id}, {season} week {week}): "
+            f"{len(context.swe_by_game)} SWE games, "
+            f"{len(context.wednesday_by_team)} practice teams, "
+            f"{len(context.trends_by_team)} trend teams, "
+            f"{len(context.valuations_by_player)} valuations"
+        )
+        return context
+
+    def covers(self, season: Optional[int], week: Optional[int]) -> bool:
+        """Whether this context was loaded for the given season/week"""
+        return season == self.season and week == self.week
+
+    def get_swe_factors(self, game_id: str) -> Optional[SimpleNamespace]:
+        """SWE factors for a game, or None"""
+        return self.swe_by_game.get(game_id)
+
+    def get_wednesday_reports(self, team_id: int) -> List[SimpleNamespace]:
+        """Wednesday practice reports for a team"""
+        return self.wednesday_by_team.get(team_id, [])
+
+    def get_team_trends(self, team_id: int) -> Optional[SimpleNamespace]:
+        """Team trends for a team, or None"""
+        return self.trends_by_team.get(team_id)
+
+    def get_player_valuation(
+        self, team_id: int, player_id: str
+    ) -> Optional[SimpleNamespace]:
+        """Player valuation for a team/player, or None"""
+        return self.valuations_by_player.get((team_id, str(player_id)))
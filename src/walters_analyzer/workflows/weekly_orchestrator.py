@@ -10,6 +10,17 @@ Coordinates the complete Billy Walters sports analytics workflow:
 6. Dynamic Adjustments (Real-time weather, injuries, situational)
 7. Reporting (Summary, ROI, recommendations)
 
+Stages declare their dependencies in STAGE_DEPENDENCIES and run as a DAG:
+each stage starts as soon as its enabled dependencies finish, so
+independent stages (e.g. prior-week results and CLV alongside data
+collection and edge detection) run concurrently. Stage outputs are cached
+in data/cache/workflow/ keyed by a fingerprint of the league, week, the
+content of the source files the stage reads (STAGE_INPUTS) and its
+dependencies' outputs; a rerun reuses any stage whose fingerprint is
+unchanged. Stages that read live data (UNCACHED_STAGES, including edge
+detection) always rerun. The final report includes the critical path
+through the DAG.
+
 Usage:
     # Run complete weekly workflow (all data + analysis)
     python scripts/workflows/weekly_workflow.py --league nfl --full
@@ -20,9 +31,13 @@ Usage:
 
     # Run with verbose output
     python scripts/workflows/weekly_workflow.py --league nfl --full --verbose
+
+    # Ignore cached stage outputs
+    python scripts/workflows/weekly_workflow.py --league nfl --full --no-cache
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import sys
@@ -31,7 +46,7 @@ from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -61,6 +76,46 @@ class WorkflowStage(str, Enum):
     REPORTING = "reporting"
 
 
+# Stages each stage waits for (listed in a valid execution order). Disabled
+# dependencies are ignored; stages with no path between them run concurrently.
+STAGE_DEPENDENCIES: Dict[WorkflowStage, Tuple[WorkflowStage, ...]] = {
+    WorkflowStage.DATA_COLLECTION: (),
+    WorkflowStage.EDGE_DETECTION: (WorkflowStage.DATA_COLLECTION,),
+    WorkflowStage.RESULTS_CHECKING: (),
+    WorkflowStage.CLV_TRACKING: (WorkflowStage.RESULTS_CHECKING,),
+    WorkflowStage.SHARP_MONEY: (WorkflowStage.DATA_COLLECTION,),
+    WorkflowStage.DYNAMIC_ADJUSTMENTS: (
+        WorkflowStage.EDGE_DETECTION,
+        WorkflowStage.SHARP_MONEY,
+    ),
+    WorkflowStage.REPORTING: (
+        WorkflowStage.EDGE_DETECTION,
+        WorkflowStage.RESULTS_CHECKING,
+        WorkflowStage.CLV_TRACKING,
+        WorkflowStage.SHARP_MONEY,
+        WorkflowStage.DYNAMIC_ADJUSTMENTS,
+    ),
+}
+
+# Source files each stage reads, as globs relative to the project root
+# ({league} and {week} are filled in). Their content hashes are part of the
+# stage's cache fingerprint.
+STAGE_INPUTS: Dict[WorkflowStage, Tuple[str, ...]] = {
+    WorkflowStage.SHARP_MONEY: ("data/action_network/{league}_odds_latest.json",),
+}
+
+# Stages whose output depends on live data, so it is never reused from cache.
+# Edge detection reads the latest odds/ratings/injury files, the database and
+# live weather; its dependents are still cached on its output.
+UNCACHED_STAGES = frozenset(
+    {
+        WorkflowStage.DATA_COLLECTION,
+        WorkflowStage.EDGE_DETECTION,
+        WorkflowStage.RESULTS_CHECKING,
+    }
+)
+
+
 @dataclass
 class StageResult:
     """Result from a single workflow stage."""
@@ -71,6 +126,9 @@ class StageResult:
     duration_seconds: float
     data: Optional[Dict] = None
     errors: List[str] = field(default_factory=list)
+    started_at: float = 0.0  # Seconds after the workflow started
+    cached: bool = False
+    fingerprint: Optional[str] = None
 
 
 @dataclass
@@ -86,6 +144,49 @@ class WorkflowReport:
     results_checked: int
     clv_tracked: int
     execution_status: str  # SUCCESS, PARTIAL, FAILED
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+
+
+def critical_path(
+    results: List[StageResult],
+    dependencies: Dict[WorkflowStage, Tuple[WorkflowStage, ...]] = STAGE_DEPENDENCIES,
+) -> Tuple[List[WorkflowStage], float]:
+    """
+    Longest chain of dependent stages by measured duration.
+
+    This is the chain that bounds the workflow's wall time; speeding up any
+    stage off it does not shorten the run.
+
+    Args:
+        results: Stage results from one run
+        dependencies: Stage dependency graph
+
+    Returns:
+        Tuple of (stages on the critical path in order, total seconds)
+    """
+    durations = {r.stage: r.duration_seconds for r in results}
+    finish: Dict[WorkflowStage, float] = {}
+    previous: Dict[WorkflowStage, Optional[WorkflowStage]] = {}
+
+    for stage in dependencies:
+        if stage not in durations:
+            continue
+        deps = [d for d in dependencies[stage] if d in finish]
+        before = max(deps, key=finish.get) if deps else None
+        previous[stage] = before
+        finish[stage] = durations[stage] + (finish[before] if before else 0.0)
+
+    if not finish:
+        return [], 0.0
+
+    stage: Optional[WorkflowStage] = max(finish, key=finish.get)
+    total = finish[stage]
+    path = []
+    while stage is not None:
+        path.append(stage)
+        stage = previous[stage]
+    return path[::-1], total
 
 
 class WeeklyWorkflowOrchestrator:
@@ -110,6 +211,7 @@ class WeeklyWorkflowOrchestrator:
         # Initialize components
         self.edge_orchestrator = EdgeDetectionOrchestrator()
         self.results_checker = BettingResultsChecker()
+        self.cache_dir = self.project_root / "data" / "cache" / "workflow"
 
         # Track execution
         self.start_time = None
@@ -123,6 +225,7 @@ class WeeklyWorkflowOrchestrator:
         detect_edges: bool = True,
         check_results: bool = True,
         track_clv: bool = True,
+        use_cache: bool = True,
     ) -> WorkflowReport:
         """
         Run complete production workflow.
@@ -133,11 +236,13 @@ class WeeklyWorkflowOrchestrator:
             detect_edges: Run edge detection
             check_results: Check results from previous week
             track_clv: Calculate CLV metrics
+            use_cache: Reuse cached outputs of stages whose inputs are unchanged
 
         Returns:
             Complete workflow report
         """
         self.start_time = datetime.now()
+        self.results = []
 
         # Auto-detect week if not provided
         if week is None:
@@ -148,86 +253,212 @@ class WeeklyWorkflowOrchestrator:
         logger.info(f"WEEKLY WORKFLOW - {self.league.upper()} Week {week}")
         logger.info("=" * 80)
 
-        # Stage 1: Data Collection
-        if collect_data:
-            await self._run_stage(WorkflowStage.DATA_COLLECTION, self._collect_data)
+        enabled = {
+            WorkflowStage.DATA_COLLECTION: collect_data,
+            WorkflowStage.EDGE_DETECTION: detect_edges,
+            WorkflowStage.RESULTS_CHECKING: check_results,  # Previous week
+            WorkflowStage.CLV_TRACKING: track_clv,
+            WorkflowStage.SHARP_MONEY: True,
+            WorkflowStage.DYNAMIC_ADJUSTMENTS: True,
+            WorkflowStage.REPORTING: True,
+        }
+        handlers = {
+            stage: handler
+            for stage, handler in self._stage_handlers().items()
+            if enabled[stage]
+        }
+        await self._run_dag(handlers, use_cache=use_cache)
+
+        # Compile final report
+        return self._compile_final_report()
 
-        # Stage 2: Edge Detection
-        if detect_edges:
-            await self._run_stage(WorkflowStage.EDGE_DETECTION, self._detect_edges)
+    def _stage_handlers(self) -> Dict[WorkflowStage, Callable[[], Awaitable[Dict]]]:
+        return {
+            WorkflowStage.DATA_COLLECTION: self._collect_data,
+            WorkflowStage.EDGE_DETECTION: self._detect_edges,
+            WorkflowStage.RESULTS_CHECKING: self._check_results,
+            WorkflowStage.CLV_TRACKING: self._track_clv,
+            WorkflowStage.SHARP_MONEY: self._integrate_sharp_money,
+            WorkflowStage.DYNAMIC_ADJUSTMENTS: self._apply_dynamic_adjustments,
+            WorkflowStage.REPORTING: self._generate_report,
+        }
 
-        # Stage 3: Results Checking (from previous week)
-        if check_results:
-            await self._run_stage(WorkflowStage.RESULTS_CHECKING, self._check_results)
+    async def _run_dag(
+        self,
+        handlers: Dict[WorkflowStage, Callable[[], Awaitable[Dict]]],
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Run the enabled stages, each once its enabled dependencies finish.
 
-        # Stage 4: CLV Tracking
-        if track_clv:
-            await self._run_stage(WorkflowStage.CLV_TRACKING, self._track_clv)
+        Args:
+            handlers: Enabled stages and their handlers
+            use_cache: Reuse cached outputs of stages whose inputs are unchanged
+        """
+        cache = self._load_cache() if use_cache else {}
+        tasks: Dict[WorkflowStage, asyncio.Task] = {}
 
-        # Stage 5: Sharp Money Integration
-        await self._run_stage(WorkflowStage.SHARP_MONEY, self._integrate_sharp_money)
+        async def run(stage: WorkflowStage) -> StageResult:
+            deps = [d for d in STAGE_DEPENDENCIES[stage] if d in handlers]
+            dep_results = await asyncio.gather(*(tasks[d] for d in deps))
 
-        # Stage 6: Dynamic Adjustments
-        await self._run_stage(
-            WorkflowStage.DYNAMIC_ADJUSTMENTS, self._apply_dynamic_adjustments
-        )
+            fingerprint = None
+            if stage not in UNCACHED_STAGES and all(r.success for r in dep_results):
+                fingerprint = self._fingerprint(stage, dep_results)
+                hit = cache.get(stage.value)
+                if hit and hit.get("fingerprint") == fingerprint:
+                    return self._cached_result(stage, hit)
 
-        # Stage 7: Reporting
-        await self._run_stage(WorkflowStage.REPORTING, self._generate_report)
+            return await self._run_stage(stage, handlers[stage], fingerprint)
 
-        # Compile final report
-        return self._compile_final_report()
+        # STAGE_DEPENDENCIES is in execution order, so every dependency's
+        # task exists before a dependent awaits it
+        for stage in STAGE_DEPENDENCIES:
+            if stage in handlers:
+                tasks[stage] = asyncio.create_task(run(stage))
+        await asyncio.gather(*tasks.values())
 
-    async def _run_stage(self, stage: WorkflowStage, handler) -> Tuple[bool, str]:
+        if use_cache:
+            self._save_cache(cache)
+
+    async def _run_stage(
+        self,
+        stage: WorkflowStage,
+        handler: Callable[[], Awaitable[Dict]],
+        fingerprint: Optional[str] = None,
+    ) -> StageResult:
         """
         Run a single workflow stage with error handling.
 
         Args:
             stage: The stage to run
             handler: Async function that runs the stage
+            fingerprint: Cache fingerprint of the stage's inputs, if cacheable
 
         Returns:
-            Tuple of (success, message)
+            StageResult (also appended to self.results)
         """
         start = datetime.now()
+        started_at = (start - self.start_time).total_seconds()
         logger.info(f"\n[STAGE] Running: {stage.value.upper()}...")
 
         try:
             result = await handler()
             duration = (datetime.now() - start).total_seconds()
 
-            self.results.append(
-                StageResult(
-                    stage=stage,
-                    success=True,
-                    message=result.get("message", "Completed"),
-                    duration_seconds=duration,
-                    data=result.get("data"),
-                )
+            stage_result = StageResult(
+                stage=stage,
+                success=True,
+                message=result.get("message", "Completed"),
+                duration_seconds=duration,
+                data=result.get("data"),
+                started_at=started_at,
+                fingerprint=fingerprint,
             )
 
             logger.info(
                 f"[OK] {stage.value.upper()}: {result.get('message', 'Completed')} "
                 f"({duration:.1f}s)"
             )
-            return True, result.get("message", "")
 
         except Exception as e:
             duration = (datetime.now() - start).total_seconds()
             error_msg = f"Stage failed: {str(e)}"
 
-            self.results.append(
-                StageResult(
-                    stage=stage,
-                    success=False,
-                    message=error_msg,
-                    duration_seconds=duration,
-                    errors=[str(e)],
-                )
+            stage_result = StageResult(
+                stage=stage,
+                success=False,
+                message=error_msg,
+                duration_seconds=duration,
+                errors=[str(e)],
+                started_at=started_at,
             )
 
             logger.error(f"[ERROR] {stage.value.upper()} FAILED: {str(e)}")
-            return False, error_msg
+
+        self.results.append(stage_result)
+        return stage_result
+
+    # =========================================================================
+    # STAGE CACHE
+    # =========================================================================
+
+    def _cache_file(self) -> Path:
+        return self.cache_dir / f"{self.league}_week_{self.current_week}.json"
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        cache_file = self._cache_file()
+        if not cache_file.exists():
+            return {}
+        try:
+            with open(cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable stage cache {cache_file}: {e}")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        for result in self.results:
+            if result.success and result.fingerprint and not result.cached:
+                cache[result.stage.value] = {
+                    "fingerprint": result.fingerprint,
+                    "message": result.message,
+                    "data": result.data,
+                    "duration_seconds": result.duration_seconds,
+                    "cached_at": datetime.now().isoformat(),
+                }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_file(), "w") as f:
+                json.dump(cache, f, indent=2, default=str)
+        except OSError as e:
+            logger.warning(f"Could not save stage cache: {e}")
+
+    def _input_files(self, stage: WorkflowStage) -> List[Path]:
+        files = set()
+        for pattern in STAGE_INPUTS.get(stage, ()):
+            pattern = pattern.format(league=self.league, week=self.current_week)
+            files.update(p for p in self.project_root.glob(pattern) if p.is_file())
+        return sorted(files)
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _fingerprint(self, stage: WorkflowStage, dep_results: List[StageResult]) -> str:
+        """Hash of everything a stage's output depends on"""
+        payload = {
+            "stage": stage.value,
+            "league": self.league,
+            "week": self.current_week,
+            "inputs": {
+                str(path.relative_to(self.project_root)): self._hash_file(path)
+                for path in self._input_files(stage)
+            },
+            "dependencies": {r.stage.value: r.data for r in dep_results},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _cached_result(self, stage: WorkflowStage, hit: Dict[str, Any]) -> StageResult:
+        started_at = (datetime.now() - self.start_time).total_seconds()
+        result = StageResult(
+            stage=stage,
+            success=True,
+            message=hit.get("message", "Completed"),
+            duration_seconds=0.0,
+            data=hit.get("data"),
+            started_at=started_at,
+            cached=True,
+            fingerprint=hit["fingerprint"],
+        )
+        logger.info(f"[CACHED] {stage.value.upper()}: {result.message}")
+        self.results.append(result)
+        return result
 
     async def _collect_data(self) -> Dict:
         """Stage 1: Collect data from all sources."""
@@ -258,8 +489,13 @@ class WeeklyWorkflowOrchestrator:
         """Stage 3: Check results from previous week."""
         logger.info("Checking results from previous week...")
         prev_week = self.current_week - 1
-        # Check results using BettingResultsChecker
-        results = self.results_checker.fetch_scores(league=self.league, week=prev_week)
+        # Check results using BettingResultsChecker (blocking HTTP, so run it
+        # in a thread to let concurrent stages proceed)
+        if self.league == "nfl":
+            fetch = self.results_checker.fetch_nfl_scores
+        else:
+            fetch = self.results_checker.fetch_ncaaf_scores
+        results = await asyncio.to_thread(fetch, prev_week)
         return {
             "message": f"Checked results for {len(results) if results else 0} games",
             "data": {
@@ -318,6 +554,9 @@ class WeeklyWorkflowOrchestrator:
     def _compile_final_report(self) -> WorkflowReport:
         """Compile final workflow report."""
         total_duration = (datetime.now() - self.start_time).total_seconds()
+        order = list(STAGE_DEPENDENCIES)
+        self.results.sort(key=lambda r: order.index(r.stage))
+        path, path_seconds = critical_path(self.results)
         success_count = sum(1 for r in self.results if r.success)
         failed_count = sum(1 for r in self.results if not r.success)
 
@@ -353,6 +592,8 @@ class WeeklyWorkflowOrchestrator:
             results_checked=results_checked,
             clv_tracked=clv_tracked,
             execution_status=status,
+            critical_path=[stage.value for stage in path],
+            critical_path_seconds=path_seconds,
         )
 
         self._print_final_report(report)
@@ -373,10 +614,21 @@ class WeeklyWorkflowOrchestrator:
 
         logger.info("\nStage Results:")
         for result in report.stages:
-            status_icon = "[OK]" if result.success else "[ERROR]"
+            if result.cached:
+                status_icon = "[CACHED]"
+            else:
+                status_icon = "[OK]" if result.success else "[ERROR]"
             logger.info(
                 f"  {status_icon} {result.stage.value.upper()}: "
-                f"{result.message} ({result.duration_seconds:.1f}s)"
+                f"{result.message} ({result.duration_seconds:.1f}s, "
+                f"started +{result.started_at:.1f}s)"
+            )
+
+        if report.critical_path:
+            logger.info(
+                f"\nCritical Path ({report.critical_path_seconds:.1f}s of "
+                f"{report.total_duration:.1f}s): "
+                + " -> ".join(s.upper() for s in report.critical_path)
             )
 
         logger.info("=" * 80 + "\n")
@@ -433,6 +685,11 @@ async def main():
         action="store_true",
         help="Verbose output",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rerun every stage instead of reusing cached outputs",
+    )
 
     args = parser.parse_args()
 
@@ -468,6 +725,7 @@ async def main():
         detect_edges=stages["detect_edges"],
         check_results=stages["check_results"],
         track_clv=stages["track_clv"],
+        use_cache=not args.no_cache,
     )
 
     # Save report if requested
@@ -0,0 +1,147 @@
+"""
+Tests for the Action Network odds change log
+(src/scrapers/action_network/change_log.py).
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from scrapers.action_network.change_log import OddsChangeLog
+from scrapers.action_network.scraper import ActionNetworkScraper
+
+
+def game(game_id, home_spread, tickets=50):
+    return {
+        "game_id": game_id,
+        "away_team": f"Away {game_id}",
+        "home_team": f"Home {game_id}",
+        "week": 12,
+        "spread": {
+            "home": {"value": home_spread, "odds": -110, "tickets_pct": tickets},
+            "away": {"value": -home_spread, "odds": -110, "tickets_pct": 100 - tickets},
+        },
+        "sharp_side": None,
+    }
+
+
+T1 = datetime(2025, 11, 20, 12, 0)
+T2 = datetime(2025, 11, 20, 16, 0)
+T3 = datetime(2025, 11, 20, 20, 0)
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = OddsChangeLog(tmp_path)
+    log.record("nfl", [game(1, -3.0), game(2, 7.0)], scraped_at=T1)
+    return log
+
+
+def log_lines(log):
+    return log.log_path("nfl").read_text().splitlines()
+
+
+def test_unchanged_poll_appends_nothing(log):
+    assert log.record("nfl", [game(2, 7.0), game(1, -3.0)], scraped_at=T2) == []
+    assert len(log_lines(log)) == 2
+
+
+def test_only_changed_games_are_appended(log):
+    entries = log.record(
+        "nfl", [game(1, -3.5), game(2, 7.0, tickets=60)], scraped_at=T2
+    )
+    assert [(e["game_id"], e["op"]) for e in entries] == [
+        ("1", "upsert"),
+        ("2", "upsert"),
+    ]
+
+    entries = log.record(
+        "nfl", [game(1, -3.5), game(2, 7.0, tickets=60)], scraped_at=T3
+    )
+    assert entries == []
+    assert len(log_lines(log)) == 4
+
+
+def test_dropped_game_is_removed_from_board(log):
+    entries = log.record("nfl", [game(1, -3.0)], scraped_at=T2)
+    assert entries == [
+        {"ts": T2.isoformat(), "league": "nfl", "op": "remove", "game_id": "2"}
+    ]
+    board = log.board("nfl")
+    assert [g["game_id"] for g in board["games"]] == [1]
+    assert board["game_count"] == 1
+
+
+def test_board_rebuilds_latest_and_point_in_time(log):
+    log.record("nfl", [game(1, -3.5), game(2, 7.0)], scraped_at=T2)
+
+    board = log.board("nfl")
+    assert board["source"] == "action_network"
+    assert board["week"] == 12
+    assert board["scraped_at"] == T2.isoformat()
+    assert board["games"] == [game(1, -3.5), game(2, 7.0)]
+
+    earlier = log.board("nfl", as_of=T1)
+    assert earlier["games"] == [game(1, -3.0), game(2, 7.0)]
+
+
+def test_history_lists_each_version(log):
+    log.record("nfl", [game(1, -3.5), game(2, 7.0)], scraped_at=T2)
+    history = log.history("nfl", 1)
+    assert [(h["ts"], h["spread"]["home"]["value"]) for h in history] == [
+        (T1.isoformat(), -3.0),
+        (T2.isoformat(), -3.5),
+    ]
+
+
+def test_resume_uses_index_and_replays_tail(log, tmp_path):
+    # Simulate a crash after appending to the log but before the index write
+    tail = {
+        "ts": T2.isoformat(),
+        "league": "nfl",
+        "op": "upsert",
+        "game_id": "1",
+        "hash": OddsChangeLog.game_hash(game(1, -3.5)),
+        "game": game(1, -3.5),
+    }
+    with open(log.log_path("nfl"), "a") as f:
+        f.write(json.dumps(tail) + "\n")
+
+    resumed = OddsChangeLog(tmp_path)
+    assert resumed.record("nfl", [game(1, -3.5), game(2, 7.0)], scraped_at=T3) == []
+
+    index = json.loads((tmp_path / ".nfl_changes_index.json").read_text())
+    assert index["offset"] == log.log_path("nfl").stat().st_size
+    assert set(index["hashes"]) == {"1", "2"}
+
+
+def test_leagues_are_independent(log):
+    assert log.board("ncaaf")["games"] == []
+    entries = log.record("ncaaf", [game(1, -3.0)], scraped_at=T2)
+    assert len(entries) == 1
+    assert log.board("nfl")["game_count"] == 2
+
+
+def test_board_carries_sharp_plays_and_thresholds(log, tmp_path):
+    thresholds = ActionNetworkScraper.DIVERGENCE_THRESHOLDS["nfl"]
+    sharp = [{"game_id": 1, "divergence": 12, "signal_strength": "strong"}]
+    fields = {"sharp_plays": sharp, "divergence_thresholds": thresholds}
+    games = [game(1, -3.0, tickets=30), game(2, 7.0)]
+
+    entries = log.record("nfl", games, scraped_at=T2, board_fields=fields)
+    assert [e["op"] for e in entries] == ["upsert", "board"]
+    # Unchanged fields are not logged again, even after a restart
+    resumed = OddsChangeLog(tmp_path)
+    assert resumed.record("nfl", games, scraped_at=T3, board_fields=fields) == []
+    resumed.record("nfl", games[:1], scraped_at=T3, board_fields=fields)
+
+    board = resumed.board("nfl")
+    scraper = ActionNetworkScraper(data_dir=tmp_path / "scraper")
+    assert list(board) == list(scraper.build_output([], "nfl"))
+    assert board["sharp_plays"] == sharp
+    assert board["divergence_thresholds"] == thresholds
+    assert board["game_count"] == 1
+
+    assert "sharp_plays" not in resumed.board("nfl", as_of=T1)
+    assert resumed.history("nfl", 1)[-1]["ts"] == T2.isoformat()
@@ -0,0 +1,109 @@
+"""
+Tests for the vectorized Monte Carlo bankroll simulator
+(src/walters_analyzer/core/simulation.py).
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from walters_analyzer.core import BankrollManager, BankrollSimulator, SimBet
+
+
+def slate(week=0):
+    return [
+        SimBet(0.56, -110, round=week, game_id="KC@BUF"),
+        SimBet(0.55, -110, round=week, game_id="KC@BUF"),  # Same-game total
+        SimBet(0.54, -105, round=week, game_id="DET@GB"),
+        SimBet(0.40, 180, round=week, game_id="SF@SEA"),
+    ]
+
+
+def test_single_bet_matches_analytic_distribution():
+    manager = BankrollManager(initial_bankroll=1000.0, max_risk_pct=5.0)
+    simulator = BankrollSimulator(manager, n_paths=200_000, seed=7)
+    result = simulator.simulate([SimBet(0.6, 100)])
+
+    stake = manager.recommend_pct(0.6, 100) / 100.0
+    wins = np.isclose(result.final_bankroll, 1000.0 * (1 + stake))
+    losses = np.isclose(result.final_bankroll, 1000.0 * (1 - stake))
+    assert wins.mean() == pytest.approx(0.6, abs=0.005)
+    assert (wins | losses).all()
+    assert result.max_drawdown.max() == pytest.approx(stake)
+
+
+def test_push_probability_returns_stake():
+    manager = BankrollManager(initial_bankroll=1000.0)
+    result = manager.simulate(
+        [SimBet(0.56, -110, push_probability=0.1)], n_paths=100_000, seed=1
+    )
+    pushes = np.isclose(result.final_bankroll, 1000.0)
+    assert pushes.mean() == pytest.approx(0.1, abs=0.005)
+
+
+@pytest.mark.parametrize("rho", [0.0, 0.6])
+def test_same_game_bets_are_correlated(rho):
+    manager = BankrollManager()
+    simulator = BankrollSimulator(
+        manager, n_paths=100_000, same_game_correlation=rho, seed=3
+    )
+    bets = slate()[:2]
+    outcomes = simulator._outcomes(np.random.default_rng(3), bets) > 0
+
+    # Marginal win rates are preserved whatever the correlation
+    assert outcomes[:, 0].mean() == pytest.approx(0.56, abs=0.005)
+    assert outcomes[:, 1].mean() == pytest.approx(0.55, abs=0.005)
+
+    observed = np.corrcoef(outcomes[:, 0], outcomes[:, 1])[0, 1]
+    if rho:
+        assert observed > 0.3
+    else:
+        assert abs(observed) < 0.02
+
+
+def test_season_summary_and_settings_comparison():
+    manager = BankrollManager(initial_bankroll=10_000.0)
+    season = [bet for week in range(17) for bet in slate(week)]
+    simulator = BankrollSimulator(manager, n_paths=100_000, seed=11)
+
+    start = time.perf_counter()
+    quarter, half, full = simulator.compare(
+        season,
+        [
+            {"fractional_kelly": 0.25},
+            {"fractional_kelly": 0.5},
+            {"fractional_kelly": 1.0, "max_risk_pct": 10.0},
+        ],
+    )
+    assert time.perf_counter() - start < 10.0
+
+    summary = half.summary()
+    assert summary["paths"] == 100_000
+    assert summary["rounds"] == 17
+    assert summary["settings"]["fractional_kelly"] == 0.5
+    assert set(summary["max_drawdown_pct"]) == {
+        "p5",
+        "p25",
+        "p50",
+        "p75",
+        "p95",
+        "mean",
+    }
+    assert summary["growth_rate"]["p5"] < summary["growth_rate"]["p95"]
+
+    # Same outcomes, bigger stakes: wider spread and deeper drawdowns
+    assert np.std(full.final_bankroll) > np.std(quarter.final_bankroll)
+    assert full.max_drawdown.mean() > quarter.max_drawdown.mean()
+    assert full.risk_of_ruin >= quarter.risk_of_ruin
+
+
+def test_repeat_replays_the_slate():
+    manager = BankrollManager()
+    result = manager.simulate(slate(), n_paths=1000, repeat=4, seed=5)
+    assert result.rounds == 4
+
+
+def test_invalid_correlation_rejected():
+    with pytest.raises(ValueError):
+        BankrollSimulator(BankrollManager(), same_game_correlation=1.0)
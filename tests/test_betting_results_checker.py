@@ -11,6 +11,8 @@ from walters_analyzer.performance.results_checker import (
     GameScore,
     Prediction,
     GameResult,
+    ScoreIndex,
+    _team_aliases,
 )
 
 
@@ -470,5 +472,124 @@ class TestBettingResultsChecker:
         assert result.profit_loss > 0
 
 
+def make_score(away, home, week_date="2025-11-23T18:00Z", **kwargs):
+    return GameScore(
+        game_id=f"{away}_{home}",
+        matchup=f"{away} @ {home}",
+        away_team=away,
+        home_team=home,
+        away_score=20,
+        home_score=17,
+        status="Final",
+        game_time=week_date,
+        **kwargs,
+    )
+
+
+def make_prediction(away, home, week=12, game_time=""):
+    return Prediction(
+        game_id="",
+        matchup=f"{away} @ {home}",
+        week=week,
+        away_team=away,
+        home_team=home,
+        predicted_spread=0.0,
+        market_spread=-3.0,
+        market_total=45.5,
+        recommended_bet="away",
+        kelly_fraction=0.02,
+        confidence_score=60.0,
+        timestamp="",
+        game_time=game_time,
+    )
+
+
+class TestScoreIndex:
+    """Test canonical score matching"""
+
+    def test_nfl_aliases_match(self):
+        index = ScoreIndex("nfl")
+        score = make_score("Kansas City Chiefs", "Buffalo Bills")
+        index.add([score])
+
+        for away, home in [
+            ("Kansas City", "Buffalo"),
+            ("Chiefs", "Bills"),
+            ("KC", "BUF"),
+            ("Kansas City Chiefs", "Buffalo Bills"),
+        ]:
+            assert index.match(make_prediction(away, home)) is score
+        assert index.match(make_prediction("Buffalo", "Kansas City")) is None
+
+    def test_ncaaf_miami_is_not_ambiguous(self):
+        # Names and aliases as ESPN's scoreboard reports them
+        miami_fl_team = {
+            "displayName": "Miami Hurricanes",
+            "location": "Miami",
+            "shortDisplayName": "Miami",
+            "abbreviation": "MIA",
+        }
+        miami_oh_team = {
+            "displayName": "Miami (OH) RedHawks",
+            "location": "Miami (OH)",
+            "shortDisplayName": "Miami (OH)",
+            "abbreviation": "M-OH",
+        }
+        duke = ["Duke", "DUKE"]
+
+        index = ScoreIndex("ncaaf")
+        miami_fl = make_score(
+            "Miami Hurricanes",
+            "Duke Blue Devils",
+            away_aliases=_team_aliases(miami_fl_team),
+            home_aliases=duke,
+        )
+        miami_oh = make_score(
+            "Miami (OH) RedHawks",
+            "Duke Blue Devils",
+            "2025-09-06T18:00Z",
+            away_aliases=_team_aliases(miami_oh_team),
+            home_aliases=duke,
+        )
+        index.add([miami_oh, miami_fl])
+
+        # Team names as the NCAAF edge detector writes them (Overtime.ag)
+        assert index.match(make_prediction("Miami Florida", "Duke")) is miami_fl
+        assert index.match(make_prediction("Miami Ohio", "Duke")) is miami_oh
+        # Massey names
+        assert index.match(make_prediction("Miami FL", "Duke")) is miami_fl
+        assert index.match(make_prediction("Miami OH", "Duke")) is miami_oh
+        assert index.match(make_prediction("Ohio State", "Duke")) is None
+
+    def test_rematch_picks_week_then_date(self):
+        index = ScoreIndex("nfl")
+        week_5 = make_score("Dallas Cowboys", "New York Giants", "2025-10-05T17:00Z")
+        week_14 = make_score("Dallas Cowboys", "New York Giants", "2025-12-07T18:00Z")
+        index.add([week_5], week=5)
+        index.add([week_14], week=14)
+        assert len(index) == 2
+
+        assert index.match(make_prediction("Dallas", "NY Giants", week=5)) is week_5
+        assert index.match(make_prediction("Dallas", "NY Giants", week=14)) is week_14
+        late = make_prediction("Dallas", "NY Giants", 0, "2025-12-07T13:00:00")
+        assert index.match(late) is week_14
+
+    def test_match_predictions_batch(self):
+        checker = BettingResultsChecker()
+        try:
+            score = make_score("Detroit Lions", "Green Bay Packers")
+            checker.score_indexes["nfl"] = ScoreIndex("nfl")
+            checker.score_indexes["nfl"].add([score])
+
+            preds = [
+                make_prediction("Detroit", "Green Bay"),
+                make_prediction("Chicago", "Minnesota"),
+            ]
+            matched = checker.match_predictions(preds, "nfl")
+            assert [s for _, s in matched] == [score, None]
+        finally:
+            checker.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
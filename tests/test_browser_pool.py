@@ -0,0 +1,194 @@
+"""
+Tests for the shared Playwright browser pool (src/scrapers/browser_pool.py).
+
+Playwright is replaced with small fakes, so no browser binary is needed.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from scrapers import browser_pool
+from scrapers.browser_pool import BrowserPool, ContextProfile
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.url = "about:blank"
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.pages = []
+        self.init_scripts = []
+        self.route_handler = None
+        self.closed = False
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def storage_state(self, path):
+        with open(path, "w") as f:
+            json.dump({"cookies": [{"name": "cf_clearance", "value": "ok"}]}, f)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    launches = 0
+
+    def __init__(self):
+        self.browser = FakeBrowser()
+        self.chromium = SimpleNamespace(launch=self.launch)
+
+    async def launch(self, **kwargs):
+        FakePlaywright.launches += 1
+        return self.browser
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_playwright(monkeypatch):
+    FakePlaywright.launches = 0
+    monkeypatch.setattr(browser_pool, "async_playwright", FakePlaywright)
+
+
+@pytest.mark.asyncio
+async def test_one_browser_with_isolated_contexts(tmp_path):
+    massey = ContextProfile("massey")
+    action = ContextProfile("action_network", locale="en-US", init_script="x=1")
+
+    async with BrowserPool(state_dir=tmp_path) as pool:
+        async with pool.page(massey) as page1:
+            pass
+        async with pool.page(massey) as page2:
+            pass
+        async with pool.page(action) as page3:
+            pass
+        browser = pool._browser
+
+    assert FakePlaywright.launches == 1
+    assert page1 is page2  # Released pages are reused
+    assert page3.context is not page1.context
+    assert page3.context.options["locale"] == "en-US"
+    assert page3.context.init_scripts == ["x=1"]
+    assert browser.closed and all(c.closed for c in browser.contexts)
+
+
+@pytest.mark.asyncio
+async def test_failed_lease_discards_page(tmp_path):
+    async with BrowserPool(state_dir=tmp_path) as pool:
+        with pytest.raises(RuntimeError):
+            async with pool.page() as page:
+                raise RuntimeError("scrape failed")
+        assert page.closed
+
+        async with pool.page() as fresh:
+            assert fresh is not page
+
+
+@pytest.mark.asyncio
+async def test_map_runs_in_parallel_bounded_by_max_pages(tmp_path):
+    in_flight = peak = 0
+
+    async def scrape(page, item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item * 2
+
+    async with BrowserPool(max_pages=3, state_dir=tmp_path) as pool:
+        results = await pool.map(scrape, range(10))
+        pages = pool._browser.contexts[0].pages
+
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 3
+    assert len(pages) == 3
+
+
+@pytest.mark.asyncio
+async def test_persisted_state_is_saved_and_reused(tmp_path):
+    profile = ContextProfile("action_network", persist_state=True)
+
+    async with BrowserPool(state_dir=tmp_path) as pool:
+        async with pool.page(profile) as page:
+            assert "storage_state" not in page.context.options
+    assert (tmp_path / "action_network.json").exists()
+
+    async with BrowserPool(state_dir=tmp_path) as pool:
+        async with pool.page(profile) as page:
+            options = page.context.options
+    assert options["storage_state"] == str(tmp_path / "action_network.json")
+
+
+@pytest.mark.parametrize(
+    "url, resource_type, blocked",
+    [
+        ("https://masseyratings.com/nfl/ratings", "document", False),
+        ("https://masseyratings.com/data.json", "xhr", False),
+        ("https://masseyratings.com/logo.png", "image", True),
+        ("https://fonts.example.com/a.woff2", "font", True),
+        ("https://www.googletagmanager.com/gtm.js", "script", True),
+    ],
+)
+@pytest.mark.asyncio
+async def test_route_blocks_heavy_and_tracking_requests(url, resource_type, blocked):
+    calls = []
+
+    async def abort():
+        calls.append("abort")
+
+    async def continue_():
+        calls.append("continue")
+
+    route = SimpleNamespace(
+        request=SimpleNamespace(url=url, resource_type=resource_type),
+        abort=abort,
+        continue_=continue_,
+    )
+    await browser_pool._route_request(route)
+    assert calls == ["abort" if blocked else "continue"]
@@ -0,0 +1,141 @@
+"""
+Cold-start budget for light CLI commands.
+
+Each command runs in a fresh interpreter under ``python -X importtime``; the
+test fails if the cumulative import time goes over budget or if a heavy
+dependency (ML, browser automation, LLM SDKs, dataframes) gets imported.
+"""
+
+import os
+import pathlib
+import re
+import subprocess
+import sys
+import tomllib
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+# Measured ~150-250ms for these commands; the headroom absorbs slow CI boxes
+IMPORT_BUDGET_MS = 1000
+
+HEAVY_MODULES = {
+    "torch",
+    "xgboost",
+    "sklearn",
+    "pandas",
+    "numpy",
+    "playwright",
+    "anthropic",
+    "openai",
+    "networkx",
+    "bs4",
+}
+
+LIGHT_COMMANDS = [
+    ("walters", ["--help"]),
+    ("walters", ["version"]),
+    ("walters", ["clv", "--help"]),
+    ("walters", ["analyze", "edges", "--help"]),
+    ("walters-analyzer", ["--help"]),
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def entry_points():
+    pyproject = tomllib.loads((ROOT / "pyproject.toml").read_text())
+    return pyproject["project"]["scripts"]
+
+
+def run_with_importtime(script, args, logs_dir):
+    """Run a console script in a new interpreter; returns (total_ms, modules)"""
+    module, func = entry_points()[script].split(":")
+    code = (
+        "import sys\n"
+        f"sys.argv = [{script!r}, *{args!r}]\n"
+        f"from {module} import {func}\n"
+        f"{func}()\n"
+    )
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]),
+        LOGS_DIR=str(logs_dir),  # The legacy CLI opens a log file at startup
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = match.groups()
+        modules.add(name.split(".")[0])
+        if not indent:  # Top-level imports; nested ones are in their cumulative
+            total_us += int(cumulative)
+    return total_us / 1000, modules
+
+
+@pytest.mark.parametrize("script,args", LIGHT_COMMANDS)
+def test_light_command_cold_start(script, args, tmp_path):
+    total_ms, modules = run_with_importtime(script, args, tmp_path)
+
+    assert not modules & HEAVY_MODULES, (
+        f"{script} {' '.join(args)} imported {sorted(modules & HEAVY_MODULES)}"
+    )
+    assert total_ms < IMPORT_BUDGET_MS, (
+        f"{script} {' '.join(args)} spent {total_ms:.0f}ms importing "
+        f"(budget {IMPORT_BUDGET_MS}ms)"
+    )
+
+
+def loaded_command_modules(args):
+    """`.cli.commands.` modules imported after running `walters *args`"""
+    code = (
+        "import sys\n"
+        f"sys.argv = ['walters', *{args!r}]\n"
+        "from walters_analyzer.cli.main import app\n"
+        "try:\n"
+        "    app() if len(sys.argv) > 1 else None\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in sys.modules if '.cli.commands.' in m))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=str(ROOT / "src")),
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_command_groups_load_on_demand():
+    from walters_analyzer.cli.main import COMMAND_GROUPS, app
+
+    assert loaded_command_modules([]) == "[]"
+    # Help lists every group from COMMAND_GROUPS without importing any
+    assert loaded_command_modules(["--help"]) == "[]"
+    # Only the invoked group is imported
+    assert loaded_command_modules(["clv", "--help"]) == (
+        "['walters_analyzer.cli.commands.clv']"
+    )
+
+    import typer.main
+
+    group = typer.main.get_command(app)
+    for name, (_, help_text) in COMMAND_GROUPS.items():
+        command = group.get_command(None, name)
+        assert command.name == name and command.help == help_text
@@ -0,0 +1,174 @@
+"""
+Tests for the CLVStorage snapshot + change-log engine.
+
+Covers O(1) appends, compaction, indexed week/outcome queries, migration
+from existing bets.json / bets_history.csv files, and picking up changes
+written by another CLVStorage instance.
+"""
+
+import json
+
+import pytest
+
+from walters_analyzer.models import CLVTracking
+from walters_analyzer.utils import CLVStorage
+from walters_analyzer.utils import clv_storage as clv_storage_module
+
+
+def make_bet(i: int, week: int = 12, season: int = 2025) -> CLVTracking:
+    return CLVTracking(
+        recommendation_id=f"rec_{i:03d}",
+        game_id=f"NFL_{season}_W{week}_AWAY{i}_HOME{i}",
+        opening_line=float(i % 7),
+        bet_side="away",
+        bet_type="spread",
+        edge_percentage=6.0,
+        bankroll=20000.0,
+        stake_fraction=0.02,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return CLVStorage(str(tmp_path))
+
+
+def log_lines(storage: CLVStorage) -> list:
+    if not storage.bets_log.exists():
+        return []
+    return [line for line in storage.bets_log.read_text().splitlines() if line]
+
+
+class TestChangeLog:
+    """Writes append to the log instead of rewriting bets.json."""
+
+    def test_save_appends_log_record(self, storage):
+        storage.save_bet(make_bet(1))
+        snapshot_before = storage.bets_json.read_text()
+
+        storage.save_bet(make_bet(2))
+
+        assert storage.bets_json.read_text() == snapshot_before
+        records = [json.loads(line) for line in log_lines(storage)]
+        assert [r["op"] for r in records] == ["put", "put"]
+        assert records[1]["bet"]["recommendation_id"] == "rec_002"
+
+    def test_delete_writes_tombstone(self, storage):
+        storage.save_bet(make_bet(1))
+        assert storage.delete_bet("rec_001")
+
+        assert json.loads(log_lines(storage)[-1]) == {
+            "op": "delete",
+            "recommendation_id": "rec_001",
+        }
+        assert CLVStorage(str(storage.data_dir)).list_all() == []
+
+    def test_compaction_bounds_log(self, storage, monkeypatch):
+        monkeypatch.setattr(clv_storage_module, "COMPACT_MIN_RECORDS", 5)
+
+        for i in range(12):
+            storage.save_bet(make_bet(i))
+        for _ in range(20):
+            storage.update_closing_line("rec_000", 4.5)
+
+        assert len(log_lines(storage)) <= max(5, 12)
+        reopened = CLVStorage(str(storage.data_dir))
+        assert len(reopened.list_all()) == 12
+        assert reopened.load_bet("rec_000").closing_line == 4.5
+
+    def test_explicit_compact(self, storage):
+        storage.save_bet(make_bet(1))
+        storage.save_bet(make_bet(2))
+        storage.compact()
+
+        assert log_lines(storage) == []
+        snapshot = json.loads(storage.bets_json.read_text())
+        assert list(snapshot) == ["rec_001", "rec_002"]
+
+
+class TestIndexes:
+    """Week and outcome queries come from indexes, in saved order."""
+
+    def test_list_by_week(self, storage):
+        for i, week in enumerate([12, 13, 12, 11, 12]):
+            storage.save_bet(make_bet(i, week=week))
+
+        week12 = storage.list_by_week(12, 2025)
+        assert [b.recommendation_id for b in week12] == [
+            "rec_000",
+            "rec_002",
+            "rec_004",
+        ]
+        assert storage.list_by_week(1, 2025) == []
+        assert storage.list_by_week(12, 2024) == []
+
+    def test_list_pending_tracks_outcome_changes(self, storage):
+        for i in range(4):
+            storage.save_bet(make_bet(i))
+
+        storage.update_closing_line("rec_001", 2.0)
+        storage.update_result("rec_001", 2.0, did_bet_win=True)
+
+        pending = storage.list_pending()
+        assert [b.recommendation_id for b in pending] == [
+            "rec_000",
+            "rec_002",
+            "rec_003",
+        ]
+
+    def test_update_keeps_original_position(self, storage):
+        for i in range(3):
+            storage.save_bet(make_bet(i))
+        storage.update_closing_line("rec_000", 5.0)
+
+        ids = [b.recommendation_id for b in storage.list_all()]
+        assert ids == ["rec_000", "rec_001", "rec_002"]
+
+
+class TestMigrationAndSync:
+    """Existing files are read as-is; other writers are picked up."""
+
+    def test_existing_bets_json_is_snapshot(self, tmp_path):
+        legacy = {
+            b.recommendation_id: b.model_dump(mode="json")
+            for b in (make_bet(1), make_bet(2))
+        }
+        (tmp_path / "bets.json").write_text(json.dumps(legacy, indent=2))
+
+        storage = CLVStorage(str(tmp_path))
+        assert [b.recommendation_id for b in storage.list_all()] == [
+            "rec_001",
+            "rec_002",
+        ]
+        assert len(storage.list_by_week(12)) == 2
+
+    def test_rebuild_from_history_csv(self, tmp_path):
+        writer = CLVStorage(str(tmp_path))
+        writer.save_bet(make_bet(1))
+        writer.save_bet(make_bet(2))
+        writer.update_closing_line("rec_001", 6.0)
+        writer.delete_bet("rec_002")  # CSV is an audit trail; rows remain
+        writer.bets_json.unlink()
+        writer.bets_log.unlink()
+
+        restored = CLVStorage(str(tmp_path))
+        assert restored.load_bet("rec_001").closing_line == 6.0
+        assert restored.load_bet("rec_002") is not None
+        assert restored.bets_json.exists()
+
+    def test_second_instance_sees_appends_and_compaction(self, tmp_path):
+        first = CLVStorage(str(tmp_path))
+        second = CLVStorage(str(tmp_path))
+
+        first.save_bet(make_bet(1))
+        assert second.load_bet("rec_001") is not None
+
+        second.update_closing_line("rec_001", 3.0)
+        assert first.load_bet("rec_001").closing_line == 3.0
+
+        first.compact()
+        first.save_bet(make_bet(2))
+        assert [b.recommendation_id for b in second.list_all()] == [
+            "rec_001",
+            "rec_002",
+        ]
@@ -0,0 +1,109 @@
+"""
+Tests for pooled mode in src/db/connection.py.
+
+Pooled mode must keep the execute_query/execute_many API and semantics of
+the default connection-per-query mode while reusing per-thread connections.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.db.connection import DatabaseConnection
+
+
+CREATE_SQL = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)"
+
+
+@pytest.fixture(params=[False, True], ids=["per_query", "pooled"])
+def db(request, tmp_path):
+    db = DatabaseConnection(db_path=tmp_path / "walters.db", pooled=request.param)
+    db.execute_query(CREATE_SQL, fetch=False)
+    yield db
+    db.close()
+
+
+class TestConnectionModes:
+    """Behaviour shared by both connection modes."""
+
+    def test_execute_query_roundtrip(self, db):
+        db.execute_query("INSERT INTO items VALUES (?, ?)", (1, "Chiefs"), fetch=False)
+        rows = db.execute_query("SELECT * FROM items WHERE id = ?", (1,))
+        assert rows[0]["name"] == "Chiefs"
+
+    def test_execute_many(self, db):
+        db.execute_many("INSERT INTO items VALUES (?, ?)", [(1, "Bills"), (2, "Jets")])
+        rows = db.execute_query("SELECT COUNT(*) AS n FROM items")
+        assert rows[0]["n"] == 2
+
+    def test_uncommitted_cursor_work_is_discarded(self, db):
+        with db.get_cursor() as cursor:
+            cursor.execute("INSERT INTO items VALUES (1, 'Lions')")
+        rows = db.execute_query("SELECT COUNT(*) AS n FROM items")
+        assert rows[0]["n"] == 0
+
+    def test_failed_write_rolls_back(self, db):
+        db.execute_query("INSERT INTO items VALUES (1, 'Bears')", fetch=False)
+        with pytest.raises(Exception):
+            db.execute_query("INSERT INTO items VALUES (1, 'Dupe')", fetch=False)
+        rows = db.execute_query("SELECT name FROM items")
+        assert [row["name"] for row in rows] == ["Bears"]
+
+
+class TestPooledMode:
+    """Pooled-only behaviour."""
+
+    @pytest.fixture
+    def pooled_db(self, tmp_path):
+        db = DatabaseConnection(
+            db_path=tmp_path / "walters.db",
+            pooled=True,
+            cache_size_kb=2048,
+            mmap_size=1024 * 1024,
+        )
+        yield db
+        db.close()
+
+    def test_connection_reused_within_thread(self, pooled_db):
+        assert pooled_db.get_connection() is pooled_db.get_connection()
+
+    def test_connection_per_thread(self, pooled_db):
+        main_conn = pooled_db.get_connection()
+        seen = []
+
+        def worker():
+            seen.append(pooled_db.get_connection())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen and seen[0] is not main_conn
+        assert len(pooled_db._pool) == 2
+
+    def test_pragmas_applied(self, pooled_db):
+        conn = pooled_db.get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -2048
+
+    def test_close_releases_connections(self, pooled_db):
+        first = pooled_db.get_connection()
+        pooled_db.close()
+        assert pooled_db._pool == []
+        assert pooled_db.get_connection() is not first
+
+    def test_caller_close_keeps_pooled_connection_usable(self, pooled_db):
+        pooled_db.execute_query(CREATE_SQL, fetch=False)
+        conn = pooled_db.get_connection()
+        conn.execute("INSERT INTO items VALUES (1, 'Packers')")
+        conn.close()  # Loader scripts written for per-query mode do this
+
+        # Uncommitted work is discarded, as closing a fresh connection would
+        assert pooled_db.get_connection() is conn
+        rows = pooled_db.execute_query("SELECT COUNT(*) AS n FROM items")
+        assert rows[0]["n"] == 0
+
+        pooled_db.close_all_connections()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
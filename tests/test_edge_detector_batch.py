@@ -0,0 +1,189 @@
+"""
+Tests for BillyWaltersEdgeDetector.detect_edges_batch.
+
+The vectorized path must produce the same edges as calling detect_edge
+game by game, and support threshold/HFA/bias sweeps on a DataFrame.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from walters_analyzer.valuation.billy_walters_edge_detector import (
+    BillyWaltersEdgeDetector,
+    PowerRating,
+    SharpAction,
+    SituationalFactor,
+    WeatherImpact,
+)
+
+TEAMS = [f"Team{i}" for i in range(16)]
+
+
+@pytest.fixture
+def detector(tmp_path):
+    detector = BillyWaltersEdgeDetector(output_dir=str(tmp_path))
+    rng = np.random.default_rng(7)
+    for team in TEAMS:
+        detector.power_ratings[team] = PowerRating(
+            team=team,
+            rating=float(rng.uniform(80, 100)),
+            offensive_rating=0.0,
+            defensive_rating=0.0,
+            home_field_advantage=float(rng.choice([1.5, 2.0, 2.5])),
+            source="massey",
+        )
+    return detector
+
+
+def make_slate(n_games: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    away = rng.choice(TEAMS, n_games)
+    home = [
+        TEAMS[(TEAMS.index(a) + 1 + i % 7) % len(TEAMS)] for i, a in enumerate(away)
+    ]
+    return pd.DataFrame(
+        {
+            "game_id": [f"G{i}" for i in range(n_games)],
+            "away_team": away,
+            "home_team": home,
+            "market_spread": rng.choice(np.arange(-14, 14.5, 0.5), n_games),
+            "market_total": rng.uniform(38, 54, n_games).round(1),
+            "week": 12,
+            "game_time": "2025-11-23T18:00:00",
+            "situational_adjustment": rng.choice([0.0, 0.0, 1.0, -2.5], n_games),
+            "weather_adjustment": rng.choice([0.0, -0.5, 1.0], n_games),
+            "weather_total_adjustment": rng.choice([0.0, -4.0], n_games),
+            "reverse_line_movement": rng.random(n_games) < 0.2,
+        }
+    )
+
+
+def scalar_edges(detector, slate):
+    edges = []
+    for row in slate.itertuples(index=False):
+        edge = detector.detect_edge(
+            game_id=row.game_id,
+            away_team=row.away_team,
+            home_team=row.home_team,
+            market_spread=float(row.market_spread),
+            market_total=float(row.market_total),
+            week=row.week,
+            game_time=row.game_time,
+            situational=SituationalFactor(
+                total_adjustment=float(row.situational_adjustment)
+            ),
+            weather=WeatherImpact(
+                spread_adjustment=float(row.weather_adjustment),
+                total_adjustment=float(row.weather_total_adjustment),
+            ),
+            sharp_action=SharpAction(
+                reverse_line_movement=bool(row.reverse_line_movement)
+            ),
+        )
+        if edge:
+            edges.append(edge)
+    return edges
+
+
+COMPARED_FIELDS = [
+    "game_id",
+    "edge_type",
+    "edge_strength",
+    "crosses_key_number",
+    "key_number_value",
+    "recommended_bet",
+]
+APPROX_FIELDS = [
+    "away_rating",
+    "home_rating",
+    "predicted_spread",
+    "edge_points",
+    "kelly_fraction",
+    "confidence_score",
+]
+
+
+class TestBatchMatchesScalar:
+    """detect_edges_batch agrees with detect_edge field by field."""
+
+    def test_same_edges(self, detector):
+        slate = make_slate(300)
+        expected = scalar_edges(detector, slate)
+        actual = detector.detect_edges_batch(slate)
+
+        assert expected, "slate should produce some edges"
+        assert [e.game_id for e in actual] == [e.game_id for e in expected]
+        for got, want in zip(actual, expected):
+            for field in COMPARED_FIELDS:
+                assert getattr(got, field) == getattr(want, field), field
+            for field in APPROX_FIELDS:
+                assert getattr(got, field) == pytest.approx(getattr(want, field))
+
+    def test_missing_ratings_match_scalar(self, detector):
+        slate = make_slate(20)
+        slate.loc[0, "away_team"] = "Unknown"
+        expected = scalar_edges(detector, slate.iloc[:1])
+        actual = detector.detect_edges_batch(slate.iloc[:1])
+        assert [e.edge_points for e in actual] == pytest.approx(
+            [e.edge_points for e in expected]
+        )
+
+    def test_accepts_dict_of_arrays(self, detector):
+        slate = make_slate(50)
+        from_dict = detector.detect_edges_batch(
+            {col: slate[col].to_numpy() for col in slate}
+        )
+        assert [e.game_id for e in from_dict] == [
+            e.game_id for e in detector.detect_edges_batch(slate)
+        ]
+
+
+class TestBatchSweeps:
+    """Columnar output for parameter sweeps."""
+
+    def test_frame_output_flags_edges(self, detector):
+        slate = make_slate(100)
+        frame = detector.detect_edges_batch(slate, as_frame=True)
+        assert len(frame) == 100
+        assert frame["is_edge"].sum() == len(detector.detect_edges_batch(slate))
+
+    def test_threshold_sweep_is_monotonic(self, detector):
+        slate = make_slate(500).assign(reverse_line_movement=False)
+        counts = [
+            int(
+                detector.detect_edges_batch(
+                    slate, min_edge_threshold=threshold, as_frame=True
+                )["is_edge"].sum()
+            )
+            for threshold in (2.0, 3.5, 5.0, 7.0)
+        ]
+        assert counts == sorted(counts, reverse=True)
+
+    def test_hfa_override(self, detector):
+        slate = make_slate(10)
+        base = detector.detect_edges_batch(
+            slate, home_field_advantage=0.0, bias_correction=0.0, as_frame=True
+        )
+        shifted = detector.detect_edges_batch(
+            slate, home_field_advantage=3.0, bias_correction=0.0, as_frame=True
+        )
+        assert (shifted["predicted_spread"] - base["predicted_spread"]).to_numpy() == (
+            pytest.approx(np.full(10, 3.0))
+        )
+
+    def test_rating_columns_without_hfa_column(self, detector):
+        slate = make_slate(4).assign(away_rating=90.0, home_rating=88.0)
+        slate.loc[0, "home_team"] = "Expansion"  # No cached rating or HFA
+        frame = detector.detect_edges_batch(slate, bias_correction=0.0, as_frame=True)
+
+        ratings = detector.power_ratings
+        hfas = [2.0] + [ratings[t].home_field_advantage for t in slate.home_team[1:]]
+        expected = (
+            88.0
+            - 90.0
+            + np.array(hfas)
+            + slate["situational_adjustment"].to_numpy()
+            + slate["weather_adjustment"].to_numpy()
+        )
+        assert frame["predicted_spread"].to_numpy() == pytest.approx(expected)
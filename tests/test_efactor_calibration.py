@@ -0,0 +1,152 @@
+"""
+Tests for E-Factor calibration storage and SQL-side report aggregation
+(src/walters_analyzer/core/efactor_calibration.py).
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from walters_analyzer.core.efactor_calibration import EFactorCalibrator
+
+
+@pytest.fixture
+async def calibrator(tmp_path):
+    calibrator = EFactorCalibrator(db_path=str(tmp_path / "calibration.db"))
+    await calibrator.initialize()
+    yield calibrator
+    await calibrator.close()
+
+
+async def record(calibrator, game_id, week, edge, sources, margin=None, clv=0.0):
+    await calibrator.record_prediction(
+        game_id=game_id,
+        week=week,
+        team="DAL",
+        league="nfl",
+        predicted_edge_pct=edge,
+        efactor_adjustment=-2.0 if sources else 0.0,
+        efactor_sources=sources,
+    )
+    if margin is not None:
+        result = "WIN" if margin > 0 else "LOSS"
+        await calibrator.record_outcome(game_id, result, margin, clv)
+
+
+def source_rows(calibrator):
+    return calibrator.conn.execute(
+        "SELECT r.game_id, s.source, s.weight FROM calibration_record_sources s "
+        "JOIN calibration_records r ON r.id = s.record_id ORDER BY 1, 2"
+    ).fetchall()
+
+
+@pytest.mark.asyncio
+async def test_sources_are_normalized_with_weights(calibrator):
+    await record(calibrator, "G1", 10, 5.0, ["injury_qb", "coaching"])
+    await record(calibrator, "G2", 10, 3.0, {"weather": 0.75, "travel": 0.25})
+
+    assert source_rows(calibrator) == [
+        ("G1", "coaching", 0.5),
+        ("G1", "injury_qb", 0.5),
+        ("G2", "travel", 0.25),
+        ("G2", "weather", 0.75),
+    ]
+
+    # Re-recording a prediction replaces its sources
+    await record(calibrator, "G1", 10, 5.0, ["injury_qb"])
+    assert [row for row in source_rows(calibrator) if row[0] == "G1"] == [
+        ("G1", "injury_qb", 1.0)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_report_aggregates_from_rollups(calibrator):
+    await record(calibrator, "G1", 10, 5.0, ["injury_qb"], margin=3.0, clv=0.05)
+    await record(calibrator, "G2", 10, 4.0, ["injury_qb", "coaching"], margin=-2.0)
+    await record(calibrator, "G3", 11, 6.0, ["coaching"], margin=8.0, clv=-0.01)
+    await record(calibrator, "G4", 11, 2.0, [])  # No outcome yet
+
+    metrics = await calibrator.get_calibration_report(league="nfl")
+    assert metrics.total_predictions == 4
+    assert metrics.total_outcomes == 3
+    assert (metrics.ats_wins, metrics.ats_losses, metrics.ats_pushes) == (2, 1, 0)
+    assert metrics.avg_predicted_edge == pytest.approx(5.0)
+    assert metrics.edge_rmse == pytest.approx(((4 + 36 + 4) / 3) ** 0.5)
+    assert metrics.total_roi == pytest.approx(0.04)
+    assert metrics.efactor_impact_avg == pytest.approx(1.5)
+    assert metrics.efactor_impact_min == 0.0
+
+    # injury_qb: G1 (w=1, win) + G2 (w=0.5, loss) -> 1 / 1.5
+    # coaching: G2 (w=0.5, loss) + G3 (w=1, win) -> 1 / 1.5
+    breakdown = metrics.source_breakdown
+    assert breakdown["injury_qb"]["bets"] == 2
+    assert breakdown["injury_qb"]["win_rate"] == pytest.approx(2 / 3)
+    assert breakdown["injury_qb"]["roi_per_bet_pct"] == pytest.approx(0.05 / 1.5 * 100)
+    assert breakdown["coaching"]["rmse"] == pytest.approx(((0.5 * 36 + 4) / 1.5) ** 0.5)
+    assert metrics.source_scores == {
+        source: stats["win_rate"] for source, stats in breakdown.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_last_n_weeks_filter(calibrator):
+    await record(calibrator, "G1", 9, 5.0, ["injury_qb"], margin=-3.0)
+    await record(calibrator, "G2", 10, 4.0, ["coaching"], margin=2.0)
+    await record(calibrator, "G3", 11, 6.0, ["coaching"], margin=8.0)
+
+    metrics = await calibrator.get_calibration_report(league="nfl", weeks=2)
+    assert metrics.total_outcomes == 2
+    assert metrics.ats_losses == 0
+    assert set(metrics.source_scores) == {"coaching"}
+
+    assert (
+        await calibrator.get_calibration_report(league="ncaaf")
+    ).total_predictions == 0
+
+
+@pytest.mark.asyncio
+async def test_moving_prediction_to_another_week_refreshes_both(calibrator):
+    await record(calibrator, "G1", 9, 5.0, ["injury_qb"])
+    await record(calibrator, "G1", 10, 5.0, ["injury_qb"])
+
+    weeks = calibrator.conn.execute(
+        "SELECT week, predictions FROM calibration_weekly_rollups"
+    ).fetchall()
+    assert weeks == [(10, 1)]
+
+
+@pytest.mark.asyncio
+async def test_initialize_backfills_legacy_database(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE calibration_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_id TEXT UNIQUE NOT NULL, week INTEGER NOT NULL,
+            timestamp TEXT NOT NULL, team TEXT NOT NULL, league TEXT NOT NULL,
+            predicted_edge_pct REAL NOT NULL, efactor_adjustment REAL NOT NULL,
+            efactor_sources TEXT NOT NULL, sharp_alignment TEXT NOT NULL,
+            confidence_level TEXT NOT NULL, actual_result TEXT, actual_margin REAL,
+            closing_line_value REAL, edge_accuracy REAL, ats_result INTEGER,
+            roi_contribution REAL, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """
+    )
+    conn.execute(
+        "INSERT INTO calibration_records VALUES "
+        "(1, 'G1', 12, '2025-11-20', 'DAL', 'nfl', 5.0, -2.0, ?, 'NEUTRAL', "
+        "'NONE', 'WIN', 3.0, 0.0, 2.0, 1, 0.0, NULL)",
+        (json.dumps(["injury_qb"]),),
+    )
+    conn.commit()
+    conn.close()
+
+    calibrator = EFactorCalibrator(db_path=str(db_path))
+    await calibrator.initialize()
+    metrics = await calibrator.get_calibration_report(league="nfl")
+    await calibrator.close()
+
+    assert metrics.total_outcomes == 1
+    assert metrics.source_scores == {"injury_qb": 1.0}
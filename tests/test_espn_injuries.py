@@ -0,0 +1,118 @@
+"""
+Tests for concurrent team fetching in the ESPN injury scraper
+(scrapers/espn/injuries.py).
+
+Uses httpx.MockTransport so no network access is needed.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from scrapers.espn.injuries import ESPNInjuryScraper, TokenBucket
+
+LATENCY = 0.05
+TEAMS = [{"team": {"id": str(i), "displayName": f"Team {i}"}} for i in range(1, 41)]
+
+
+class FakeESPN:
+    """Serves a teams listing and per-team injury reports with fixed latency"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.team_params = None
+
+    async def __call__(self, request):
+        path = request.url.path
+        if path.endswith("/teams"):
+            self.team_params = dict(request.url.params)
+            return httpx.Response(
+                200, json={"sports": [{"leagues": [{"teams": TEAMS}]}]}
+            )
+
+        team_id = int(path.split("/")[-2])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        # Later teams answer first, so arrival order differs from team order
+        await asyncio.sleep(LATENCY * (1 + (40 - team_id) / 40))
+        self.in_flight -= 1
+
+        if team_id % 10 == 0:
+            return httpx.Response(404)
+        injuries = [
+            {
+                "athlete": {"id": f"{team_id}-{n}", "displayName": f"P{team_id}-{n}"},
+                "status": {"type": "Out"},
+            }
+            for n in range(team_id % 3)
+        ]
+        return httpx.Response(200, json={"injuries": injuries})
+
+
+@pytest.fixture
+def api():
+    return FakeESPN()
+
+
+async def connect(scraper, api):
+    await scraper.connect()
+    await scraper._client.aclose()
+    scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+
+
+@pytest.mark.asyncio
+async def test_teams_fetched_concurrently_in_team_order(api, tmp_path):
+    scraper = ESPNInjuryScraper(
+        output_dir=str(tmp_path), max_concurrency=8, requests_per_second=1000
+    )
+    await connect(scraper, api)
+
+    start = time.perf_counter()
+    injuries = await scraper.scrape_ncaaf_injuries_async(filename="fbs.json")
+    elapsed = time.perf_counter() - start
+    await scraper.close()
+
+    # 40 teams at ~LATENCY each: serial would take > 40 * LATENCY
+    assert elapsed < 40 * LATENCY / 2
+    assert api.peak == 8
+    assert api.team_params == {"groups": "80", "limit": "200"}
+
+    expected = sum(i % 3 for i in range(1, 41) if i % 10)
+    assert len(injuries) == expected
+    team_ids = [int(injury["team_id"]) for injury in injuries]
+    assert team_ids == sorted(team_ids)
+    assert injuries[0]["league"] == "NCAAF"
+
+    # JSONL is streamed in arrival order; JSON array is in team order
+    lines = (tmp_path / "fbs.jsonl").read_text().splitlines()
+    assert len(lines) == expected
+    assert json.loads((tmp_path / "fbs.json").read_text()) == injuries
+
+
+@pytest.mark.asyncio
+async def test_max_teams_limits_requests(api, tmp_path):
+    scraper = ESPNInjuryScraper(output_dir=str(tmp_path), requests_per_second=1000)
+    await connect(scraper, api)
+    injuries = await scraper.scrape_ncaaf_injuries_async(max_teams=5)
+    await scraper.close()
+
+    assert {injury["team"] for injury in injuries} == {
+        "Team 1",
+        "Team 2",
+        "Team 4",
+        "Team 5",
+    }
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=5)
+    start = time.perf_counter()
+    for _ in range(15):
+        await bucket.acquire()
+    # 5 burst tokens, then 10 more at 50/sec
+    assert time.perf_counter() - start >= 10 / 50 * 0.9
@@ -0,0 +1,254 @@
+"""
+Tests for BettingKnowledgeGraph indexes and incremental persistence.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from walters_analyzer.models import (
+    BettingKnowledgeGraph,
+    Game,
+    MatchupEvaluation,
+    PowerRatingSnapshot,
+    Team,
+)
+from walters_analyzer.models import knowledge_graph as kg_module
+
+T0 = datetime(2025, 9, 1)
+TEAMS = ["DET", "PHI", "KC", "BUF", "CIN", "DAL"]
+
+
+def make_rating(team_id, hours, source="massey", rating=0.0):
+    return PowerRatingSnapshot(
+        team_id=team_id,
+        season=2025,
+        week=1,
+        rating=rating,
+        source=source,
+        created_at=T0 + timedelta(hours=hours),
+    )
+
+
+def make_game(game_id, home, away, week=1):
+    return Game(
+        game_id=game_id,
+        week=week,
+        season=2025,
+        home_team_id=home,
+        away_team_id=away,
+        kickoff_datetime=T0 + timedelta(days=7 * week),
+    )
+
+
+def make_evaluation(game, spread):
+    home = Team(team_id=game.home_team_id, name=game.home_team_id)
+    away = Team(team_id=game.away_team_id, name=game.away_team_id)
+    return MatchupEvaluation(
+        game=game,
+        home_team=home,
+        away_team=away,
+        home_rating=make_rating(home.team_id, 0),
+        away_rating=make_rating(away.team_id, 0),
+        base_spread=spread,
+        market_spread=spread,
+        effective_spread=spread,
+        edge_points=0.0,
+        edge_percent=0.0,
+        star_rating=0,
+    )
+
+
+@pytest.fixture
+def rated_graph():
+    graph = BettingKnowledgeGraph()
+    rng = random.Random(3)
+    hours = list(range(200))
+    rng.shuffle(hours)
+    for h in hours:
+        graph.add_power_rating(
+            make_rating(
+                rng.choice(TEAMS[:2]), h, rng.choice(["massey", "custom"]), float(h)
+            )
+        )
+    return graph
+
+
+@pytest.fixture
+def matchup_graph():
+    graph = BettingKnowledgeGraph()
+    rng = random.Random(5)
+    spreads = rng.sample([x / 2 for x in range(-40, 41)], 40)
+    for i, spread in enumerate(spreads):
+        home, away = rng.sample(TEAMS, 2)
+        game = make_game(f"G{i}", home, away, week=1 + i % 18)
+        graph.add_game(game)
+        graph.add_evaluation(make_evaluation(game, spread))
+    return graph
+
+
+class TestPowerRatingIndex:
+    """As-of lookups agree with a linear filter."""
+
+    @pytest.mark.parametrize("source", [None, "massey", "custom"])
+    def test_latest_matches_brute_force(self, rated_graph, source):
+        for team in TEAMS[:2]:
+            ratings = rated_graph.power_ratings[team]
+            assert ratings == sorted(ratings, key=lambda r: r.created_at)
+            for hours in (-1, 0, 57, 120.5, 500):
+                as_of = T0 + timedelta(hours=hours)
+                expected = [
+                    r
+                    for r in ratings
+                    if (not source or r.source == source) and r.created_at <= as_of
+                ]
+                got = rated_graph.get_latest_power_rating(team, source, as_of)
+                assert got == (expected[-1] if expected else None)
+
+    def test_history_by_source(self, rated_graph):
+        history = rated_graph.get_power_rating_history("DET", source="custom")
+        assert history
+        assert all(r.source == "custom" for r in history)
+        assert history == sorted(history, key=lambda r: r.created_at)
+
+    def test_unknown_team(self, rated_graph):
+        assert rated_graph.get_latest_power_rating("NOPE") is None
+
+
+class TestSimilarMatchups:
+    """Spread-index search agrees with a full scan."""
+
+    def brute_force(self, graph, game_id, max_results):
+        target = graph.games[game_id]
+        target_spread = graph.get_game_evaluations(game_id)[-1].market_spread
+        teams = {target.home_team_id, target.away_team_id}
+        candidates = [
+            (
+                abs(target_spread - graph.get_game_evaluations(gid)[-1].market_spread),
+                gid,
+            )
+            for gid, game in graph.games.items()
+            if gid != game_id and teams & {game.home_team_id, game.away_team_id}
+        ]
+        return [gid for _, gid in sorted(candidates)[:max_results]]
+
+    @pytest.mark.parametrize("game_id", ["G0", "G7", "G19", "G33"])
+    def test_matches_full_scan(self, matchup_graph, game_id):
+        got = matchup_graph.find_similar_matchups(game_id, max_results=5)
+        assert [g.game_id for g, _ in got] == self.brute_force(
+            matchup_graph, game_id, 5
+        )
+
+    def test_reevaluation_moves_game_in_index(self, matchup_graph):
+        target = matchup_graph.games["G0"]
+        target_spread = matchup_graph.get_game_evaluations("G0")[-1].market_spread
+        # Re-evaluate another game sharing a team at the exact target spread
+        other = next(
+            g
+            for gid, g in matchup_graph.games.items()
+            if gid != "G0" and target.home_team_id in (g.home_team_id, g.away_team_id)
+        )
+        matchup_graph._put_evaluation(
+            "eval_override", make_evaluation(other, target_spread)
+        )
+
+        got = matchup_graph.find_similar_matchups("G0", max_results=1)
+        assert got[0][0].game_id == other.game_id
+        assert got[0][1].market_spread == target_spread
+
+    def test_unevaluated_game(self, matchup_graph):
+        matchup_graph.add_game(make_game("NEW", "DET", "PHI"))
+        assert matchup_graph.find_similar_matchups("NEW") == []
+
+
+class TestIncrementalPersistence:
+    """save() appends changes; load() replays snapshot + log."""
+
+    def test_save_after_one_change_appends_only(self, matchup_graph, tmp_path):
+        path = tmp_path / "graph.json"
+        matchup_graph.save(path)
+        snapshot = path.read_text()
+
+        matchup_graph.add_power_rating(make_rating("KC", 5, rating=4.5))
+        matchup_graph.record_closing_line("G1", -3.5)
+        matchup_graph.save(path)
+
+        assert path.read_text() == snapshot
+        log_lines = BettingKnowledgeGraph.log_path_for(path).read_text().splitlines()
+        assert [json.loads(line)["type"] for line in log_lines] == [
+            "power_rating",
+            "closing_line",
+        ]
+
+        reloaded = BettingKnowledgeGraph(storage_path=path)
+        assert reloaded.get_latest_power_rating("KC").rating == 4.5
+        assert reloaded.closing_lines["G1"] == -3.5
+        assert [g.game_id for g, _ in reloaded.find_similar_matchups("G3")] == [
+            g.game_id for g, _ in matchup_graph.find_similar_matchups("G3")
+        ]
+
+    def test_reloaded_graph_keeps_appending(self, tmp_path):
+        path = tmp_path / "graph.json"
+        graph = BettingKnowledgeGraph(storage_path=path)
+        graph.add_team(Team(team_id="DET", name="Detroit Lions"))
+        graph.save()
+
+        reloaded = BettingKnowledgeGraph(storage_path=path)
+        reloaded.add_game(make_game("G1", "NYJ", "DET"))  # New team key
+        reloaded.save()
+
+        final = BettingKnowledgeGraph(storage_path=path)
+        assert final.get_team_games("NYJ")[0].game_id == "G1"
+
+    def test_log_is_compacted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(kg_module, "COMPACT_MIN_RECORDS", 10)
+        path = tmp_path / "graph.json"
+        graph = BettingKnowledgeGraph(storage_path=path)
+        graph.save()
+
+        for h in range(30):
+            graph.add_power_rating(make_rating("DET", h))
+            graph.save()
+
+        log_path = BettingKnowledgeGraph.log_path_for(path)
+        assert len(log_path.read_text().splitlines()) < 30
+        assert len(BettingKnowledgeGraph(storage_path=path).power_ratings["DET"]) == 30
+
+    def test_pending_changes_are_bounded_without_save(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(kg_module, "PENDING_FLUSH_RECORDS", 10)
+        path = tmp_path / "graph.json"
+        graph = BettingKnowledgeGraph(storage_path=path)
+        graph.save()
+
+        snapshot = path.read_text()
+        for h in range(25):
+            graph.add_power_rating(make_rating("DET", h))
+            assert len(graph._pending) < 10
+
+        # Unsaved changes never reach disk
+        log_path = BettingKnowledgeGraph.log_path_for(path)
+        assert log_path.read_text() == ""
+        assert path.read_text() == snapshot
+        assert BettingKnowledgeGraph(storage_path=path).power_ratings == {}
+
+        graph.save()
+        assert log_path.read_text() == ""
+        assert len(BettingKnowledgeGraph(storage_path=path).power_ratings["DET"]) == 25
+
+    def test_unsaved_graph_queues_nothing(self, rated_graph):
+        assert rated_graph._pending == []
+
+    def test_loads_legacy_snapshot(self, matchup_graph, tmp_path):
+        path = tmp_path / "graph.json"
+        matchup_graph.save(path)
+        data = json.loads(path.read_text())
+        del data["latest_evaluation"]
+        path.write_text(json.dumps(data))
+
+        reloaded = BettingKnowledgeGraph(storage_path=path)
+        assert isinstance(
+            reloaded.get_evaluation(next(iter(data["evaluations"]))), MatchupEvaluation
+        )
+        assert len(reloaded.find_similar_matchups("G0")) == 5
@@ -0,0 +1,111 @@
+"""
+Tests for the bounded line history used by MarketMonitor.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from walters_analyzer.feeds import GameLineHistory, LineHistory, MarketMonitor
+
+SHARP = ["Pinnacle", "Circa"]
+PUBLIC = ["DraftKings", "FanDuel"]
+START = datetime(2025, 11, 23, 12, 0, 0)
+
+
+def snapshot(lines, game_id="G1"):
+    return [
+        {
+            "game_id": game_id,
+            "book": book,
+            "teams": {"away": "Bills", "home": "Chiefs"},
+            "markets": {"spread": {"home": {"line": line}}},
+        }
+        for book, line in lines.items()
+    ]
+
+
+class TestGameLineHistory:
+    """Ring buffer behaviour."""
+
+    def test_capacity_bounds_memory(self):
+        history = GameLineHistory(capacity=5)
+        for i in range(12):
+            history.append(START + timedelta(seconds=i), {"Pinnacle": -i}, -i, None)
+
+        assert len(history) == 5
+        timestamps, lines = history.book_history("Pinnacle")
+        assert list(lines) == [-7, -8, -9, -10, -11]
+        assert np.all(np.diff(timestamps) > 0)
+        assert history.averages(-1) == (-11.0, None)
+        assert history.averages(-2) == (-10.0, None)
+
+    def test_new_books_add_columns(self):
+        history = GameLineHistory(capacity=3)
+        history.append(START, {"Pinnacle": -3.0}, -3.0, None)
+        history.append(START, {"Pinnacle": -3.5, "FanDuel": -3.0}, -3.5, -3.0)
+
+        _, fanduel = history.book_history("FanDuel")
+        assert np.isnan(fanduel[0]) and fanduel[1] == -3.0
+        assert history.lines.shape == (3, 2)
+
+    def test_rejects_tiny_capacity(self):
+        with pytest.raises(ValueError):
+            GameLineHistory(capacity=1)
+
+
+class TestLineHistory:
+    """Per-game store with precomputed sharp/public averages."""
+
+    def test_record_precomputes_averages(self):
+        store = LineHistory(SHARP, PUBLIC, history_size=10)
+        history = store.record(
+            "G1",
+            snapshot(
+                {"Pinnacle": -3.0, "Circa": -4.0, "DraftKings": -2.5, "Other": -9}
+            ),
+            START,
+        )
+        assert history.averages() == (-3.5, -2.5)
+
+    def test_prune_drops_idle_games(self):
+        store = LineHistory(SHARP, PUBLIC)
+        store.record("old", snapshot({"Pinnacle": -3.0}), START)
+        store.record("live", snapshot({"Pinnacle": -3.0}), START + timedelta(hours=5))
+
+        assert store.prune(START + timedelta(hours=1)) == 1
+        assert "old" not in store and "live" in store
+
+
+class TestMarketMonitorDetection:
+    """_detect_sharp_money on the new history store."""
+
+    @pytest.fixture
+    def monitor(self):
+        monitor = MarketMonitor()
+        monitor.settings = monitor.settings.model_copy(deep=True)
+        monitor.settings.skills.market_analysis.sharp_books = SHARP
+        monitor.settings.skills.market_analysis.public_books = PUBLIC
+        monitor.settings.skills.market_analysis.alert_threshold = 0.7
+        monitor.line_history = LineHistory(SHARP, PUBLIC, history_size=4)
+        return monitor
+
+    def test_sharp_move_alerts(self, monitor):
+        first = snapshot({"Pinnacle": -3.0, "Circa": -3.0, "DraftKings": -3.0})
+        second = snapshot({"Pinnacle": -4.5, "Circa": -4.0, "DraftKings": -3.0})
+
+        assert monitor._detect_sharp_money("G1", first) is None
+        alert = monitor._detect_sharp_money("G1", second)
+
+        assert alert["sharp_movement"] == -1.25
+        assert alert["public_movement"] == 0
+        assert alert["books_analyzed"] == {
+            "sharp": ["Pinnacle", "Circa"],
+            "public": ["DraftKings"],
+        }
+
+    def test_history_stays_bounded(self, monitor):
+        for i in range(50):
+            monitor._detect_sharp_money("G1", snapshot({"Pinnacle": -3.0}))
+        assert len(monitor.line_history["G1"]) == 4
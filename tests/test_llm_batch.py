@@ -0,0 +1,248 @@
+"""
+Tests for concurrent, cached LLM explanations (src/walters_analyzer/llm/batch.py).
+
+Requests go through the real Anthropic SDK to a local stub server, so no
+network access or API key is needed.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from walters_analyzer.cli import llm_demo
+from walters_analyzer.llm import build_system_prompt, load_system_prompt
+from walters_analyzer.llm.agent import WaltersLLMAgent
+from walters_analyzer.llm.batch import ExplanationBatcher
+from walters_analyzer.llm.client import FALLBACK_EXPLANATION
+from walters_analyzer.llm.settings import LLMSettings
+from walters_analyzer.pipelines.run_test_pipelines import run_pipeline
+
+
+class StubMessagesServer(ThreadingHTTPServer):
+    """Serves POST /v1/messages, echoing the prompt and tracking concurrency"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.05):
+        super().__init__(("127.0.0.1", 0), StubMessagesHandler)
+        self.delay = delay
+        self.fail = False
+        self.bodies = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubMessagesHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.bodies.append(body)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        if server.fail:
+            self._send(500, {"type": "error", "error": {"type": "api_error"}})
+            return
+
+        prompt = body["messages"][0]["content"]
+        self._send(
+            200,
+            {
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": body["model"],
+                "content": [{"type": "text", "text": f"explained: {prompt}"}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {
+                    "input_tokens": 10,
+                    "output_tokens": 5,
+                    "cache_read_input_tokens": 40,
+                    "cache_creation_input_tokens": 0,
+                },
+            },
+        )
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    server = StubMessagesServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def settings():
+    return LLMSettings(LLM_PROVIDER="anthropic", ANTHROPIC_API_KEY="test-key")
+
+
+def make_batcher(server, settings, tmp_path, **kwargs):
+    options = {"max_concurrency": 4, "requests_per_minute": 0, "max_retries": 0}
+    options.update(kwargs)
+    return ExplanationBatcher(
+        settings=settings, cache_dir=tmp_path / "llm", base_url=server.url, **options
+    )
+
+
+@pytest.mark.asyncio
+async def test_slate_runs_concurrently_in_order(server, settings, tmp_path):
+    prompts = [f"game {i}" for i in range(12)]
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        texts = await batcher.explain_many(prompts)
+
+    assert texts == [f"explained: {p}" for p in prompts]
+    assert len(server.bodies) == 12
+    assert 1 < server.max_active <= 4
+    assert batcher.stats.api_calls == 12
+    assert batcher.stats.prompt_cache_read_tokens == 12 * 40
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_is_a_cacheable_prefix(server, settings, tmp_path):
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        await batcher.explain("game 1")
+
+    (body,) = server.bodies
+    assert body["system"] == [
+        {
+            "type": "text",
+            "text": build_system_prompt(),
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert body["model"] == settings.model_name
+
+
+def test_system_prompt_carries_the_shared_instructions():
+    system = build_system_prompt()
+    assert load_system_prompt().strip() in system
+    assert '"id": "System.BWSA"' in system
+    # Below ~1024-2048 tokens (model dependent) the API silently skips
+    # prompt caching; JSON runs well under 4 characters per token
+    assert len(system) >= 4 * 2048
+
+    prompt = WaltersLLMAgent().build_prompt(*run_pipeline(return_models=True))
+    assert prompt.startswith("== MATCHUP EVALUATION ==")
+    assert "analysis layer" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_unchanged_matchups_are_never_rebilled(server, settings, tmp_path):
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        await batcher.explain_many(["game 1", "game 2"])
+
+    # A fresh batcher (e.g. the next run) reads from disk
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        texts = await batcher.explain_many(["game 1", "game 2", "game 3"])
+
+    assert texts[0] == "explained: game 1"
+    assert [b["messages"][0]["content"] for b in server.bodies] == [
+        "game 1",
+        "game 2",
+        "game 3",
+    ]
+    assert batcher.stats.cache_hits == 2 and batcher.stats.api_calls == 1
+
+    # Any change to the model invalidates the entry
+    other = settings.model_copy(update={"model_name": "claude-other"})
+    async with make_batcher(server, other, tmp_path) as batcher:
+        await batcher.explain("game 1")
+    assert len(server.bodies) == 4
+
+
+@pytest.mark.asyncio
+async def test_duplicate_prompts_in_flight_share_one_request(
+    server, settings, tmp_path
+):
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        texts = await batcher.explain_many(["same"] * 5)
+
+    assert texts == ["explained: same"] * 5
+    assert len(server.bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_fall_back_and_are_not_cached(server, settings, tmp_path):
+    server.fail = True
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        assert await batcher.explain("game 1") == FALLBACK_EXPLANATION
+        assert batcher.stats.failures == 1
+
+    server.fail = False
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        assert await batcher.explain("game 1") == "explained: game 1"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_request_starts(server, settings, tmp_path):
+    server.delay = 0.0
+    batcher = make_batcher(server, settings, tmp_path, requests_per_minute=600)
+    start = time.perf_counter()
+    async with batcher:
+        await batcher.explain_many([f"game {i}" for i in range(4)])
+    # Four starts 0.1s apart
+    assert time.perf_counter() - start >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_client_is_built_lazily(tmp_path):
+    settings = LLMSettings(LLM_PROVIDER="anthropic", ANTHROPIC_API_KEY="")
+    batcher = ExplanationBatcher(settings=settings, cache_dir=tmp_path)
+    assert batcher._client is None
+
+    with pytest.raises(RuntimeError, match="ANTHROPIC_API_KEY"):
+        await batcher.explain("game 1")
+
+
+@pytest.mark.asyncio
+async def test_agent_explains_slate_through_batcher(server, settings, tmp_path):
+    agent = WaltersLLMAgent(settings)
+    slate = [run_pipeline(return_models=True)] * 2
+    async with make_batcher(server, settings, tmp_path) as batcher:
+        texts = await agent.explain_slate(slate, batcher=batcher)
+        again = await agent.explain_slate(slate, batcher=batcher)
+
+    prompt = agent.build_prompt(*slate[0])
+    assert texts == again == [f"explained: {prompt}"] * 2
+    assert batcher.stats.api_calls == 1
+
+
+def test_llm_demo_uses_explain_slate(monkeypatch, capsys):
+    calls = []
+
+    async def explain_slate(self, matchups, batcher=None):
+        calls.append(matchups)
+        return ["slate explanation"]
+
+    monkeypatch.setattr(WaltersLLMAgent, "explain_slate", explain_slate)
+    llm_demo.main()
+
+    assert len(calls) == 1 and len(calls[0]) == 1
+    assert "slate explanation" in capsys.readouterr().out
@@ -7,6 +7,7 @@ Unit and integration tests for the NCAAF edge detection system.
 import pytest
 import json
 import asyncio
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
@@ -406,6 +407,88 @@ class TestNCAAFEdgeDetectorIntegration:
         assert edge.home_rating == 94.2
 
 
+class TestConcurrentGameAnalysis:
+    """analyze_games: bounded concurrency, timeouts, schedule order"""
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        monkeypatch.setenv("ACCUWEATHER_API_KEY", "test-key")
+        return NCAAFEdgeDetector(max_concurrency=8, game_timeout=1.0)
+
+    @staticmethod
+    def slate(n):
+        return [{"matchup": f"G{i}", "delay": 0.1} for i in range(n)]
+
+    @staticmethod
+    def fake_analysis(detector, counts=None):
+        counts = counts if counts is not None else {}
+
+        async def analyze(game, ratings, odds, injuries, week):
+            counts["now"] = counts.get("now", 0) + 1
+            counts["peak"] = max(counts.get("peak", 0), counts["now"])
+            await asyncio.sleep(game["delay"])
+            counts["now"] -= 1
+            if game.get("fail"):
+                raise RuntimeError("bad odds")
+            return game["matchup"]
+
+        detector._analyze_game = analyze
+
+    @pytest.mark.asyncio
+    async def test_slate_runs_concurrently_in_order(self, detector):
+        self.fake_analysis(detector)
+        games = self.slate(16)
+        games[3]["delay"] = 0.2
+
+        start = time.perf_counter()
+        results = await detector.analyze_games(games, {}, {}, {}, 13)
+
+        assert time.perf_counter() - start < 0.6  # Serial would be 1.7s
+        assert results == [g["matchup"] for g in games]
+
+    @pytest.mark.asyncio
+    async def test_semaphore_bounds_in_flight_games(self, monkeypatch):
+        monkeypatch.setenv("ACCUWEATHER_API_KEY", "test-key")
+        detector = NCAAFEdgeDetector(max_concurrency=3)
+        counts = {}
+        self.fake_analysis(detector, counts)
+
+        await detector.analyze_games(self.slate(10), {}, {}, {}, 13)
+
+        assert counts["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_timeouts_and_errors_yield_none(self, detector):
+        self.fake_analysis(detector)
+        detector.game_timeout = 0.3
+        games = self.slate(4)
+        games[1]["delay"] = 5.0
+        games[2]["fail"] = True
+
+        start = time.perf_counter()
+        results = await detector.analyze_games(games, {}, {}, {}, 13)
+
+        assert time.perf_counter() - start < 1.0
+        assert results == ["G0", None, None, "G3"]
+
+    @pytest.mark.asyncio
+    async def test_db_lookups_do_not_block_event_loop(self, detector):
+        db_ops = Mock()
+        db_ops.get_team_trends.side_effect = lambda **kw: time.sleep(0.2)
+        detector.db_ops = db_ops
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                detector.calculate_team_trend_adjustment_ncaaf(1, 2025, 13)
+                for _ in range(5)
+            )
+        )
+
+        assert time.perf_counter() - start < 0.6
+        assert results == [1.0] * 5
+
+
 # Run tests
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -27,7 +27,7 @@ class TestNFLGameStatsClient:
 
         client = NFLGameStatsClient()
         assert client.headless is True
-        assert client._browser is None
+        assert client._pool is None
         assert client._page is None
 
     def test_client_initialization_with_headless_false(self):
@@ -384,3 +384,82 @@ class TestNFLGameStatsClient:
         for team_name, team_stats in game["teams_stats"].items():
             assert "passing" in team_stats
             assert "rushing" in team_stats
+
+
+class TestConcurrentWeekStats:
+    """Parallel game extraction and API-based stats parsing."""
+
+    @pytest.mark.asyncio
+    async def test_games_extracted_concurrently_in_schedule_order(self):
+        import asyncio
+        from contextlib import asynccontextmanager
+
+        from scrapers.nfl_com import NFLGameStatsClient
+
+        links = [f"https://www.nfl.com/games/game-{i}?tab=stats" for i in range(8)]
+        pages_used = set()
+        in_flight = peak = 0
+
+        class FakePool:
+            @asynccontextmanager
+            async def page(self, profile):
+                yield object()
+
+        async def fake_game_stats(game_url, page=None):
+            nonlocal in_flight, peak
+            pages_used.add(id(page))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            number = int(game_url.split("game-")[1].split("?")[0])
+            # Later games finish first
+            await asyncio.sleep(0.01 * (8 - number))
+            in_flight -= 1
+            return {} if number == 3 else {"url": game_url}
+
+        client = NFLGameStatsClient(max_concurrency=3)
+        client._pool = FakePool()
+        client._page = AsyncMock()
+        client._extract_game_links = AsyncMock(return_value=links)
+        client.get_game_stats = fake_game_stats
+
+        stats = await client.get_week_stats(year=2025, week="reg-12")
+
+        assert peak == 3
+        assert len(pages_used) == 3
+        assert [g["url"] for g in stats["games"]] == [
+            link for link in links if "game-3" not in link
+        ]
+
+    def test_stats_from_api_responses(self):
+        from scrapers.nfl_com import NFLGameStatsClient
+
+        responses = [
+            {"url": "https://api.nfl.com/other", "data": {"ads": []}},
+            {
+                "url": "https://api.nfl.com/stats/game",
+                "data": {
+                    "teams": [
+                        {
+                            "team": {"nickName": "Packers", "abbreviation": "GB"},
+                            "passing": [
+                                {"playerName": "J. Love", "cmp": 21, "att": 30}
+                            ],
+                            "rushing": [
+                                {"player": {"displayName": "J. Jacobs"}, "yds": 88}
+                            ],
+                        },
+                        {
+                            "team": {"nickName": "Lions"},
+                            "passing": [{"playerName": "J. Goff", "cmp": 25}],
+                        },
+                    ]
+                },
+            },
+        ]
+
+        stats = NFLGameStatsClient._stats_from_responses(responses, "PACKERS")
+        assert stats["passing"] == {"J. Love": ["21", "30"]}
+        assert stats["rushing"] == {"J. Jacobs": ["88"]}
+        assert stats["defense"] == {}
+
+        assert NFLGameStatsClient._stats_from_responses(responses, "BEARS") is None
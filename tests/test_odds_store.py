@@ -0,0 +1,270 @@
+"""
+Tests for the partitioned Parquet odds snapshot store
+(src/walters_analyzer/query/odds_store.py).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scrapers.overtime import OvertimeApiClient
+from walters_analyzer.query.odds_store import OddsSnapshotStore
+from walters_analyzer.query.odds_viewer import OddsViewer
+
+
+def overtime_game(collected_at, away_line, game_key="g1", **overrides):
+    game = {
+        "source": "overtime.ag",
+        "sport": "nfl",
+        "game_key": game_key,
+        "rotation_number": "451",
+        "event_date": "2025-11-09",
+        "event_time": "1:00 PM",
+        "teams": {"away": "Arizona Cardinals", "home": "Seattle Seahawks"},
+        "markets": {
+            "spread": {
+                "away": {"line": away_line, "price": -110},
+                "home": {"line": -away_line, "price": -110},
+            },
+            "total": {
+                "over": {"line": 44.5, "price": -110},
+                "under": {"line": 44.5, "price": -110},
+            },
+            "moneyline": {"away": {"price": 250}, "home": {"price": -300}},
+        },
+        "collected_at": collected_at,
+    }
+    game.update(overrides)
+    return game
+
+
+ACTION_NETWORK_DOC = {
+    "source": "action_network",
+    "league": "ncaaf",
+    "scraped_at": "2025-11-08T12:00:00+00:00",
+    "games": [
+        {
+            "game_id": 9001,
+            "away_team": "Ohio State Buckeyes",
+            "home_team": "Michigan Wolverines",
+            "start_time": "2025-11-29T17:00:00Z",
+            "spread": {
+                "away": {"value": -10.5, "odds": -108},
+                "home": {"value": 10.5, "odds": -112},
+            },
+            "total": {"over": {"value": 41.5, "odds": -110}},
+            "moneyline": {"away": {"odds": -450}, "home": {"odds": 340}},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OddsSnapshotStore(tmp_path / "odds_store")
+    store.ingest([overtime_game("2025-11-05T12:00:00+00:00", 6.5)])
+    store.ingest([overtime_game("2025-11-06T12:00:00+00:00", 6.5)])
+    store.ingest([overtime_game("2025-11-07T12:00:00+00:00", 7.0)])
+    return store
+
+
+def test_ingest_partitions_by_league_season_week(store):
+    partitions = sorted(
+        str(p.parent.relative_to(store.root)) for p in store.root.rglob("*.parquet")
+    )
+    assert partitions == ["league=nfl/season=2025/week=10"] * 3
+
+    table = store.query()
+    assert table.num_rows == 3
+    row = table.to_pylist()[0]
+    assert row["away_key"] == "Arizona"
+    assert row["home_key"] == "Seattle"
+    assert row["event_date"] == date(2025, 11, 9)
+    assert row["ml_home_price"] == -300
+
+
+def test_reingest_is_idempotent(store):
+    store.ingest([overtime_game("2025-11-07T12:00:00+00:00", 7.0)])
+    assert store.query().num_rows == 3
+
+
+def test_query_pushes_down_predicates(store):
+    assert store.query(team="Cardinals").num_rows == 3
+    assert store.query(team="ARI", league="nfl", week=10).num_rows == 3
+    assert store.query(team="Chiefs").num_rows == 0
+    assert store.query(start="2025-11-10").num_rows == 0
+    assert store.query(book="pinnacle").num_rows == 0
+
+    table = store.query(team="Seahawks", columns=["snapshot_at", "spread_away_line"])
+    assert table.column_names == ["snapshot_at", "spread_away_line"]
+    assert table.column("spread_away_line").to_pylist() == [6.5, 6.5, 7.0]
+
+
+def test_latest_returns_one_row_per_game_and_book(store):
+    latest = store.latest(league="nfl")
+    assert len(latest) == 1
+    assert latest[0]["spread_away_line"] == 7.0
+    assert latest[0]["snapshot_at"] == datetime(2025, 11, 7, 12, tzinfo=timezone.utc)
+
+
+def test_line_movement_keeps_changes_only(store):
+    moves = store.line_movement("Arizona Cardinals")
+    assert [(m["line"], m["move"]) for m in moves] == [(6.5, 0.0), (7.0, 0.5)]
+    assert moves[0]["side"] == "away"
+    assert moves[0]["opponent"] == "Seattle Seahawks"
+
+    home = store.line_movement("Seattle", market="spread")
+    assert [m["line"] for m in home] == [-6.5, -7.0]
+
+    with pytest.raises(ValueError):
+        store.line_movement("Seattle", market="props")
+
+
+def test_ingest_action_network_document(tmp_path):
+    path = tmp_path / "action_network_ncaaf.json"
+    path.write_text(json.dumps(ACTION_NETWORK_DOC))
+    store = OddsSnapshotStore(tmp_path / "odds_store")
+
+    assert store.ingest_file(path) == 1
+    [row] = store.query(league="college_football", team="Ohio St").to_pylist()
+    assert row["source"] == row["book"] == "action_network"
+    assert row["game_key"] == "9001"
+    assert (row["away_key"], row["home_key"]) == ("Ohio St", "Michigan")
+    assert row["spread_away_line"] == -10.5
+    assert row["total_line"] == 41.5
+    assert row["season"] == 2025
+
+
+def test_ingest_file_jsonl_splits_odds_api_books(tmp_path):
+    path = tmp_path / "odds.jsonl"
+    games = [
+        overtime_game("2025-11-05T12:00:00+00:00", 6.5, source=f"the-odds-api/{book}")
+        for book in ("pinnacle", "draftkings")
+    ]
+    path.write_text("\n".join(json.dumps(game) for game in games) + "\nnot json\n")
+    store = OddsSnapshotStore(tmp_path / "odds_store")
+
+    assert store.ingest_file(path) == 2
+    assert store.query(book="pinnacle").num_rows == 1
+    assert {r["source"] for r in store.query().to_pylist()} == {"the-odds-api"}
+
+
+def test_query_missing_store_is_empty(tmp_path):
+    store = OddsSnapshotStore(tmp_path / "missing")
+    assert store.query().num_rows == 0
+    assert store.line_movement("Arizona") == []
+
+
+def test_viewer_loads_latest_lines_from_store(store):
+    viewer = OddsViewer(store_dir=str(store.root))
+    assert viewer.load_from_store(sport="nfl") == 1
+
+    game = viewer.games[0]
+    assert game["teams"] == {"away": "Arizona Cardinals", "home": "Seattle Seahawks"}
+    assert game["markets"]["spread"]["away"] == {"line": 7.0, "price": -110}
+    assert game["markets"]["moneyline"]["home"] == {"line": None, "price": -300}
+    assert viewer.filter_by_team("Cardinals") == viewer.games
+
+
+async def test_overtime_api_scrape_is_ingested(tmp_path):
+    game_line = {
+        "GameNum": 5501,
+        "Team1ID": "Arizona Cardinals",
+        "Team2ID": "Seattle Seahawks",
+        "Team1RotNum": 451,
+        "Team2RotNum": 452,
+        "Spread1": 6.5,
+        "Spread2": -6.5,
+        "SpreadAdj1": -105,
+        "SpreadAdj2": -115,
+        "MoneyLine1": 240,
+        "MoneyLine2": -290,
+        "TotalPoints": 44.5,
+        "TtlPtsAdj1": -110,
+        "TtlPtsAdj2": -110,
+        "GameDateTime": "/Date(1762711200000)/",
+        "Comments": "NFL Week 10",
+    }
+
+    def handler(request):
+        return httpx.Response(200, json={"d": {"Data": {"GameLines": [game_line]}}})
+
+    store = OddsSnapshotStore(tmp_path / "odds_store")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = OvertimeApiClient(tmp_path / "output", client=http, odds_store=store)
+        await client.scrape_nfl(save_raw=False, save_converted=False)
+
+    [row] = store.query(league="nfl").to_pylist()
+    assert row["source"] == "overtime.ag"
+    assert row["game_key"] == "5501"
+    assert row["rotation_number"] == "451"
+    assert (row["away_key"], row["home_key"]) == ("Arizona", "Seattle")
+    assert row["spread_away_line"] == 6.5
+    assert row["spread_home_price"] == -115
+    assert row["total_line"] == 44.5
+    assert row["ml_home_price"] == -290
+    assert (row["season"], row["week"]) == (2025, 10)
+
+
+def test_query_package_import_does_not_load_pyarrow():
+    code = (
+        "import sys, walters_analyzer.query as q; "
+        "assert 'pyarrow' not in sys.modules; "
+        "q.OddsSnapshotStore; assert 'pyarrow' in sys.modules"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = dict(os.environ, PYTHONPATH=str(src))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_naive_scrape_time_live_and_file_ingest_agree(tmp_path, monkeypatch):
+    # The Action Network scraper writes naive local scraped_at values
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        store = OddsSnapshotStore(tmp_path / "odds_store")
+        scraped_at = datetime(2025, 11, 8, 12, 0)
+        store.ingest(
+            ACTION_NETWORK_DOC["games"],
+            snapshot_at=scraped_at,
+            source="action_network",
+            league="ncaaf",
+        )
+        path = tmp_path / "ncaaf_odds_latest.json"
+        path.write_text(
+            json.dumps({**ACTION_NETWORK_DOC, "scraped_at": scraped_at.isoformat()})
+        )
+        store.ingest_file(path)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    [row] = store.query(league="ncaaf").to_pylist()
+    assert row["snapshot_at"] == datetime(2025, 11, 8, 12, 0, tzinfo=timezone.utc)
+    assert len(list(store.root.rglob("*.parquet"))) == 1
+
+
+async def test_overtime_store_failure_does_not_fail_scrape(tmp_path, caplog):
+    class BrokenStore:
+        def ingest(self, *args, **kwargs):
+            raise OSError("disk full")
+
+    def handler(request):
+        return httpx.Response(200, json={"d": {"Data": {"GameLines": []}}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        client = OvertimeApiClient(
+            tmp_path / "output", client=http, odds_store=BrokenStore()
+        )
+        converted = await client.scrape_nfl(save_raw=False)
+
+    assert converted["summary"]["total_games"] == 0
+    assert list((tmp_path / "output" / "nfl" / "pregame").glob("nfl_odds_*.json"))
+    assert "disk full" in caplog.text
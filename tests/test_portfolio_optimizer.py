@@ -0,0 +1,120 @@
+"""
+Tests for joint multi-bet Kelly sizing
+(src/walters_analyzer/core/portfolio.py).
+"""
+
+import numpy as np
+import pytest
+
+from walters_analyzer.core import (
+    BankrollManager,
+    PortfolioOptimizer,
+    SimBet,
+    kelly_fraction,
+)
+from walters_analyzer.core.portfolio import project_capped_simplex
+
+
+def week(n_games=16, seed=1):
+    rng = np.random.default_rng(seed)
+    bets = []
+    for g in range(n_games):
+        bets.append(SimBet(float(rng.uniform(0.53, 0.62)), -110, game_id=f"g{g}"))
+        bets.append(SimBet(float(rng.uniform(0.52, 0.58)), -110, game_id=f"g{g}"))
+    return bets
+
+
+def test_projection_respects_box_and_total():
+    x = np.array([0.5, 0.04, 0.02, -0.01])
+    f = project_capped_simplex(x, np.full(4, 0.03), 0.05)
+    assert f.min() >= 0.0 and f.max() <= 0.03
+    assert f.sum() == pytest.approx(0.05)
+
+    small = np.array([0.01, 0.02])
+    assert project_capped_simplex(small, np.full(2, 0.03), 0.15) == pytest.approx(small)
+
+
+def test_single_bet_matches_fractional_kelly():
+    manager = BankrollManager(max_risk_pct=10.0, fractional_kelly=0.5)
+    allocation = PortfolioOptimizer(manager).optimize([SimBet(0.56, -110)])
+
+    expected = kelly_fraction(0.56, -110, 0.5) * 100
+    assert allocation.stake_pct[0] == pytest.approx(expected, abs=0.05)
+
+
+def test_week_respects_caps_and_prefers_bigger_edges():
+    bets = week()
+    allocation = PortfolioOptimizer().optimize(bets)
+
+    assert allocation.total_pct <= 15.0 + 1e-6
+    assert max(allocation.stake_pct) <= 3.0
+    # Sized independently the same bets would risk far more than 15%
+    assert sum(allocation.independent_pct) > 15.0
+
+    # Funded bets are sized non-increasing in edge, and out-edge the unfunded
+    # ones on average (a same-game pair splits its stake, so a bet can be
+    # dropped below the minimum ahead of a slightly weaker one elsewhere)
+    probs = np.array([b.win_probability for b in bets])
+    stakes = np.array(allocation.stake_pct)
+    funded = stakes > 0.0
+    order = np.argsort(-probs[funded])
+    assert np.all(np.diff(stakes[funded][order]) <= 0.05)
+    assert probs[funded].mean() > probs[~funded].mean()
+    assert allocation.expected_growth > 0.0
+
+
+def test_no_edge_and_tiny_stakes_are_zero():
+    manager = BankrollManager(min_bet_pct=0.5)
+    bets = [SimBet(0.50, -110, game_id="a"), SimBet(0.60, -110, game_id="b")]
+    allocation = PortfolioOptimizer(manager).optimize(bets)
+    assert allocation.stake_pct[0] == 0.0
+    assert allocation.stake_pct[1] > 0.5
+
+
+def test_full_card_of_thin_edges_fills_total_above_min_bet():
+    manager = BankrollManager(min_bet_pct=0.5)
+    bets = [SimBet(0.58, -110, game_id=f"g{g}") for g in range(40)]
+    optimizer = PortfolioOptimizer(manager)
+    allocation = optimizer.optimize(bets)
+
+    # 15% over 40 bets would be 0.375% each, under the 0.5% minimum
+    assert allocation.total_pct == pytest.approx(15.0, abs=0.02)
+    funded = [s for s in allocation.stake_pct if s > 0.0]
+    assert min(funded) >= 0.5 - 0.01
+    assert len(funded) < len(bets)
+
+    moved = optimizer.update(3, odds=-130)
+    assert moved.total_pct == pytest.approx(15.0, abs=0.02)
+    assert min(s for s in moved.stake_pct if s > 0.0) >= 0.5 - 0.01
+
+
+def test_correlated_same_game_pair_gets_less_than_independent_pair():
+    same_game = [SimBet(0.58, -110, game_id="KC@BUF") for _ in range(2)]
+    two_games = [SimBet(0.58, -110, game_id=game) for game in ("KC@BUF", "DET@GB")]
+    manager = BankrollManager(max_risk_pct=50.0, fractional_kelly=1.0)
+
+    def optimize(bets):
+        optimizer = PortfolioOptimizer(
+            manager, max_total_pct=100.0, same_game_correlation=0.6
+        )
+        return optimizer.optimize(bets)
+
+    assert optimize(same_game).total_pct < optimize(two_games).total_pct - 1.0
+
+
+def test_line_move_update_is_warm_and_fast():
+    optimizer = PortfolioOptimizer()
+    cold = optimizer.optimize(week())
+    assert cold.solve_seconds < 1.0
+
+    best = int(np.argmax(cold.stake_pct))
+    moved = optimizer.update(best, odds=-130)
+    assert moved.solve_seconds < 1.0
+    assert moved.stake_pct[best] < cold.stake_pct[best]
+    assert optimizer.bets[best].odds == -130
+    assert moved.total_pct <= 15.0 + 1e-6
+
+
+def test_empty_slate():
+    allocation = PortfolioOptimizer().optimize([])
+    assert allocation.stake_pct == [] and allocation.total_pct == 0.0
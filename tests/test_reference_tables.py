@@ -0,0 +1,121 @@
+"""
+Tests for the in-memory reference table cache (src/db/reference_tables.py).
+
+Cached lookups must return exactly what the equivalent SQL lookups return,
+issue no queries once loaded, and reload after invalidation.
+"""
+
+import pytest
+
+from src.db.connection import DatabaseConnection
+from src.db.raw_data_operations import RawDataOperations
+from src.db.reference_tables import ReferenceTables
+
+
+class CountingDB(DatabaseConnection):
+    """DatabaseConnection that counts executed queries."""
+
+    query_count = 0
+
+    def execute_query(self, query, params=None, fetch=True):
+        self.query_count += 1
+        return super().execute_query(query, params, fetch)
+
+
+@pytest.fixture
+def db_ops(tmp_path):
+    db = CountingDB(db_path=tmp_path / "walters.db")
+    db.create_pool()
+    return RawDataOperations(db)
+
+
+def _sql_one(db, query, params):
+    rows = db.execute_query(query, params)
+    return rows[0][0] if rows else None
+
+
+class TestReferenceTablesMatchSQL:
+    """Cached lookups agree with direct SQL for every seeded row."""
+
+    def test_point_values(self, db_ops):
+        for row in db_ops.get_all_point_values():
+            spread = row["point_spread"]
+            assert db_ops.get_point_value_percentage(spread) == pytest.approx(
+                row["value_percentage"] / 100.0
+            )
+            assert (
+                db_ops.get_buying_power_cost(spread)
+                == row["dollar_value_buy_half_point"]
+            )
+        assert db_ops.get_point_value_percentage(99.5) is None
+        assert db_ops.get_buying_power_cost(99.5) is None
+
+    @pytest.mark.parametrize("edge", [0.0, 0.05, 0.055, 0.07, 0.1, 0.14, 0.5])
+    def test_play_strength(self, db_ops, edge):
+        expected = _sql_one(
+            db_ops.db,
+            "SELECT play_strength_stars FROM lookup_play_strength_guidelines "
+            "WHERE min_percentage <= ? ORDER BY min_percentage DESC LIMIT 1",
+            (edge * 100,),
+        )
+        assert db_ops.get_play_strength(edge) == expected
+
+    def test_moneyline(self, db_ops):
+        for row in db_ops.get_moneyline_table():
+            assert db_ops.get_moneyline(row["point_spread"]) == (
+                row["favorite_moneyline"],
+                row["dog_moneyline"],
+            )
+        assert db_ops.get_moneyline(99.0) is None
+
+    def test_odds_adjusted_spread(self, db_ops):
+        for row in db_ops.get_odds_conversion_table():
+            assert (
+                db_ops.get_odds_adjusted_spread(
+                    row["posted_spread"], row["bet_price_text"]
+                )
+                == row["implied_spread_at_110"]
+            )
+        assert db_ops.get_odds_adjusted_spread(3.0, "+999") is None
+
+    def test_calculate_edge_percentage(self, db_ops):
+        # 5, 6, 7 = 3% + 5% + 6%
+        assert db_ops.calculate_edge_percentage([5, 6, 7]) == pytest.approx(14.0)
+
+
+class TestReferenceTablesCaching:
+    """Load-once and invalidation behaviour."""
+
+    def test_no_queries_after_load(self, db_ops):
+        db_ops.get_moneyline(3.0)
+        before = db_ops.db.query_count
+
+        for spread in range(1, 22):
+            db_ops.get_point_value_percentage(spread)
+            db_ops.get_moneyline(spread)
+            db_ops.get_buying_power_cost(spread)
+        db_ops.get_play_strength(0.14)
+        db_ops.get_odds_adjusted_spread(3.0, "-120")
+
+        assert db_ops.db.query_count == before
+
+    def test_invalidate_reloads_changes(self, db_ops):
+        assert db_ops.get_point_value_percentage(3) == pytest.approx(0.08)
+
+        db_ops.db.execute_query(
+            "UPDATE lookup_point_values SET value_percentage = 9.0 "
+            "WHERE point_spread = 3",
+            fetch=False,
+        )
+        # Still cached until invalidated
+        assert db_ops.get_point_value_percentage(3) == pytest.approx(0.08)
+
+        db_ops.invalidate_reference_tables()
+        assert db_ops.get_point_value_percentage(3) == pytest.approx(0.09)
+
+    def test_empty_tables(self):
+        tables = ReferenceTables()
+        assert tables.point_value_percentage(3) is None
+        assert tables.play_strength(0.2) is None
+        assert tables.moneyline(3) is None
+        assert tables.odds_adjusted_spread(3, "-110") is None
@@ -0,0 +1,139 @@
+"""
+Tests for the in-process scraper scheduler (monitoring/scheduler.py).
+
+Uses fake sources so no network access is needed.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from walters_analyzer.monitoring.scheduler import (
+    ScraperScheduler,
+    ScraperSource,
+    build_source,
+)
+
+
+class FakeSource(ScraperSource):
+    def __init__(self, name, interval=0.05, work=0.0, fail=False, **kw):
+        self.name = name
+        super().__init__(interval=interval, **kw)
+        self.work = work
+        self.fail = fail
+        self.setups = 0
+        self.closes = 0
+        self.polls = 0
+
+    async def setup(self):
+        self.setups += 1
+
+    async def poll(self):
+        self.polls += 1
+        await asyncio.sleep(self.work)
+        if self.fail:
+            raise RuntimeError("feed down")
+        return f"poll {self.polls}"
+
+    async def close(self):
+        self.closes += 1
+
+
+@pytest.mark.asyncio
+async def test_sources_poll_concurrently():
+    sources = [FakeSource(f"s{i}", work=0.2) for i in range(4)]
+    scheduler = ScraperScheduler(sources, verbose=False)
+
+    start = time.perf_counter()
+    stats = await scheduler.run_once()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # 4 x 0.2s sequentially would be 0.8s
+    assert all(s.runs == 1 and s.failures == 0 for s in stats.values())
+    assert all(s.last_latency >= 0.2 for s in stats.values())
+
+
+@pytest.mark.asyncio
+async def test_per_source_intervals_and_warm_clients():
+    fast = FakeSource("fast", interval=0.02, jitter=0.0)
+    slow = FakeSource("slow", interval=0.5, jitter=0.0)
+    scheduler = ScraperScheduler([fast, slow], verbose=False)
+
+    await scheduler.run(duration=0.3)
+
+    assert fast.polls > 5
+    assert slow.polls == 1
+    # Clients opened once and closed once, not per poll
+    assert (fast.setups, fast.closes, slow.setups, slow.closes) == (1, 1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_are_recorded():
+    broken = FakeSource("broken", fail=True)
+    hung = FakeSource("hung", work=1.0, timeout=0.05)
+    healthy = FakeSource("healthy")
+    scheduler = ScraperScheduler([broken, hung, healthy], verbose=False)
+
+    stats = await scheduler.run(max_polls=2)
+
+    assert stats["broken"].failures == 2
+    assert stats["broken"].last_result == "feed down"
+    assert stats["hung"].failures == 2
+    assert "timed out" in stats["hung"].last_result
+    assert stats["healthy"].successes == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_run():
+    source = FakeSource("loop", interval=10.0)
+    scheduler = ScraperScheduler([source], verbose=False)
+
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(0.05)
+    scheduler.stop()
+    await asyncio.wait_for(task, timeout=1.0)
+
+    assert source.polls == 1 and source.closes == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_closes_sources_that_set_up():
+    class BrokenSetup(FakeSource):
+        async def setup(self):
+            await super().setup()
+            raise ConnectionError("no API key")
+
+    good = FakeSource("good")
+    broken = BrokenSetup("broken")
+    scheduler = ScraperScheduler([good, broken], verbose=False)
+
+    with pytest.raises(ConnectionError):
+        await scheduler.run_once()
+
+    assert good.closes == 1
+    assert broken.closes == 0
+    assert good.polls == broken.polls == 0
+
+
+def test_source_must_implement_poll():
+    class NoPoll(ScraperSource):
+        name = "no-poll"
+
+    with pytest.raises(TypeError):
+        NoPoll()
+
+
+def test_jitter_bounds():
+    source = FakeSource("jittery", interval=10.0, jitter=0.2)
+    delays = [source.next_delay() for _ in range(200)]
+    assert all(8.0 <= d <= 12.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_build_source():
+    source = build_source("sharp-monitor", sport="ncaaf", interval=45)
+    assert source.sport == "americanfootball_ncaaf"
+    assert source.interval == 45
+    with pytest.raises(ValueError):
+        build_source("nope")
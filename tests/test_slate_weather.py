@@ -0,0 +1,184 @@
+"""
+Tests for the slate-level weather stage (scrapers/weather/slate.py).
+
+Provider methods are replaced with fakes so no network access is needed.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from scrapers.weather import AccuWeatherClient, OpenWeatherClient, SlateWeatherStage
+
+LATENCY = 0.2
+KICKOFF = datetime(2025, 12, 7, 18, 0, tzinfo=timezone.utc)
+
+# 14-game Sunday: two games share a venue/hour, three are indoors
+SLATE = {
+    "NYJ@GB": ("Green Bay Packers", KICKOFF),
+    "NYG@GB": ("Green Bay", KICKOFF + timedelta(minutes=25)),  # Same venue/hour
+    "TEN@CLE": ("Cleveland Browns", KICKOFF),
+    "CIN@PIT": ("Pittsburgh Steelers", KICKOFF.isoformat()),
+    "DAL@PHI": ("Philadelphia Eagles", KICKOFF),
+    "SEA@CHI": ("Chicago Bears", KICKOFF),
+    "KC@BUF": ("Buffalo Bills", KICKOFF + timedelta(hours=3)),  # Indoor
+    "MIA@NE": ("New England Patriots", KICKOFF),
+    "LV@DEN": ("Denver Broncos", KICKOFF + timedelta(hours=3)),
+    "WAS@NYG": ("New York Giants", KICKOFF),
+    "ARI@SF": ("San Francisco 49ers", KICKOFF + timedelta(hours=3)),
+    "HOU@KC": ("Kansas City Chiefs", KICKOFF + timedelta(hours=7)),
+    "IND@DET": ("Detroit Lions", KICKOFF),  # Indoor
+    "TB@NO": ("New Orleans Saints", KICKOFF),  # Indoor
+}
+
+
+class Calls:
+    def __init__(self):
+        self.locations = []
+        self.forecasts = []
+        self.alerts = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def request(self, log, item):
+        log.append(item)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(LATENCY)
+        self.in_flight -= 1
+
+
+@pytest.fixture
+def calls():
+    return Calls()
+
+
+@pytest.fixture
+def accuweather(calls, monkeypatch):
+    client = AccuWeatherClient(api_key="test")
+
+    async def get_location(city, state, max_retries=3):
+        await calls.request(calls.locations, city)
+        if city == "Denver":
+            raise RuntimeError("No location found")
+        return {"key": f"key-{city}", "latitude": 40.0, "longitude": -80.0}
+
+    async def get_forecast_at(location_key, game_time, max_retries=3):
+        await calls.request(calls.forecasts, (location_key, game_time))
+        return {"temperature": 30, "wind_speed": 18, "forecast_time": "x"}
+
+    monkeypatch.setattr(client, "get_location", get_location)
+    monkeypatch.setattr(client, "get_forecast_at", get_forecast_at)
+    return client
+
+
+@pytest.fixture
+def openweather(calls, monkeypatch):
+    client = OpenWeatherClient(api_key="test")
+
+    async def get_weather_alerts(lat, lon, game_time=None, max_retries=3):
+        await calls.request(calls.alerts, game_time)
+        return [{"event": "Wind Advisory"}]
+
+    monkeypatch.setattr(client, "get_weather_alerts", get_weather_alerts)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_slate_takes_two_rounds_not_fourteen(calls, accuweather, openweather):
+    stage = SlateWeatherStage(accuweather, openweather)
+
+    start = time.perf_counter()
+    weather = await stage.fetch(SLATE)
+    elapsed = time.perf_counter() - start
+
+    # Location lookups, then forecasts + alerts: two latencies, not 14+
+    assert elapsed < 4 * LATENCY
+    assert calls.peak >= 9
+    assert list(weather) == list(SLATE)
+
+    # One lookup per outdoor venue, one forecast/alert per venue and hour
+    assert len(calls.locations) == len(set(calls.locations)) == 10
+    assert len(calls.forecasts) == 9  # Denver lookup failed
+    assert len(calls.alerts) == 9
+    assert weather["NYJ@GB"].forecast == weather["NYG@GB"].forecast
+
+    green_bay = weather["NYJ@GB"]
+    assert green_bay.forecast["wind_speed"] == 18
+    assert green_bay.forecast["city"] == "Green Bay"
+    assert green_bay.forecast["latitude"] == 40.0
+    assert green_bay.alerts == [{"event": "Wind Advisory"}]
+
+    # Pooled clients are opened for the slate and closed afterwards
+    assert accuweather._client.is_closed and openweather._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_indoor_and_failed_games(calls, accuweather):
+    weather = await SlateWeatherStage(accuweather).fetch(
+        {**SLATE, "BAD@XXX": ("Nowhere Nomads", KICKOFF), "T@GB": ("GB", "soon")}
+    )
+
+    assert weather["IND@DET"].indoor
+    assert weather["IND@DET"].forecast["weather_text"] == "Indoor"
+    assert weather["LV@DEN"].forecast is None
+    assert weather["BAD@XXX"].forecast is None
+    assert weather["T@GB"].forecast is None
+    assert weather["NYJ@GB"].alerts == []  # No alert provider
+    assert "Detroit" not in calls.locations and not calls.alerts
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit(calls, accuweather, openweather):
+    await SlateWeatherStage(accuweather, openweather, max_concurrency=3).fetch(SLATE)
+    assert calls.peak == 3
+
+
+def test_alert_window_with_aware_game_time():
+    client = OpenWeatherClient(api_key="test")
+    start = int(KICKOFF.timestamp())
+    during = {"event": "High Wind Warning", "start": start - 3600, "end": start + 60}
+    before = {"event": "Frost Advisory", "start": start - 7200, "end": start - 3600}
+
+    assert client._is_alert_active_during_game(during, KICKOFF)
+    assert not client._is_alert_active_during_game(before, KICKOFF)
+
+
+@pytest.mark.asyncio
+async def test_slate_requests_respect_accuweather_rate_limit():
+    starts = []
+
+    def api(request):
+        starts.append(time.monotonic())
+        if request.url.path.startswith("/locations/"):
+            geo = {"Latitude": 41.0, "Longitude": -87.0}
+            return httpx.Response(200, json=[{"Key": "1", "GeoPosition": geo}])
+        hour = datetime.now(timezone.utc) + timedelta(hours=3)
+        forecast = {"DateTime": hour.isoformat(), "Temperature": {"Value": 30}}
+        return httpx.Response(200, json=[forecast])
+
+    client = AccuWeatherClient(api_key="test", rate_limit_delay=0.05, use_cache=False)
+    client._client = httpx.AsyncClient(
+        base_url=client.BASE_URL, transport=httpx.MockTransport(api)
+    )
+    kickoff = datetime.now(timezone.utc) + timedelta(hours=3)
+    slate = {
+        game_id: (team, kickoff)
+        for game_id, team in [
+            ("NYJ@GB", "Green Bay Packers"),
+            ("SEA@CHI", "Chicago Bears"),
+            ("TEN@CLE", "Cleveland Browns"),
+            ("DAL@PHI", "Philadelphia Eagles"),
+        ]
+    }
+    await SlateWeatherStage(client).fetch(slate)
+    await client.close()
+
+    # 4 location lookups + 4 forecasts, fanned out but never closer than
+    # the client's rate_limit_delay
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 8
+    assert min(gaps) >= 0.045
@@ -0,0 +1,105 @@
+"""
+Tests for the shared team name resolver (src/walters_analyzer/team_names.py).
+"""
+
+import pytest
+
+from walters_analyzer.team_names import (
+    NCAAF_MASCOTS,
+    TeamNameResolver,
+    get_team_resolver,
+)
+
+
+@pytest.fixture
+def nfl():
+    return get_team_resolver("nfl")
+
+
+@pytest.fixture
+def ncaaf():
+    return get_team_resolver("ncaaf")
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["Kansas City Chiefs", "Chiefs", "Kansas City", "KC", "kansas city chiefs "],
+)
+def test_nfl_aliases_resolve_to_one_team(nfl, name):
+    assert nfl.canonical(name) == "Kansas City"
+    assert nfl.team_id(name) == "KC"
+    assert nfl.full_name(name) == "Kansas City Chiefs"
+
+
+def test_nfl_unknown_names(nfl):
+    assert nfl.lookup("Chicago Cubs") is None
+    assert nfl.canonical(" Chicago Cubs ") == "Chicago Cubs"
+    assert nfl.team_id("Chicago Cubs") is None
+    assert len(nfl) == 32
+
+
+@pytest.mark.parametrize(
+    "espn_name, stripped",
+    [
+        ("Ohio State Buckeyes", "Ohio State"),
+        ("Alabama Crimson Tide", "Alabama"),  # Longest mascot wins over "Tide"
+        ("Kent State Golden Flashes", "Kent State"),
+        ("California Golden Bears", "California"),
+        ("Stanford Cardinal", "Stanford"),
+        ("Syracuse Orange", "Syracuse"),
+        ("Orange", "Orange"),  # Never strips the whole name
+        ("Ohio State", "Ohio State"),
+    ],
+)
+def test_strip_mascot(ncaaf, espn_name, stripped):
+    assert ncaaf.strip_mascot(espn_name) == stripped
+
+
+def test_strip_mascot_matches_sequential_scan(ncaaf):
+    """Trie gives the same answer as checking each mascot suffix in turn"""
+
+    def sequential(name):
+        for mascot in sorted(NCAAF_MASCOTS, key=lambda m: -len(m.split())):
+            if name.endswith(f" {mascot}"):
+                return name[: -len(mascot) - 1].strip()
+        return name
+
+    for mascot in NCAAF_MASCOTS:
+        for name in (f"Test {mascot}", f"North Test {mascot}", mascot):
+            assert ncaaf.strip_mascot(name) == sequential(name)
+
+
+@pytest.mark.parametrize(
+    "name, massey, team_id",
+    [
+        ("Ohio State Buckeyes", "Ohio St", "OSU"),  # ESPN
+        ("Ohio State", "Ohio St", "OSU"),  # Overtime.ag
+        ("Ohio St", "Ohio St", "OSU"),  # Massey
+        ("Ole Miss Rebels", "Mississippi", "MISS"),  # ESPN override
+        ("Texas A&M Aggies", "Texas A&M", "TAMU"),
+    ],
+)
+def test_ncaaf_sources_resolve_to_massey(ncaaf, name, massey, team_id):
+    assert ncaaf.canonical(name) == massey
+    assert ncaaf.team_id(name) == team_id
+
+
+def test_ncaaf_fallback_shortens_state(ncaaf):
+    assert ncaaf.lookup("Nowhere State Owls") is None
+    assert ncaaf.canonical("Nowhere State Cougars") == "Nowhere St"
+
+
+def test_resolvers_are_shared(nfl):
+    assert get_team_resolver("NFL") is nfl
+    with pytest.raises(ValueError):
+        get_team_resolver("mlb")
+
+
+def test_lookups_are_memoized():
+    resolver = TeamNameResolver(
+        "ncaaf", {"Ohio State": "Ohio St"}, {"Ohio St": "OSU"}, ["Buckeyes"]
+    )
+    assert resolver.lookup("Ohio State Buckeyes") == "Ohio St"
+    resolver._index.clear()
+    assert resolver.lookup("Ohio State Buckeyes") == "Ohio St"
+    assert resolver.lookup("Ohio State") is None
@@ -57,6 +57,24 @@ class TestPhase31PlayerValuations:
         assert value == 3.5
         mock_db_ops.get_player_valuation.assert_called_once()
 
+    def test_get_player_value_from_db_dict_row(self):
+        """Test database rows returned as dicts (RawDataOperations)"""
+        valuation = PlayerValuation()
+
+        mock_db_ops = Mock()
+        mock_db_ops.get_player_valuation.return_value = {"point_value": 3.5}
+
+        value = valuation.get_player_value_from_db(
+            player_id="123",
+            team_id=1,
+            season=2025,
+            week=13,
+            position="QB",
+            db_ops=mock_db_ops,
+        )
+
+        assert value == 3.5
+
     def test_get_player_value_from_db_fallback(self):
         """Test fallback to position default when DB not available"""
         valuation = PlayerValuation()
@@ -0,0 +1,186 @@
+"""
+Tests for the walk-forward power rating backtester (backtest/walk_forward.py).
+"""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from walters_analyzer.backtest import (
+    BacktestConfig,
+    PowerRatingBacktest,
+    WalkForwardBacktest,
+)
+from walters_analyzer.backtest.walk_forward import GameArrays, run_config
+from walters_analyzer.valuation.power_ratings import initialize_nfl_ratings
+
+
+def make_season(weeks=6, seed=7):
+    """Round-robin-ish season over the preseason NFL teams (plus one unknown)"""
+    rng = random.Random(seed)
+    teams = list(initialize_nfl_ratings())
+    games = []
+    for week in range(1, weeks + 1):
+        rng.shuffle(teams)
+        kickoff = date(2025, 9, 4) + timedelta(weeks=week - 1)
+        for home, away in zip(teams[::2], teams[1::2]):
+            games.append(
+                {
+                    "date": kickoff.isoformat(),
+                    "home_team": home,
+                    "away_team": away,
+                    "home_score": rng.randint(3, 41),
+                    "away_score": rng.randint(3, 41),
+                    "week": week,
+                }
+            )
+    # Unrated team: skipped by both engines
+    games.insert(
+        5,
+        {
+            "date": "2025-09-04",
+            "home_team": "London",
+            "away_team": "Kansas City",
+            "home_score": 20,
+            "away_score": 17,
+            "week": 1,
+        },
+    )
+    return games
+
+
+def assert_same_weekly_stats(actual, expected):
+    assert actual.keys() == expected.keys()
+    for week, stats in expected.items():
+        assert actual[week] == pytest.approx(stats)
+
+
+@pytest.fixture
+def season():
+    return make_season()
+
+
+def test_matches_power_rating_backtest(season):
+    expected = PowerRatingBacktest().run_backtest(season)
+    result = WalkForwardBacktest([BacktestConfig()], max_workers=1).run(season)[0]
+
+    assert result.total_games == expected.total_games == len(season) - 1
+    assert result.final_ratings == expected.final_ratings
+    assert result.correct_winner_pct == expected.correct_winner_pct
+    assert result.ats_record == expected.ats_record
+    assert result.mean_absolute_error == pytest.approx(expected.mean_absolute_error)
+    assert result.median_absolute_error == expected.median_absolute_error
+    assert_same_weekly_stats(result.weekly_stats, expected.weekly_stats)
+
+    spreads = result.predicted_spreads
+    assert np.isnan(spreads[5])
+    assert spreads[~np.isnan(spreads)].tolist() == [
+        p.predicted_spread for p in expected.predictions
+    ]
+
+    # Expands back into a reportable BacktestResult
+    full = result.to_backtest_result(season)
+    assert full.predictions == expected.predictions
+    assert full.biggest_movers == expected.biggest_movers
+    assert "FINAL TOP 10 TEAMS" in PowerRatingBacktest().generate_report(full)
+
+
+def test_grid_in_process_pool(season):
+    configs = BacktestConfig.grid(
+        performance_weights=[0.05, 0.10, 0.15], home_field_advantages=[1.5, 2.5]
+    )
+    assert len(configs) == 6
+    assert configs[2].old_rating_weight == 0.9
+
+    results = WalkForwardBacktest(configs, max_workers=3).run(season)
+
+    arrays = GameArrays.from_games(season)
+    for config, result in zip(configs, results):
+        assert result.config.name == config.name
+        inline = run_config(config, arrays)
+        assert result.final_ratings == inline.final_ratings
+        assert result.mean_absolute_error == inline.mean_absolute_error
+    assert len({r.mean_absolute_error for r in results}) == 6
+
+
+def test_new_week_resumes_from_checkpoint(season, tmp_path):
+    engine = WalkForwardBacktest(BacktestConfig.grid([0.1, 0.2]), tmp_path, 1)
+    first_five = [g for g in season if g["week"] <= 5]
+
+    first = engine.run(first_five)
+    assert all(r.resumed_from_week is None for r in first)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+    resumed = engine.run(season)
+    week6 = sum(g["week"] == 6 for g in season)
+    assert [r.resumed_from_week for r in resumed] == [5, 5]
+    assert [r.games_replayed for r in resumed] == [week6, week6]
+
+    fresh = WalkForwardBacktest(engine.configs, max_workers=1).run(season)
+    for a, b in zip(resumed, fresh):
+        assert a.final_ratings == b.final_ratings
+        assert_same_weekly_stats(a.weekly_stats, b.weekly_stats)
+        np.testing.assert_array_equal(a.predicted_spreads, b.predicted_spreads)
+
+
+def test_resume_rates_teams_first_seen_after_checkpoint(tmp_path):
+    config = BacktestConfig(
+        initial_ratings={"Alpha": 5.0, "Bravo": 2.0, "Charlie": -1.0, "Delta": 0.0}
+    )
+
+    def game(week, home, away, home_score, away_score):
+        kickoff = date(2025, 9, 4) + timedelta(weeks=week - 1)
+        return {
+            "date": kickoff.isoformat(),
+            "home_team": home,
+            "away_team": away,
+            "home_score": home_score,
+            "away_score": away_score,
+            "week": week,
+        }
+
+    season = [
+        game(1, "Alpha", "Bravo", 24, 17),
+        game(2, "Bravo", "Alpha", 10, 13),
+        # Charlie and Delta never appear before the checkpoint
+        game(3, "Charlie", "Alpha", 20, 27),
+        game(3, "Delta", "Bravo", 17, 14),
+    ]
+
+    engine = WalkForwardBacktest([config], tmp_path, 1)
+    engine.run(season[:2])
+    resumed = engine.run(season)[0]
+    fresh = WalkForwardBacktest([config], max_workers=1).run(season)[0]
+
+    assert resumed.resumed_from_week == 2
+    assert resumed.total_games == fresh.total_games == 4
+    assert resumed.final_ratings == fresh.final_ratings
+    np.testing.assert_array_equal(resumed.predicted_spreads, fresh.predicted_spreads)
+
+
+def test_changed_results_invalidate_later_checkpoints(season, tmp_path):
+    engine = WalkForwardBacktest([BacktestConfig()], tmp_path, 1)
+    engine.run(season)
+
+    # Partial week 6 only resumes from the last complete week
+    partial = season[:-3]
+    assert engine.run(partial)[0].resumed_from_week == 5
+
+    # A corrected week 3 score replays from week 2
+    corrected = [dict(g) for g in season]
+    week3 = next(g for g in corrected if g["week"] == 3)
+    week3["home_score"] += 1
+    result = engine.run(corrected)[0]
+    assert result.resumed_from_week == 2
+
+    expected = WalkForwardBacktest([BacktestConfig()], max_workers=1).run(corrected)
+    assert result.final_ratings == expected[0].final_ratings
+
+
+def test_requires_week_order(season):
+    with pytest.raises(ValueError):
+        GameArrays.from_games(list(reversed(season)))
+    with pytest.raises(ValueError):
+        GameArrays.from_games([{**season[0], "week": None}])
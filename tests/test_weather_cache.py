@@ -0,0 +1,164 @@
+"""
+Tests for the AccuWeather response cache (scrapers/weather/cache.py).
+
+Uses httpx.MockTransport so no network access is needed.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from scrapers.weather import AccuWeatherClient, WeatherCache
+from scrapers.weather.cache import CacheEntry
+
+LOCATION = [{"Key": "331473", "GeoPosition": {"Latitude": 44.5, "Longitude": -88.0}}]
+
+
+def hourly(temp):
+    return [
+        {"DateTime": "2025-12-07T13:00:00-06:00", "Temperature": {"Value": temp}}
+    ] * 12
+
+
+class FakeAccuWeather:
+    """Counts requests per endpoint and serves canned responses"""
+
+    def __init__(self):
+        self.requests = []
+        self.temp = 20
+
+    def __call__(self, request):
+        self.requests.append(request.url.path)
+        if "apikey" not in request.url.params:
+            return httpx.Response(401)
+        if request.url.path.startswith("/locations/"):
+            query = request.url.params["q"]
+            return httpx.Response(200, json=LOCATION if "Green" in query else [])
+        return httpx.Response(200, json=hourly(self.temp))
+
+
+@pytest.fixture
+def api():
+    return FakeAccuWeather()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return WeatherCache(tmp_path / "weather.db")
+
+
+def make_client(api, cache, **kwargs):
+    client = AccuWeatherClient(
+        api_key="test", rate_limit_delay=0.0, cache=cache, **kwargs
+    )
+    client._client = httpx.AsyncClient(
+        base_url=client.BASE_URL, transport=httpx.MockTransport(api)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_location_keys_cached_across_clients(api, cache):
+    client = make_client(api, cache)
+    location = await client.get_location("Green Bay", "WI")
+    assert location == {"key": "331473", "latitude": 44.5, "longitude": -88.0}
+    await client.close()
+
+    # New client (e.g. next run) reuses the on-disk entry
+    client = make_client(api, WeatherCache(cache.path))
+    assert await client.get_location_key("Green Bay", "WI") == "331473"
+    assert api.requests == ["/locations/v1/cities/US/search"]
+
+    # Misses are not cached
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await client.get_location_key("Nowhere", "XX")
+    assert len(api.requests) == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_forecasts_bucketed_by_hour(api, cache, monkeypatch):
+    client = make_client(api, cache)
+    first = await client.get_hourly_forecast("331473")
+    again = await client.get_hourly_forecast("331473")
+    assert first == again
+    assert len(api.requests) == 1
+
+    # Next hour: the entry is expired and refetched
+    api.temp = 15
+    next_hour = time.time() + 3600
+    monkeypatch.setattr(time, "time", lambda: next_hour)
+    refreshed = await client.get_hourly_forecast("331473")
+    assert refreshed[0]["temperature"] == 15
+    assert len(api.requests) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(api, cache):
+    endpoint = "/forecasts/v1/hourly/12hour/331473"
+    key = AccuWeatherClient._cache_key(endpoint, {"details": "true"})
+    cache.set("accuweather", key, hourly(30), fetched_at=time.time() - 3700)
+
+    client = make_client(api, cache, stale_while_revalidate=True)
+    stale = await client.get_hourly_forecast("331473")
+    assert stale[0]["temperature"] == 30  # Served without waiting
+
+    await asyncio.gather(*client._refreshes.values())
+    assert cache.get("accuweather", key).value[0]["Temperature"]["Value"] == 20
+    fresh = await client.get_hourly_forecast("331473")
+    assert fresh[0]["temperature"] == 20
+    assert len(api.requests) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_too_stale_blocks_on_refetch(api, cache):
+    endpoint = "/forecasts/v1/hourly/12hour/331473"
+    key = AccuWeatherClient._cache_key(endpoint, {"details": "true"})
+    cache.set("accuweather", key, hourly(30), fetched_at=time.time() - 86400)
+
+    client = make_client(api, cache, stale_while_revalidate=True)
+    forecast = await client.get_hourly_forecast("331473")
+    assert forecast[0]["temperature"] == 20
+    assert not client._refreshes
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled(api, cache):
+    client = make_client(api, cache, use_cache=False)
+    await client.get_location_key("Green Bay", "WI")
+    await client.get_location_key("Green Bay", "WI")
+    assert len(api.requests) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_spaced_by_rate_limit(api):
+    starts = []
+
+    def timed(request):
+        starts.append(time.monotonic())
+        return api(request)
+
+    client = AccuWeatherClient(api_key="test", rate_limit_delay=0.1, use_cache=False)
+    client._client = httpx.AsyncClient(
+        base_url=client.BASE_URL, transport=httpx.MockTransport(timed)
+    )
+    await asyncio.gather(*(client.get_hourly_forecast(str(k)) for k in range(6)))
+    await client.close()
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 6
+    assert min(gaps) >= 0.09
+
+
+def test_entry_freshness():
+    entry = CacheEntry(value=None, fetched_at=7200.0 + 59 * 60)  # 02:59
+    assert entry.is_fresh(3600, now=7200.0 + 59 * 60 + 30)
+    assert not entry.is_fresh(3600, now=3 * 3600.0)  # 03:00 is a new bucket
+    assert entry.is_fresh(None, now=1e12)
@@ -0,0 +1,233 @@
+"""
+Tests for week-level context prefetch used by BillyWaltersEdgeDetector.
+
+Verifies that:
+- WeekContext bulk-loads and indexes TIER 1 tables for a league week
+- detect_edge reads from the prefetched indexes (no per-game queries)
+"""
+
+import pytest
+
+from src.db.connection import DatabaseConnection
+from src.db.raw_data_models import (
+    GameSWEFactors,
+    InjuryReport,
+    PlayerValuation,
+    PracticeReport,
+    TeamTrends,
+)
+from src.db.raw_data_operations import RawDataOperations
+from walters_analyzer.valuation.billy_walters_edge_detector import (
+    BillyWaltersEdgeDetector,
+    PowerRating,
+)
+from walters_analyzer.valuation.week_context import WeekContext
+
+
+class CountingDB(DatabaseConnection):
+    """DatabaseConnection that counts executed queries."""
+
+    query_count = 0
+
+    def execute_query(self, query, params=None, fetch=True):
+        self.query_count += 1
+        return super().execute_query(query, params, fetch)
+
+
+@pytest.fixture
+def db_ops(tmp_path):
+    db = CountingDB(db_path=tmp_path / "walters.db")
+    db.create_pool()
+    ops = RawDataOperations(db)
+
+    ops.insert_game_swe_factors(
+        GameSWEFactors(
+            league_id=1,
+            game_id="KC_BUF",
+            season=2025,
+            week=13,
+            away_team_id=1,
+            home_team_id=2,
+            special_adjustment=0.5,
+            weather_adjustment=-1.0,
+            emotional_adjustment=0.0,
+            total_adjustment=-0.5,
+            confidence_level=1.1,
+        )
+    )
+    ops.insert_team_trends(
+        TeamTrends(
+            league_id=1,
+            team_id=2,
+            season=2025,
+            week=13,
+            streak_direction="W",
+            streak_length=4,
+            desperation_level=9,
+        )
+    )
+    for player_id, name in [("p1", "QB One"), ("p2", "WR Two")]:
+        ops.insert_player_valuation(
+            PlayerValuation(
+                league_id=1,
+                team_id=2,
+                player_id=player_id,
+                player_name=name,
+                position="QB" if player_id == "p1" else "WR",
+                season=2025,
+                week=13,
+                point_value=4.0,
+                impact_rating=4.0,
+            )
+        )
+        ops.insert_practice_report(
+            PracticeReport(
+                league_id=1,
+                team_id=2,
+                player_id=player_id,
+                player_name=name,
+                season=2025,
+                week=13,
+                practice_date="2025-11-26",
+                day_of_week=2,
+                participation="FP",
+            )
+        )
+    ops.insert_injury_report(
+        InjuryReport(
+            league_id=1,
+            team_id=1,
+            player_name="RB Three",
+            player_id="p3",
+            position="RB",
+            season=2025,
+            week=13,
+            injury_status="Out",
+            body_part="Hamstring",
+        )
+    )
+    return ops
+
+
+def _count_queries(db_ops):
+    return db_ops.db.query_count
+
+
+class TestWeekContext:
+    """WeekContext bulk loading and indexing."""
+
+    def test_load_builds_indexes(self, db_ops):
+        context = WeekContext.load(db_ops, league_id=1, season=2025, week=13)
+
+        assert context.get_swe_factors("KC_BUF").special_adjustment == 0.5
+        assert context.get_swe_factors("MISSING") is None
+        assert context.get_team_trends(2).streak_length == 4
+        assert context.get_team_trends(1) is None
+
+        reports = context.get_wednesday_reports(2)
+        assert len(reports) == 2
+        # impact_rating joined from player_valuations
+        assert all(report.impact_rating == 4.0 for report in reports)
+
+        assert context.get_player_valuation(2, "p1").point_value == 4.0
+
+    def test_load_uses_fixed_query_count(self, db_ops):
+        before = _count_queries(db_ops)
+        WeekContext.load(db_ops, league_id=1, season=2025, week=13)
+        assert _count_queries(db_ops) - before == 4
+
+    def test_covers(self, db_ops):
+        context = WeekContext.load(db_ops, league_id=1, season=2025, week=13)
+        assert context.covers(2025, 13)
+        assert not context.covers(2025, 14)
+        assert not context.covers(None, 13)
+
+
+class TestDetectorPrefetch:
+    """BillyWaltersEdgeDetector reads from the prefetched context."""
+
+    @pytest.fixture
+    def detector(self, db_ops, tmp_path):
+        detector = BillyWaltersEdgeDetector(
+            output_dir=str(tmp_path / "edges"), db_ops=db_ops
+        )
+        for team, rating in [("Kansas City", 80.0), ("Buffalo", 90.0)]:
+            detector.power_ratings[team] = PowerRating(
+                team=team,
+                rating=rating,
+                offensive_rating=0.0,
+                defensive_rating=0.0,
+                home_field_advantage=2.0,
+                source="test",
+            )
+        return detector
+
+    def test_prefetch_without_database(self, tmp_path):
+        detector = BillyWaltersEdgeDetector(output_dir=str(tmp_path / "edges"))
+        assert detector.prefetch_week_context(season=2025, week=13) is None
+
+    def test_context_lookups(self, detector):
+        detector.prefetch_week_context(season=2025, week=13)
+
+        swe = detector.get_swe_adjustments("KC_BUF", 2025, 13)
+        assert swe["special"] == 0.5
+        assert swe["weather"] == -1.0
+        assert swe["confidence_impact"] == 1.1
+
+        signal, multiplier = detector.check_wednesday_signal(2, "Buffalo", 2025, 13)
+        assert signal is True
+        assert multiplier == 1.15
+
+        trend = detector.calculate_trend_confidence_adjustment(2, 1, 2025, 13)
+        assert trend == pytest.approx(1.15)
+
+    def test_prefetch_does_not_change_injury_impact(self, detector):
+        detector.injury_data = {
+            "Buffalo": [
+                {
+                    "position": "QB",
+                    "injury_type": "Ankle",
+                    "game_status": "Out",
+                    "player_id": "p1",
+                    "player_name": "QB One",
+                }
+            ]
+        }
+        teams = [("Kansas City", 1), ("Buffalo", 2)]
+
+        def impacts():
+            return [
+                detector.calculate_team_injury_impact(
+                    team, team_id=team_id, season=2025, week=13
+                )
+                for team, team_id in teams
+            ]
+
+        per_call = impacts()
+        detector.prefetch_week_context(season=2025, week=13)
+        prefetched = impacts()
+
+        assert prefetched == per_call
+        # injury_reports rows are not an injury source on either path
+        assert prefetched[0].injury_count == 0
+        assert prefetched[1].injury_count == 1
+
+    def test_detect_edge_issues_no_queries_after_prefetch(self, detector, db_ops):
+        detector.prefetch_week_context(season=2025, week=13)
+        before = _count_queries(db_ops)
+
+        for _ in range(10):
+            detector.detect_edge(
+                game_id="KC_BUF",
+                away_team="Kansas City",
+                home_team="Buffalo",
+                market_spread=3.0,
+                market_total=47.5,
+                week=13,
+                game_time="2025-11-30T20:00:00",
+                season=2025,
+                away_team_id=1,
+                home_team_id=2,
+            )
+
+        assert _count_queries(db_ops) == before
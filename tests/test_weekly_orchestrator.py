@@ -0,0 +1,157 @@
+"""
+Tests for DAG stage scheduling, stage caching and critical-path reporting
+in the weekly workflow orchestrator
+(src/walters_analyzer/workflows/weekly_orchestrator.py).
+"""
+
+import asyncio
+
+import pytest
+
+from walters_analyzer.workflows.weekly_orchestrator import (
+    StageResult,
+    WeeklyWorkflowOrchestrator,
+    WorkflowStage,
+    critical_path,
+)
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orch = WeeklyWorkflowOrchestrator(league="ncaaf")
+    orch.project_root = tmp_path
+    orch.cache_dir = tmp_path / "cache"
+
+    orch.calls = {}
+
+    def stage(name, delay, data):
+        async def handler():
+            orch.calls[name] = orch.calls.get(name, 0) + 1
+            await asyncio.sleep(delay)
+            return {"message": f"{name} done", "data": data}
+
+        return handler
+
+    orch._collect_data = stage("collect", 0.0, {"sources": []})
+    orch._detect_edges = stage("edges", 0.2, {"edges": 3})
+    orch._check_results = stage("results", 0.1, {"games_checked": 40})
+    orch._track_clv = stage("clv", 0.05, {"clv_records": 2})
+    orch._integrate_sharp_money = stage("sharp", 0.0, {"sharp_plays": 1})
+    orch._apply_dynamic_adjustments = stage("dynamic", 0.0, {})
+    orch._generate_report = stage("report", 0.0, {})
+    return orch
+
+
+def by_stage(report):
+    return {r.stage: r for r in report.stages}
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently(orchestrator):
+    report = await orchestrator.run_complete_workflow(week=12, use_cache=False)
+    stages = by_stage(report)
+
+    assert report.execution_status == "SUCCESS"
+    assert [r.stage for r in report.stages] == list(WorkflowStage)
+
+    edges = stages[WorkflowStage.EDGE_DETECTION]
+    edges_done = edges.started_at + edges.duration_seconds
+    # Prior-week results and CLV overlap current-week edge detection
+    assert stages[WorkflowStage.RESULTS_CHECKING].started_at < edges_done
+    assert stages[WorkflowStage.CLV_TRACKING].started_at < edges_done
+    # Dependents wait for their dependencies
+    assert stages[WorkflowStage.DYNAMIC_ADJUSTMENTS].started_at >= edges_done
+    assert report.total_duration < 0.3
+
+    assert report.edges_found == 3
+    assert report.results_checked == 40
+    assert report.critical_path == [
+        "data_collection",
+        "edge_detection",
+        "dynamic_adjustments",
+        "reporting",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rerun_reuses_stages_with_unchanged_inputs(orchestrator, tmp_path):
+    await orchestrator.run_complete_workflow(week=12)
+    report = await orchestrator.run_complete_workflow(week=12)
+    stages = by_stage(report)
+
+    # Live-data stages always rerun; everything downstream of unchanged
+    # outputs comes from cache
+    assert orchestrator.calls["collect"] == 2
+    assert orchestrator.calls["edges"] == 2
+    assert orchestrator.calls["results"] == 2
+    assert orchestrator.calls["clv"] == 1
+    assert orchestrator.calls["dynamic"] == 1
+    assert not stages[WorkflowStage.EDGE_DETECTION].cached
+    assert stages[WorkflowStage.DYNAMIC_ADJUSTMENTS].cached
+    assert report.edges_found == 3
+
+    # Changing a source file invalidates the stage that reads it
+    odds = tmp_path / "data" / "action_network" / "ncaaf_odds_latest.json"
+    odds.parent.mkdir(parents=True)
+    odds.write_text('{"games": []}')
+    report = await orchestrator.run_complete_workflow(week=12)
+    assert orchestrator.calls["sharp"] == 2
+    assert not by_stage(report)[WorkflowStage.SHARP_MONEY].cached
+
+
+@pytest.mark.asyncio
+async def test_new_odds_file_reruns_edge_detection(orchestrator, tmp_path):
+    odds_dir = tmp_path / "output" / "overtime" / "ncaaf" / "pregame"
+    odds_dir.mkdir(parents=True)
+    edges_found = iter([3, 5])
+
+    async def detect_edges():
+        # Reads whatever odds files exist, like the real detector
+        orchestrator.calls["edges"] = orchestrator.calls.get("edges", 0) + 1
+        return {"message": "edges", "data": {"edges": next(edges_found)}}
+
+    orchestrator._detect_edges = detect_edges
+    (odds_dir / "ncaaf_odds_20251118_090000.json").write_text("[]")
+    await orchestrator.run_complete_workflow(week=12)
+
+    (odds_dir / "ncaaf_odds_20251119_090000.json").write_text('[{"spread": -3}]')
+    report = await orchestrator.run_complete_workflow(week=12)
+    stages = by_stage(report)
+
+    assert orchestrator.calls["edges"] == 2
+    assert report.edges_found == 5
+    # New edges invalidate the stages built on them
+    assert not stages[WorkflowStage.DYNAMIC_ADJUSTMENTS].cached
+    assert orchestrator.calls["dynamic"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_stage_is_not_cached(orchestrator):
+    async def failing():
+        orchestrator.calls["edges"] = orchestrator.calls.get("edges", 0) + 1
+        raise RuntimeError("odds file missing")
+
+    orchestrator._detect_edges = failing
+    report = await orchestrator.run_complete_workflow(week=12)
+    assert report.execution_status == "PARTIAL"
+
+    await orchestrator.run_complete_workflow(week=12)
+    assert orchestrator.calls["edges"] == 2
+
+
+def test_critical_path_follows_longest_chain():
+    results = [
+        StageResult(WorkflowStage.DATA_COLLECTION, True, "", 1.0),
+        StageResult(WorkflowStage.EDGE_DETECTION, True, "", 2.0),
+        StageResult(WorkflowStage.RESULTS_CHECKING, True, "", 4.0),
+        StageResult(WorkflowStage.CLV_TRACKING, True, "", 0.5),
+        StageResult(WorkflowStage.REPORTING, True, "", 0.1),
+    ]
+    path, seconds = critical_path(results)
+    assert path == [
+        WorkflowStage.RESULTS_CHECKING,
+        WorkflowStage.CLV_TRACKING,
+        WorkflowStage.REPORTING,
+    ]
+    assert seconds == pytest.approx(4.6)
+    assert critical_path([]) == ([], 0.0)